@@ -5,6 +5,12 @@ Database backup and restore utility for Infra Mind.
 This script provides comprehensive backup and restore capabilities
 for MongoDB databases with integrity verification and compression.
 
+Collections are streamed to chunked BSON (or NDJSON) files, compressed with
+zstd when the ``zstandard`` package is installed and gzip otherwise, with
+checksums computed while writing. Restores insert in unordered batches and
+record a checkpoint after every chunk so an interrupted restore resumes
+where it stopped.
+
 Usage:
     python scripts/backup_restore.py backup --database infra_mind --output ./backups/
     python scripts/backup_restore.py restore --database infra_mind --backup ./backups/backup_20240101_120000/
@@ -15,6 +21,8 @@ Usage:
 import asyncio
 import argparse
 import sys
+import io
+import os
 import json
 import gzip
 import hashlib
@@ -33,6 +41,187 @@ from infra_mind.core.config import settings
 from motor.motor_asyncio import AsyncIOMotorClient
 from loguru import logger
 import bson
+from bson import json_util
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo.errors import BulkWriteError
+
+# Optional zstd compression - falls back to gzip
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+BACKUP_FORMAT_VERSION = "2.0"
+BACKUP_FORMATS = ("bson", "ndjson")
+
+# Documents are streamed as raw BSON so they are never decoded into Python objects
+RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def default_compression() -> str:
+    """Best available compression codec."""
+    return "zstd" if ZSTD_AVAILABLE else "gzip"
+
+
+class ChecksumWriter:
+    """Binary file wrapper that hashes and counts bytes as they are written."""
+    
+    def __init__(self, path: Path):
+        self._file = open(path, "wb")
+        self._hash = hashlib.sha256()
+        self.bytes_written = 0
+    
+    def write(self, data: bytes) -> int:
+        self._hash.update(data)
+        self.bytes_written += len(data)
+        return self._file.write(data)
+    
+    def flush(self) -> None:
+        self._file.flush()
+    
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+    
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+    
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def _open_compressed_writer(raw: ChecksumWriter, compression: Optional[str]):
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=3).stream_writer(raw)
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+    return raw
+
+
+def _open_compressed_reader(path: Path, compression: Optional[str]):
+    raw = open(path, "rb")
+    if compression == "zstd":
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True))
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    return raw
+
+
+class ChunkedCollectionWriter:
+    """
+    Streaming writer for one collection's backup.
+    
+    Documents are appended in batches and rotated into a new chunk file
+    every ``chunk_documents`` documents. Each chunk's SHA-256 is computed
+    over the bytes written to disk, so no second pass is needed to verify
+    it. Methods are synchronous and intended to run in a worker thread.
+    """
+    
+    def __init__(
+        self,
+        backup_path: Path,
+        collection_name: str,
+        output_format: str = "bson",
+        compression: Optional[str] = None,
+        chunk_documents: int = 100_000
+    ):
+        if output_format not in BACKUP_FORMATS:
+            raise ValueError(f"Unsupported backup format: {output_format}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the zstandard package")
+        
+        self.backup_path = backup_path
+        self.collection_name = collection_name
+        self.output_format = output_format
+        self.compression = compression
+        self.chunk_documents = chunk_documents
+        self.document_count = 0
+        self.chunks: List[Dict[str, Any]] = []
+        
+        self._raw: Optional[ChecksumWriter] = None
+        self._stream = None
+        self._chunk_file: Optional[str] = None
+        self._chunk_count = 0
+    
+    def _chunk_name(self) -> str:
+        extension = {"zstd": ".zst", "gzip": ".gz"}.get(self.compression, "")
+        return f"{self.collection_name}.{len(self.chunks):05d}.{self.output_format}{extension}"
+    
+    def _open_chunk(self) -> None:
+        self._chunk_file = self._chunk_name()
+        self._raw = ChecksumWriter(self.backup_path / self._chunk_file)
+        self._stream = _open_compressed_writer(self._raw, self.compression)
+        self._chunk_count = 0
+    
+    def _close_chunk(self) -> None:
+        if self._raw is None:
+            return
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+        
+        self.chunks.append({
+            "file": self._chunk_file,
+            "document_count": self._chunk_count,
+            "file_size_bytes": self._raw.bytes_written,
+            "checksum": self._raw.hexdigest()
+        })
+        self._raw = None
+        self._stream = None
+    
+    def _encode(self, document) -> bytes:
+        if self.output_format == "bson":
+            return document.raw if isinstance(document, RawBSONDocument) else bson.encode(document)
+        return (json_util.dumps(document, json_options=json_util.CANONICAL_JSON_OPTIONS) + "\n").encode("utf-8")
+    
+    def write_batch(self, documents: List[Any]) -> None:
+        """Append documents, rotating chunk files as they fill up."""
+        start = 0
+        while start < len(documents):
+            if self._raw is None:
+                self._open_chunk()
+            room = self.chunk_documents - self._chunk_count
+            part = documents[start:start + room]
+            self._stream.write(b"".join(self._encode(document) for document in part))
+            self._chunk_count += len(part)
+            self.document_count += len(part)
+            start += len(part)
+            if self._chunk_count >= self.chunk_documents:
+                self._close_chunk()
+    
+    def close(self) -> List[Dict[str, Any]]:
+        """Finish the current chunk and return metadata for every chunk."""
+        self._close_chunk()
+        return self.chunks
+
+
+def iter_chunk_batches(path: Path, output_format: str, compression: Optional[str], batch_size: int):
+    """
+    Read a backup chunk in batches of documents.
+    
+    BSON chunks yield RawBSONDocument instances that can be passed to
+    ``insert_many`` without being decoded.
+    """
+    with _open_compressed_reader(path, compression) as stream:
+        if output_format == "bson":
+            documents = bson.decode_file_iter(stream, codec_options=RAW_CODEC_OPTIONS)
+        else:
+            documents = (json_util.loads(line) for line in io.TextIOWrapper(stream, encoding="utf-8") if line.strip())
+        
+        batch = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
 
 class BackupRestoreManager:
@@ -40,17 +229,29 @@ class BackupRestoreManager:
     Comprehensive backup and restore manager for MongoDB databases.
     
     Features:
-    - Full database backup with compression
+    - Streaming, chunked backup with zstd/gzip compression
+    - Parallel per-collection backup and restore workers
     - Selective collection backup/restore
-    - Integrity verification with checksums
-    - Incremental backup support
+    - Integrity verification with checksums computed while writing
+    - Resumable restores with per-chunk checkpoints
     - Backup metadata and cataloging
     """
     
-    def __init__(self, database_name: str):
+    def __init__(
+        self,
+        database_name: str,
+        parallelism: int = 4,
+        batch_size: int = 1000,
+        chunk_documents: int = 100_000,
+        output_format: str = "bson"
+    ):
         self.database_name = database_name
         self.client: Optional[AsyncIOMotorClient] = None
         self.database = None
+        self.parallelism = max(1, parallelism)
+        self.batch_size = batch_size
+        self.chunk_documents = chunk_documents
+        self.output_format = output_format
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -131,36 +332,40 @@ class BackupRestoreManager:
                 "total_documents": 0,
                 "total_size_bytes": 0,
                 "compressed": compress,
+                "compression": default_compression() if compress else None,
+                "format": self.output_format,
                 "includes_indexes": include_indexes,
-                "version": "1.0"
+                "version": BACKUP_FORMAT_VERSION
             }
             
-            total_documents = 0
-            total_size = 0
+            semaphore = asyncio.Semaphore(self.parallelism)
             
-            # Backup each collection
-            for collection_name in collections:
-                try:
-                    collection_result = await self._backup_collection(
-                        collection_name=collection_name,
-                        backup_path=backup_path,
-                        compress=compress,
-                        include_indexes=include_indexes
-                    )
-                    
-                    backup_metadata["collections"][collection_name] = collection_result
-                    total_documents += collection_result["document_count"]
-                    total_size += collection_result["file_size_bytes"]
-                    
-                    logger.info(f"✅ Backed up {collection_name}: {collection_result['document_count']} documents")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Failed to backup collection {collection_name}: {e}")
-                    backup_metadata["collections"][collection_name] = {
-                        "error": str(e),
-                        "document_count": 0,
-                        "file_size_bytes": 0
-                    }
+            async def backup_one(collection_name: str) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        collection_result = await self._backup_collection(
+                            collection_name=collection_name,
+                            backup_path=backup_path,
+                            compress=compress,
+                            include_indexes=include_indexes
+                        )
+                        logger.info(f"✅ Backed up {collection_name}: {collection_result['document_count']} documents")
+                        return collection_result
+                        
+                    except Exception as e:
+                        logger.error(f"❌ Failed to backup collection {collection_name}: {e}")
+                        return {
+                            "error": str(e),
+                            "document_count": 0,
+                            "file_size_bytes": 0
+                        }
+            
+            # Backup collections in parallel
+            results = await asyncio.gather(*(backup_one(name) for name in collections))
+            backup_metadata["collections"] = dict(zip(collections, results))
+            
+            total_documents = sum(result["document_count"] for result in results)
+            total_size = sum(result["file_size_bytes"] for result in results)
             
             backup_metadata["total_documents"] = total_documents
             backup_metadata["total_size_bytes"] = total_size
@@ -193,63 +398,61 @@ class BackupRestoreManager:
         compress: bool,
         include_indexes: bool
     ) -> Dict[str, Any]:
-        """Backup a single collection."""
-        collection = self.database[collection_name]
-        
-        # Count documents
-        doc_count = await collection.count_documents({})
-        if doc_count == 0:
-            return {
-                "document_count": 0,
-                "file_size_bytes": 0,
-                "file_path": None,
-                "checksum": None
-            }
+        """
+        Stream a single collection to chunk files.
         
-        # Prepare output file
-        if compress:
-            output_file = backup_path / f"{collection_name}.json.gz"
-            file_handle = gzip.open(output_file, 'wt', encoding='utf-8')
-        else:
-            output_file = backup_path / f"{collection_name}.json"
-            file_handle = open(output_file, 'w', encoding='utf-8')
+        Documents are read as raw BSON and handed to the writer thread in
+        batches, so reading the next batch overlaps with encoding,
+        compressing and writing the previous one.
+        """
+        collection = self.database[collection_name].with_options(codec_options=RAW_CODEC_OPTIONS)
+        writer = ChunkedCollectionWriter(
+            backup_path=backup_path,
+            collection_name=collection_name,
+            output_format=self.output_format,
+            compression=default_compression() if compress else None,
+            chunk_documents=self.chunk_documents
+        )
         
+        pending_write = None
         try:
-            documents = []
+            batch = []
+            async for doc in collection.find(batch_size=self.batch_size):
+                batch.append(doc)
+                if len(batch) >= self.batch_size:
+                    if pending_write:
+                        await pending_write
+                    pending_write = asyncio.ensure_future(asyncio.to_thread(writer.write_batch, batch))
+                    batch = []
             
-            # Export documents
-            async for doc in collection.find():
-                # Convert ObjectId and datetime for JSON serialization
-                serialized_doc = self._serialize_document(doc)
-                documents.append(serialized_doc)
-            
-            # Write documents to file
-            json.dump(documents, file_handle, indent=2, default=str)
-            
-            # Backup indexes if requested
-            if include_indexes:
-                indexes = await collection.list_indexes().to_list(length=None)
-                index_file = backup_path / f"{collection_name}_indexes.json"
-                
-                if compress:
-                    with gzip.open(f"{index_file}.gz", 'wt', encoding='utf-8') as idx_f:
-                        json.dump(indexes, idx_f, indent=2, default=str)
-                else:
-                    with open(index_file, 'w', encoding='utf-8') as idx_f:
-                        json.dump(indexes, idx_f, indent=2, default=str)
-        
+            if pending_write:
+                await pending_write
+                pending_write = None
+            if batch:
+                await asyncio.to_thread(writer.write_batch, batch)
         finally:
-            file_handle.close()
+            if pending_write:
+                await asyncio.gather(pending_write, return_exceptions=True)
+            chunks = await asyncio.to_thread(writer.close)
         
-        # Calculate file checksum
-        checksum = self._calculate_file_checksum(output_file)
-        file_size = output_file.stat().st_size
+        # Backup indexes if requested
+        if include_indexes:
+            indexes = await self.database[collection_name].list_indexes().to_list(length=None)
+            index_file = backup_path / f"{collection_name}_indexes.json"
+            
+            if compress:
+                with gzip.open(f"{index_file}.gz", 'wt', encoding='utf-8') as idx_f:
+                    json.dump(indexes, idx_f, indent=2, default=str)
+            else:
+                with open(index_file, 'w', encoding='utf-8') as idx_f:
+                    json.dump(indexes, idx_f, indent=2, default=str)
         
         return {
-            "document_count": doc_count,
-            "file_path": str(output_file),
-            "file_size_bytes": file_size,
-            "checksum": checksum,
+            "document_count": writer.document_count,
+            "chunks": chunks,
+            "file_size_bytes": sum(chunk["file_size_bytes"] for chunk in chunks),
+            "format": writer.output_format,
+            "compression": writer.compression,
             "compressed": compress,
             "backup_time": datetime.utcnow().isoformat()
         }
@@ -259,7 +462,8 @@ class BackupRestoreManager:
         backup_path: str,
         collections: Optional[List[str]] = None,
         drop_existing: bool = False,
-        verify_checksums: bool = True
+        verify_checksums: bool = True,
+        resume: bool = True
     ) -> Dict[str, Any]:
         """
         Restore database from backup.
@@ -269,6 +473,7 @@ class BackupRestoreManager:
             collections: Specific collections to restore (None for all)
             drop_existing: Whether to drop existing collections before restore
             verify_checksums: Whether to verify file checksums before restore
+            resume: Whether to skip chunks recorded in a previous restore's checkpoint
         
         Returns:
             Restore result metadata
@@ -304,6 +509,18 @@ class BackupRestoreManager:
                     logger.warning(f"⚠️ Collections not found in backup: {missing}")
                     collections = [c for c in collections if c in available_collections]
             
+            # Load restore checkpoint
+            checkpoint_file = self._checkpoint_path(Path(backup_path))
+            checkpoint = self._load_checkpoint(checkpoint_file, backup_metadata["backup_id"]) if resume else None
+            if checkpoint is None:
+                checkpoint = {
+                    "backup_id": backup_metadata["backup_id"],
+                    "database_name": self.database_name,
+                    "collections": {}
+                }
+            elif checkpoint["collections"]:
+                logger.info(f"⏩ Resuming restore from checkpoint: {checkpoint_file}")
+            
             logger.info(f"🔄 Restoring {len(collections)} collections")
             
             restore_results = {
@@ -316,45 +533,63 @@ class BackupRestoreManager:
                 "errors": []
             }
             
-            total_restored = 0
+            semaphore = asyncio.Semaphore(self.parallelism)
             
-            # Restore each collection
-            for collection_name in collections:
-                try:
-                    if collection_name not in backup_metadata["collections"]:
-                        logger.warning(f"⚠️ Collection {collection_name} not found in backup")
-                        continue
-                    
-                    collection_metadata = backup_metadata["collections"][collection_name]
-                    if "error" in collection_metadata:
-                        logger.warning(f"⚠️ Skipping {collection_name} (backup error: {collection_metadata['error']})")
-                        continue
-                    
-                    result = await self._restore_collection(
-                        collection_name=collection_name,
-                        backup_dir=backup_dir,
-                        collection_metadata=collection_metadata,
-                        drop_existing=drop_existing,
-                        verify_checksum=verify_checksums
-                    )
-                    
+            async def restore_one(collection_name: str) -> Optional[Dict[str, Any]]:
+                collection_metadata = backup_metadata["collections"][collection_name]
+                if "error" in collection_metadata:
+                    logger.warning(f"⚠️ Skipping {collection_name} (backup error: {collection_metadata['error']})")
+                    return None
+                
+                async with semaphore:
+                    try:
+                        if "chunks" in collection_metadata:
+                            result = await self._restore_collection(
+                                collection_name=collection_name,
+                                backup_dir=backup_dir,
+                                collection_metadata=collection_metadata,
+                                drop_existing=drop_existing,
+                                verify_checksum=verify_checksums,
+                                checkpoint=checkpoint,
+                                checkpoint_file=checkpoint_file
+                            )
+                        else:
+                            result = await self._restore_legacy_collection(
+                                collection_name=collection_name,
+                                backup_dir=backup_dir,
+                                collection_metadata=collection_metadata,
+                                drop_existing=drop_existing,
+                                verify_checksum=verify_checksums
+                            )
+                        
+                        logger.info(f"✅ Restored {collection_name}: {result['documents_restored']} documents")
+                        return result
+                        
+                    except Exception as e:
+                        error_msg = f"Failed to restore collection {collection_name}: {e}"
+                        logger.error(f"❌ {error_msg}")
+                        restore_results["errors"].append(error_msg)
+                        return {
+                            "error": str(e),
+                            "documents_restored": 0
+                        }
+            
+            # Restore collections in parallel
+            results = await asyncio.gather(*(restore_one(name) for name in collections))
+            for collection_name, result in zip(collections, results):
+                if result is not None:
                     restore_results["collections"][collection_name] = result
-                    total_restored += result["documents_restored"]
-                    
-                    logger.info(f"✅ Restored {collection_name}: {result['documents_restored']} documents")
-                    
-                except Exception as e:
-                    error_msg = f"Failed to restore collection {collection_name}: {e}"
-                    logger.error(f"❌ {error_msg}")
-                    restore_results["errors"].append(error_msg)
-                    restore_results["collections"][collection_name] = {
-                        "error": str(e),
-                        "documents_restored": 0
-                    }
             
+            total_restored = sum(
+                result["documents_restored"] for result in restore_results["collections"].values()
+            )
             restore_results["total_documents_restored"] = total_restored
             restore_results["duration_seconds"] = (datetime.utcnow() - start_time).total_seconds()
             
+            # A completed restore no longer needs its checkpoint
+            if not restore_results["errors"] and checkpoint_file.exists():
+                checkpoint_file.unlink()
+            
             logger.success(f"✅ Restore completed: {total_restored} documents restored")
             
             return restore_results
@@ -364,6 +599,149 @@ class BackupRestoreManager:
             raise
     
     async def _restore_collection(
+        self,
+        collection_name: str,
+        backup_dir: Path,
+        collection_metadata: Dict[str, Any],
+        drop_existing: bool,
+        verify_checksum: bool,
+        checkpoint: Dict[str, Any],
+        checkpoint_file: Path
+    ) -> Dict[str, Any]:
+        """Restore a single collection chunk by chunk, checkpointing after each."""
+        collection = self.database[collection_name].with_options(codec_options=RAW_CODEC_OPTIONS)
+        progress = checkpoint["collections"].setdefault(
+            collection_name, {"completed_chunks": [], "documents_restored": 0}
+        )
+        completed = set(progress["completed_chunks"])
+        
+        # Only drop on a fresh start; a resumed restore keeps what it already inserted
+        if drop_existing and not completed:
+            await collection.drop()
+            logger.info(f"🗑️ Dropped existing collection: {collection_name}")
+        
+        output_format = collection_metadata.get("format", "bson")
+        compression = collection_metadata.get("compression")
+        chunks_skipped = 0
+        
+        for chunk in collection_metadata["chunks"]:
+            if chunk["file"] in completed:
+                chunks_skipped += 1
+                continue
+            
+            chunk_file = backup_dir / chunk["file"]
+            if not chunk_file.exists():
+                raise FileNotFoundError(f"Backup file not found: {chunk_file}")
+            
+            if verify_checksum and chunk.get("checksum"):
+                current_checksum = await asyncio.to_thread(self._calculate_file_checksum, chunk_file)
+                if current_checksum != chunk["checksum"]:
+                    raise ValueError(
+                        f"Checksum mismatch for {chunk['file']}: expected {chunk['checksum']}, got {current_checksum}"
+                    )
+            
+            progress["documents_restored"] += await self._restore_chunk(
+                collection, collection_name, chunk_file, output_format, compression
+            )
+            progress["completed_chunks"].append(chunk["file"])
+            await asyncio.to_thread(self._save_checkpoint, checkpoint_file, checkpoint)
+        
+        # Build indexes after the data is loaded
+        await self._restore_indexes_if_available(self.database[collection_name], collection_name, backup_dir)
+        
+        return {
+            "documents_restored": progress["documents_restored"],
+            "chunks_restored": len(collection_metadata["chunks"]) - chunks_skipped,
+            "chunks_skipped": chunks_skipped,
+            "restore_time": datetime.utcnow().isoformat()
+        }
+    
+    async def _restore_chunk(
+        self,
+        collection,
+        collection_name: str,
+        chunk_file: Path,
+        output_format: str,
+        compression: Optional[str]
+    ) -> int:
+        """
+        Insert one chunk in unordered batches.
+        
+        The next batch is read and decompressed while the current one is
+        being inserted. Duplicate key errors are expected when resuming a
+        partially restored chunk and are not treated as failures.
+        """
+        batches = iter_chunk_batches(chunk_file, output_format, compression, self.batch_size)
+        documents_restored = 0
+        failed = 0
+        
+        next_batch = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+        try:
+            while True:
+                batch = await next_batch
+                if batch is None:
+                    break
+                next_batch = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+                
+                try:
+                    result = await collection.insert_many(batch, ordered=False)
+                    documents_restored += len(result.inserted_ids)
+                except BulkWriteError as e:
+                    documents_restored += e.details.get("nInserted", 0)
+                    failed += sum(
+                        1 for error in e.details.get("writeErrors", [])
+                        if error.get("code") != DUPLICATE_KEY_ERROR
+                    )
+        finally:
+            if not next_batch.done():
+                await asyncio.gather(next_batch, return_exceptions=True)
+            await asyncio.to_thread(batches.close)
+        
+        if failed:
+            logger.warning(f"⚠️ {failed} documents failed to insert into {collection_name} from {chunk_file.name}")
+        
+        return documents_restored
+    
+    def _checkpoint_path(self, backup_path: Path) -> Path:
+        """Checkpoint location, kept next to the original backup so it survives archive extraction."""
+        if backup_path.is_dir():
+            return backup_path / f"restore_checkpoint_{self.database_name}.json"
+        return backup_path.with_name(f"{backup_path.name}.restore_checkpoint_{self.database_name}.json")
+    
+    def _load_checkpoint(self, checkpoint_file: Path, backup_id: str) -> Optional[Dict[str, Any]]:
+        if not checkpoint_file.exists():
+            return None
+        try:
+            with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable restore checkpoint {checkpoint_file}: {e}")
+            return None
+        
+        if checkpoint.get("backup_id") != backup_id or checkpoint.get("database_name") != self.database_name:
+            return None
+        return checkpoint
+    
+    def _save_checkpoint(self, checkpoint_file: Path, checkpoint: Dict[str, Any]) -> None:
+        # Write-then-rename so an interrupted write never corrupts the checkpoint
+        temp_file = checkpoint_file.with_name(f"{checkpoint_file.name}.tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(temp_file, checkpoint_file)
+    
+    async def _restore_indexes_if_available(self, collection, collection_name: str, backup_dir: Path):
+        index_file = backup_dir / f"{collection_name}_indexes.json"
+        if not index_file.exists():
+            index_file = backup_dir / f"{collection_name}_indexes.json.gz"
+        
+        if index_file.exists():
+            try:
+                await self._restore_collection_indexes(collection, index_file)
+                logger.info(f"📊 Restored indexes for {collection_name}")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to restore indexes for {collection_name}: {e}")
+    
+    async def _restore_legacy_collection(
         self,
         collection_name: str,
         backup_dir: Path,
@@ -371,9 +749,12 @@ class BackupRestoreManager:
         drop_existing: bool,
         verify_checksum: bool
     ) -> Dict[str, Any]:
-        """Restore a single collection."""
+        """Restore a single collection from a version 1.0 (JSON array) backup."""
         collection = self.database[collection_name]
         
+        if not collection_metadata.get("file_path"):
+            return {"documents_restored": 0}
+        
         # Determine backup file path
         backup_file = Path(collection_metadata["file_path"])
         if not backup_file.is_absolute():
@@ -410,35 +791,18 @@ class BackupRestoreManager:
         restored_docs = [self._deserialize_document(doc) for doc in documents]
         
         # Insert documents in batches
-        batch_size = 1000
         documents_restored = 0
         
-        for i in range(0, len(restored_docs), batch_size):
-            batch = restored_docs[i:i + batch_size]
+        for i in range(0, len(restored_docs), self.batch_size):
+            batch = restored_docs[i:i + self.batch_size]
             try:
                 await collection.insert_many(batch, ordered=False)
                 documents_restored += len(batch)
-            except Exception as e:
+            except BulkWriteError as e:
                 logger.warning(f"⚠️ Batch insert error for {collection_name}: {e}")
-                # Try individual inserts for failed batch
-                for doc in batch:
-                    try:
-                        await collection.insert_one(doc)
-                        documents_restored += 1
-                    except Exception:
-                        pass  # Skip failed documents
+                documents_restored += e.details.get("nInserted", 0)
         
-        # Restore indexes if available
-        index_file = backup_dir / f"{collection_name}_indexes.json"
-        if not index_file.exists():
-            index_file = backup_dir / f"{collection_name}_indexes.json.gz"
-        
-        if index_file.exists():
-            try:
-                await self._restore_collection_indexes(collection, index_file)
-                logger.info(f"📊 Restored indexes for {collection_name}")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to restore indexes for {collection_name}: {e}")
+        await self._restore_indexes_if_available(collection, collection_name, backup_dir)
         
         return {
             "documents_restored": documents_restored,
@@ -499,20 +863,30 @@ class BackupRestoreManager:
                     verification_result["warnings"].append(f"Collection {collection_name} has backup error")
                     continue
                 
-                # Check file exists
-                backup_file = backup_dir / Path(collection_metadata["file_path"]).name
-                if not backup_file.exists():
-                    verification_result["errors"].append(f"Backup file missing for {collection_name}")
-                    continue
+                if "chunks" in collection_metadata:
+                    files = [(chunk["file"], chunk.get("checksum")) for chunk in collection_metadata["chunks"]]
+                elif collection_metadata.get("file_path"):
+                    files = [(Path(collection_metadata["file_path"]).name, collection_metadata.get("checksum"))]
+                else:
+                    files = []
                 
-                # Verify checksum
-                if "checksum" in collection_metadata:
-                    current_checksum = self._calculate_file_checksum(backup_file)
-                    expected_checksum = collection_metadata["checksum"]
-                    
-                    if current_checksum != expected_checksum:
-                        verification_result["errors"].append(f"Checksum mismatch for {collection_name}")
+                collection_errors = []
+                for file_name, expected_checksum in files:
+                    # Check file exists
+                    backup_file = backup_dir / file_name
+                    if not backup_file.exists():
+                        collection_errors.append(f"Backup file missing for {collection_name}: {file_name}")
                         continue
+                    
+                    # Verify checksum
+                    if expected_checksum:
+                        current_checksum = await asyncio.to_thread(self._calculate_file_checksum, backup_file)
+                        if current_checksum != expected_checksum:
+                            collection_errors.append(f"Checksum mismatch for {collection_name}: {file_name}")
+                
+                if collection_errors:
+                    verification_result["errors"].extend(collection_errors)
+                    continue
                 
                 verification_result["collections_verified"] += 1
             
@@ -627,17 +1001,21 @@ class BackupRestoreManager:
         hash_sha256 = hashlib.sha256()
         
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
                 hash_sha256.update(chunk)
         
         return hash_sha256.hexdigest()
     
     async def _create_backup_archive(self, backup_path: Path) -> Path:
-        """Create compressed archive of backup directory."""
-        archive_path = backup_path.parent / f"{backup_path.name}.tar.gz"
+        """Bundle the backup directory into a single archive."""
+        # Chunk files are already compressed; a second compression pass only costs time
+        archive_path = backup_path.parent / f"{backup_path.name}.tar"
+        
+        def build_archive():
+            with tarfile.open(archive_path, "w") as tar:
+                tar.add(backup_path, arcname=backup_path.name)
         
-        with tarfile.open(archive_path, "w:gz") as tar:
-            tar.add(backup_path, arcname=backup_path.name)
+        await asyncio.to_thread(build_archive)
         
         # Remove original directory after archiving
         shutil.rmtree(backup_path)
@@ -676,6 +1054,9 @@ async def main():
     backup_parser.add_argument('--collections', nargs='*', help='Specific collections to backup')
     backup_parser.add_argument('--no-compress', action='store_true', help='Disable compression')
     backup_parser.add_argument('--no-indexes', action='store_true', help='Skip index backup')
+    backup_parser.add_argument('--format', choices=BACKUP_FORMATS, default='bson', help='Document file format')
+    backup_parser.add_argument('--chunk-documents', type=int, default=100_000, help='Documents per chunk file')
+    backup_parser.add_argument('--parallelism', type=int, default=4, help='Collections backed up concurrently')
     
     # Restore command
     restore_parser = subparsers.add_parser('restore', help='Restore database from backup')
@@ -684,6 +1065,9 @@ async def main():
     restore_parser.add_argument('--collections', nargs='*', help='Specific collections to restore')
     restore_parser.add_argument('--drop-existing', action='store_true', help='Drop existing collections')
     restore_parser.add_argument('--no-verify', action='store_true', help='Skip checksum verification')
+    restore_parser.add_argument('--no-resume', action='store_true', help='Ignore any existing restore checkpoint')
+    restore_parser.add_argument('--batch-size', type=int, default=1000, help='Documents per insert_many batch')
+    restore_parser.add_argument('--parallelism', type=int, default=4, help='Collections restored concurrently')
     
     # Verify command
     verify_parser = subparsers.add_parser('verify', help='Verify backup integrity')
@@ -709,7 +1093,12 @@ async def main():
     
     try:
         if args.command == 'backup':
-            async with BackupRestoreManager(args.database) as manager:
+            async with BackupRestoreManager(
+                args.database,
+                parallelism=args.parallelism,
+                chunk_documents=args.chunk_documents,
+                output_format=args.format
+            ) as manager:
                 result = await manager.create_backup(
                     output_path=args.output,
                     collections=args.collections,
@@ -719,12 +1108,17 @@ async def main():
                 logger.info(f"📄 Backup metadata: {json.dumps(result, indent=2, default=str)}")
         
         elif args.command == 'restore':
-            async with BackupRestoreManager(args.database) as manager:
+            async with BackupRestoreManager(
+                args.database,
+                parallelism=args.parallelism,
+                batch_size=args.batch_size
+            ) as manager:
                 result = await manager.restore_backup(
                     backup_path=args.backup,
                     collections=args.collections,
                     drop_existing=args.drop_existing,
-                    verify_checksums=not args.no_verify
+                    verify_checksums=not args.no_verify,
+                    resume=not args.no_resume
                 )
                 logger.info(f"📄 Restore result: {json.dumps(result, indent=2, default=str)}")
         
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming backup format against the legacy JSON backup.
+
+Generates a synthetic collection, then times the version 1.0 algorithm
+(materialize every document, ``json.dump`` with ``indent=2``) against the
+chunked streaming writer, and reports duration, peak Python memory and
+on-disk size for each.
+
+Usage:
+    # Serialization only, no database required
+    python scripts/benchmark_backup_restore.py --offline --documents 1000000
+
+    # End-to-end backup and restore against the configured MongoDB
+    python scripts/benchmark_backup_restore.py --database infra_mind_benchmark --documents 1000000
+"""
+
+import asyncio
+import argparse
+import gzip
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+# Add src and scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import bson
+from bson.raw_bson import RawBSONDocument
+from loguru import logger
+
+from backup_restore import BackupRestoreManager, ChunkedCollectionWriter, default_compression
+
+BENCHMARK_COLLECTION = "backup_benchmark"
+
+
+def generate_documents(count: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """Generate assessment-like documents of roughly 1 KB each."""
+    rng = random.Random(seed)
+    base_time = datetime(2024, 1, 1)
+    providers = ["aws", "azure", "gcp", "alibaba", "ibm"]
+    for i in range(count):
+        yield {
+            "_id": bson.ObjectId(),
+            "user_id": f"user_{rng.randint(1, 10_000)}",
+            "title": f"Assessment {i}",
+            "status": rng.choice(["draft", "in_progress", "completed"]),
+            "created_at": base_time + timedelta(seconds=i),
+            "score": rng.random(),
+            "providers": rng.sample(providers, 2),
+            "requirements": {
+                "budget": rng.randint(1_000, 1_000_000),
+                "regions": [f"region-{rng.randint(1, 20)}" for _ in range(3)],
+                "notes": "x" * rng.randint(200, 600)
+            }
+        }
+
+
+def _measure(label: str, func) -> Dict[str, Any]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = func()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {"label": label, "seconds": round(duration, 2), "peak_mb": round(peak / 1024 / 1024, 1)}
+    if size is not None:
+        result["size_mb"] = round(size / 1024 / 1024, 1)
+    logger.info(f"⏱️ {result}")
+    return result
+
+
+def _legacy_write(documents: List[Dict[str, Any]], output_file: Path) -> int:
+    """Version 1.0 algorithm: one JSON array, indented, gzip-compressed."""
+    manager = BackupRestoreManager("benchmark")
+    serialized = [manager._serialize_document(doc) for doc in documents]
+    with gzip.open(output_file, "wt", encoding="utf-8") as f:
+        json.dump(serialized, f, indent=2, default=str)
+    return output_file.stat().st_size
+
+
+def _streaming_write(documents: List[Dict[str, Any]], output_dir: Path, batch_size: int) -> int:
+    writer = ChunkedCollectionWriter(output_dir, BENCHMARK_COLLECTION, compression=default_compression())
+    batch = []
+    for doc in documents:
+        batch.append(RawBSONDocument(bson.encode(doc)))
+        if len(batch) >= batch_size:
+            writer.write_batch(batch)
+            batch = []
+    if batch:
+        writer.write_batch(batch)
+    return sum(chunk["file_size_bytes"] for chunk in writer.close())
+
+
+def run_offline(document_count: int, batch_size: int) -> List[Dict[str, Any]]:
+    """Compare serialization and compression without a database."""
+    workdir = Path(tempfile.mkdtemp(prefix="backup_benchmark_"))
+    try:
+        logger.info(f"📦 Generating {document_count} documents")
+        documents = list(generate_documents(document_count))
+        return [
+            _measure("legacy_json", lambda: _legacy_write(documents, workdir / "legacy.json.gz")),
+            _measure("streaming_bson", lambda: _streaming_write(documents, workdir, batch_size)),
+        ]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+async def run_database(database_name: str, document_count: int, batch_size: int) -> List[Dict[str, Any]]:
+    """Backup and restore a generated collection end to end."""
+    workdir = Path(tempfile.mkdtemp(prefix="backup_benchmark_"))
+    results = []
+    try:
+        async with BackupRestoreManager(database_name, batch_size=batch_size) as manager:
+            collection = manager.database[BENCHMARK_COLLECTION]
+            await collection.drop()
+
+            logger.info(f"📦 Inserting {document_count} documents into {database_name}.{BENCHMARK_COLLECTION}")
+            batch = []
+            for doc in generate_documents(document_count):
+                batch.append(doc)
+                if len(batch) >= 10_000:
+                    await collection.insert_many(batch, ordered=False)
+                    batch = []
+            if batch:
+                await collection.insert_many(batch, ordered=False)
+
+            async def legacy_backup():
+                documents = [doc async for doc in collection.find()]
+                return await asyncio.to_thread(_legacy_write, documents, workdir / "legacy.json.gz")
+
+            backup_metadata = {}
+
+            async def streaming_backup():
+                backup_metadata.update(await manager.create_backup(
+                    str(workdir), collections=[BENCHMARK_COLLECTION], include_indexes=False
+                ))
+                return backup_metadata["total_size_bytes"]
+
+            for label, coroutine in (("legacy_backup", legacy_backup), ("streaming_backup", streaming_backup)):
+                tracemalloc.start()
+                start = time.perf_counter()
+                size = await coroutine()
+                duration = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                results.append({
+                    "label": label,
+                    "seconds": round(duration, 2),
+                    "peak_mb": round(peak / 1024 / 1024, 1),
+                    "size_mb": round(size / 1024 / 1024, 1)
+                })
+                logger.info(f"⏱️ {results[-1]}")
+
+            start = time.perf_counter()
+            restore = await manager.restore_backup(
+                backup_metadata["archive_path"], collections=[BENCHMARK_COLLECTION], drop_existing=True
+            )
+            results.append({
+                "label": "streaming_restore",
+                "seconds": round(time.perf_counter() - start, 2),
+                "documents": restore["total_documents_restored"]
+            })
+            logger.info(f"⏱️ {results[-1]}")
+
+            await collection.drop()
+        return results
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark backup formats")
+    parser.add_argument('--database', help='Scratch database for the end-to-end benchmark')
+    parser.add_argument('--documents', type=int, default=1_000_000, help='Number of generated documents')
+    parser.add_argument('--batch-size', type=int, default=1000, help='Documents per batch')
+    parser.add_argument('--offline', action='store_true', help='Benchmark serialization only')
+    args = parser.parse_args()
+
+    if args.offline:
+        results = run_offline(args.documents, args.batch_size)
+    elif args.database:
+        results = asyncio.run(run_database(args.database, args.documents, args.batch_size))
+    else:
+        parser.error("either --offline or --database is required")
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
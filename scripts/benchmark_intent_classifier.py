@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Offline accuracy and latency benchmark for the chatbot's local intent classifier.
+
+Reports:
+- k-fold cross-validated accuracy on the seed corpus
+- accuracy on a held-out set of messages phrased differently from the seeds
+- coverage (share of messages answered locally) and accuracy of those at the
+  confidence threshold, i.e. how many LLM round-trips are avoided
+- per-message prediction latency (p50/p99) and training time
+
+Usage:
+    python scripts/benchmark_intent_classifier.py --folds 5 --threshold 0.6
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infra_mind.agents.intent_classifier import IntentClassifier, SEED_EXAMPLES, seed_examples
+
+HELD_OUT: Dict[str, List[str]] = {
+    "greeting": ["hey folks", "hello, good to be here", "hi! first time using this", "good morning everyone"],
+    "question": [
+        "what does the simulation agent do?", "how do you estimate egress costs?",
+        "which provider is cheapest for gpu training?", "what is a landing zone?",
+    ],
+    "help_request": [
+        "could you help me set up the budget fields?", "I need a hand with my report",
+        "how do I rerun an assessment?", "walk me through adding aws credentials",
+    ],
+    "complaint": [
+        "this report is garbage", "I'm really annoyed, it took hours",
+        "your estimates were way off and I'm upset", "honestly this platform is disappointing",
+    ],
+    "compliment": [
+        "fantastic report, thank you", "this was incredibly useful", "love the new dashboard", "great work team",
+    ],
+    "goodbye": ["ok bye now", "that's it from me, see you", "thanks and goodbye", "signing off, have a good one"],
+    "escalation_request": [
+        "please get a human on this", "I want a real person to review my case",
+        "can you connect me to someone from support?", "I'd rather talk to a human agent",
+    ],
+    "technical_issue": [
+        "the export button throws an error", "I can't open my report, it shows a blank page",
+        "upload keeps failing with a timeout", "the assessment crashed halfway",
+    ],
+    "feature_inquiry": [
+        "can it produce terraform modules?", "do you integrate with jira?",
+        "is there support for alibaba cloud?", "can I white-label the reports?",
+    ],
+    "pricing_inquiry": [
+        "what's the monthly price?", "do you have a nonprofit discount?",
+        "how much would 50 seats cost?", "I was billed twice this month",
+    ],
+}
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))]
+
+
+def _evaluate(classifier: IntentClassifier, examples: List[Tuple[str, str]], threshold: float) -> Dict[str, float]:
+    correct = confident = confident_correct = 0
+    for text, label in examples:
+        predicted, confidence = classifier.predict(text)
+        correct += predicted == label
+        if confidence >= threshold:
+            confident += 1
+            confident_correct += predicted == label
+    return {
+        "accuracy": round(correct / len(examples), 3),
+        "local_coverage": round(confident / len(examples), 3),
+        "local_accuracy": round(confident_correct / confident, 3) if confident else None,
+    }
+
+
+def cross_validate(folds: int, threshold: float) -> Dict[str, float]:
+    examples = seed_examples()
+    random.Random(0).shuffle(examples)
+    totals = {"accuracy": 0.0, "local_coverage": 0.0}
+    for fold in range(folds):
+        test = examples[fold::folds]
+        train = [e for i, e in enumerate(examples) if i % folds != fold]
+        result = _evaluate(IntentClassifier(list(SEED_EXAMPLES)).fit(train), test, threshold)
+        for key in totals:
+            totals[key] += result[key] / folds
+    return {key: round(value, 3) for key, value in totals.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the local intent classifier")
+    parser.add_argument("--folds", type=int, default=5, help="Cross-validation folds on the seed corpus")
+    parser.add_argument("--threshold", type=float, default=0.6, help="Confidence threshold for local answers")
+    parser.add_argument("--iterations", type=int, default=20_000, help="Predictions timed for latency")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    classifier = IntentClassifier(list(SEED_EXAMPLES)).fit(seed_examples())
+    training_seconds = time.perf_counter() - started
+
+    held_out = [(text, label) for label, texts in HELD_OUT.items() for text in texts]
+    messages = [text for text, _ in held_out]
+    latencies = []
+    for i in range(args.iterations):
+        text = messages[i % len(messages)]
+        started = time.perf_counter()
+        classifier.predict(text)
+        latencies.append((time.perf_counter() - started) * 1e6)
+
+    print(json.dumps({
+        "seed_examples": classifier.examples_seen,
+        "training_seconds": round(training_seconds, 3),
+        "cross_validation": cross_validate(args.folds, args.threshold),
+        "held_out": _evaluate(classifier, held_out, args.threshold),
+        "threshold": args.threshold,
+        "latency_us": {
+            "p50": round(_percentile(latencies, 50), 1),
+            "p99": round(_percentile(latencies, 99), 1),
+        },
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
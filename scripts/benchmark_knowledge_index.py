@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for the chatbot's local knowledge index.
+
+Builds an index of synthetic FAQ/conversation documents, then reports:
+- build time and incremental refresh time (only a few documents changed)
+- per-query search latency (p50/p99) at the requested corpus size
+
+Usage:
+    python scripts/benchmark_knowledge_index.py --documents 5000 --queries 5000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infra_mind.agents.knowledge_index import KnowledgeDocument, KnowledgeIndex
+
+WORDS = (
+    "aws azure gcp kubernetes cluster gpu training inference cost budget report assessment export pdf "
+    "compliance hipaa gdpr soc2 latency region migration database storage network vpc security iam "
+    "billing invoice dashboard alert monitoring autoscaling terraform pipeline deployment backup "
+    "recovery availability sla encryption key vault quota limit upgrade plan team seat login password"
+).split()
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def _documents(rng: random.Random, count: int, offset: int = 0) -> List[KnowledgeDocument]:
+    return [
+        KnowledgeDocument(
+            doc_id=f"conversation:{offset + i}",
+            source="conversation",
+            title=_sentence(rng, rng.randint(5, 12)),
+            body=_sentence(rng, rng.randint(30, 80))
+        )
+        for i in range(count)
+    ]
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the local knowledge index")
+    parser.add_argument("--documents", type=int, default=5000, help="Indexed documents")
+    parser.add_argument("--queries", type=int, default=5000, help="Timed queries")
+    parser.add_argument("--changed", type=int, default=20, help="Documents changed per refresh")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    documents = _documents(rng, args.documents)
+    index = KnowledgeIndex()
+
+    started = time.perf_counter()
+    index.sync_source("conversation", documents)
+    build_seconds = time.perf_counter() - started
+
+    refreshed = documents[args.changed:] + _documents(rng, args.changed, offset=args.documents)
+    started = time.perf_counter()
+    changed, removed = index.sync_source("conversation", refreshed)
+    refresh_seconds = time.perf_counter() - started
+
+    queries = [_sentence(rng, rng.randint(3, 8)) for _ in range(200)]
+    latencies = []
+    for i in range(args.queries):
+        started = time.perf_counter()
+        index.search(queries[i % len(queries)], limit=3)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    print(json.dumps({
+        "documents": len(index),
+        "build_seconds": round(build_seconds, 3),
+        "refresh": {"changed": changed, "removed": removed, "seconds": round(refresh_seconds, 4)},
+        "search_latency_ms": {
+            "p50": round(_percentile(latencies, 50), 3),
+            "p99": round(_percentile(latencies, 99), 3),
+        },
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
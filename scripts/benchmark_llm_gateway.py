@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared LLM manager against one LLMManager per agent.
+
+Simulates full assessments: 11 agents run concurrently and each makes a
+few LLM calls. In "per-agent" mode every agent instance builds its own
+managers, as agents did before the shared manager: one in ``__init__`` and
+one on its first ``_call_llm``. Each manager has its own provider clients,
+response cache and cost tracker. In "shared" mode all agents use
+``get_shared_llm_manager()``.
+
+The provider's HTTP call is replaced by a fixed simulated latency, so no API
+traffic is made. Client construction, caching, validation and cost tracking
+run for real. The script reports wall time, peak Python memory, provider
+clients created, upstream calls and cache hits for each mode.
+
+Usage:
+    python scripts/benchmark_llm_gateway.py --assessments 5 --calls-per-agent 4 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Offline provider configuration; no request leaves the process
+os.environ.setdefault("INFRA_MIND_OPENAI_API_KEY", "sk-benchmark")
+os.environ["INFRA_MIND_LLM_PROVIDER"] = "openai"
+
+from infra_mind.llm import manager as llm_manager_module
+from infra_mind.llm.interface import LLMProvider, LLMRequest, LLMResponse, TokenUsage
+from infra_mind.llm.openai_provider import OpenAIProvider
+
+AGENTS = [
+    "cto", "cloud_engineer", "research", "mlops", "infrastructure", "compliance",
+    "ai_consultant", "web_research", "simulation", "chatbot", "report_generator",
+]
+
+TOPICS = [
+    "compute sizing and instance families",
+    "managed database options and replication",
+    "network topology, ingress and egress costs",
+    "security controls and identity management",
+    "observability stack and alerting thresholds",
+    "migration sequencing and rollback strategy",
+]
+
+_stats = {"clients": 0, "upstream_calls": 0}
+
+
+def _patch_provider(latency: float) -> None:
+    original_init = OpenAIProvider.__init__
+
+    def counting_init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        _stats["clients"] += 1
+
+    async def simulated_response(self, request: LLMRequest) -> LLMResponse:
+        _stats["upstream_calls"] += 1
+        await asyncio.sleep(latency)
+        return LLMResponse(
+            content=f"Analysis for {request.agent_name}: " + "recommendation " * 150,
+            model=request.model,
+            provider=LLMProvider.OPENAI,
+            token_usage=TokenUsage(
+                prompt_tokens=900, completion_tokens=600, total_tokens=1500,
+                estimated_cost=0.05, model=request.model
+            ),
+            response_time=latency,
+            request_id=request.request_id
+        )
+
+    OpenAIProvider.__init__ = counting_init
+    OpenAIProvider.generate_response = simulated_response
+
+
+def _request(agent: str, assessment: int, call: int) -> LLMRequest:
+    return LLMRequest(
+        # Re-runs repeat the prompts of earlier assessments
+        prompt=f"Assessment {assessment % 2}: recommend {TOPICS[call % len(TOPICS)]}",
+        system_prompt=f"You are the {agent} agent.",
+        model="gpt-4",
+        agent_name=agent
+    )
+
+
+async def _run_agent(mode: str, agent: str, assessment: int, calls: int) -> None:
+    if mode == "per-agent":
+        llm_manager_module.LLMManager()  # BaseAgent.__init__
+        manager = llm_manager_module.LLMManager()  # first _call_llm
+    else:
+        llm_manager_module.get_shared_llm_manager()
+        manager = llm_manager_module.get_shared_llm_manager()
+
+    for call in range(calls):
+        await manager.generate_response(_request(agent, assessment, call), agent_name=agent)
+
+
+async def run_mode(mode: str, assessments: int, calls: int) -> Dict[str, Any]:
+    _stats.update(clients=0, upstream_calls=0)
+    tracemalloc.start()
+    start = time.perf_counter()
+    latencies: List[float] = []
+
+    for assessment in range(assessments):
+        assessment_start = time.perf_counter()
+        await asyncio.gather(*(_run_agent(mode, agent, assessment, calls) for agent in AGENTS))
+        latencies.append(time.perf_counter() - assessment_start)
+
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total_calls = assessments * len(AGENTS) * calls
+    return {
+        "mode": mode,
+        "seconds": round(duration, 2),
+        "mean_assessment_seconds": round(sum(latencies) / len(latencies), 3),
+        "peak_mb": round(peak / 1024 / 1024, 1),
+        "provider_clients": _stats["clients"],
+        "llm_calls": total_calls,
+        "upstream_calls": _stats["upstream_calls"],
+        "cache_hits": total_calls - _stats["upstream_calls"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark shared vs per-agent LLM managers")
+    parser.add_argument("--assessments", type=int, default=5, help="Assessments to run sequentially")
+    parser.add_argument("--calls-per-agent", type=int, default=4, help="LLM calls per agent per assessment")
+    parser.add_argument("--latency", type=float, default=0.2, help="Simulated provider latency in seconds")
+    args = parser.parse_args()
+
+    _patch_provider(args.latency)
+    results = [
+        asyncio.run(run_mode(mode, args.assessments, args.calls_per_agent))
+        for mode in ("per-agent", "shared")
+    ]
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Per-keystroke latency benchmark for the form typeahead index.
+
+Builds an index over a synthetic vocabulary of one field (labels drawn from a
+Zipf-distributed word pool, seeded with cloud service words), then replays
+users typing suggestion labels one character at a time (some with a typo) and
+reports:
+- index build time
+- per-keystroke latency (p50/p99) with the result cache disabled and enabled
+- the same keystrokes against the previous linear substring scan, for reference
+
+Usage:
+    python scripts/benchmark_typeahead.py --vocabulary 10000 --words 500
+
+A small --distinct-words (e.g. 70) makes every word very common, which is the
+worst case for multi-word queries.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infra_mind.forms.intelligent_features import Suggestion
+from infra_mind.forms.typeahead import TypeaheadIndex
+
+WORDS = (
+    "compute instance managed database kubernetes container orchestration gateway api serverless function "
+    "object storage block archive backup recovery cdn edge cache queue stream event bus analytics warehouse "
+    "lake pipeline etl ml platform training inference gpu notebook vector search identity access secrets "
+    "vault firewall load balancer dns monitoring logging tracing alerting cost optimization autoscaling "
+    "registry artifact build deploy migration replication failover cluster mesh network private link"
+).split()
+
+
+SYLLABLES = "ka lo mi ne ru sa ti vo xe zu bra cle dri fro gla pli sto tra vex qui".split()
+
+
+def _word_pool(rng: random.Random, size: int) -> List[str]:
+    pool = list(WORDS[:size])
+    seen = set(pool)
+    while len(pool) < size:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            pool.append(word)
+    return pool
+
+
+def _vocabulary(rng: random.Random, size: int, pool: Sequence[str]) -> List[Suggestion]:
+    # Zipf-like word frequencies, as in real vocabularies
+    weights = [1 / rank for rank in range(1, len(pool) + 1)]
+
+    def words(count: int) -> List[str]:
+        return rng.choices(pool, weights=weights, k=count)
+
+    suggestions = []
+    for i in range(size):
+        label_words = words(rng.randint(2, 4))
+        suggestions.append(Suggestion(
+            value="_".join(label_words) + f"_{i}",
+            label=" ".join(word.title() for word in label_words),
+            description=" ".join(words(rng.randint(4, 10))),
+            confidence=round(rng.uniform(0.3, 0.95), 2),
+        ))
+    return suggestions
+
+
+def _typo(rng: random.Random, text: str) -> str:
+    if len(text) < 5:
+        return text
+    i = rng.randint(1, len(text) - 2)
+    return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+
+
+def _keystrokes(rng: random.Random, vocabulary: List[Suggestion], words: int, typo_rate: float) -> List[str]:
+    queries = []
+    for suggestion in rng.sample(vocabulary, words):
+        text = suggestion.label.lower()[:rng.randint(6, 18)]
+        if rng.random() < typo_rate:
+            text = _typo(rng, text)
+        queries.extend(text[:n] for n in range(1, len(text) + 1))
+    return queries
+
+
+def _linear_scan(vocabulary: List[Suggestion], query: str) -> List[Suggestion]:
+    query_lower = query.lower()
+    matches = [
+        s for s in vocabulary
+        if query_lower in s.value.lower() or query_lower in s.label.lower() or query_lower in s.description.lower()
+    ]
+    matches.sort(key=lambda s: s.confidence, reverse=True)
+    return matches[:10]
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))]
+
+
+def _time(queries: List[str], search: Callable[[str], object]) -> dict:
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        search(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return {
+        "p50": round(_percentile(latencies, 50), 3),
+        "p99": round(_percentile(latencies, 99), 3),
+        "max": round(max(latencies), 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the form typeahead index")
+    parser.add_argument("--vocabulary", type=int, default=10000, help="Suggestions in the field")
+    parser.add_argument("--distinct-words", type=int, default=3000, help="Size of the word pool labels are drawn from")
+    parser.add_argument("--words", type=int, default=500, help="Labels typed out keystroke by keystroke")
+    parser.add_argument("--typo-rate", type=float, default=0.2, help="Share of labels typed with a transposition")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    vocabulary = _vocabulary(rng, args.vocabulary, _word_pool(rng, args.distinct_words))
+    queries = _keystrokes(rng, vocabulary, args.words, args.typo_rate)
+
+    started = time.perf_counter()
+    index = TypeaheadIndex({"cloud_services": vocabulary}, cache_size=0)
+    build_seconds = time.perf_counter() - started
+    cached_index = TypeaheadIndex({"cloud_services": vocabulary})
+
+    print(json.dumps({
+        "vocabulary": args.vocabulary,
+        "distinct_words": args.distinct_words,
+        "keystrokes": len(queries),
+        "build_seconds": round(build_seconds, 3),
+        "keystroke_latency_ms": {
+            "uncached": _time(queries, lambda q: index.search("cloud_services", q)),
+            "cached": _time(queries + queries, lambda q: cached_index.search("cloud_services", q)),
+            "linear_scan": _time(queries[:300], lambda q: _linear_scan(vocabulary, q)),
+        },
+        "cache": cached_index.get_stats(),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -66,7 +66,10 @@ class MigrationCLI:
                 dry_run=args.dry_run,
                 preserve_ids=args.preserve_ids,
                 skip_existing=args.skip_existing,
-                rollback_on_error=args.rollback_on_error
+                rollback_on_error=args.rollback_on_error,
+                transform_workers=args.transform_workers,
+                process_pool_workers=args.process_pool_workers,
+                resume=not args.no_resume
             )
             
             logger.info(f"📋 Migration configuration:")
@@ -248,6 +251,7 @@ class MigrationCLI:
                     "records_migrated": result.records_migrated,
                     "records_failed": result.records_failed,
                     "duration_seconds": result.duration_seconds,
+                    "metrics": result.metrics or {},
                     "errors": result.errors[:50] if result.errors else [],  # Limit errors
                     "warnings": result.warnings[:50] if result.warnings else []  # Limit warnings
                 }
@@ -307,6 +311,9 @@ Examples:
     migrate_parser.add_argument('--skip-existing', action='store_true', default=True, help='Skip existing documents')
     migrate_parser.add_argument('--rollback-on-error', action='store_true', default=True, help='Rollback on error')
     migrate_parser.add_argument('--output-report', help='Output path for migration report')
+    migrate_parser.add_argument('--transform-workers', type=int, default=4, help='Concurrent transform workers')
+    migrate_parser.add_argument('--process-pool-workers', type=int, default=0, help='Run transformers in a process pool of this size')
+    migrate_parser.add_argument('--no-resume', action='store_true', help='Ignore checkpoints from an interrupted migration')
     
     # Validate command
     validate_parser = subparsers.add_parser('validate', help='Validate data structure')
@@ -23,7 +23,7 @@ from ..core.error_handling import error_handler, ErrorContext
 from ..core.advanced_logging import get_agent_logger, log_context
 from .memory import AgentMemory
 from .tools import AgentToolkit, ToolResult
-from ..llm.manager import LLMManager
+from ..llm.manager import get_shared_llm_manager
 
 logger = logging.getLogger(__name__)
 
@@ -109,12 +109,9 @@ class BaseAgent(ABC):
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         
-        # Initialize LLM client
-        self.llm_client = LLMManager({
-            "model": config.model_name,
-            "temperature": config.temperature,
-            "max_tokens": config.max_tokens
-        })
+        # Process-wide LLM manager: provider clients, response cache and cost
+        # tracking are shared by all agents; requests carry the agent name
+        self.llm_client = get_shared_llm_manager()
         
         # Agent state
         self.current_assessment: Optional[Assessment] = None
@@ -436,16 +433,9 @@ class BaseAgent(ABC):
         Returns:
             LLM response content
         """
-        from ..llm.manager import LLMManager
         from ..llm.interface import LLMRequest
-        from ..core.config import get_settings
         
-        # Get or create LLM manager instance with explicit configuration
-        if not hasattr(self, '_llm_manager'):
-            # Ensure we have fresh settings - use Azure OpenAI as configured
-            settings = get_settings()
-            # Pass settings directly to LLMManager
-            self._llm_manager = LLMManager(settings)
+        llm_manager = get_shared_llm_manager()
         
         # Create LLM request
         request = LLMRequest(
@@ -460,7 +450,7 @@ class BaseAgent(ABC):
         
         try:
             # Generate response using LLM manager
-            response = await self._llm_manager.generate_response(
+            response = await llm_manager.generate_response(
                 request, 
                 validate_response=True,
                 agent_name=self.name
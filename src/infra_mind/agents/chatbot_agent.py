@@ -19,9 +19,17 @@ from ..models.user import User
 from ..models.assessment import Assessment
 from ..core.database import get_database
 from ..core.cache import get_cache_manager
-from ..llm.manager import LLMManager
+from ..llm.manager import get_shared_llm_manager
 from ..llm.interface import LLMRequest
 from ..llm.prompt_sanitizer import PromptSanitizer
+from .intent_classifier import load_intent_classifier, normalize_label, train_with_logged_intents
+from .knowledge_index import (
+    ANSWER_SOURCES,
+    faq_documents,
+    get_knowledge_index,
+    load_resolved_conversation_answers,
+    web_documents,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +89,8 @@ class ChatbotAgent(BaseAgent):
                     "max_conversation_turns": 20,
                     "escalation_threshold": 3,
                     "enable_faq_integration": True,
-                    "enable_context_memory": True
+                    "enable_context_memory": True,
+                    "intent_confidence_threshold": 0.6
                 }
             )
         super().__init__(config)
@@ -94,6 +103,9 @@ class ChatbotAgent(BaseAgent):
         self.escalation_threshold = config.custom_config.get("escalation_threshold", 3)
         self.enable_faq_integration = config.custom_config.get("enable_faq_integration", True)
         self.enable_context_memory = config.custom_config.get("enable_context_memory", True)
+        # Below this local classifier confidence, intents are recognized by the LLM
+        self.intent_confidence_threshold = config.custom_config.get("intent_confidence_threshold", 0.6)
+        self.last_intent_source = "classifier"
         
         # Conversation state
         self.conversation_history: List[Dict[str, Any]] = []
@@ -104,6 +116,12 @@ class ChatbotAgent(BaseAgent):
         # Knowledge base and FAQ integration
         self.faq_cache_key = "chatbot:faq_knowledge"
         self.knowledge_base: Dict[str, Any] = {}
+        self.knowledge_index = get_knowledge_index()
+        # Minimum index confidence to answer from an FAQ / past conversation without the LLM
+        self.faq_confidence_threshold = config.custom_config.get("faq_confidence_threshold", 0.7)
+        self.conversation_answer_threshold = config.custom_config.get("conversation_answer_threshold", 0.85)
+        # Minimum index confidence to use indexed web results instead of a new search
+        self.local_knowledge_threshold = config.custom_config.get("local_knowledge_threshold", 0.5)
         
         # Real-time knowledge integration
         self.web_search_client = None
@@ -122,11 +140,17 @@ class ChatbotAgent(BaseAgent):
         if not self.web_search_client:
             self.web_search_client = await get_web_search_client()
         if not self.llm_client:
-            self.llm_client = LLMManager()
+            self.llm_client = get_shared_llm_manager()
         
         # Initialize knowledge base with real-time data
         await self._load_knowledge_base_with_real_time_data()
         
+        # Retrain the intent classifier with intents the LLM assigned before
+        try:
+            await train_with_logged_intents(await get_database())
+        except Exception as e:
+            logger.warning(f"Intent classifier retraining skipped: {e}")
+        
         # Initialize conversation context
         self.conversation_history = []
         self.current_context = ConversationContext.GENERAL_INQUIRY
@@ -198,7 +222,8 @@ class ChatbotAgent(BaseAgent):
                 message, 
                 intent, 
                 conversation_context,
-                context
+                context,
+                user_id=user_id
             )
             
             # Add response to conversation history
@@ -207,6 +232,7 @@ class ChatbotAgent(BaseAgent):
                 "content": response["content"],
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "intent": intent.value,
+                "intent_source": self.last_intent_source,
                 "context": conversation_context.value,
                 "confidence": response.get("confidence", 0.8)
             }
@@ -249,7 +275,7 @@ class ChatbotAgent(BaseAgent):
     
     async def _recognize_intent(self, message: str, context: Optional[Dict[str, Any]] = None) -> IntentType:
         """
-        Recognize user intent from message using LLM.
+        Recognize user intent with the local classifier, falling back to the LLM.
         
         Args:
             message: User message
@@ -258,6 +284,36 @@ class ChatbotAgent(BaseAgent):
         Returns:
             Recognized intent type
         """
+        classifier = await load_intent_classifier()
+        label, confidence = classifier.predict(message)
+        if confidence >= self.intent_confidence_threshold:
+            self.last_intent_source = "classifier"
+            return IntentType(label)
+        
+        intent = await self._recognize_intent_with_llm(message, context)
+        if intent is None:
+            # LLM unavailable or unparseable: the classifier's best guess
+            self.last_intent_source = "classifier"
+            return IntentType(label)
+        
+        self.last_intent_source = "llm"
+        # Teach the classifier the label it was unsure about
+        classifier.learn(message, intent.value)
+        return intent
+    
+    async def _recognize_intent_with_llm(
+        self, message: str, context: Optional[Dict[str, Any]] = None
+    ) -> Optional[IntentType]:
+        """
+        Recognize user intent from message using LLM.
+        
+        Args:
+            message: User message
+            context: Additional context
+            
+        Returns:
+            Recognized intent type, or None if the LLM gave no usable answer
+        """
         # Create intent recognition prompt
         intent_prompt = f"""
         Analyze the following user message and classify the intent. Consider the conversation context if provided.
@@ -296,33 +352,14 @@ class ChatbotAgent(BaseAgent):
                 max_tokens=50
             )
             
-            # Parse response and map to enum
-            intent_text = response.strip().lower() if isinstance(response, str) else str(response).strip().lower()
-            
-            # Map common variations
-            intent_mapping = {
-                "greeting": IntentType.GREETING,
-                "question": IntentType.QUESTION,
-                "help_request": IntentType.HELP_REQUEST,
-                "help": IntentType.HELP_REQUEST,
-                "complaint": IntentType.COMPLAINT,
-                "compliment": IntentType.COMPLIMENT,
-                "goodbye": IntentType.GOODBYE,
-                "escalation_request": IntentType.ESCALATION_REQUEST,
-                "escalation": IntentType.ESCALATION_REQUEST,
-                "technical_issue": IntentType.TECHNICAL_ISSUE,
-                "technical": IntentType.TECHNICAL_ISSUE,
-                "feature_inquiry": IntentType.FEATURE_INQUIRY,
-                "feature": IntentType.FEATURE_INQUIRY,
-                "pricing_inquiry": IntentType.PRICING_INQUIRY,
-                "pricing": IntentType.PRICING_INQUIRY
-            }
+            # Parse response and map common variations to the enum
+            intent_value = normalize_label(response if isinstance(response, str) else str(response))
             
-            return intent_mapping.get(intent_text, IntentType.QUESTION)
+            return IntentType(intent_value) if intent_value else None
             
         except Exception as e:
             logger.warning(f"Intent recognition failed: {str(e)}")
-            return IntentType.QUESTION  # Default fallback
+            return None
     
     async def _determine_context(
         self, 
@@ -440,7 +477,8 @@ class ChatbotAgent(BaseAgent):
         message: str, 
         intent: IntentType, 
         context: ConversationContext,
-        additional_context: Optional[Dict[str, Any]] = None
+        additional_context: Optional[Dict[str, Any]] = None,
+        user_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate appropriate response based on message, intent, and context.
@@ -450,6 +488,7 @@ class ChatbotAgent(BaseAgent):
             intent: Recognized intent
             context: Conversation context
             additional_context: Additional context information
+            user_id: User ID, the only one whose past answers may be reused
             
         Returns:
             Response dictionary with content and metadata
@@ -458,7 +497,7 @@ class ChatbotAgent(BaseAgent):
         
         # Check FAQ first if enabled
         if self.enable_faq_integration:
-            faq_response = await self._check_faq(message, context)
+            faq_response = await self._check_faq(message, context, user_id)
             if faq_response:
                 return {
                     "content": faq_response["answer"],
@@ -541,7 +580,7 @@ class ChatbotAgent(BaseAgent):
             # Check if we should enhance with real-time knowledge
             enhanced_response = None
             if self.enable_real_time_search and await self._should_use_real_time_knowledge(message, intent, context):
-                real_time_info = await self._search_real_time_knowledge(message, intent, context)
+                real_time_info = await self._search_real_time_knowledge(message, intent, context, user_id)
                 if real_time_info and real_time_info.get("summary"):
                     prompt += f"""
                     
@@ -1088,72 +1127,43 @@ DO NOT provide generic advice when specific report data is available!
 
         return "\n".join(context_parts)
 
-    async def _check_faq(self, message: str, context: ConversationContext) -> Optional[Dict[str, Any]]:
+    async def _check_faq(
+        self, message: str, context: ConversationContext, user_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
-        Check FAQ knowledge base for relevant answers using the FAQ service.
+        Check the local knowledge index for an FAQ or past answer to the message.
         
         Args:
             message: User message
             context: Conversation context
+            user_id: User ID; only this user's past answers are considered
             
         Returns:
             FAQ response if found, None otherwise
         """
         try:
-            # FAQ service not implemented yet, skip FAQ search
-            # from ..services.faq_service import faq_service
-            logger.debug("FAQ service not available, skipping FAQ search")
-            return None
+            hits = self.knowledge_index.search(message, limit=3, sources=ANSWER_SOURCES, user_id=user_id)
+            if not hits:
+                return None
+            
+            best_match = hits[0]
+            # Answers from the user's past conversations were written for a
+            # different question, so they need a closer match than curated FAQ entries
+            threshold = self.faq_confidence_threshold
+            if best_match.document.source == "conversation":
+                threshold = self.conversation_answer_threshold
+            if best_match.confidence < threshold:
+                return None
             
-            # Map conversation context to FAQ category
-            category_mapping = {
-                ConversationContext.TECHNICAL_SUPPORT: "technical",
-                ConversationContext.ASSESSMENT_HELP: "assessments",
-                ConversationContext.PLATFORM_GUIDANCE: "platform",
-                ConversationContext.BILLING_SUPPORT: "billing",
-                ConversationContext.GENERAL_INQUIRY: None
-            }
-            
-            # Search FAQs using the service
-            search_context = {
-                "category": category_mapping.get(context)
+            return {
+                "answer": best_match.document.body,
+                "confidence": round(best_match.confidence, 3),
+                "related_questions": [
+                    hit.document.title for hit in hits[1:3] if hit.document.source == "faq"
+                ],
+                "faq_id": best_match.document.doc_id
             }
             
-            # Use the chatbot-specific FAQ search endpoint logic
-            from ..models.faq import FAQCategory
-            from ..services.faq_service import SearchMode
-            
-            category = None
-            if search_context.get("category"):
-                try:
-                    category = FAQCategory(search_context["category"])
-                except ValueError:
-                    pass
-            
-            results = await faq_service.search_faqs(
-                query=message,
-                category=category,
-                mode=SearchMode.HYBRID,
-                limit=3
-            )
-            
-            # Check if we have a good match
-            if results["results"]:
-                best_match = results["results"][0]
-                
-                # Return best match if confidence is high enough
-                if best_match["relevance_score"] > 0.7:
-                    return {
-                        "answer": best_match["short_answer"] or best_match["answer"],
-                        "confidence": best_match["relevance_score"],
-                        "related_questions": [
-                            r["question"] for r in results["results"][1:3]
-                        ],
-                        "faq_id": best_match["id"]
-                    }
-            
-            return None
-            
         except Exception as e:
             logger.warning(f"FAQ check failed: {str(e)}")
             return None
@@ -1533,20 +1543,49 @@ DO NOT provide generic advice when specific report data is available!
             # Load base knowledge base first
             await self._load_knowledge_base()
             
-            # Collect real-time knowledge updates
-            real_time_knowledge = await self._collect_real_time_knowledge()
-            
-            # Integrate real-time data into knowledge base
-            if real_time_knowledge:
-                self.knowledge_base["real_time_updates"] = real_time_knowledge
-                self.knowledge_base["last_update"] = datetime.now(timezone.utc).isoformat()
+            # The knowledge index is shared by all chatbot instances; only
+            # collect real-time knowledge again once the indexed copy is stale
+            if self.knowledge_index.source_age("web") > self.search_cache_ttl:
+                real_time_knowledge = await self._collect_real_time_knowledge()
                 
-                logger.info(f"Enhanced knowledge base with {len(real_time_knowledge)} real-time sources")
+                # Integrate real-time data into knowledge base
+                if real_time_knowledge:
+                    self.knowledge_base["real_time_updates"] = real_time_knowledge
+                    self.knowledge_base["last_update"] = datetime.now(timezone.utc).isoformat()
+                    
+                    logger.info(f"Enhanced knowledge base with {len(real_time_knowledge)} real-time sources")
             
         except Exception as e:
             logger.warning(f"Failed to load real-time knowledge data: {str(e)}")
             # Fall back to base knowledge base
             await self._load_knowledge_base()
+        
+        await self._refresh_knowledge_index()
+    
+    async def _refresh_knowledge_index(self) -> None:
+        """Incrementally sync the knowledge index with FAQ, web and conversation sources."""
+        index = self.knowledge_index
+        try:
+            index.sync_source("faq", faq_documents(self.knowledge_base.get("faq", [])))
+            
+            real_time_updates = self.knowledge_base.get("real_time_updates")
+            if real_time_updates:
+                index.sync_source("web", web_documents(
+                    result for results in real_time_updates.values() for result in results
+                ))
+            
+            # Past answers only grow, so fetch conversations resolved since the last refresh
+            since = None
+            if "conversation" in index.refreshed_at:
+                since = datetime.fromtimestamp(index.refreshed_at["conversation"], tz=timezone.utc)
+            conversations = await load_resolved_conversation_answers(await get_database(), since=since)
+            index.upsert(conversations)
+            index.refreshed_at["conversation"] = datetime.now(timezone.utc).timestamp()
+            
+            logger.debug(f"Knowledge index refreshed: {index.get_stats()}")
+            
+        except Exception as e:
+            logger.warning(f"Knowledge index refresh failed: {str(e)}")
     
     async def _collect_real_time_knowledge(self) -> Dict[str, Any]:
         """Collect real-time knowledge from various sources."""
@@ -1635,16 +1674,34 @@ DO NOT provide generic advice when specific report data is available!
             has_current_keywords
         )
     
-    async def _search_real_time_knowledge(self, message: str, intent: IntentType, context: ConversationContext) -> Dict[str, Any]:
+    async def _search_real_time_knowledge(
+        self, message: str, intent: IntentType, context: ConversationContext, user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Search for relevant real-time knowledge based on the message."""
         logger.debug("Searching real-time knowledge")
         
         try:
+            # Answer from already indexed knowledge when it matches well,
+            # skipping the web search and the summarization LLM call
+            hits = self.knowledge_index.search(message, limit=3, user_id=user_id)
+            local_hits = [hit for hit in hits if hit.confidence >= self.local_knowledge_threshold]
+            if local_hits:
+                return {
+                    "query": message,
+                    "sources": [
+                        {"title": hit.document.title, "snippet": hit.document.body, **hit.document.metadata}
+                        for hit in local_hits
+                    ],
+                    "summary": "\n".join(f"- {hit.document.title}: {hit.document.body}" for hit in local_hits),
+                    "knowledge_source": "index"
+                }
+            
             # Create search query based on message and context
             search_query = await self._create_contextual_search_query(message, intent, context)
             
             # Search for relevant real-time information
             search_results = await self.web_search_client.search(search_query, max_results=3)
+            self.knowledge_index.upsert(web_documents(search_results.get("results", [])))
             
             # Process and structure the results
             real_time_info = {
@@ -1755,7 +1812,7 @@ DO NOT provide generic advice when specific report data is available!
         """
         try:
             if not self.llm_client:
-                self.llm_client = LLMManager()
+                self.llm_client = get_shared_llm_manager()
             
             # Create LLM request
             from ..llm.interface import LLMRequest
@@ -1765,7 +1822,8 @@ DO NOT provide generic advice when specific report data is available!
                 system_prompt=system_prompt,
                 temperature=temperature,
                 max_tokens=max_tokens,
-                model="gpt-4"  # Use GPT-4 for better conversational responses
+                model="gpt-4",  # Use GPT-4 for better conversational responses
+                context={"priority": "interactive"}
             )
             
             # Generate response
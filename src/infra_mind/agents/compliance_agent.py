@@ -16,7 +16,7 @@ from .tools import ToolResult
 from .web_search import WebSearchClient, get_web_search_client
 from ..models.assessment import Assessment
 from ..llm.prompt_sanitizer import PromptSanitizer
-from ..llm.manager import LLMManager
+from ..llm.manager import get_shared_llm_manager
 
 logger = logging.getLogger(__name__)
 
@@ -163,7 +163,7 @@ class ComplianceAgent(BaseAgent):
             if not self.web_search_client:
                 self.web_search_client = await get_web_search_client()
             if not self.llm_client:
-                self.llm_client = LLMManager()
+                self.llm_client = get_shared_llm_manager()
             
             # Step 1: Collect real-time regulatory updates
             regulatory_updates = await self._collect_regulatory_updates()
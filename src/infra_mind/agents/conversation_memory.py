@@ -325,10 +325,10 @@ class ConversationMemory:
                 return None
             
             # Import LLM manager here to avoid circular imports
-            from ..llm.manager import LLMManager
+            from ..llm.manager import get_shared_llm_manager
             from ..llm.interface import LLMRequest
             
-            llm_manager = LLMManager()
+            llm_manager = get_shared_llm_manager()
             
             # Build conversation text
             conversation_text = "\n".join([
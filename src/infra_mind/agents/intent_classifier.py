@@ -0,0 +1,345 @@
+"""
+Local intent classifier for the Chatbot Agent.
+
+Classifying a chat message into one of the ``IntentType`` labels used to
+take a full LLM round-trip before the answer could even start. This module
+classifies messages in-process instead: word, word-bigram and character
+trigram features are hashed into a sparse vector and scored by a
+multinomial logistic regression, which takes tens of microseconds per
+message. The chatbot only falls back to the LLM when the classifier's
+confidence is below its threshold, and the LLM's answer is fed back as a
+training example.
+
+The model is trained on a built-in seed corpus plus intents the LLM
+assigned in past conversations (``conversation_history`` documents whose
+``bot_message.intent_source`` is ``"llm"``). Labels are normalized through
+``INTENT_ALIASES``, the same mapping used to parse LLM answers.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import re
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# LLM answers and logged labels to intent values
+INTENT_ALIASES: Dict[str, str] = {
+    "greeting": "greeting",
+    "question": "question",
+    "help_request": "help_request",
+    "help": "help_request",
+    "complaint": "complaint",
+    "compliment": "compliment",
+    "goodbye": "goodbye",
+    "escalation_request": "escalation_request",
+    "escalation": "escalation_request",
+    "technical_issue": "technical_issue",
+    "technical": "technical_issue",
+    "feature_inquiry": "feature_inquiry",
+    "feature": "feature_inquiry",
+    "pricing_inquiry": "pricing_inquiry",
+    "pricing": "pricing_inquiry",
+}
+
+SEED_EXAMPLES: Dict[str, Sequence[str]] = {
+    "greeting": (
+        "hi", "hello", "hey there", "hello, how are you?", "good morning", "good afternoon",
+        "hi team", "hey, anyone there?", "greetings", "hello infra mind", "hi, I'm new here",
+        "morning!", "good evening", "hey! nice to meet you", "hiya", "hello again",
+        "hi there, I just signed up", "howdy",
+    ),
+    "question": (
+        "what is an assessment?", "how does the recommendation engine work?",
+        "what cloud providers do you compare?", "which regions do you cover?",
+        "what does the compliance score mean?", "how long does an assessment take?",
+        "can you explain what a reserved instance is?", "is kubernetes a good fit for a small team?",
+        "what's the difference between aws and azure for ml workloads?",
+        "how are the cost estimates calculated?", "what data do you store about my company?",
+        "why did the report recommend gcp?", "what does multi-cloud mean here?",
+        "how accurate are the savings numbers?", "should I use serverless or containers?",
+        "what is the best database for analytics?", "where does the pricing data come from?",
+        "what happens after I submit my requirements?",
+    ),
+    "help_request": (
+        "can you help me fill out the assessment?", "I need help setting up my first assessment",
+        "help me understand my report", "how do I add a team member?",
+        "please help me configure my cloud credentials", "I'm stuck on the technical requirements step",
+        "can you walk me through the dashboard?", "how do I export my report to pdf?",
+        "I need assistance with the migration plan", "show me how to compare providers",
+        "help", "I don't know how to start", "guide me through creating a report",
+        "can someone help me with the form?", "how do I change my password?",
+        "I need help interpreting the recommendations", "how can I share a report with my cto?",
+        "assist me with the budget section",
+    ),
+    "complaint": (
+        "this is really frustrating", "your report was useless", "I'm not happy with the results",
+        "the recommendations are completely wrong", "this is the worst experience",
+        "I've been waiting forever for my report", "your support never answers",
+        "I'm disappointed with the platform", "this is unacceptable",
+        "the numbers in my report make no sense", "I was charged and got nothing",
+        "terrible service", "why is this so slow, this is annoying",
+        "I keep getting the same bad advice", "this tool wasted my time",
+        "very poor quality analysis", "I'm unhappy with how this works",
+        "nothing works the way it should",
+    ),
+    "compliment": (
+        "thanks, that was really helpful", "great job", "this report is excellent",
+        "I love this platform", "awesome, thank you so much", "the recommendations were spot on",
+        "amazing work", "this saved us a lot of money, thanks", "very useful analysis",
+        "you guys are great", "perfect, exactly what I needed", "impressive results",
+        "nice, that's super helpful", "the dashboard looks fantastic", "really appreciate the help",
+        "brilliant, thanks", "this is so good", "wonderful experience",
+    ),
+    "goodbye": (
+        "bye", "goodbye", "see you later", "thanks, bye", "that's all for now",
+        "I'm done, thanks", "talk to you later", "have a nice day", "catch you later",
+        "bye for now", "ok that's everything, goodbye", "I'll log off now", "see ya",
+        "good night", "nothing else, thanks bye", "cheers, bye", "later!", "farewell",
+    ),
+    "escalation_request": (
+        "I want to talk to a human", "let me speak to a real person", "connect me with support staff",
+        "can I talk to your manager?", "transfer me to an agent", "I need a human agent",
+        "escalate this please", "get me a person, not a bot", "I want to speak with someone",
+        "put me through to customer service", "is there a human I can talk to?",
+        "please escalate my issue", "I'd like to speak to a representative", "human please",
+        "stop the bot, I need a real support engineer", "can a person call me?",
+        "I need to speak to your sales team", "connect me to a live agent",
+    ),
+    "technical_issue": (
+        "the page won't load", "I get an error when I submit the form", "the report download fails",
+        "login is broken", "I'm getting a 500 error", "the dashboard is blank",
+        "my assessment is stuck at 50 percent", "the app crashes when I click export",
+        "there's a bug in the cost chart", "I can't upload my file", "the api returns an error",
+        "the website keeps timing out", "my session expired and I lost my data",
+        "the pdf is corrupted", "the charts are not rendering", "I can't log in, it says invalid token",
+        "something is broken on the settings page", "the workflow failed with an exception",
+    ),
+    "feature_inquiry": (
+        "do you support ibm cloud?", "can I compare three providers at once?",
+        "does the platform integrate with terraform?", "is there an api I can use?",
+        "can I schedule recurring assessments?", "do you have a slack integration?",
+        "what features does the enterprise plan include?", "can the report include compliance checks?",
+        "does it support multi-region deployments?", "can I customize the report template?",
+        "is there a mobile app?", "do you offer sso?", "can I invite my whole team?",
+        "does it generate infrastructure as code?", "what can the platform do?",
+        "do you support hipaa compliance analysis?", "can I export to excel?",
+        "is there a dark mode?",
+    ),
+    "pricing_inquiry": (
+        "how much does it cost?", "what are your pricing plans?", "is there a free tier?",
+        "how much is the enterprise plan?", "can I get a discount?", "how am I billed?",
+        "what's the price per assessment?", "do you offer annual billing?",
+        "why was I charged twice?", "how do I cancel my subscription?", "is there a trial?",
+        "what does the pro plan cost?", "can I pay by invoice?", "do you have startup pricing?",
+        "how much for 10 users?", "where can I see my invoices?", "what's included in the price?",
+        "refund please, I was billed by mistake",
+    ),
+}
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def _hash(feature: str, dimensions: int) -> int:
+    return zlib.crc32(feature.encode("utf-8")) & (dimensions - 1)
+
+
+def featurize(text: str, dimensions: int = 1 << 18) -> Dict[int, float]:
+    """Hashed word, word-bigram and character-trigram features, L2-normalized."""
+    lowered = text.lower()
+    words = _TOKEN.findall(lowered)
+    features = [f"w:{word}" for word in words]
+    features += [f"b:{a} {b}" for a, b in zip(words, words[1:])]
+    padded = f" {' '.join(words)} "
+    features += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+    if words:
+        features.append(f"first:{words[0]}")
+    if "?" in lowered:
+        features.append("punct:?")
+    features.append(f"len:{min(len(words), 12) // 3}")
+
+    counts: Dict[int, float] = {}
+    for feature in features:
+        index = _hash(feature, dimensions)
+        counts[index] = counts.get(index, 0.0) + 1.0
+    norm = math.sqrt(sum(value * value for value in counts.values())) or 1.0
+    return {index: value / norm for index, value in counts.items()}
+
+
+class IntentClassifier:
+    """
+    Multinomial logistic regression over hashed n-gram features.
+
+    Weights are stored sparsely (one row of class weights per feature seen
+    in training), so the model stays small and prediction only touches the
+    features of the message.
+    """
+
+    def __init__(self, labels: Sequence[str], dimensions: int = 1 << 18, l2: float = 1e-5):
+        self.labels = list(labels)
+        self.dimensions = dimensions
+        self.l2 = l2
+        self.weights: Dict[int, List[float]] = {}
+        self.bias = [0.0] * len(self.labels)
+        self._index = {label: i for i, label in enumerate(self.labels)}
+        self._lock = threading.Lock()
+        self.examples_seen = 0
+
+    def _probabilities(self, features: Dict[int, float]) -> List[float]:
+        scores = self.bias
+        weights = self.weights
+        for index, value in features.items():
+            row = weights.get(index)
+            if row is not None:
+                scores = [score + weight * value for score, weight in zip(scores, row)]
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        total = sum(exps)
+        return [e / total for e in exps]
+
+    def _step(self, features: Dict[int, float], label: str, learning_rate: float) -> None:
+        target = self._index[label]
+        probabilities = self._probabilities(features)
+        gradient = [p - (1.0 if k == target else 0.0) for k, p in enumerate(probabilities)]
+        for k, g in enumerate(gradient):
+            self.bias[k] -= learning_rate * g
+        decay = 1.0 - learning_rate * self.l2
+        for index, value in features.items():
+            row = self.weights.get(index)
+            if row is None:
+                row = self.weights[index] = [0.0] * len(self.labels)
+            for k, g in enumerate(gradient):
+                row[k] = row[k] * decay - learning_rate * g * value
+
+    def fit(
+        self,
+        examples: Iterable[Tuple[str, str]],
+        epochs: int = 30,
+        learning_rate: float = 1.0,
+        seed: int = 0
+    ) -> "IntentClassifier":
+        """Train from scratch on ``(text, label)`` pairs; unknown labels are skipped."""
+        data = [
+            (featurize(text, self.dimensions), label)
+            for text, label in examples
+            if label in self._index and text
+        ]
+        rng = random.Random(seed)
+        with self._lock:
+            self.weights = {}
+            self.bias = [0.0] * len(self.labels)
+            for epoch in range(epochs):
+                rng.shuffle(data)
+                rate = learning_rate / (1.0 + epoch * 0.2)
+                for features, label in data:
+                    self._step(features, label, rate)
+            self.examples_seen = len(data)
+        return self
+
+    def learn(self, text: str, label: str, learning_rate: float = 0.1) -> None:
+        """Online update from one labelled message (e.g. an LLM classification)."""
+        if label not in self._index or not text:
+            return
+        with self._lock:
+            self._step(featurize(text, self.dimensions), label, learning_rate)
+            self.examples_seen += 1
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """Most likely label and its probability."""
+        probabilities = self._probabilities(featurize(text, self.dimensions))
+        best = max(range(len(probabilities)), key=probabilities.__getitem__)
+        return self.labels[best], probabilities[best]
+
+
+def seed_examples() -> List[Tuple[str, str]]:
+    return [(text, label) for label, texts in SEED_EXAMPLES.items() for text in texts]
+
+
+def normalize_label(label: Optional[str]) -> Optional[str]:
+    """Map an LLM answer or logged label to an intent value."""
+    if not label:
+        return None
+    return INTENT_ALIASES.get(str(label).strip().strip('"\'.').lower())
+
+
+async def load_logged_intents(database, limit: int = 5000) -> List[Tuple[str, str]]:
+    """Messages the LLM classified in past conversations, newest first."""
+    cursor = database.conversation_history.find(
+        {"bot_message.intent_source": "llm"},
+        {"user_message.content": 1, "bot_message.intent": 1}
+    ).sort("timestamp", -1).limit(limit)
+
+    examples = []
+    async for turn in cursor:
+        text = (turn.get("user_message") or {}).get("content")
+        label = normalize_label((turn.get("bot_message") or {}).get("intent"))
+        if text and label:
+            examples.append((text, label))
+    return examples
+
+
+_classifier: Optional[IntentClassifier] = None
+_logged_intents_loaded = False
+
+# Bounds retraining on logged intents to a few seconds of CPU
+_MAX_TRAINING_STEPS = 60_000
+
+
+def get_intent_classifier() -> IntentClassifier:
+    """Get the process-wide classifier, trained on the seed corpus on first use."""
+    global _classifier
+
+    if _classifier is None:
+        _classifier = IntentClassifier(list(SEED_EXAMPLES)).fit(seed_examples())
+    return _classifier
+
+
+async def load_intent_classifier() -> IntentClassifier:
+    """
+    Get the process-wide classifier without blocking the event loop.
+
+    The first call trains the seed model in a worker thread; warm it at
+    startup so the first chat message does not wait for it.
+    """
+    global _classifier
+
+    if _classifier is None:
+        model = await asyncio.to_thread(_train, seed_examples())
+        if _classifier is None:
+            _classifier = model
+    return _classifier
+
+
+def _train(examples: List[Tuple[str, str]]) -> IntentClassifier:
+    epochs = max(3, min(30, _MAX_TRAINING_STEPS // max(1, len(examples))))
+    return IntentClassifier(list(SEED_EXAMPLES)).fit(examples, epochs=epochs)
+
+
+async def train_with_logged_intents(database) -> IntentClassifier:
+    """
+    Retrain the process-wide classifier on seed and logged intents, once per process.
+
+    Training runs in a worker thread on a new model, which replaces the
+    seed-only model when done; messages are classified by the old model
+    meanwhile.
+    """
+    global _classifier, _logged_intents_loaded
+
+    if _logged_intents_loaded:
+        return await load_intent_classifier()
+    _logged_intents_loaded = True
+
+    try:
+        logged = await load_logged_intents(database)
+    except Exception as e:
+        logger.warning(f"Could not load logged intents: {e}")
+        return await load_intent_classifier()
+
+    if logged:
+        _classifier = await asyncio.to_thread(_train, seed_examples() + logged)
+        logger.info(f"Intent classifier trained on {_classifier.examples_seen} examples ({len(logged)} logged)")
+    return await load_intent_classifier()
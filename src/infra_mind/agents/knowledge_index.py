@@ -0,0 +1,480 @@
+"""
+Local retrieval index for chatbot FAQ and knowledge base answers.
+
+Support questions the platform has answered many times used to go out to
+web search or the LLM. The chatbot now keeps an in-process index over:
+
+- ``faq``: the knowledge base FAQ entries
+- ``conversation``: question/answer pairs from resolved, non-escalated
+  conversations that were not about a specific assessment or report; these
+  are only returned to the user who had the conversation
+- ``web``: real-time search results collected earlier, reused as context
+
+Documents are ranked with BM25 over their title (question) and body
+(answer). Whether a match is good enough to answer without the LLM is
+decided by its confidence, which unlike the BM25 score is bounded and
+comparable across queries: how much of the query (IDF-weighted) the
+document's title and keywords cover, discounted when the query covers
+little of the title, so "error" does not confidently match
+"I get an error when exporting to PDF".
+
+Optionally, an ``embed`` function (a local embedding model; a network call
+per query would defeat the purpose) adds dense vectors, kept in a
+memory-mapped NumPy matrix. Lexical and dense rankings are merged by
+reciprocal rank fusion and confidence is the better of the two.
+
+The index is refreshed incrementally: documents are keyed by id and
+fingerprint, so a refresh only re-tokenizes (and re-embeds) documents
+that changed, and removes those that disappeared from their source.
+"""
+
+import hashlib
+import heapq
+import logging
+import math
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+logger = logging.getLogger(__name__)
+
+ANSWER_SOURCES = ("faq", "conversation")
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset("""
+a about an and are as at be been but by can could do does did for from have has how i if in into is it
+its me my of on or our please should so than that the their them then there these they this to us was
+we what when where which who why will with would you your
+""".split())
+
+
+def _stem(token: str) -> str:
+    """Crude suffix stripping so "pricing", "prices" and "price" match."""
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        token = token[:-1]
+    if len(token) > 5 and token.endswith("ing"):
+        token = token[:-3]
+    elif len(token) > 4 and token.endswith("ed"):
+        token = token[:-2]
+    if len(token) > 4 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased, stemmed word tokens without stopwords."""
+    return [_stem(token) for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+@dataclass(frozen=True)
+class KnowledgeDocument:
+    """One retrievable entry; ``title`` is what it answers, ``body`` the answer."""
+    doc_id: str
+    source: str
+    title: str
+    body: str
+    keywords: Tuple[str, ...] = ()
+    metadata: Dict[str, Any] = field(default_factory=dict, compare=False, hash=False)
+
+    @property
+    def fingerprint(self) -> str:
+        content = "\x1f".join((self.title, self.body, *self.keywords))
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SearchHit:
+    document: KnowledgeDocument
+    score: float
+    confidence: float
+
+
+class _VectorMatrix:
+    """Unit-normalized document vectors in a growable memory-mapped float32 matrix."""
+
+    def __init__(self, path: str, dimensions: int):
+        self.path = path
+        self.dimensions = dimensions
+        self.rows: Dict[str, int] = {}
+        self.free: List[int] = []
+        self.capacity = 0
+        self.matrix = None
+        self._ensure_capacity(64)
+
+    def _ensure_capacity(self, rows: int) -> None:
+        if rows <= self.capacity:
+            return
+        capacity = max(rows, self.capacity * 2)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "ab") as handle:
+            handle.truncate(capacity * self.dimensions * 4)
+        self.matrix = np.memmap(self.path, dtype=np.float32, mode="r+", shape=(capacity, self.dimensions))
+        self.capacity = capacity
+
+    def put(self, doc_id: str, vector: Sequence[float]) -> None:
+        row = self.rows.get(doc_id)
+        if row is None:
+            row = self.free.pop() if self.free else len(self.rows)
+            self._ensure_capacity(row + 1)
+            self.rows[doc_id] = row
+        values = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(values)) or 1.0
+        self.matrix[row] = values / norm
+
+    def delete(self, doc_id: str) -> None:
+        row = self.rows.pop(doc_id, None)
+        if row is not None:
+            self.matrix[row] = 0.0
+            self.free.append(row)
+
+    def similarities(self, vector: Sequence[float]) -> Dict[str, float]:
+        if not self.rows:
+            return {}
+        query = np.asarray(vector, dtype=np.float32)
+        query = query / (float(np.linalg.norm(query)) or 1.0)
+        used = max(self.rows.values()) + 1
+        scores = self.matrix[:used] @ query
+        return {doc_id: float(scores[row]) for doc_id, row in self.rows.items()}
+
+
+class KnowledgeIndex:
+    """Incremental BM25 (plus optional dense) index over knowledge documents."""
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        embed: Optional[Callable[[List[str]], Sequence[Sequence[float]]]] = None,
+        vector_path: Optional[str] = None,
+        vector_dimensions: Optional[int] = None
+    ):
+        """
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+            embed: Local embedding function for dense retrieval (optional)
+            vector_path: File backing the memory-mapped vector matrix
+            vector_dimensions: Embedding size
+        """
+        self.k1 = k1
+        self.b = b
+        self.documents: Dict[str, KnowledgeDocument] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self._norms: Optional[Dict[str, float]] = None
+        self._title_terms: Dict[str, FrozenSet[str]] = {}
+        self._keyword_terms: Dict[str, FrozenSet[str]] = {}
+        self._total_length = 0
+        self.refreshed_at: Dict[str, float] = {}
+
+        self.embed = None
+        self._vectors: Optional[_VectorMatrix] = None
+        if embed is not None:
+            if np is None or not vector_path or not vector_dimensions:
+                logger.warning("Dense retrieval needs numpy, vector_path and vector_dimensions; using BM25 only")
+            else:
+                self.embed = embed
+                self._vectors = _VectorMatrix(vector_path, vector_dimensions)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def upsert(self, documents: Iterable[KnowledgeDocument]) -> int:
+        """Add or replace documents; returns how many were new or changed."""
+        changed = []
+        for document in documents:
+            fingerprint = document.fingerprint
+            if self._fingerprints.get(document.doc_id) == fingerprint:
+                continue
+            self._remove_terms(document.doc_id)
+            self._add_terms(document)
+            self.documents[document.doc_id] = document
+            self._fingerprints[document.doc_id] = fingerprint
+            changed.append(document)
+
+        if changed and self._vectors is not None:
+            try:
+                vectors = self.embed([f"{d.title}\n{d.body}" for d in changed])
+                for document, vector in zip(changed, vectors):
+                    self._vectors.put(document.doc_id, vector)
+            except Exception as e:
+                logger.warning(f"Embedding {len(changed)} knowledge documents failed: {e}")
+        return len(changed)
+
+    def remove(self, doc_id: str) -> bool:
+        if doc_id not in self.documents:
+            return False
+        self._remove_terms(doc_id)
+        del self.documents[doc_id]
+        del self._fingerprints[doc_id]
+        if self._vectors is not None:
+            self._vectors.delete(doc_id)
+        return True
+
+    def sync_source(self, source: str, documents: Iterable[KnowledgeDocument]) -> Tuple[int, int]:
+        """Make ``source`` contain exactly ``documents``; returns (changed, removed)."""
+        documents = list(documents)
+        keep = {d.doc_id for d in documents}
+        stale = [doc_id for doc_id, d in self.documents.items() if d.source == source and doc_id not in keep]
+        for doc_id in stale:
+            self.remove(doc_id)
+        changed = self.upsert(documents)
+        self.refreshed_at[source] = time.time()
+        return changed, len(stale)
+
+    def source_age(self, source: str) -> float:
+        """Seconds since ``source`` was last refreshed (infinite if never)."""
+        refreshed = self.refreshed_at.get(source)
+        return time.time() - refreshed if refreshed else math.inf
+
+    def _add_terms(self, document: KnowledgeDocument) -> None:
+        title_terms = tokenize(document.title)
+        keyword_terms = tokenize(" ".join(document.keywords))
+        # Titles and keywords count twice: they say what the document is about
+        terms = (title_terms + keyword_terms) * 2 + tokenize(document.body)
+        counts: Dict[str, int] = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        for term, count in counts.items():
+            self._postings.setdefault(term, {})[document.doc_id] = count
+        self._lengths[document.doc_id] = len(terms)
+        self._doc_terms[document.doc_id] = tuple(counts)
+        self._norms = None
+        self._title_terms[document.doc_id] = frozenset(title_terms)
+        self._keyword_terms[document.doc_id] = frozenset(keyword_terms)
+        self._total_length += len(terms)
+
+    def _remove_terms(self, doc_id: str) -> None:
+        length = self._lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        self._norms = None
+        self._title_terms.pop(doc_id, None)
+        self._keyword_terms.pop(doc_id, None)
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+    def _length_norms(self) -> Dict[str, float]:
+        """Per-document BM25 length normalization, recomputed after changes."""
+        if self._norms is None:
+            average_length = self._total_length / len(self.documents)
+            self._norms = {
+                doc_id: self.k1 * (1 - self.b + self.b * length / average_length)
+                for doc_id, length in self._lengths.items()
+            }
+        return self._norms
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        n = len(self.documents)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def _weight(self, terms: Iterable[str]) -> float:
+        return sum(self._idf(term) for term in terms)
+
+    def _confidence(self, query_terms: FrozenSet[str], doc_id: str) -> float:
+        """Query coverage by title and keywords, discounted by uncovered title terms."""
+        title_terms = self._title_terms.get(doc_id, frozenset())
+        covered = title_terms | self._keyword_terms.get(doc_id, frozenset())
+        query_weight = self._weight(query_terms)
+        if not query_weight or not covered:
+            return 0.0
+        query_coverage = self._weight(query_terms & covered) / query_weight
+        title_weight = self._weight(title_terms)
+        title_coverage = self._weight(query_terms & title_terms) / title_weight if title_weight else 1.0
+        return query_coverage * (0.5 + 0.5 * title_coverage)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 3,
+        sources: Optional[Sequence[str]] = None,
+        user_id: Optional[str] = None
+    ) -> List[SearchHit]:
+        """
+        Best matching documents, optionally restricted to ``sources``.
+
+        Past conversation answers are only matched for the ``user_id`` that
+        had the conversation, so one user's answers never reach another.
+        """
+        query_terms = frozenset(tokenize(query))
+        if not self.documents or (not query_terms and self._vectors is None):
+            return []
+
+        norms = self._length_norms()
+        scores: Dict[str, float] = {}
+        for term in query_terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            weight = self._idf(term) * (self.k1 + 1)
+            for doc_id, tf in postings.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * tf / (tf + norms[doc_id])
+
+        def allowed(doc_id: str) -> bool:
+            document = self.documents[doc_id]
+            if sources is not None and document.source not in sources:
+                return False
+            return document.source != "conversation" or (
+                user_id is not None and document.metadata.get("user_id") == user_id
+            )
+
+        candidates = [d for d in scores if allowed(d)]
+        lexical = heapq.nlargest(limit * 5, candidates, key=scores.__getitem__)
+        confidence = {doc_id: self._confidence(query_terms, doc_id) for doc_id in lexical}
+
+        if self._vectors is None:
+            ranked = lexical[:limit]
+        else:
+            try:
+                similarities = self._vectors.similarities(self.embed([query])[0])
+            except Exception as e:
+                logger.warning(f"Query embedding failed, using BM25 only: {e}")
+                similarities = {}
+            dense = heapq.nlargest(limit * 5, (d for d in similarities if allowed(d)), key=similarities.__getitem__)
+            fused: Dict[str, float] = {}
+            for ranking in (lexical, dense):
+                for rank, doc_id in enumerate(ranking):
+                    fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (60 + rank)
+            ranked = sorted(fused, key=fused.__getitem__, reverse=True)[:limit]
+            for doc_id in ranked:
+                confidence[doc_id] = max(confidence.get(doc_id, 0.0), similarities.get(doc_id, 0.0))
+
+        return [
+            SearchHit(self.documents[doc_id], scores.get(doc_id, 0.0), confidence.get(doc_id, 0.0))
+            for doc_id in ranked
+        ]
+
+    def best_answer(
+        self,
+        query: str,
+        min_confidence: float = 0.75,
+        user_id: Optional[str] = None
+    ) -> Optional[SearchHit]:
+        """The best FAQ or past answer if it is confident enough to answer directly."""
+        hits = self.search(query, limit=1, sources=ANSWER_SOURCES, user_id=user_id)
+        if hits and hits[0].confidence >= min_confidence:
+            return hits[0]
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        by_source: Dict[str, int] = {}
+        for document in self.documents.values():
+            by_source[document.source] = by_source.get(document.source, 0) + 1
+        return {
+            "documents": len(self.documents),
+            "terms": len(self._postings),
+            "by_source": by_source,
+            "dense": self._vectors is not None
+        }
+
+
+def faq_documents(faq_entries: Iterable[Dict[str, Any]]) -> List[KnowledgeDocument]:
+    """Knowledge base FAQ entries as documents."""
+    documents = []
+    for entry in faq_entries:
+        question, answer = entry.get("question"), entry.get("answer")
+        if question and answer:
+            documents.append(KnowledgeDocument(
+                doc_id=f"faq:{hashlib.sha1(question.encode('utf-8')).hexdigest()[:16]}",
+                source="faq",
+                title=question,
+                body=answer,
+                keywords=tuple(entry.get("keywords", ())),
+                metadata={"confidence": entry.get("confidence", 0.9)}
+            ))
+    return documents
+
+
+def web_documents(results: Iterable[Dict[str, Any]]) -> List[KnowledgeDocument]:
+    """Web search results (title, snippet, url) as context documents."""
+    documents = []
+    for result in results:
+        title, snippet = result.get("title"), result.get("snippet")
+        key = result.get("url") or title
+        if title and snippet:
+            documents.append(KnowledgeDocument(
+                doc_id=f"web:{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}",
+                source="web",
+                title=title,
+                body=snippet,
+                metadata={"url": result.get("url")}
+            ))
+    return documents
+
+
+async def load_resolved_conversation_answers(
+    database,
+    since: Optional[datetime] = None,
+    limit: int = 2000
+) -> List[KnowledgeDocument]:
+    """
+    Question/answer pairs from resolved conversations.
+
+    Only conversations that were not escalated, not rated poorly and not
+    about a particular assessment or report are used. Each document keeps
+    the conversation's ``user_id``, and ``KnowledgeIndex.search`` only
+    returns it to that user.
+    """
+    query: Dict[str, Any] = {
+        "status": "resolved",
+        "escalated": {"$ne": True},
+        "assessment_id": None,
+        "report_id": None,
+        "$or": [{"satisfaction_rating": None}, {"satisfaction_rating": {"$gte": 4}}]
+    }
+    if since is not None:
+        query["last_activity"] = {"$gt": since}
+
+    cursor = database.conversations.find(query, {"messages": 1, "user_id": 1}).sort("last_activity", -1).limit(limit)
+
+    documents = []
+    async for conversation in cursor:
+        owner = conversation.get("user_id")
+        if not owner:
+            continue
+        messages = conversation.get("messages") or []
+        for i, (question, answer) in enumerate(zip(messages, messages[1:])):
+            metadata = answer.get("metadata") or {}
+            if (
+                question.get("role") == "user"
+                and answer.get("role") == "assistant"
+                and question.get("content")
+                and answer.get("content")
+                and not metadata.get("escalation_triggered")
+                and metadata.get("knowledge_source") in (None, "llm", "faq")
+            ):
+                documents.append(KnowledgeDocument(
+                    doc_id=f"conversation:{conversation['_id']}:{i}",
+                    source="conversation",
+                    title=question["content"],
+                    body=answer["content"],
+                    metadata={"user_id": str(owner)}
+                ))
+    return documents
+
+
+_knowledge_index: Optional[KnowledgeIndex] = None
+
+
+def get_knowledge_index() -> KnowledgeIndex:
+    """Get the process-wide chatbot knowledge index."""
+    global _knowledge_index
+
+    if _knowledge_index is None:
+        _knowledge_index = KnowledgeIndex()
+    return _knowledge_index
@@ -14,7 +14,7 @@ from .tools import ToolResult
 from .web_search import get_web_search_client
 from ..models.assessment import Assessment
 from ..llm.prompt_sanitizer import PromptSanitizer
-from ..llm.manager import LLMManager
+from ..llm.manager import get_shared_llm_manager
 
 logger = logging.getLogger(__name__)
 
@@ -118,7 +118,7 @@ class MLOpsAgent(BaseAgent):
             if not self.web_search_client:
                 self.web_search_client = await get_web_search_client()
             if not self.llm_client:
-                self.llm_client = LLMManager()
+                self.llm_client = get_shared_llm_manager()
             
             # Step 1: Analyze ML workload requirements with LLM enhancement
             ml_analysis = await self._analyze_ml_requirements_with_llm()
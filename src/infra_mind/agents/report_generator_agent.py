@@ -5,10 +5,11 @@ This agent specializes in generating comprehensive reports from assessment data
 and agent recommendations, producing executive summaries and technical documentation.
 """
 
+import asyncio
 import logging
 import json
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Callable, Awaitable
 from dataclasses import dataclass, field
 from pathlib import Path
 import uuid
@@ -156,6 +157,9 @@ class ReportGeneratorAgent(BaseAgent):
         # Enhanced report templates
         self.report_templates = self._load_enhanced_report_templates()
         
+        # Sections are independent LLM calls; generate this many at a time
+        self.section_concurrency = config.custom_config.get("section_concurrency", 4)
+        
         # Professional report capabilities
         self.professional_features = {
             "executive_dashboards": True,
@@ -869,7 +873,8 @@ class ReportGeneratorAgent(BaseAgent):
             "executive": {
                 "title_template": "Infrastructure Assessment Report - {company_name}",
                 "sections": [
-                    {"title": "Executive Summary", "order": 1},
+                    {"title": "Executive Summary", "order": 1,
+                     "depends_on": ["Key Recommendations", "Investment Summary", "Risk Assessment"]},
                     {"title": "Business Context", "order": 2},
                     {"title": "Key Recommendations", "order": 3},
                     {"title": "Investment Summary", "order": 4},
@@ -892,7 +897,8 @@ class ReportGeneratorAgent(BaseAgent):
             "full": {
                 "title_template": "Complete Infrastructure Assessment - {company_name}",
                 "sections": [
-                    {"title": "Executive Summary", "order": 1},
+                    {"title": "Executive Summary", "order": 1,
+                     "depends_on": ["Recommendations Overview", "Cost Analysis", "Risk Assessment & Mitigation"]},
                     {"title": "Business Context & Goals", "order": 2},
                     {"title": "Current State Analysis", "order": 3},
                     {"title": "Technical Requirements", "order": 4},
@@ -901,7 +907,7 @@ class ReportGeneratorAgent(BaseAgent):
                     {"title": "Cost Analysis", "order": 7},
                     {"title": "Implementation Roadmap", "order": 8},
                     {"title": "Risk Assessment & Mitigation", "order": 9},
-                    {"title": "Next Steps", "order": 10}
+                    {"title": "Next Steps", "order": 10, "depends_on": ["Implementation Roadmap"]}
                 ]
             }
         }
@@ -934,11 +940,21 @@ class ReportGeneratorAgent(BaseAgent):
             # Collect real-time research data to enhance the report
             research_data = await self._collect_research_data(assessment, recommendations)
             
-            # Generate the report with enhanced data
-            report = await self._generate_report(assessment, recommendations, report_type, research_data)
+            # The database id is chosen up front so streamed sections reference
+            # the report document that is stored once generation finishes
+            planned_report_id = str(ObjectId())
+            
+            async def publish_section(report: Report, section: ReportSection) -> None:
+                await self._publish_section(report, section, planned_report_id)
+            
+            # Generate the report with enhanced data, streaming sections as they complete
+            report = await self._generate_report(
+                assessment, recommendations, report_type, research_data,
+                on_section=publish_section
+            )
             
             # Store report in database
-            db_report_id = await self._store_report_in_database(report, assessment)
+            db_report_id = await self._store_report_in_database(report, assessment, planned_report_id)
             
             # Create result
             result = AgentResult(
@@ -1098,8 +1114,10 @@ class ReportGeneratorAgent(BaseAgent):
         
         return research_data
     
-    async def _store_report_in_database(self, report: "Report", assessment: Any) -> Optional[str]:
-        """Store the generated report in the database."""
+    async def _store_report_in_database(
+        self, report: "Report", assessment: Any, db_report_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Store the generated report in the database, under ``db_report_id`` if given."""
         try:
             from ..models.report import Report as DBReport, ReportType, ReportFormat, ReportStatus
             from ..schemas.base import Priority
@@ -1113,6 +1131,7 @@ class ReportGeneratorAgent(BaseAgent):
             
             # Create database report object
             db_report = DBReport(
+                id=ObjectId(db_report_id) if db_report_id else None,
                 assessment_id=str(assessment.id),
                 user_id=getattr(assessment, 'user_id', 'anonymous_user'),
                 title=report.title,
@@ -1140,6 +1159,7 @@ class ReportGeneratorAgent(BaseAgent):
                 },
                 metadata={
                     **report.metadata,
+                    "generation_report_id": report.id,
                     "agent_generated": True,
                     "report_format": "markdown",
                     "generation_method": "llm_enhanced"
@@ -1229,8 +1249,22 @@ class ReportGeneratorAgent(BaseAgent):
         
         return list(tech_topics)[:4]  # Return max 4 tech topics
     
-    async def _generate_report(self, assessment: Any, recommendations: List[Any], report_type: str, research_data: Dict[str, Any] = None) -> Report:
-        """Generate a complete report based on assessment and recommendations."""
+    async def _generate_report(
+        self,
+        assessment: Any,
+        recommendations: List[Any],
+        report_type: str,
+        research_data: Dict[str, Any] = None,
+        on_section: Optional[Callable[[Report, ReportSection], Awaitable[None]]] = None
+    ) -> Report:
+        """
+        Generate a complete report based on assessment and recommendations.
+        
+        Sections are generated concurrently (at most ``section_concurrency`` at
+        a time), each starting once the sections it declares in ``depends_on``
+        are done, and generated with those sections as input.
+        ``on_section`` is awaited with each section as it completes.
+        """
         # Get template for report type
         template = self.report_templates.get(report_type, self.report_templates["full"])
         
@@ -1276,29 +1310,140 @@ class ReportGeneratorAgent(BaseAgent):
         )
         
         # Generate sections based on template with research data
-        for section_config in template["sections"]:
-            section = await self._generate_section(
-                section_config["title"],
-                section_config["order"],
-                assessment,
-                recommendations,
-                research_data
-            )
+        section_configs = self._order_section_dependencies(template["sections"])
+        semaphore = asyncio.Semaphore(self.section_concurrency)
+        tasks: Dict[str, asyncio.Task] = {}
+        
+        async def generate(section_config: Dict[str, Any]) -> ReportSection:
+            # Wait for dependencies outside the semaphore so they can take the slots
+            dependencies = {}
+            for dependency in section_config.get("depends_on", []):
+                dependencies[dependency] = await tasks[dependency]
+            async with semaphore:
+                section = await self._generate_section(
+                    section_config["title"],
+                    section_config["order"],
+                    assessment,
+                    recommendations,
+                    research_data,
+                    dependencies=dependencies
+                )
             report.add_section(section)
+            if on_section:
+                await on_section(report, section)
+            return section
+        
+        for section_config in section_configs:
+            tasks[section_config["title"]] = asyncio.create_task(generate(section_config))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            # Fail like the sequential version did: first error wins, nothing left running
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
         
         return report
     
-    async def _generate_section(self, title: str, order: int, assessment: Any, recommendations: List[Any], research_data: Dict[str, Any] = None) -> ReportSection:
-        """Generate a specific section of the report with real data integration."""
+    def _order_section_dependencies(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Order section configs so every section comes after its dependencies.
+        
+        Unknown dependencies are dropped with a warning; cycles raise ValueError.
+        """
+        by_title = {section["title"]: section for section in sections}
+        ordered: List[Dict[str, Any]] = []
+        state: Dict[str, str] = {}
+        
+        def visit(title: str) -> None:
+            if state.get(title) == "done":
+                return
+            if state.get(title) == "visiting":
+                raise ValueError(f"Circular report section dependency involving '{title}'")
+            state[title] = "visiting"
+            section = by_title[title]
+            depends_on = []
+            for dependency in section.get("depends_on", []):
+                if dependency in by_title:
+                    depends_on.append(dependency)
+                    visit(dependency)
+                else:
+                    logger.warning(f"Section '{title}' depends on unknown section '{dependency}'")
+            state[title] = "done"
+            ordered.append({**section, "depends_on": depends_on})
+        
+        for section in sections:
+            visit(section["title"])
+        return ordered
+    
+    async def _publish_section(self, report: Report, section: ReportSection, db_report_id: str) -> None:
+        """Persist a completed section and stream it to clients watching the assessment."""
+        try:
+            from ..models.report import ReportSection as DBReportSection
+            
+            await DBReportSection(
+                report_id=db_report_id,
+                section_id=section.section_id,
+                title=section.title,
+                order=section.order,
+                content=section.content,
+                is_interactive=section.is_interactive,
+                drill_down_data=section.drill_down_data,
+                charts_config=section.charts_config,
+                generated_by=section.generated_by
+            ).insert()
+        except Exception as e:
+            logger.warning(f"Failed to persist report section '{section.title}': {e}")
+        
+        try:
+            from ..core.dependencies import get_event_manager
+            from ..orchestration.events import AgentEvent, EventType
+            
+            template = self.report_templates.get(report.report_type, self.report_templates["full"])
+            event_manager = await get_event_manager()
+            await event_manager.publish(AgentEvent(
+                event_type=EventType.REPORT_SECTION_GENERATED,
+                agent_name=self.name,
+                data={
+                    "assessment_id": str(report.assessment_id),
+                    "report_id": db_report_id,
+                    "report_type": report.report_type,
+                    "section": section.to_dict(),
+                    "completed_sections": len(report.sections),
+                    "total_sections": len(template["sections"])
+                }
+            ))
+        except Exception as e:
+            logger.warning(f"Failed to publish report section '{section.title}': {e}")
+    
+    async def _generate_section(
+        self,
+        title: str,
+        order: int,
+        assessment: Any,
+        recommendations: List[Any],
+        research_data: Dict[str, Any] = None,
+        dependencies: Optional[Dict[str, ReportSection]] = None
+    ) -> ReportSection:
+        """
+        Generate a specific section of the report with real data integration.
+        
+        ``dependencies`` are the completed sections this one declares in
+        ``depends_on``, keyed by title.
+        """
         content = ""
+        dependencies = dependencies or {}
         
         # Use LLM-powered content generation with research data
         if research_data and len(research_data.get("industry_insights", {})) > 0:
-            content = await self._generate_section_with_llm(title, assessment, recommendations, research_data)
+            content = await self._generate_section_with_llm(title, assessment, recommendations, research_data, dependencies)
         else:
             # Fallback to original content generation
             if title == "Executive Summary":
-                content = await self._generate_executive_summary_enhanced(assessment, recommendations, research_data)
+                content = await self._generate_executive_summary_enhanced(
+                    assessment, recommendations, research_data, dependencies
+                )
             elif title == "Business Context" or title == "Business Context & Goals":
                 content = self._generate_business_context(assessment)
             elif title == "Current State Analysis":
@@ -1350,15 +1495,48 @@ class ReportGeneratorAgent(BaseAgent):
             section_id=str(ObjectId())  # Use ObjectId instead of uuid
         )
     
-    async def _generate_section_with_llm(self, title: str, assessment: Any, recommendations: List[Any], research_data: Dict[str, Any]) -> str:
+    async def _generate_section_with_llm(
+        self,
+        title: str,
+        assessment: Any,
+        recommendations: List[Any],
+        research_data: Dict[str, Any],
+        dependencies: Optional[Dict[str, ReportSection]] = None
+    ) -> str:
         """Generate section content using LLM with research data enhancement."""
         # This is a simplified version - in a full implementation, this would use the LLM
         # to generate enhanced content based on the research data
-        return f"Enhanced {title} content with research data integration (LLM-generated content would go here)"
+        content = f"Enhanced {title} content with research data integration (LLM-generated content would go here)"
+        highlights = self._summarize_dependency_sections(dependencies or {})
+        if highlights:
+            content += "\n\n" + highlights
+        return content
     
-    async def _generate_executive_summary_enhanced(self, assessment: Any, recommendations: List[Any], research_data: Dict[str, Any] = None) -> str:
-        """Generate enhanced executive summary with research data."""
-        return self._generate_executive_summary(assessment, recommendations)
+    async def _generate_executive_summary_enhanced(
+        self,
+        assessment: Any,
+        recommendations: List[Any],
+        research_data: Dict[str, Any] = None,
+        dependencies: Optional[Dict[str, ReportSection]] = None
+    ) -> str:
+        """Generate enhanced executive summary with research data and the sections it summarizes."""
+        summary = self._generate_executive_summary(assessment, recommendations)
+        highlights = self._summarize_dependency_sections(dependencies or {})
+        if highlights:
+            summary += "\n\n" + highlights
+        return summary
+    
+    def _summarize_dependency_sections(self, dependencies: Dict[str, ReportSection], max_lines: int = 4) -> str:
+        """Highlights of completed sections for a section that summarizes them ("" if none)."""
+        parts = []
+        for title, section in dependencies.items():
+            lines = [line.strip() for line in section.content.splitlines() if line.strip()]
+            if lines:
+                parts.append(f"\n*{title}*")
+                parts.extend(lines[:max_lines])
+        if not parts:
+            return ""
+        return "\n".join(["**Highlights from the Report:**", *parts])
     
     async def _generate_current_state_analysis_enhanced(self, assessment: Any, research_data: Dict[str, Any] = None) -> str:
         """Generate enhanced current state analysis with research data."""
@@ -22,7 +22,7 @@ from .tools import ToolResult
 from .web_search import WebSearchClient, get_web_search_client
 from ..models.assessment import Assessment
 from ..llm.prompt_sanitizer import PromptSanitizer
-from ..llm.manager import LLMManager
+from ..llm.manager import get_shared_llm_manager
 
 logger = logging.getLogger(__name__)
 
@@ -189,7 +189,7 @@ class SimulationAgent(BaseAgent):
             if not self.web_search_client:
                 self.web_search_client = await get_web_search_client()
             if not self.llm_client:
-                self.llm_client = LLMManager()
+                self.llm_client = get_shared_llm_manager()
             
             # Step 1: Collect real-time performance benchmarks and data
             performance_benchmarks = await self._collect_performance_benchmarks()
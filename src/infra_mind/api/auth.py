@@ -13,7 +13,7 @@ import logging
 from datetime import datetime
 
 from ..core.auth import (
-    auth_service, AuthenticationError, security, get_current_active_user,
+    auth_service, AuthenticationError, security, get_current_active_user, get_current_user_with_credentials,
     log_authentication_event, log_security_event, AuditEventType, AuditSeverity
 )
 from ..models.user import User
@@ -420,7 +420,7 @@ async def get_profile(
 async def update_profile(
     request: ProfileUpdateRequest,
     http_request: Request,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_user_with_credentials)
 ):
     """
     Update user profile with comprehensive validation.
@@ -503,7 +503,7 @@ async def update_profile(
 async def change_password(
     request: ChangePasswordRequest,
     http_request: Request,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_user_with_credentials)
 ):
     """
     Change user password with comprehensive validation.
@@ -1,16 +1,7 @@
 """
 API endpoints package.
-"""
 
-# Import all endpoint modules to make them available
-from . import scenarios
-from . import validation
-from . import experiments
-from . import feedback
-from . import quality
-from . import vendor_lockin
-from . import rollback
-from . import budget_forecasting
-from . import change_impact
-from . import gitops
-from . import approval_workflows
\ No newline at end of file
+Endpoint modules are imported by ``api.routes`` (core routers) or mounted
+on first use by ``api.lazy_routes``; nothing is imported here so that
+loading one endpoint does not load all of them.
+"""
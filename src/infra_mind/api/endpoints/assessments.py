@@ -30,15 +30,19 @@ from ...schemas.base import AssessmentStatus, Priority, CloudProvider, Recommend
 from .auth import get_current_user
 from ...core.smart_defaults import smart_get, SmartDefaults
 from ...models.user import User
-from ...core.dependencies import DatabaseDep, CacheManagerDep  # Dependency injection
+from ...core.dependencies import DatabaseDep, CacheManagerDep, LoadersDep  # Dependency injection
+from ..streaming_export import CURSOR_BATCH_SIZE, export_projection, export_response
+from ..pagination import keyset_query, keyset_sort, split_page
 from ...core.config import settings
 from ...workflows.orchestrator import agent_orchestrator, OrchestrationConfig
+from ...orchestration.admission_control import CELERY_PRIORITIES, WorkloadClass, admit_assessment
 from ...workflows.parallel_assessment_workflow import ParallelAssessmentWorkflow as AssessmentWorkflow  # 10x faster parallel execution
 from ...agents.cloud_engineer_agent import CloudEngineerAgent
 from ...agents.cto_agent import CTOAgent
 from ...agents.mlops_agent import MLOpsAgent
 from ...agents.compliance_agent import ComplianceAgent
 from ...services.report_service import ReportService
+from ...services.dashboard_stats import DashboardStatsStore
 from ...agents.base import AgentRole
 from ...services.advanced_compliance_engine import AdvancedComplianceEngine, ComplianceFramework
 from ...services.predictive_cost_modeling import PredictiveCostModeling, CostScenario
@@ -436,6 +440,21 @@ async def start_assessment_workflow(assessment: Assessment, app_state=None, db=N
         await broadcast_update("failed", 20.0, f"Workflow failed: {str(e)}")
 
 
+async def run_admitted_assessment_workflow(
+    assessment: Assessment,
+    workload_class: WorkloadClass = WorkloadClass.INTERACTIVE,
+    app_state=None,
+    db=None
+):
+    """Run ``start_assessment_workflow`` once the admission controller admits it."""
+    async with admit_assessment(assessment, workload_class) as admission:
+        logger.info(
+            f"Assessment {assessment.id} admitted as {workload_class.value} "
+            f"after {admission.queue_wait_seconds:.1f}s in queue"
+        )
+        await start_assessment_workflow(assessment, app_state, db)
+
+
 async def generate_advanced_analytics(assessment: Assessment, app_state=None, broadcast_update=None):
     """Generate advanced analytics and metrics automatically after report generation."""
     logger.info(f"Starting automated advanced analytics generation for assessment {assessment.id}")
@@ -1480,7 +1499,8 @@ async def create_assessment(
                     celery_task = process_assessment.apply_async(
                         args=[str(assessment.id)],
                         queue='assessments',
-                        routing_key='assessment'
+                        routing_key='assessment',
+                        priority=CELERY_PRIORITIES[WorkloadClass.INTERACTIVE]
                     )
                     celery_task_id = celery_task.id
                     logger.info(f"✅ Assessment {assessment.id} queued via Celery to 'assessments' queue. Task ID: {celery_task_id}")
@@ -1570,6 +1590,51 @@ async def create_assessment(
         )
 
 
+ASSESSMENT_EXPORT_COLUMNS = {
+    "id": "_id",
+    "title": "title",
+    "company_name": "business_requirements.company_name",
+    "industry": "business_requirements.industry",
+    "status": "status",
+    "priority": "priority",
+    "completion_percentage": "completion_percentage",
+    "recommendations_generated": "recommendations_generated",
+    "reports_generated": "reports_generated",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "completed_at": "completed_at",
+}
+
+
+@router.get("/export")
+async def export_assessments(
+    db: DatabaseDep,
+    current_user: User = Depends(get_current_user),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Export format: ndjson or csv"),
+    status_filter: Optional[AssessmentStatus] = Query(None, description="Filter by status"),
+    priority_filter: Optional[Priority] = Query(None, description="Filter by priority")
+):
+    """
+    Export all assessments of the current user as NDJSON or CSV.
+
+    Rows are streamed from a projected cursor as they are read, so memory
+    use does not grow with the number of assessments.
+    """
+    query_filter = {"user_id": str(current_user.id)}
+    if status_filter:
+        query_filter["status"] = status_filter.value
+    if priority_filter:
+        query_filter["priority"] = priority_filter.value
+
+    cursor = db.assessments.find(
+        query_filter,
+        export_projection(ASSESSMENT_EXPORT_COLUMNS),
+        batch_size=CURSOR_BATCH_SIZE
+    ).sort([("created_at", -1), ("_id", -1)])
+
+    return export_response(cursor, ASSESSMENT_EXPORT_COLUMNS, format, "assessments")
+
+
 @router.get("/{assessment_id}")
 async def get_assessment(
     assessment_id: str,
@@ -1683,8 +1748,11 @@ async def get_assessment(
 
 @router.get("/", response_model=AssessmentListResponse)
 async def list_assessments(
-    page: int = Query(1, ge=1, description="Page number"),
+    loaders: LoadersDep,
+    page: int = Query(1, ge=1, description="Page number (ignored when a cursor is given)"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    approximate_count: bool = Query(False, description="Take the total from cached stats instead of counting"),
     status_filter: Optional[AssessmentStatus] = Query(None, description="Filter by status"),
     priority_filter: Optional[Priority] = Query(None, description="Filter by priority"),
     current_user: User = Depends(get_current_user)
@@ -1692,8 +1760,12 @@ async def list_assessments(
     """
     List all assessments for the current user.
     
-    Returns a paginated list of assessments with filtering options.
-    Includes summary information for each assessment.
+    Returns a paginated list of assessments, newest first, with filtering
+    options. Pass ``next_cursor`` back as ``cursor`` to page through the list;
+    every cursor page is one index seek, while ``page`` offsets get slower the
+    deeper they go and are kept for existing clients.
+    Includes summary information for each assessment. Recommendation and
+    report counts for the whole page are loaded with one grouped query each.
     """
     try:
         # Build query with filters
@@ -1706,9 +1778,23 @@ async def list_assessments(
         # Users can only see their own assessments
         query_filter["user_id"] = str(current_user.id)
         
-        # Get total count and paginated results
-        total = await Assessment.find(query_filter).count()
-        assessments = await Assessment.find(query_filter).skip((page - 1) * limit).limit(limit).to_list()
+        # Fetch one extra row to learn whether there is a next page
+        skip = 0 if cursor else (page - 1) * limit
+        assessments = await Assessment.find(keyset_query(query_filter, cursor))\
+            .sort(keyset_sort())\
+            .skip(skip)\
+            .limit(limit + 1)\
+            .to_list()
+        assessments, next_cursor = split_page(assessments, limit)
+
+        total = None
+        if approximate_count and not priority_filter:
+            total = await DashboardStatsStore(Assessment.get_motor_collection().database).approximate_count(
+                str(current_user.id), "assessments", status=status_filter
+            )
+        total_is_approximate = total is not None
+        if total is None:
+            total = await Assessment.find(query_filter).count()
         
         # Sync completion percentages for assessments that need it
         for assessment in assessments:
@@ -1717,6 +1803,14 @@ async def list_assessments(
                 await assessment.save()
         
         logger.info(f"Listed {len(assessments)} assessments - page: {page}, limit: {limit}, total: {total}")
+
+        assessment_ids = [str(assessment.id) for assessment in assessments]
+        recommendation_counts, report_counts = await asyncio.gather(
+            loaders.recommendation_counts.load_many(assessment_ids),
+            loaders.report_counts.load_many(assessment_ids)
+        )
+        recommendation_counts = dict(zip(assessment_ids, recommendation_counts))
+        report_counts = dict(zip(assessment_ids, report_counts))
         
         # Convert assessments to summaries
         assessment_summaries = []
@@ -1838,7 +1932,9 @@ async def list_assessments(
                     budget_range=budget_range,
                     workload_types=workload_types,
                     recommendations_generated=bool(assessment.recommendations_generated),
-                    reports_generated=bool(assessment.reports_generated)
+                    reports_generated=bool(assessment.reports_generated),
+                    recommendations_count=recommendation_counts.get(str(assessment.id), 0),
+                    reports_count=report_counts.get(str(assessment.id), 0)
                 ))
             except Exception as e:
                 logger.error(f"Error processing assessment {assessment.id}: {e}")
@@ -1867,9 +1963,14 @@ async def list_assessments(
             total=total,
             page=page,
             limit=limit,
-            pages=pages
+            pages=pages,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None,
+            total_is_approximate=total_is_approximate
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list assessments: {e}")
         raise HTTPException(
@@ -2100,6 +2201,7 @@ async def start_assessment_analysis(
         }
         await assessment.save()
 
+        workload_class = WorkloadClass.BATCH if request.batch else WorkloadClass.INTERACTIVE
         use_celery = settings.use_celery_for_assessments
         celery_task_id: Optional[str] = None
         celery_error: Optional[Exception] = None
@@ -2107,7 +2209,11 @@ async def start_assessment_analysis(
         if use_celery:
             try:
                 from ...tasks.assessment_tasks import process_assessment
-                celery_task = process_assessment.delay(assessment_id)
+                celery_task = process_assessment.apply_async(
+                    args=[assessment_id],
+                    kwargs={"workload_class": workload_class.value, "full_rerun": request.full_rerun},
+                    priority=CELERY_PRIORITIES[workload_class]
+                )
                 celery_task_id = celery_task.id
                 logger.info(f"✅ Assessment {assessment_id} queued via Celery. Task ID: {celery_task_id}")
             except Exception as workflow_error:
@@ -2132,8 +2238,9 @@ async def start_assessment_analysis(
 
         # Fallback to local async execution when Celery is unavailable or disabled
         try:
-            asyncio.create_task(start_assessment_workflow(
+            asyncio.create_task(run_admitted_assessment_workflow(
                 assessment,
+                workload_class,
                 getattr(fastapi_request.app, 'state', None),
                 db
             ))
@@ -2542,14 +2649,14 @@ async def generate_llm_powered_recommendations(assessment: Assessment) -> List[R
     Returns:
         List of AI-generated recommendations with real cloud services
     """
-    from ...llm.manager import LLMManager
+    from ...llm.manager import get_shared_llm_manager
     from ...llm.interface import LLMRequest
     import json
     
     logger.info(f"Generating LLM-powered recommendations with cloud services API for assessment {assessment.id}")
     
     # Initialize LLM Manager
-    llm_manager = LLMManager()
+    llm_manager = get_shared_llm_manager()
     
     # Fetch relevant cloud services
     logger.info("Fetching relevant cloud services from API...")
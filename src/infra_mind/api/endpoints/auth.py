@@ -45,6 +45,7 @@ except ImportError:  # pragma: no cover - fallback for test environments
         QRCode = _FallbackQRCode
 
 from ...models.user import User
+from ...core.principal_cache import principal_cache
 from ...services.email_service import email_service
 import jwt
 from jwt.exceptions import InvalidTokenError
@@ -135,13 +136,21 @@ async def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] =
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token")
     
-    user = await User.get(user_id)
+    user = await principal_cache.get_user(user_id)
     if not user or not user.is_active:
         raise HTTPException(status_code=401, detail="User not found or inactive")
     
     return user
 
 
+async def get_current_user_with_credentials(current_user: User = Depends(get_current_user)) -> User:
+    """Get current user with password and MFA fields, for endpoints that check them or save the user."""
+    user = await principal_cache.load_credentials(current_user)
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found or inactive")
+    return user
+
+
 def require_admin(current_user: User = Depends(get_current_user)):
     """Dependency that requires the current user to be an admin."""
     if not current_user.is_admin and current_user.role != "admin":
@@ -491,6 +500,7 @@ async def logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
                 import hashlib
                 token_hash = hashlib.sha256(token.encode()).hexdigest()
                 redis_client.setex(f"blacklist:{token_hash}", ttl, "1")
+                principal_cache.invalidate_token(payload.get("jti"))
 
                 logger.info(f"Token blacklisted successfully (TTL: {ttl}s)")
             else:
@@ -562,7 +572,7 @@ async def request_password_reset(request: PasswordReset):
 @router.post("/change-password")
 async def change_password(
     request: PasswordChange,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_with_credentials)
 ):
     """
     Change user password.
@@ -599,7 +609,7 @@ async def change_password(
 @router.put("/profile", response_model=UserProfile)
 async def update_profile(
     update_data: ProfileUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_with_credentials)
 ):
     """
     Update user profile.
@@ -886,7 +896,7 @@ async def reset_password(request: ResetPasswordRequest):
 
 
 @router.post("/mfa/setup", response_model=MFASetupResponse)
-async def setup_mfa(current_user: User = Depends(get_current_user)):
+async def setup_mfa(current_user: User = Depends(get_current_user_with_credentials)):
     """
     Setup Multi-Factor Authentication.
     
@@ -932,7 +942,7 @@ async def setup_mfa(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/mfa/verify")
-async def verify_mfa_setup(request: MFAVerifyRequest, current_user: User = Depends(get_current_user)):
+async def verify_mfa_setup(request: MFAVerifyRequest, current_user: User = Depends(get_current_user_with_credentials)):
     """
     Verify MFA setup with TOTP token.
     
@@ -976,7 +986,7 @@ async def verify_mfa_setup(request: MFAVerifyRequest, current_user: User = Depen
 
 
 @router.post("/mfa/disable")
-async def disable_mfa(current_user: User = Depends(get_current_user)):
+async def disable_mfa(current_user: User = Depends(get_current_user_with_credentials)):
     """
     Disable Multi-Factor Authentication.
     
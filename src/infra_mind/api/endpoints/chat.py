@@ -27,6 +27,7 @@ from ...agents.base import AgentConfig, AgentRole
 from .auth import get_current_user
 from ...core.rate_limiter import get_chat_rate_limiter
 from ...services.assessment_context_cache import get_assessment_context_cache
+from ..pagination import keyset_query, keyset_sort, split_page
 
 logger = logging.getLogger(__name__)
 
@@ -57,18 +58,14 @@ async def simple_chat(request: SimpleChatRequest):
     Perfect for testing and public-facing chat interfaces.
     """
     try:
-        from infra_mind.llm.manager import LLMManager
+        from infra_mind.llm.manager import get_shared_llm_manager
         from infra_mind.llm.interface import LLMRequest
         
         # Generate or use provided session ID
         session_id = request.session_id or f"session_{uuid.uuid4()}"
         
-        # Initialize LLM manager with Azure OpenAI preference
-        llm_config = {
-            "preferred_provider": "azure_openai",
-            "validation": {"enabled": False}  # Disable strict validation for simple chat
-        }
-        llm_manager = LLMManager(config=llm_config)
+        # Shared LLM manager with Azure OpenAI preference
+        llm_manager = get_shared_llm_manager(preferred_provider="azure_openai")
         
         # Create LLM request with infrastructure-focused system prompt
         # Use the deployment name from Azure OpenAI configuration
@@ -101,7 +98,8 @@ Keep responses concise but comprehensive, focusing on practical implementation d
             context={
                 "agent_name": "infrastructure_assistant",
                 "session_id": session_id,
-                "domain": "cloud_infrastructure"
+                "domain": "cloud_infrastructure",
+                "priority": "interactive"
             }
         )
         
@@ -193,10 +191,11 @@ class StartConversationRequest(BaseModel):
 class ConversationListResponse(BaseModel):
     """Response model for conversation lists."""
     conversations: List[ConversationResponse]
-    total: int
+    total: Optional[int]
     page: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class ChatAnalyticsResponse(BaseModel):
@@ -368,8 +367,10 @@ async def start_conversation(
 @router.get("/conversations", response_model=ConversationListResponse)
 async def get_conversations(
     http_request: Request,
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when a cursor is given)"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    include_total: bool = Query(True, description="Count all matching conversations"),
     status_filter: Optional[ConversationStatus] = Query(None, description="Filter by status"),
     context_filter: Optional[ConversationContext] = Query(None, description="Filter by context"),
     current_user: User = Depends(get_current_user)
@@ -377,7 +378,9 @@ async def get_conversations(
     """
     Get user's conversations with pagination and filtering.
     
-    Returns a paginated list of conversations for the current user.
+    Returns a paginated list of conversations for the current user, most
+    recently active first. Pass ``next_cursor`` back as ``cursor`` for the
+    next page; cursor pages cost the same at any depth.
     """
     try:
         # Build query filters
@@ -388,18 +391,19 @@ async def get_conversations(
         if context_filter:
             query_filters["context"] = context_filter
         
-        # Calculate skip for pagination
-        skip = (page - 1) * limit
+        # Offsets are only used by clients that still send page numbers
+        skip = 0 if cursor else (page - 1) * limit
         
-        # Get conversations with pagination
-        conversations_docs = await Conversation.find(query_filters)\
-            .sort([("last_activity", -1)])\
+        # Fetch one extra row to learn whether there is a next page
+        conversations_docs = await Conversation.find(keyset_query(query_filters, cursor, "last_activity"))\
+            .sort(keyset_sort("last_activity"))\
             .skip(skip)\
-            .limit(limit)\
+            .limit(limit + 1)\
             .to_list()
+        conversations_docs, next_cursor = split_page(conversations_docs, limit, "last_activity")
         
         # Get total count
-        total_count = await Conversation.find(query_filters).count()
+        total_count = await Conversation.find(query_filters).count() if include_total else None
         
         # Convert to response format
         conversations = [
@@ -418,8 +422,6 @@ async def get_conversations(
             for conv in conversations_docs
         ]
         
-        has_more = (skip + limit) < total_count
-        
         logger.debug(f"Retrieved {len(conversations)} conversations for user {current_user.id}")
         
         return ConversationListResponse(
@@ -427,9 +429,12 @@ async def get_conversations(
             total=total_count,
             page=page,
             limit=limit,
-            has_more=has_more
+            has_more=next_cursor is not None,
+            next_cursor=next_cursor
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get conversations: {str(e)}")
         raise HTTPException(
@@ -773,16 +778,12 @@ async def generate_conversation_title(conversation: Conversation) -> str:
             "Assistant: " + msg[:200] + ("..." if len(msg) > 200 else "") for msg in assistant_messages
         ])
 
-        from infra_mind.llm.manager import LLMManager
+        from infra_mind.llm.manager import get_shared_llm_manager
         from infra_mind.llm.interface import LLMRequest
         from infra_mind.core.config import get_settings
 
-        # Initialize LLM manager
-        llm_config = {
-            "preferred_provider": "azure_openai",
-            "validation": {"enabled": False}
-        }
-        llm_manager = LLMManager(config=llm_config)
+        # Shared LLM manager with Azure OpenAI preference
+        llm_manager = get_shared_llm_manager(preferred_provider="azure_openai")
 
         # Get Azure OpenAI model name
         settings = get_settings()
@@ -810,7 +811,8 @@ Title:"""
             temperature=0.3,
             context={
                 "agent_name": "title_generator",
-                "session_id": conversation.session_id
+                "session_id": conversation.session_id,
+                "priority": "interactive"
             }
         )
 
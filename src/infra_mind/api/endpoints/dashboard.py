@@ -149,7 +149,7 @@ async def get_dashboard_overview(
             "_performance": {
                 "service": "OptimizedDashboardService",
                 "caching_enabled": dashboard_service.cache_manager is not None,
-                "aggregation_pipelines": True
+                "materialized_stats": True
             }
         }
 
@@ -176,6 +176,32 @@ async def get_performance_summary():
         raise HTTPException(status_code=500, detail="Failed to retrieve performance summary")
 
 
+@router.get("/admission")
+async def get_admission_metrics():
+    """Get assessment admission queue, wait time and cost prediction metrics."""
+    try:
+        from ...orchestration.admission_control import get_admission_controller
+
+        return get_admission_controller().get_metrics()
+
+    except Exception as e:
+        logger.error(f"Failed to get admission metrics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve admission metrics")
+
+
+@router.get("/llm-scheduler")
+async def get_llm_scheduler_metrics():
+    """Get LLM rate budget, queue depth, wait time and utilization metrics."""
+    try:
+        from ...llm.rate_scheduler import get_llm_scheduler
+
+        return get_llm_scheduler().get_metrics()
+
+    except Exception as e:
+        logger.error(f"Failed to get LLM scheduler metrics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve LLM scheduler metrics")
+
+
 @router.get("/alerts", response_model=List[AlertResponse])
 async def get_alerts(
     active_only: bool = Query(True, description="Return only active alerts"),
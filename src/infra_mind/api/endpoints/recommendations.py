@@ -18,6 +18,7 @@ from ...models.user import User
 from ...schemas.base import RecommendationConfidence, CloudProvider, Priority
 from ...core.rbac import require_permission, Permission, AccessControl
 from ...core.dependencies import CacheManagerDep
+from ..pagination import keyset_query, keyset_sort, split_page
 
 router = APIRouter()
 
@@ -68,9 +69,11 @@ class RecommendationResponse(BaseModel):
 class RecommendationListResponse(BaseModel):
     """Response for recommendation list endpoints."""
     recommendations: List[RecommendationResponse]
-    total: int
+    total: Optional[int]
     assessment_id: str
     summary: Dict[str, Any]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 def convert_decimal128_to_decimal(value):
@@ -102,13 +105,17 @@ async def list_recommendations(
     confidence_min: Optional[float] = Query(None, ge=0.0, le=1.0, description="Minimum confidence score"),
     category_filter: Optional[str] = Query(None, description="Filter by category"),
     limit: int = Query(10, ge=1, le=100, description="Number of recommendations to return"),
-    skip: int = Query(0, ge=0, description="Number of recommendations to skip")
+    skip: int = Query(0, ge=0, description="Number of recommendations to skip (ignored when a cursor is given)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    include_total: bool = Query(True, description="Count all matching recommendations")
 ):
     """
     List recommendations with optional filtering.
     
-    Returns recommendations based on query parameters. If no assessment_id is provided,
-    returns recommendations for all assessments accessible to the current user.
+    Returns recommendations based on query parameters, newest first. If no
+    assessment_id is provided, returns recommendations for all assessments
+    accessible to the current user. Pass ``next_cursor`` back as ``cursor``
+    for the next page; cursor pages cost the same at any depth.
     """
     try:
         logger.info(f"Listing recommendations for user: {current_user.email}")
@@ -124,9 +131,14 @@ async def list_recommendations(
         if category_filter:
             query_filter["category"] = category_filter
             
-        # Get recommendations
-        recommendations = await Recommendation.find(query_filter).skip(skip).limit(limit).to_list()
-        total = await Recommendation.find(query_filter).count()
+        # Get recommendations, plus one extra row to learn whether there is a next page
+        recommendations = await Recommendation.find(keyset_query(query_filter, cursor))\
+            .sort(keyset_sort())\
+            .skip(0 if cursor else skip)\
+            .limit(limit + 1)\
+            .to_list()
+        recommendations, next_cursor = split_page(recommendations, limit)
+        total = await Recommendation.find(query_filter).count() if include_total else None
         
         logger.info(f"Found {len(recommendations)} recommendations (total: {total})")
         
@@ -166,9 +178,13 @@ async def list_recommendations(
                 "filtered_count": len(recommendations),
                 "avg_confidence": sum(r.confidence_score for r in recommendation_responses) / len(recommendation_responses) if recommendation_responses else 0,
                 "categories": list(set(r.category for r in recommendation_responses))
-            }
+            },
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list recommendations: {e}")
         raise HTTPException(
@@ -0,0 +1,128 @@
+"""
+Lazy router mounting for rarely used API endpoints.
+
+Importing every endpoint module at startup pulls in cloud provider SDKs,
+analytics and quality services that most requests never touch. Routers
+declared as ``LazyRouter`` are instead imported and mounted on the first
+request whose path falls under one of their prefixes; the request then
+proceeds through the normal routing table and sees the new routes.
+
+``LazyRouterLoader.load_all`` mounts everything that is still pending. It
+is used when lazy loading is disabled, before the OpenAPI schema is built
+and by the optional background preload after startup.
+"""
+
+import asyncio
+import importlib
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from fastapi import FastAPI
+from loguru import logger
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+@dataclass(frozen=True)
+class LazyRouter:
+    """An endpoint module whose ``router`` is mounted on first use."""
+
+    module: str
+    prefix: str
+    tags: Sequence[str]
+    versions: Tuple[str, ...] = ("v1", "v2")
+
+    def mount_prefixes(self, api_prefix: str = "/api") -> List[str]:
+        """Prefixes the router is mounted under, mirroring ``api_router``."""
+        prefixes = [f"{api_prefix}/{version}{self.prefix}" for version in self.versions]
+        if "v2" in self.versions:
+            # The unversioned API is an alias of v2
+            prefixes.append(f"{api_prefix}{self.prefix}")
+        return prefixes
+
+
+class LazyRouterLoader:
+    """Tracks pending lazy routers for an app and mounts them on demand."""
+
+    def __init__(self, app: FastAPI, routers: Sequence[LazyRouter], api_prefix: str = "/api"):
+        self.app = app
+        self.api_prefix = api_prefix
+        self._pending: Dict[str, LazyRouter] = {router.module: router for router in routers}
+        self._lock = asyncio.Lock()
+        self.load_times: Dict[str, float] = {}
+
+    @property
+    def pending(self) -> List[str]:
+        return list(self._pending)
+
+    def match(self, path: str) -> List[LazyRouter]:
+        """Pending routers mounted under ``path``."""
+        return [
+            router for router in self._pending.values()
+            if any(
+                path == prefix or path.startswith(prefix + "/")
+                for prefix in router.mount_prefixes(self.api_prefix)
+            )
+        ]
+
+    def _import(self, router: LazyRouter):
+        start = time.perf_counter()
+        module = importlib.import_module(f".endpoints.{router.module}", __package__)
+        self.load_times[router.module] = time.perf_counter() - start
+        return module
+
+    def _mount(self, router: LazyRouter, module) -> None:
+        if router.module not in self._pending:
+            return
+        for prefix in router.mount_prefixes(self.api_prefix):
+            self.app.include_router(module.router, prefix=prefix, tags=list(router.tags))
+        del self._pending[router.module]
+        # Regenerate the schema with the new routes on next request
+        self.app.openapi_schema = None
+        logger.info(
+            f"📦 Mounted lazy router '{router.module}' "
+            f"({self.load_times.get(router.module, 0.0) * 1000:.0f}ms import)"
+        )
+
+    async def ensure_loaded(self, path: str) -> None:
+        """Mount any pending routers serving ``path`` before it is routed."""
+        routers = self.match(path)
+        if not routers:
+            return
+        async with self._lock:
+            for router in routers:
+                if router.module in self._pending:
+                    module = await asyncio.to_thread(self._import, router)
+                    self._mount(router, module)
+
+    def load_all(self) -> None:
+        """Synchronously mount every pending router that imports cleanly."""
+        for router in list(self._pending.values()):
+            try:
+                self._mount(router, self._import(router))
+            except Exception as e:
+                logger.error(f"Failed to load router '{router.module}': {e}")
+
+    async def preload(self) -> None:
+        """Mount every pending router in the background, one at a time."""
+        for router in list(self._pending.values()):
+            try:
+                async with self._lock:
+                    if router.module in self._pending:
+                        module = await asyncio.to_thread(self._import, router)
+                        self._mount(router, module)
+            except Exception as e:
+                logger.error(f"Failed to load router '{router.module}': {e}")
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that mounts lazy routers ahead of routing."""
+
+    def __init__(self, app: ASGIApp, loader: LazyRouterLoader):
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and self.loader.pending:
+            await self.loader.ensure_loaded(scope["path"])
+        await self.app(scope, receive, send)
@@ -0,0 +1,113 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Offset pagination makes MongoDB walk and discard ``skip`` index entries, so
+page N costs O(N * limit). Keyset pagination instead remembers the sort key
+of the last row returned and asks for rows strictly after it, which is a
+single index seek on ``(user_id, <sort field>, _id)`` at any depth.
+
+Cursors are opaque URL-safe tokens encoding the sort field, its value and
+the ``_id`` tie-breaker of the last row of a page. Clients pass a page's
+``next_cursor`` back as ``cursor`` to get the next one.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, status
+
+CURSOR_VERSION = 1
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to another listing."""
+
+
+def keyset_sort(field: str = "created_at") -> List[Tuple[str, int]]:
+    """Newest-first sort on ``field`` with ``_id`` as a unique tie-breaker."""
+    return [(field, -1), ("_id", -1)]
+
+
+def _document_value(document: Any, name: str) -> Any:
+    if isinstance(document, dict):
+        return document.get(name)
+    if name == "_id":
+        return document.id
+    return getattr(document, name)
+
+
+def encode_cursor(document: Any, field: str = "created_at") -> str:
+    """Build the cursor pointing just past ``document`` (a Beanie document or raw dict)."""
+    value = _document_value(document, field)
+    payload = {
+        "v": CURSOR_VERSION,
+        "f": field,
+        "k": value.isoformat() if isinstance(value, datetime) else value,
+        "i": str(_document_value(document, "_id")),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, field: str = "created_at") -> Tuple[Any, ObjectId]:
+    """
+    Decode a cursor into the ``(sort value, _id)`` of the last row seen.
+
+    Raises:
+        InvalidCursorError: If the token is malformed or was issued for a
+            different sort field
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload.get("v") != CURSOR_VERSION or payload.get("f") != field:
+            raise InvalidCursorError("Cursor does not belong to this listing")
+        value = payload["k"]
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        return value, ObjectId(payload["i"])
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError, AttributeError, InvalidId) as e:
+        raise InvalidCursorError(f"Malformed cursor: {e}") from e
+
+
+def keyset_query(query: Dict[str, Any], cursor: Optional[str], field: str = "created_at") -> Dict[str, Any]:
+    """
+    Restrict ``query`` to rows after ``cursor`` in ``keyset_sort(field)`` order.
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid
+    """
+    if not cursor:
+        return query
+    try:
+        value, last_id = decode_cursor(cursor, field)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    after = {"$or": [
+        {field: {"$lt": value}},
+        {field: value, "_id": {"$lt": last_id}},
+    ]}
+    if "$or" in query:
+        return {"$and": [query, after]}
+    return {**query, **after}
+
+
+def split_page(documents: Sequence[Any], limit: int, field: str = "created_at") -> Tuple[List[Any], Optional[str]]:
+    """
+    Trim a ``limit + 1`` fetch to one page and build the next page's cursor.
+
+    Fetching a single extra row tells whether another page exists without
+    a ``count()``.
+    """
+    page = list(documents[:limit])
+    if len(documents) > limit and page:
+        return page, encode_cursor(page[-1], field)
+    return page, None
@@ -3,11 +3,18 @@ Main API router for Infra Mind with versioning support.
 
 Combines all API routes into versioned routers for the main application.
 Supports API versioning for backward compatibility and evolution.
+
+Core routers used by the web app on every page load are included eagerly.
+Rarely used routers are listed in ``LAZY_ROUTERS`` and mounted by
+``api.lazy_routes`` on the first request under their prefix, so their
+imports (cloud SDKs, analytics and quality services) stay off the startup
+path.
 """
 
 from fastapi import APIRouter, HTTPException, status
-from .endpoints import auth, assessments, recommendations, reports, monitoring, webhooks, admin, testing, resilience, compliance, integrations, compliance_dashboard, business_tools, performance_monitoring, forms, cloud_services, chat, advanced_analytics, scenarios, validation, dashboard, experiments, feedback, quality, vendor_lockin, rollback, budget_forecasting, change_impact, gitops, approval_workflows, executive, assessment_features, di_example, cache_demo  # task_status temporarily disabled (celery dep)
+from .endpoints import auth, assessments, recommendations, reports, monitoring, webhooks, admin, performance_monitoring, forms, chat, dashboard, di_example, cache_demo  # task_status temporarily disabled (celery dep)
 from .documentation import get_api_integration_guide
+from .lazy_routes import LazyRouter
 
 # Create versioned API routers
 api_v1_router = APIRouter()
@@ -68,54 +75,6 @@ api_v1_router.include_router(
     tags=["Chat"]
 )
 
-api_v1_router.include_router(
-    cloud_services.router,
-    prefix="/cloud-services",
-    tags=["Cloud Services"]
-)
-
-api_v1_router.include_router(
-    scenarios.router,
-    prefix="/scenarios",
-    tags=["Scenarios"]
-)
-
-api_v1_router.include_router(
-    vendor_lockin.router,
-    prefix="/vendor-lockin",
-    tags=["Vendor Lock-in"]
-)
-
-api_v1_router.include_router(
-    rollback.router,
-    prefix="/rollback",
-    tags=["Rollback Automation"]
-)
-
-api_v1_router.include_router(
-    budget_forecasting.router,
-    prefix="/budget-forecasting",
-    tags=["Budget Forecasting"]
-)
-
-api_v1_router.include_router(
-    change_impact.router,
-    prefix="/change-impact",
-    tags=["Change Impact Analysis"]
-)
-
-api_v1_router.include_router(
-    gitops.router,
-    prefix="/gitops",
-    tags=["GitOps Integration"]
-)
-
-api_v1_router.include_router(
-    approval_workflows.router,
-    prefix="/approval-workflows",
-    tags=["Approval Workflows"]
-)
-
 # V2 API Routes (Enhanced with new features)
 api_v2_router.include_router(
     auth.router,
@@ -165,42 +124,6 @@ api_v2_router.include_router(
     tags=["Admin"]
 )
 
-api_v2_router.include_router(
-    testing.router,
-    prefix="/testing",
-    tags=["Testing"]
-)
-
-api_v2_router.include_router(
-    resilience.router,
-    prefix="/resilience",
-    tags=["Resilience"]
-)
-
-api_v2_router.include_router(
-    compliance.router,
-    prefix="/compliance",
-    tags=["Compliance"]
-)
-
-api_v2_router.include_router(
-    integrations.router,
-    prefix="/integrations",
-    tags=["Integrations"]
-)
-
-api_v2_router.include_router(
-    compliance_dashboard.router,
-    prefix="/compliance-dashboard",
-    tags=["Compliance Dashboard"]
-)
-
-api_v2_router.include_router(
-    business_tools.router,
-    prefix="/business-tools",
-    tags=["Business Tools"]
-)
-
 api_v2_router.include_router(
     performance_monitoring.router,
     prefix="/performance",
@@ -214,109 +137,18 @@ api_v2_router.include_router(
     tags=["Performance Monitoring"]
 )
 
-api_v2_router.include_router(
-    cloud_services.router,
-    prefix="/cloud-services",
-    tags=["Cloud Services"]
-)
-
 api_v2_router.include_router(
     chat.router,
     prefix="/chat",
     tags=["Chat"]
 )
 
-api_v2_router.include_router(
-    advanced_analytics.router,
-    prefix="/advanced-analytics",
-    tags=["Advanced Analytics"]
-)
-
-api_v2_router.include_router(
-    scenarios.router,
-    prefix="/scenarios",
-    tags=["Scenarios"]
-)
-
-api_v2_router.include_router(
-    validation.router,
-    prefix="/validation",
-    tags=["Data Validation"]
-)
-
 api_v2_router.include_router(
     dashboard.router,
     prefix="/dashboard",
     tags=["Dashboard"]
 )
 
-api_v2_router.include_router(
-    experiments.router,
-    prefix="/experiments",
-    tags=["A/B Testing & Experiments"]
-)
-
-api_v2_router.include_router(
-    feedback.router,
-    prefix="/feedback",
-    tags=["User Feedback"]
-)
-
-api_v2_router.include_router(
-    quality.router,
-    prefix="/quality",
-    tags=["Quality Assurance"]
-)
-
-api_v2_router.include_router(
-    vendor_lockin.router,
-    prefix="/vendor-lockin",
-    tags=["Vendor Lock-in"]
-)
-
-api_v2_router.include_router(
-    rollback.router,
-    prefix="/rollback",
-    tags=["Rollback Automation"]
-)
-
-api_v2_router.include_router(
-    budget_forecasting.router,
-    prefix="/budget-forecasting",
-    tags=["Budget Forecasting"]
-)
-
-api_v2_router.include_router(
-    change_impact.router,
-    prefix="/change-impact",
-    tags=["Change Impact Analysis"]
-)
-
-api_v2_router.include_router(
-    gitops.router,
-    prefix="/gitops",
-    tags=["GitOps Integration"]
-)
-
-api_v2_router.include_router(
-    approval_workflows.router,
-    prefix="/approval-workflows",
-    tags=["Approval Workflows"]
-)
-
-api_v2_router.include_router(
-    executive.router,
-    prefix="/executive",
-    tags=["Executive Dashboard"]
-)
-
-# Assessment Features - Unified additional features endpoint
-api_v1_router.include_router(
-    assessment_features.router,
-    prefix="/features",
-    tags=["Additional Features"]
-)
-
 # Dependency Injection Example - For testing and reference
 api_v1_router.include_router(
     di_example.router,
@@ -336,12 +168,6 @@ api_v1_router.include_router(
     tags=["Performance & Caching"]
 )
 
-api_v2_router.include_router(
-    assessment_features.router,
-    prefix="/features",
-    tags=["Additional Features"]
-)
-
 # Dependency Injection Example in V2 as well
 api_v2_router.include_router(
     di_example.router,
@@ -361,6 +187,32 @@ api_v2_router.include_router(
     tags=["Performance & Caching"]
 )
 
+# Lazily mounted routers, imported on the first request under their prefix.
+# Mounted at /v1 and /v2 (and the unversioned v2 alias) according to versions.
+LAZY_ROUTERS = [
+    LazyRouter("cloud_services", "/cloud-services", ["Cloud Services"]),
+    LazyRouter("scenarios", "/scenarios", ["Scenarios"]),
+    LazyRouter("vendor_lockin", "/vendor-lockin", ["Vendor Lock-in"]),
+    LazyRouter("rollback", "/rollback", ["Rollback Automation"]),
+    LazyRouter("budget_forecasting", "/budget-forecasting", ["Budget Forecasting"]),
+    LazyRouter("change_impact", "/change-impact", ["Change Impact Analysis"]),
+    LazyRouter("gitops", "/gitops", ["GitOps Integration"]),
+    LazyRouter("approval_workflows", "/approval-workflows", ["Approval Workflows"]),
+    LazyRouter("assessment_features", "/features", ["Additional Features"]),
+    LazyRouter("testing", "/testing", ["Testing"], versions=("v2",)),
+    LazyRouter("resilience", "/resilience", ["Resilience"], versions=("v2",)),
+    LazyRouter("compliance", "/compliance", ["Compliance"], versions=("v2",)),
+    LazyRouter("integrations", "/integrations", ["Integrations"], versions=("v2",)),
+    LazyRouter("compliance_dashboard", "/compliance-dashboard", ["Compliance Dashboard"], versions=("v2",)),
+    LazyRouter("business_tools", "/business-tools", ["Business Tools"], versions=("v2",)),
+    LazyRouter("advanced_analytics", "/advanced-analytics", ["Advanced Analytics"], versions=("v2",)),
+    LazyRouter("validation", "/validation", ["Data Validation"], versions=("v2",)),
+    LazyRouter("experiments", "/experiments", ["A/B Testing & Experiments"], versions=("v2",)),
+    LazyRouter("feedback", "/feedback", ["User Feedback"], versions=("v2",)),
+    LazyRouter("quality", "/quality", ["Quality Assurance"], versions=("v2",)),
+    LazyRouter("executive", "/executive", ["Executive Dashboard"], versions=("v2",)),
+]
+
 # Documentation endpoints are now included directly in main api_router
 
 # Main API router that includes all versions
@@ -0,0 +1,173 @@
+"""
+Streaming NDJSON/CSV export of MongoDB query results.
+
+Export endpoints iterate a Motor cursor and write rows straight into a
+``StreamingResponse`` instead of materializing the result set with
+``to_list(length=None)``. Memory stays bounded by one cursor batch plus one
+output chunk regardless of how many documents a user has, and since
+Starlette awaits each ``send``, a slow client throttles the cursor
+(backpressure) rather than letting output pile up in memory.
+"""
+
+import csv
+import inspect
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from bson import Decimal128, ObjectId
+from fastapi.responses import StreamingResponse
+from loguru import logger
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Rows are flushed to the client in chunks of about this size
+CHUNK_SIZE = 64 * 1024
+
+# Documents fetched from MongoDB per round trip
+CURSOR_BATCH_SIZE = 500
+
+# Leading characters that make spreadsheet apps evaluate a CSV cell as a formula
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _plain(value: Any) -> Any:
+    """Convert BSON/driver types to JSON-serializable values."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal128):
+        return str(value.to_decimal())
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _lookup(document: Dict[str, Any], path: str) -> Any:
+    """Read a dotted field path such as ``business_requirements.company_name``."""
+    value: Any = document
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _csv_cell(value: Any) -> Any:
+    """CSV cell for an exported value, with formula-like strings neutralized."""
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        # A leading quote makes spreadsheets show the text instead of running it
+        return "'" + value
+    return value
+
+
+async def _close_cursor(cursor) -> None:
+    close = getattr(cursor, "close", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.warning(f"Failed to close export cursor: {e}")
+
+
+def export_row(document: Dict[str, Any], columns: Dict[str, str]) -> Dict[str, Any]:
+    """Select ``columns`` (output name -> document field path) from a document."""
+    return {name: _plain(_lookup(document, path)) for name, path in columns.items()}
+
+
+async def stream_export(
+    cursor,
+    columns: Dict[str, str],
+    format: str,
+    transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+) -> AsyncIterator[bytes]:
+    """
+    Yield an export of ``cursor`` as encoded NDJSON or CSV chunks.
+
+    The CSV header and the first row are flushed immediately so the first
+    byte does not wait for a full chunk. CSV cells starting with a formula
+    character are prefixed with a quote. The cursor is closed when the
+    stream ends, fails or the client disconnects.
+    """
+    buffer = io.StringIO()
+    writer = None
+    rows = 0
+    try:
+        if format == "csv":
+            writer = csv.DictWriter(buffer, fieldnames=list(columns), extrasaction="ignore")
+            writer.writeheader()
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+        try:
+            async for document in cursor:
+                row = export_row(document, columns)
+                if transform:
+                    row = transform(row)
+                if writer:
+                    writer.writerow({key: _csv_cell(value) for key, value in row.items()})
+                else:
+                    buffer.write(json.dumps(row, default=str))
+                    buffer.write("\n")
+                rows += 1
+
+                if rows == 1 or buffer.tell() >= CHUNK_SIZE:
+                    yield buffer.getvalue().encode("utf-8")
+                    buffer.seek(0)
+                    buffer.truncate()
+        except Exception as e:
+            # Headers are already sent; aborting the response tells the client the export is incomplete
+            logger.error(f"Export stream failed after {rows} rows: {e}")
+            raise
+
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+        logger.info(f"Streamed {rows} rows as {format}")
+    finally:
+        # Kill the server-side cursor instead of waiting for it to time out
+        await _close_cursor(cursor)
+
+
+def export_response(
+    cursor,
+    columns: Dict[str, str],
+    format: str,
+    filename: str,
+    transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+) -> StreamingResponse:
+    """Wrap ``stream_export`` in a downloadable ``StreamingResponse``."""
+    extension = "ndjson" if format == "ndjson" else "csv"
+    return StreamingResponse(
+        stream_export(cursor, columns, format, transform),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}.{extension}",
+            "Cache-Control": "no-store",
+            # Stop reverse proxies from buffering the whole export
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+def export_projection(columns: Dict[str, str]) -> Dict[str, int]:
+    """MongoDB projection fetching only the exported fields."""
+    projection = {path: 1 for path in columns.values()}
+    if "_id" not in projection:
+        projection["_id"] = 0
+    return projection
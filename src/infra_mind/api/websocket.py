@@ -35,6 +35,7 @@ class MessageType(str, Enum):
     WORKFLOW_PROGRESS = "workflow_progress"
     AGENT_STATUS = "agent_status"
     STEP_COMPLETED = "step_completed"
+    REPORT_SECTION = "report_section"
     
     # Notifications
     NOTIFICATION = "notification"
@@ -150,6 +151,7 @@ class WebSocketManager:
         await self.event_manager.subscribe(EventType.DATA_UPDATED, self._on_data_updated)
         await self.event_manager.subscribe(EventType.RECOMMENDATION_GENERATED, self._on_recommendation_generated)
         await self.event_manager.subscribe(EventType.REPORT_GENERATED, self._on_report_generated)
+        await self.event_manager.subscribe(EventType.REPORT_SECTION_GENERATED, self._on_report_section_generated)
         
         # Performance alerts
         self.workflow_monitor.add_alert_callback(self._on_performance_alert)
@@ -692,6 +694,25 @@ class WebSocketManager:
         if workflow_id and workflow_id in self.assessment_rooms:
             await self._broadcast_to_assessment(workflow_id, message)
     
+    async def _on_report_section_generated(self, event: AgentEvent) -> None:
+        """Stream a completed report section to clients watching the assessment."""
+        assessment_id = event.data.get("assessment_id")
+        
+        message = WebSocketMessage(
+            type=MessageType.REPORT_SECTION,
+            data={
+                "report_id": event.data.get("report_id"),
+                "report_type": event.data.get("report_type"),
+                "section": event.data.get("section"),
+                "completed_sections": event.data.get("completed_sections"),
+                "total_sections": event.data.get("total_sections")
+            },
+            timestamp=event.timestamp
+        )
+        
+        if assessment_id and assessment_id in self.assessment_rooms:
+            await self._broadcast_to_assessment(assessment_id, message)
+    
     async def _on_performance_alert(self, alert: PerformanceAlert) -> None:
         """Handle performance alert."""
         message = WebSocketMessage(
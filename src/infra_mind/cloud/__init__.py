@@ -2,50 +2,39 @@
 Cloud service integration package for Infra Mind.
 
 Provides unified interfaces for interacting with multiple cloud providers.
+
+Provider clients are resolved lazily: ``from infra_mind.cloud import AWSClient``
+still works, but importing ``infra_mind.cloud.base`` or another submodule no
+longer loads boto3, the Azure SDK and the Google API client up front.
 """
 
-from .aws import AWSClient, AWSPricingClient, AWSEC2Client, AWSRDSClient, AWSAIClient
-from .azure import AzureClient, AzurePricingClient, AzureComputeClient, AzureSQLClient, AzureAIClient
-from .gcp import GCPClient, GCPBillingClient, GCPComputeClient, GCPSQLClient, GCPAIClient, GCPGKEClient, GCPAssetClient, GCPRecommenderClient
-from .alibaba import AlibabaCloudClient, AlibabaPricingClient, create_alibaba_client
-from .ibm import IBMCloudClient, IBMPricingClient, create_ibm_client
-from .terraform import TerraformClient, TerraformCloudClient, TerraformRegistryClient
-from .base import CloudProvider, CloudService, CloudServiceResponse, CloudServiceError, AuthenticationError, ServiceCategory
-from .unified import UnifiedCloudClient
+from ..core.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "base": [
+        "CloudProvider",
+        "CloudService",
+        "CloudServiceResponse",
+        "CloudServiceError",
+        "AuthenticationError",
+        "ServiceCategory",
+    ],
+    "aws": ["AWSClient", "AWSPricingClient", "AWSEC2Client", "AWSRDSClient", "AWSAIClient"],
+    "azure": ["AzureClient", "AzurePricingClient", "AzureComputeClient", "AzureSQLClient", "AzureAIClient"],
+    "gcp": [
+        "GCPClient",
+        "GCPBillingClient",
+        "GCPComputeClient",
+        "GCPSQLClient",
+        "GCPAIClient",
+        "GCPGKEClient",
+        "GCPAssetClient",
+        "GCPRecommenderClient",
+    ],
+    "alibaba": ["AlibabaCloudClient", "AlibabaPricingClient", "create_alibaba_client"],
+    "ibm": ["IBMCloudClient", "IBMPricingClient", "create_ibm_client"],
+    "terraform": ["TerraformClient", "TerraformCloudClient", "TerraformRegistryClient"],
+    "unified": ["UnifiedCloudClient"],
+}
 
-__all__ = [
-    "CloudProvider",
-    "CloudService", 
-    "CloudServiceResponse",
-    "CloudServiceError",
-    "AuthenticationError",
-    "ServiceCategory",
-    "AWSClient",
-    "AWSPricingClient",
-    "AWSEC2Client", 
-    "AWSRDSClient",
-    "AWSAIClient",
-    "AzureClient",
-    "AzurePricingClient",
-    "AzureComputeClient",
-    "AzureSQLClient",
-    "AzureAIClient",
-    "GCPClient",
-    "GCPBillingClient",
-    "GCPComputeClient",
-    "GCPSQLClient",
-    "GCPAIClient",
-    "GCPGKEClient",
-    "GCPAssetClient",
-    "GCPRecommenderClient",
-    "AlibabaCloudClient",
-    "AlibabaPricingClient",
-    "create_alibaba_client",
-    "IBMCloudClient",
-    "IBMPricingClient",
-    "create_ibm_client",
-    "TerraformClient",
-    "TerraformCloudClient",
-    "TerraformRegistryClient",
-    "UnifiedCloudClient"
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _EXPORTS)
@@ -9,12 +9,6 @@ import logging
 from typing import Dict, Any, List, Optional, Union, Callable
 from datetime import datetime, timezone
 
-from .aws import AWSClient
-from .azure import AzureClient
-from .gcp import GCPClient
-from .alibaba import AlibabaCloudClient
-from .ibm import IBMCloudClient
-from .terraform import TerraformClient
 from .base import (
     BaseCloudClient, CloudProvider, CloudService, CloudServiceResponse,
     ServiceCategory, CloudServiceError, AuthenticationError
@@ -46,6 +40,9 @@ class UnifiedCloudClient:
         """
         Initialize the unified cloud client.
         
+        Provider modules are imported here rather than at module level so
+        that importing this module does not load every provider SDK.
+        
         Args:
             aws_region: Default AWS region
             azure_region: Default Azure region
@@ -71,6 +68,7 @@ class UnifiedCloudClient:
         
         # Initialize cloud clients
         try:
+            from .aws import AWSClient
             self.clients[CloudProvider.AWS] = AWSClient(
                 region=aws_region,
                 aws_access_key_id=aws_access_key_id,
@@ -83,6 +81,7 @@ class UnifiedCloudClient:
             logger.error(f"Unexpected error initializing AWS client: {e}")
         
         try:
+            from .azure import AzureClient
             self.clients[CloudProvider.AZURE] = AzureClient(
                 region=azure_region,
                 subscription_id=azure_subscription_id,
@@ -94,6 +93,7 @@ class UnifiedCloudClient:
             logger.error(f"Unexpected error initializing Azure client: {e}")
         
         try:
+            from .gcp import GCPClient
             if gcp_project_id:
                 self.clients[CloudProvider.GCP] = GCPClient(
                     project_id=gcp_project_id,
@@ -107,6 +107,7 @@ class UnifiedCloudClient:
             logger.error(f"Unexpected error initializing GCP client: {e}")
         
         try:
+            from .alibaba import AlibabaCloudClient
             if alibaba_access_key_id and alibaba_access_key_secret:
                 self.clients[CloudProvider.ALIBABA] = AlibabaCloudClient(
                     access_key_id=alibaba_access_key_id,
@@ -120,6 +121,7 @@ class UnifiedCloudClient:
             logger.error(f"Unexpected error initializing Alibaba Cloud client: {e}")
         
         try:
+            from .ibm import IBMCloudClient
             if ibm_api_key and ibm_account_id:
                 self.clients[CloudProvider.IBM] = IBMCloudClient(
                     api_key=ibm_api_key,
@@ -134,6 +136,7 @@ class UnifiedCloudClient:
         
         # Initialize Terraform client (always available for registry access)
         try:
+            from .terraform import TerraformClient
             self.terraform_client = TerraformClient(
                 terraform_token=terraform_token,
                 organization=terraform_organization
@@ -24,6 +24,7 @@ import logging
 from ..models.user import User
 from ..schemas.base import ErrorResponse
 from .audit import log_authentication_event, log_security_event, AuditEventType, AuditSeverity
+from .principal_cache import BloomFilter, principal_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -103,11 +104,15 @@ class TokenBlacklist:
     Token blacklist management for secure logout and token invalidation.
     
     Uses Redis for distributed blacklisting or in-memory storage as fallback.
+    Tokens revoked by this process are also recorded in a bloom filter so the
+    authentication hot path can prove a token was not revoked locally without
+    a backend lookup.
     """
     
     def __init__(self):
         self.redis_client = redis_client
         self._memory_blacklist = set()  # Fallback for when Redis is unavailable
+        self._revoked_filter = BloomFilter()
     
     async def blacklist_token(self, jti: str, exp: int) -> None:
         """
@@ -117,6 +122,7 @@ class TokenBlacklist:
             jti: JWT ID
             exp: Token expiration timestamp
         """
+        self._revoked_filter.add(jti)
         try:
             if self.redis_client:
                 # Calculate TTL based on token expiration
@@ -148,6 +154,18 @@ class TokenBlacklist:
         except Exception as e:
             logger.error(f"Failed to check blacklist: {e}")
             return jti in self._memory_blacklist
+    
+    def may_be_blacklisted(self, jti: str) -> bool:
+        """
+        Check the local bloom filter for a revoked token.
+        
+        Args:
+            jti: JWT ID
+            
+        Returns:
+            False if the token was definitely not revoked by this process
+        """
+        return jti in self._revoked_filter
 
 
 class TokenManager:
@@ -387,6 +405,7 @@ class TokenManager:
         try:
             claims = await self.verify_token(token, check_blacklist=False)
             await self.blacklist.blacklist_token(claims.jti, claims.exp)
+            principal_cache.invalidate_token(claims.jti)
             
             logger.info(f"Token revoked: {claims.jti}")
             
@@ -405,7 +424,8 @@ class TokenManager:
             user_id: User ID
         """
         # This would require tracking all issued tokens per user
-        # For now, we'll log the action
+        # For now, drop cached sessions and log the action
+        principal_cache.invalidate_user(user_id)
         logger.info(f"All tokens revoked for user: {user_id}")
         
         # In a full implementation, you would:
@@ -561,6 +581,7 @@ class AuthService:
     
     def __init__(self):
         self.token_manager = TokenManager()
+        self.principal_cache = principal_cache
         self.failed_attempts = {}  # In production, use Redis
         self.max_failed_attempts = int(os.getenv("MAX_FAILED_ATTEMPTS", "5"))
         self.lockout_duration = int(os.getenv("LOCKOUT_DURATION_MINUTES", "15"))
@@ -795,6 +816,11 @@ class AuthService:
         """
         Get current user from JWT token with comprehensive validation.
         
+        The signature and expiry are always verified. The blacklist lookup is
+        skipped for tokens that passed it within the principal cache TTL and
+        were not revoked by this process, and the user is resolved through the
+        principal cache instead of MongoDB.
+        
         Args:
             token: JWT access token
             
@@ -805,11 +831,24 @@ class AuthService:
             AuthenticationError: If token is invalid or user not found
         """
         try:
-            # Verify token
-            claims = await self.token_manager.verify_token(token, TokenType.ACCESS)
+            # Verify token signature and claims
+            claims = await self.token_manager.verify_token(
+                token, TokenType.ACCESS, check_blacklist=False
+            )
             
-            # Get user from database
-            user = await User.get(claims.sub)
+            # Check blacklist unless the hot path can prove the token is live
+            blacklist = self.token_manager.blacklist
+            if claims.jti and (
+                blacklist.may_be_blacklisted(claims.jti)
+                or not self.principal_cache.is_token_verified(claims.jti, claims.sub)
+            ):
+                if await blacklist.is_blacklisted(claims.jti):
+                    self.principal_cache.invalidate_token(claims.jti)
+                    raise AuthenticationError("Token has been revoked")
+                self.principal_cache.mark_token_verified(claims.jti, claims.sub)
+            
+            # Get user from principal cache (falls back to database)
+            user = await self.principal_cache.get_user(claims.sub)
             if not user:
                 raise AuthenticationError("User not found")
             
@@ -1032,6 +1071,28 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_user_with_credentials(
+    current_user: User = Depends(get_current_active_user)
+) -> User:
+    """
+    FastAPI dependency for endpoints that check credentials or save the user.
+    
+    Cached principals may omit password and MFA secrets; this re-reads the
+    user from MongoDB when they do.
+    
+    Raises:
+        HTTPException: If the user no longer exists
+    """
+    user = await principal_cache.load_credentials(current_user)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
 async def get_current_user_optional(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
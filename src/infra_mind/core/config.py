@@ -43,6 +43,30 @@ class Settings(BaseSettings):
         default=True,
         description="Queue assessments via Celery instead of running locally"
     )
+    lazy_routers: bool = Field(
+        default=True,
+        description="Import rarely used API routers on their first request instead of at startup"
+    )
+    preload_lazy_routers: bool = Field(
+        default=False,
+        description="Mount lazy API routers in the background once startup completes"
+    )
+    assessment_max_concurrent: int = Field(
+        default=4,
+        description="Assessment workflows admitted at once per API or worker process"
+    )
+    assessment_interactive_reserved_slots: int = Field(
+        default=1,
+        description="Workflow slots batch re-runs may never use"
+    )
+    assessment_max_tokens_in_flight: int = Field(
+        default=400_000,
+        description="Estimated LLM tokens of admitted workflows per process"
+    )
+    assessment_batch_max_wait_seconds: float = Field(
+        default=300.0,
+        description="Queue wait after which a batch re-run is admitted ahead of interactive work"
+    )
     
     # Security Configuration
     secret_key: SecretStr = Field(
@@ -138,6 +162,42 @@ class Settings(BaseSettings):
         default=60,
         description="LLM request timeout in seconds"
     )
+    llm_scheduler_enabled: bool = Field(
+        default=True,
+        description="Pace LLM requests to the per-minute token and request budgets"
+    )
+    llm_tokens_per_minute: int = Field(
+        default=90_000,
+        description="Tokens per minute per provider model and process, unless overridden"
+    )
+    llm_requests_per_minute: int = Field(
+        default=500,
+        description="Requests per minute per provider model and process, unless overridden"
+    )
+    llm_rate_budgets: Dict[str, Dict[str, int]] = Field(
+        default_factory=dict,
+        description='Budgets keyed by "provider:model" or "provider", e.g. {"openai:gpt-4": {"tokens_per_minute": 300000}}'
+    )
+    llm_hedging_enabled: bool = Field(
+        default=False,
+        description="Duplicate short LLM requests that outlast the provider's p90 latency"
+    )
+    llm_hedge_budget_ratio: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        description="Maximum estimated hedge spend as a share of regular LLM spend"
+    )
+    llm_hedge_max_tokens: int = Field(
+        default=1000,
+        description="Largest max_tokens of a request that may be hedged"
+    )
+    llm_interactive_token_reserve: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=0.9,
+        description="Share of each token budget kept free for interactive requests"
+    )
     
     # AWS Configuration
     aws_access_key_id: Optional[SecretStr] = None
@@ -263,6 +323,26 @@ class Settings(BaseSettings):
         description="Maximum file upload size in bytes"
     )
     allowed_file_types: List[str] = [".json", ".yaml", ".yml", ".txt", ".csv"]
+
+    # Report Rendering
+    report_render_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Processes rendering report downloads (PDF/HTML/markdown)"
+    )
+    report_render_queue_size: int = Field(
+        default=16,
+        ge=0,
+        description="Renders allowed to wait for a free process before downloads get 503"
+    )
+    report_cache_dir: str = Field(
+        default="data/report_cache",
+        description="Directory for rendered report artifacts"
+    )
+    report_cache_max_mb: int = Field(
+        default=2048,
+        description="Rendered report cache size limit in megabytes"
+    )
     
     # External Services
     google_search_api_key: Optional[SecretStr] = None
@@ -11,6 +11,8 @@ This module provides comprehensive data migration capabilities including:
 import asyncio
 import json
 import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
@@ -18,11 +20,21 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import shutil
 import tempfile
+import uuid
 from loguru import logger
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import InsertOne, ReplaceOne
 from pymongo.errors import BulkWriteError, DuplicateKeyError
 from beanie import Document
 import bson
+from bson.binary import Binary
+from bson.decimal128 import Decimal128
+from bson.int64 import Int64
+from bson.max_key import MaxKey
+from bson.min_key import MinKey
+from bson.objectid import ObjectId
+from bson.regex import Regex
+from bson.timestamp import Timestamp
 
 from .database import db, init_database
 from .config import settings
@@ -64,12 +76,15 @@ class MigrationResult:
     errors: List[str] = None
     warnings: List[str] = None
     duration_seconds: float = 0.0
+    metrics: Dict[str, Any] = None
     
     def __post_init__(self):
         if self.errors is None:
             self.errors = []
         if self.warnings is None:
             self.warnings = []
+        if self.metrics is None:
+            self.metrics = {}
 
 
 @dataclass
@@ -85,12 +100,99 @@ class MigrationConfig:
     preserve_ids: bool = False
     skip_existing: bool = True
     rollback_on_error: bool = True
+    transform_workers: int = 4  # Concurrent transform stages
+    process_pool_workers: int = 0  # >0 runs transformers in a process pool (CPU-heavy transformers)
+    queue_size: int = 4  # Batches buffered between pipeline stages
+    resume: bool = True  # Continue from the last checkpointed _id
+    checkpoint_collection: str = "_migration_checkpoints"
     
     def __post_init__(self):
         if self.backup_path is None:
             self.backup_path = f"./backups/migration_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
 
 
+@dataclass
+class _MigrationBatch:
+    """A batch moving through the migration pipeline."""
+    sequence: int
+    documents: List[Dict[str, Any]]
+    last_id: Any = None
+    transformed: List[Dict[str, Any]] = None
+    migrated: int = 0
+    failed: int = 0
+    errors: List[str] = None
+
+
+async def _apply_transformer(transformer_func: callable, doc: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Run a transformer on one document, returning (result, error)."""
+    try:
+        result = transformer_func(doc)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result, None
+    except Exception as e:
+        return None, f"Transform failed for document {doc.get('_id')}: {e}"
+
+
+async def _apply_transformer_to_all(transformer_func: callable, documents: List[Dict[str, Any]]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """Transform documents concurrently, so async transformers overlap their I/O."""
+    return list(await asyncio.gather(*(_apply_transformer(transformer_func, doc) for doc in documents)))
+
+
+def _transform_batch_in_process(transformer_func: callable, documents: List[Dict[str, Any]]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """Process pool entry point: transform a slice of a batch in a worker process."""
+    return asyncio.run(_apply_transformer_to_all(transformer_func, documents))
+
+
+# MongoDB compares and sorts values of different BSON types by type first
+# (https://www.mongodb.com/docs/manual/reference/bson-type-comparison-order/),
+# while "$gt" only matches values of the same type. _id cannot be an array.
+_BSON_SORT_ORDER: List[Tuple[str, Tuple[type, ...]]] = [
+    ("minKey", (MinKey,)),
+    ("null", (type(None),)),
+    ("number", (int, float, Int64, Decimal128)),
+    ("string", (str,)),
+    ("object", (dict,)),
+    ("binData", (bytes, Binary, uuid.UUID)),
+    ("objectId", (ObjectId,)),
+    ("bool", (bool,)),
+    ("date", (datetime,)),
+    ("timestamp", (Timestamp,)),
+    ("regex", (Regex,)),
+    ("maxKey", (MaxKey,)),
+]
+
+
+def _bson_sort_rank(value: Any) -> Optional[int]:
+    # bool subclasses int but sorts after ObjectId, so match it first
+    if isinstance(value, bool):
+        return next(i for i, (alias, _) in enumerate(_BSON_SORT_ORDER) if alias == "bool")
+    for rank, (_, types) in enumerate(_BSON_SORT_ORDER):
+        if isinstance(value, types):
+            return rank
+    return None
+
+
+def _resume_query(last_id: Any) -> Dict[str, Any]:
+    """
+    Match every ``_id`` that sorts after ``last_id``.
+    
+    ``{"_id": {"$gt": last_id}}`` alone skips documents whose ``_id`` is a
+    later BSON type (e.g. ObjectIds after a string ``_id``), so those types
+    are matched explicitly.
+    """
+    if last_id is None:
+        return {}
+    rank = _bson_sort_rank(last_id)
+    if rank is None:
+        logger.warning(f"Unrecognised _id type {type(last_id).__name__}; resuming with $gt only")
+        return {"_id": {"$gt": last_id}}
+    later_types = [alias for alias, _ in _BSON_SORT_ORDER[rank + 1:]]
+    if not later_types:
+        return {"_id": {"$gt": last_id}}
+    return {"$or": [{"_id": {"$gt": last_id}}, {"_id": {"$type": later_types}}]}
+
+
 class DataMigrationManager:
     """
     Comprehensive data migration manager for transitioning from demo to production data.
@@ -395,9 +497,16 @@ class DataMigrationManager:
         """
         Migrate a specific collection with data transformation.
         
+        Runs as a three-stage pipeline connected by bounded queues: a cursor
+        reader ordered by ``_id``, ``transform_workers`` concurrent transform
+        stages (optionally backed by a process pool), and a bulk writer.
+        After each contiguous run of written batches the last ``_id`` is
+        checkpointed so an interrupted migration resumes from there.
+        
         Args:
             collection_name: Name of the collection to migrate
-            transformer_func: Function to transform documents
+            transformer_func: Function to transform documents. Must be a
+                module-level function when ``process_pool_workers`` is set.
             target_model: Beanie document model for validation
         """
         start_time = datetime.utcnow()
@@ -418,81 +527,58 @@ class DataMigrationManager:
                     duration_seconds=0.0
                 )
             
+            checkpoint = await self._load_checkpoint(collection_name)
+            if checkpoint:
+                logger.info(
+                    f"⏩ Resuming {collection_name} after _id {checkpoint['last_id']} "
+                    f"({checkpoint['processed']} documents already processed)"
+                )
+            
             logger.info(f"📊 Processing {total_docs} documents in batches of {self.config.batch_size}")
             
-            processed = 0
-            migrated = 0
-            failed = 0
-            errors = []
+            state = {
+                "processed": checkpoint["processed"] if checkpoint else 0,
+                "migrated": checkpoint["migrated"] if checkpoint else 0,
+                "failed": checkpoint["failed"] if checkpoint else 0,
+                "errors": [],
+                "stage_seconds": {"read": 0.0, "transform": 0.0, "write": 0.0},
+                "batches": 0
+            }
+            resumed_from = checkpoint["processed"] if checkpoint else 0
             
-            # Process documents in batches
-            async for batch in self._get_document_batches(source_collection, self.config.batch_size):
-                try:
-                    transformed_batch = []
-                    
-                    for doc in batch:
-                        try:
-                            # Transform document
-                            transformed_doc = await transformer_func(doc)
-                            
-                            if transformed_doc:
-                                # Validate with target model if provided
-                                if target_model and self.config.validate_data:
-                                    try:
-                                        # Create model instance for validation
-                                        model_instance = target_model(**transformed_doc)
-                                        transformed_doc = model_instance.model_dump()
-                                    except Exception as validation_error:
-                                        errors.append(f"Validation failed for document {doc.get('_id')}: {validation_error}")
-                                        failed += 1
-                                        continue
-                                
-                                transformed_batch.append(transformed_doc)
-                            
-                        except Exception as transform_error:
-                            errors.append(f"Transform failed for document {doc.get('_id')}: {transform_error}")
-                            failed += 1
-                    
-                    # Insert transformed batch
-                    if transformed_batch and not self.config.dry_run:
-                        try:
-                            if self.config.skip_existing:
-                                # Use upsert to skip existing documents
-                                for doc in transformed_batch:
-                                    await target_collection.replace_one(
-                                        {"_id": doc["_id"]},
-                                        doc,
-                                        upsert=True
-                                    )
-                            else:
-                                # Insert all documents
-                                await target_collection.insert_many(transformed_batch, ordered=False)
-                            
-                            migrated += len(transformed_batch)
-                            
-                        except BulkWriteError as bulk_error:
-                            # Handle partial failures in bulk operations
-                            migrated += bulk_error.details.get("nInserted", 0)
-                            failed += len(bulk_error.details.get("writeErrors", []))
-                            
-                            for error in bulk_error.details.get("writeErrors", []):
-                                errors.append(f"Bulk write error: {error.get('errmsg', 'Unknown error')}")
-                    
-                    processed += len(batch)
-                    
-                    # Log progress
-                    if processed % (self.config.batch_size * 10) == 0:
-                        logger.info(f"📊 Progress: {processed}/{total_docs} processed, {migrated} migrated, {failed} failed")
-                
-                except Exception as batch_error:
-                    errors.append(f"Batch processing error: {str(batch_error)}")
-                    failed += len(batch)
+            process_pool = None
+            if self.config.process_pool_workers > 0:
+                process_pool = ProcessPoolExecutor(max_workers=self.config.process_pool_workers)
+            
+            try:
+                await self._run_migration_pipeline(
+                    collection_name=collection_name,
+                    source_collection=source_collection,
+                    target_collection=target_collection,
+                    transformer_func=transformer_func,
+                    target_model=target_model,
+                    start_after_id=checkpoint["last_id"] if checkpoint else None,
+                    total_docs=total_docs,
+                    state=state,
+                    process_pool=process_pool
+                )
+            finally:
+                if process_pool:
+                    process_pool.shutdown(wait=False, cancel_futures=True)
+            
+            processed = state["processed"]
+            migrated = state["migrated"]
+            failed = state["failed"]
+            errors = state["errors"]
             
             duration = (datetime.utcnow() - start_time).total_seconds()
             
             if self.config.dry_run:
                 logger.info(f"🧪 Dry run completed for {collection_name}: {processed} documents would be processed")
                 migrated = processed - failed  # Estimate for dry run
+            else:
+                # The collection is complete; a later run starts from the beginning
+                await self._clear_checkpoint(collection_name)
             
             success = failed == 0 or (migrated > 0 and failed < processed * 0.1)  # Allow up to 10% failure rate
             
@@ -503,11 +589,15 @@ class DataMigrationManager:
                 records_migrated=migrated,
                 records_failed=failed,
                 errors=errors[:100],  # Limit error list size
-                duration_seconds=duration
+                duration_seconds=duration,
+                metrics=self._pipeline_metrics(state, processed - resumed_from, duration)
             )
             
             if success:
-                logger.success(f"✅ Collection '{collection_name}' migrated: {migrated}/{processed} documents")
+                logger.success(
+                    f"✅ Collection '{collection_name}' migrated: {migrated}/{processed} documents "
+                    f"({result.metrics['documents_per_second']:.0f} docs/s)"
+                )
             else:
                 logger.warning(f"⚠️ Collection '{collection_name}' migration completed with errors: {failed} failed")
             
@@ -526,6 +616,218 @@ class DataMigrationManager:
                 errors=[error_msg]
             )
     
+    async def _run_migration_pipeline(
+        self,
+        collection_name: str,
+        source_collection,
+        target_collection,
+        transformer_func: callable,
+        target_model: Optional[Document],
+        start_after_id: Any,
+        total_docs: int,
+        state: Dict[str, Any],
+        process_pool: Optional[ProcessPoolExecutor]
+    ) -> None:
+        """Run the reader, transform and writer stages until the cursor is exhausted."""
+        workers = max(1, self.config.transform_workers)
+        read_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.queue_size)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.queue_size)
+        
+        async def reader():
+            cursor = source_collection.find(_resume_query(start_after_id)).sort("_id", 1).batch_size(self.config.batch_size)
+            sequence = 0
+            batch = []
+            started = time.perf_counter()
+            async for doc in cursor:
+                batch.append(doc)
+                if len(batch) >= self.config.batch_size:
+                    state["stage_seconds"]["read"] += time.perf_counter() - started
+                    await read_queue.put(_MigrationBatch(sequence, batch, last_id=batch[-1]["_id"]))
+                    sequence += 1
+                    batch = []
+                    started = time.perf_counter()
+            if batch:
+                state["stage_seconds"]["read"] += time.perf_counter() - started
+                await read_queue.put(_MigrationBatch(sequence, batch, last_id=batch[-1]["_id"]))
+            for _ in range(workers):
+                await read_queue.put(None)
+        
+        async def transformer():
+            while True:
+                batch = await read_queue.get()
+                if batch is None:
+                    await write_queue.put(None)
+                    return
+                started = time.perf_counter()
+                await self._transform_batch(batch, transformer_func, target_model, process_pool)
+                state["stage_seconds"]["transform"] += time.perf_counter() - started
+                await write_queue.put(batch)
+        
+        async def writer():
+            finished_workers = 0
+            pending: Dict[int, _MigrationBatch] = {}
+            next_sequence = 0
+            while finished_workers < workers:
+                batch = await write_queue.get()
+                if batch is None:
+                    finished_workers += 1
+                    continue
+                
+                started = time.perf_counter()
+                migrated, failed, errors = await self._write_batch(target_collection, batch.transformed)
+                state["stage_seconds"]["write"] += time.perf_counter() - started
+                
+                batch.migrated = migrated
+                batch.failed += failed
+                batch.errors.extend(errors)
+                batch.transformed = None
+                state["errors"].extend(batch.errors)
+                state["batches"] += 1
+                
+                # Batches finish out of order; only count and checkpoint a contiguous prefix
+                pending[batch.sequence] = batch
+                checkpoint_batch = None
+                while next_sequence in pending:
+                    checkpoint_batch = pending.pop(next_sequence)
+                    state["processed"] += len(checkpoint_batch.documents)
+                    state["migrated"] += checkpoint_batch.migrated
+                    state["failed"] += checkpoint_batch.failed
+                    next_sequence += 1
+                if checkpoint_batch is not None and not self.config.dry_run:
+                    await self._save_checkpoint(collection_name, checkpoint_batch.last_id, state)
+                
+                # Log progress
+                if state["batches"] % 10 == 0:
+                    logger.info(
+                        f"📊 Progress: {state['processed']}/{total_docs} processed, "
+                        f"{state['migrated']} migrated, {state['failed']} failed"
+                    )
+        
+        tasks = [asyncio.create_task(reader()), asyncio.create_task(writer())]
+        tasks.extend(asyncio.create_task(transformer()) for _ in range(workers))
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    
+    async def _transform_batch(
+        self,
+        batch: _MigrationBatch,
+        transformer_func: callable,
+        target_model: Optional[Document],
+        process_pool: Optional[ProcessPoolExecutor]
+    ) -> None:
+        """Transform and validate a batch in place."""
+        if process_pool:
+            # Split the batch so every pool worker transforms part of it
+            loop = asyncio.get_running_loop()
+            size = -(-len(batch.documents) // self.config.process_pool_workers)
+            slices = await asyncio.gather(*(
+                loop.run_in_executor(
+                    process_pool, _transform_batch_in_process, transformer_func, batch.documents[start:start + size]
+                )
+                for start in range(0, len(batch.documents), size)
+            ))
+            results = [result for part in slices for result in part]
+        else:
+            results = await _apply_transformer_to_all(transformer_func, batch.documents)
+        
+        batch.transformed = []
+        batch.errors = []
+        for doc, (transformed_doc, error) in zip(batch.documents, results):
+            if error:
+                batch.errors.append(error)
+                batch.failed += 1
+                continue
+            if not transformed_doc:
+                continue
+            
+            # Validate with target model if provided
+            if target_model and self.config.validate_data:
+                try:
+                    model_instance = target_model(**transformed_doc)
+                    transformed_doc = model_instance.model_dump()
+                    # Beanie dumps the primary key as "id"; store it as "_id"
+                    document_id = transformed_doc.pop("id", None)
+                    if document_id is not None and "_id" not in transformed_doc:
+                        transformed_doc["_id"] = document_id
+                except Exception as validation_error:
+                    batch.errors.append(f"Validation failed for document {doc.get('_id')}: {validation_error}")
+                    batch.failed += 1
+                    continue
+            
+            batch.transformed.append(transformed_doc)
+    
+    async def _write_batch(self, target_collection, documents: List[Dict[str, Any]]) -> Tuple[int, int, List[str]]:
+        """
+        Write a transformed batch with a single unordered bulk_write.
+        
+        Returns:
+            Tuple of (documents written, documents failed, error messages)
+        """
+        if not documents or self.config.dry_run:
+            return 0, 0, []
+        
+        if self.config.skip_existing:
+            # Upserts keep re-runs and resumed batches idempotent
+            requests = [
+                ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) if "_id" in doc else InsertOne(doc)
+                for doc in documents
+            ]
+        else:
+            requests = [InsertOne(doc) for doc in documents]
+        
+        try:
+            await target_collection.bulk_write(requests, ordered=False)
+            return len(documents), 0, []
+        except BulkWriteError as bulk_error:
+            # Handle partial failures in bulk operations
+            write_errors = bulk_error.details.get("writeErrors", [])
+            errors = [f"Bulk write error: {error.get('errmsg', 'Unknown error')}" for error in write_errors]
+            return len(documents) - len(write_errors), len(write_errors), errors
+    
+    def _checkpoint_key(self, collection_name: str) -> str:
+        return f"{self.config.source_database}.{collection_name}->{self.config.target_database}"
+    
+    async def _load_checkpoint(self, collection_name: str) -> Optional[Dict[str, Any]]:
+        """Load the resume checkpoint for a collection, if resuming is enabled."""
+        if not self.config.resume or self.config.dry_run:
+            return None
+        return await self.target_db[self.config.checkpoint_collection].find_one(
+            {"_id": self._checkpoint_key(collection_name)}
+        )
+    
+    async def _save_checkpoint(self, collection_name: str, last_id: Any, state: Dict[str, Any]) -> None:
+        await self.target_db[self.config.checkpoint_collection].replace_one(
+            {"_id": self._checkpoint_key(collection_name)},
+            {
+                "last_id": last_id,
+                "processed": state["processed"],
+                "migrated": state["migrated"],
+                "failed": state["failed"],
+                "updated_at": datetime.utcnow()
+            },
+            upsert=True
+        )
+    
+    async def _clear_checkpoint(self, collection_name: str) -> None:
+        await self.target_db[self.config.checkpoint_collection].delete_one(
+            {"_id": self._checkpoint_key(collection_name)}
+        )
+    
+    def _pipeline_metrics(self, state: Dict[str, Any], documents: int, duration: float) -> Dict[str, Any]:
+        """Throughput metrics for one migration run."""
+        return {
+            "documents_per_second": documents / duration if duration > 0 else 0.0,
+            "batches": state["batches"],
+            "stage_seconds": {stage: round(seconds, 3) for stage, seconds in state["stage_seconds"].items()},
+            "transform_workers": max(1, self.config.transform_workers),
+            "process_pool_workers": self.config.process_pool_workers
+        }
+    
     async def rollback_migration(self) -> MigrationResult:
         """Rollback migration using backup data."""
         start_time = datetime.utcnow()
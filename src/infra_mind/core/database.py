@@ -12,11 +12,13 @@ Features:
 
 import asyncio
 import ssl
+import warnings
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from beanie import init_beanie
 from pymongo import WriteConcern, ReadPreference
+from pymongo.compression_support import validate_compressors
 from pymongo.errors import (
     ConnectionFailure, 
     ServerSelectionTimeoutError,
@@ -30,6 +32,22 @@ import certifi
 from .config import settings
 from .database_optimization import optimize_database_for_production
 
+# Wire compressors in preference order (zlib is built in)
+_WIRE_COMPRESSORS = "zstd,zlib,snappy"
+
+
+def wire_compressors() -> str:
+    """
+    The MongoDB wire compressors this environment's pymongo can use.
+
+    pymongo drops a compressor whose package is missing with only a warning,
+    so ask it up front and configure (and log) what is actually used.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return ",".join(validate_compressors("compressors", _WIRE_COMPRESSORS))
+
+
 # Provide deterministic attributes for tests that rely on AsyncIOMotorDatabase collections
 if not hasattr(AsyncIOMotorDatabase, "assessments"):  # pragma: no cover - testing aid
     AsyncIOMotorDatabase.assessments = None  # type: ignore[attr-defined]
@@ -118,7 +136,7 @@ async def init_database() -> None:
                 "readPreference": "primaryPreferred",
                 
                 # Performance settings
-                "compressors": "zstd,zlib,snappy",
+                "compressors": wire_compressors(),
                 "zlibCompressionLevel": 6,
                 
                 # SSL/TLS settings
@@ -130,7 +148,7 @@ async def init_database() -> None:
             if ssl_context:
                 connection_options["tlsCAFile"] = certifi.where()
             
-            logger.info(f"📊 Connection pool settings: max={settings.mongodb_max_connections}, min={settings.mongodb_min_connections}")
+            logger.info(f"📊 Connection pool settings: max={settings.mongodb_max_connections}, min={settings.mongodb_min_connections}, compressors={connection_options['compressors']}")
             
             # Create MongoDB client with production settings
             db.client = AsyncIOMotorClient(db_url, **connection_options)
@@ -503,6 +521,17 @@ async def create_production_indexes() -> None:
     await _safe_create_index(db.database.audit_logs, [("timestamp", 1)], expireAfterSeconds=31536000, name="idx_audit_logs_ttl")
     created_indexes.extend(["audit_logs_user_timestamp", "audit_logs_action_timestamp", "audit_logs_resource", "audit_logs_ip_timestamp", "audit_logs_user_agent_timestamp", "audit_logs_severity_timestamp", "audit_logs_ttl"])
 
+    # === KEYSET PAGINATION INDEXES ===
+    # List endpoints page newest-first on (sort key, _id) after the owner filter (see api/pagination.py),
+    # so each page is one index seek however deep it is
+    logger.info("📑 Creating keyset pagination indexes...")
+    await _safe_create_index(db.database.assessments, [("user_id", 1), ("created_at", -1), ("_id", -1)], name="idx_assessments_user_created_id")
+    await _safe_create_index(db.database.reports, [("user_id", 1), ("created_at", -1), ("_id", -1)], name="idx_reports_user_created_id")
+    await _safe_create_index(db.database.recommendations, [("assessment_id", 1), ("created_at", -1), ("_id", -1)], name="idx_recommendations_assessment_created_id")
+    await _safe_create_index(db.database.recommendations, [("created_at", -1), ("_id", -1)], name="idx_recommendations_created_id")
+    await _safe_create_index(db.database.conversations, [("user_id", 1), ("last_activity", -1), ("_id", -1)], name="idx_conversations_user_activity_id")
+    created_indexes.extend(["assessments_user_created_id", "reports_user_created_id", "recommendations_assessment_created_id", "recommendations_created_id", "conversations_user_activity_id"])
+
     # Calculate index creation time
     end_time = datetime.utcnow()
     creation_time = (end_time - start_time).total_seconds()
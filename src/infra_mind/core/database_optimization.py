@@ -129,13 +129,57 @@ class DatabaseOptimizer:
                 IndexModel([("feature_flag", ASCENDING), ("timestamp", DESCENDING)]),
                 IndexModel([("user_id", ASCENDING), ("timestamp", DESCENDING)]),
                 IndexModel([("event_type", ASCENDING), ("timestamp", DESCENDING)]),
-                IndexModel([("variant_name", ASCENDING), ("event_type", ASCENDING)])
+                IndexModel([("variant_name", ASCENDING), ("event_type", ASCENDING)]),
+                IndexModel([("experiment_id", ASCENDING), ("variant_id", ASCENDING), ("event_name", ASCENDING)])
             ]
             
             result = await self._safe_create_indexes("experiment_events", experiment_event_indexes)
             if result:
                 created_indexes["experiment_events"] = result
             
+            # Experiment assignment indexes for variant lookups and aggregation
+            experiment_assignment_indexes = [
+                IndexModel([("experiment_id", ASCENDING), ("user_id", ASCENDING)]),
+                IndexModel([("user_id", ASCENDING)]),
+                IndexModel([("experiment_id", ASCENDING), ("variant_id", ASCENDING)])
+            ]
+            
+            result = await self._safe_create_indexes("experiment_assignments", experiment_assignment_indexes)
+            if result:
+                created_indexes["experiment_assignments"] = result
+            
+            # Incremental per-variant statistics counters
+            experiment_stats_indexes = [
+                IndexModel(
+                    [("experiment_id", ASCENDING), ("variant_id", ASCENDING), ("event_name", ASCENDING)],
+                    unique=True
+                )
+            ]
+            
+            result = await self._safe_create_indexes("experiment_variant_stats", experiment_stats_indexes)
+            if result:
+                created_indexes["experiment_variant_stats"] = result
+            
+            # Materialized dashboard stats: contributions are swept per user on reconciliation
+            dashboard_contribution_indexes = [
+                IndexModel([("user_id", ASCENDING), ("updated_at", ASCENDING)])
+            ]
+            
+            result = await self._safe_create_indexes("dashboard_stat_contributions", dashboard_contribution_indexes)
+            if result:
+                created_indexes["dashboard_stat_contributions"] = result
+            
+            # Incremental re-run snapshots: loaded per assessment, expire after 30 days
+            # (workflows.incremental.SNAPSHOT_TTL_DAYS)
+            snapshot_indexes = [
+                IndexModel([("assessment_id", ASCENDING), ("stage", ASCENDING)]),
+                IndexModel([("updated_at", ASCENDING)], expireAfterSeconds=30 * 86400)
+            ]
+            
+            result = await self._safe_create_indexes("agent_result_snapshots", snapshot_indexes)
+            if result:
+                created_indexes["agent_result_snapshots"] = result
+            
             # Feedback indexes for analytics and reporting
             feedback_indexes = [
                 IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
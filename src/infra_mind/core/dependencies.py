@@ -17,6 +17,8 @@ from fastapi import Depends
 from functools import lru_cache
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
+from .query_optimizer import RequestLoaders
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -188,6 +190,34 @@ async def get_database() -> AsyncIOMotorDatabase:
 DatabaseDep = Annotated[AsyncIOMotorDatabase, Depends(get_database)]
 
 
+# ============================================================================
+# Request-Scoped Query Batching
+# ============================================================================
+
+async def get_request_loaders(db: DatabaseDep) -> RequestLoaders:
+    """
+    Provide a DataLoader registry for the current request.
+
+    FastAPI resolves a dependency once per request, so every use of
+    ``LoadersDep`` within a request shares the same batching caches and
+    nothing leaks across requests.
+
+    Returns:
+        RequestLoaders bound to the request's database
+
+    Usage:
+        @router.get("/reports")
+        async def list_reports(loaders: LoadersDep):
+            await loaders.assessments.load_many(assessment_ids)  # one query
+            assessment = await loaders.assessments.load(assessment_id)  # cached
+    """
+    return RequestLoaders(db)
+
+
+# Type alias
+LoadersDep = Annotated[RequestLoaders, Depends(get_request_loaders)]
+
+
 # ============================================================================
 # Event Manager Dependencies
 # ============================================================================
@@ -316,9 +346,14 @@ async def cleanup_dependencies():
         # Shutdown
         await cleanup_dependencies()
     """
+    from ..llm.manager import shutdown_shared_llm_managers
+    from ..services.report_renderer import shutdown_report_renderer
+
     await close_database_client()
     await close_event_manager()
     await close_cache_manager()
+    await shutdown_shared_llm_managers()
+    shutdown_report_renderer()
     logger.info("✅ All dependencies cleaned up")
 
 
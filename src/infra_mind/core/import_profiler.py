@@ -0,0 +1,161 @@
+"""
+Startup import profiler.
+
+Measures what importing a module costs in a fresh interpreter: wall time,
+peak resident memory and the per-module breakdown reported by CPython's
+``-X importtime``. Running in a subprocess keeps the numbers independent
+of whatever the calling process has already imported.
+
+Usage:
+```bash
+# Top 25 modules by cumulative import time
+python -m infra_mind.core.import_profiler infra_mind.main --top 25
+```
+
+```python
+profile = profile_import("infra_mind.main")
+print(profile.total_seconds, profile.peak_rss_mb)
+for entry in profile.top(10):
+    print(entry.module, entry.cumulative_us)
+```
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+# Runs in the child: import the target, then report wall time, peak RSS
+# and which of the watched modules ended up loaded.
+_CHILD_SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss_kb //= 1024
+print(json.dumps({{"seconds": elapsed, "peak_rss_kb": rss_kb, "modules": sorted(sys.modules)}}))
+"""
+
+
+@dataclass
+class ModuleImportCost:
+    """Import cost of a single module as reported by ``-X importtime``."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class ImportProfile:
+    """Result of profiling one top-level import."""
+
+    module: str
+    total_seconds: float
+    peak_rss_mb: float
+    modules: List[ModuleImportCost] = field(default_factory=list)
+    loaded_modules: List[str] = field(default_factory=list)
+
+    def top(self, count: int = 20) -> List[ModuleImportCost]:
+        """Modules with the highest cumulative import time."""
+        return sorted(self.modules, key=lambda m: m.cumulative_us, reverse=True)[:count]
+
+    def loaded(self, prefix: str) -> bool:
+        """Whether ``prefix`` or any of its submodules was imported."""
+        return any(name == prefix or name.startswith(prefix + ".") for name in self.loaded_modules)
+
+    def to_dict(self, top: int = 20) -> Dict:
+        return {
+            "module": self.module,
+            "total_seconds": round(self.total_seconds, 3),
+            "peak_rss_mb": round(self.peak_rss_mb, 1),
+            "loaded_module_count": len(self.loaded_modules),
+            "top_modules": [asdict(entry) for entry in self.top(top)],
+        }
+
+
+def parse_importtime(output: str) -> List[ModuleImportCost]:
+    """Parse ``-X importtime`` stderr lines into per-module costs."""
+    costs = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        costs.append(ModuleImportCost(
+            module=parts[2].strip(),
+            self_us=int(parts[0]),
+            cumulative_us=int(parts[1])
+        ))
+    return costs
+
+
+def profile_import(
+    module: str,
+    env: Optional[Dict[str, str]] = None,
+    cwd: Optional[str] = None,
+    timeout: float = 120.0
+) -> ImportProfile:
+    """
+    Import ``module`` in a fresh interpreter and measure the cost.
+
+    Args:
+        module: Dotted module path to import
+        env: Extra environment variables for the child process
+        cwd: Working directory for the child process
+        timeout: Seconds to wait for the import
+
+    Raises:
+        RuntimeError: If the import fails in the child process
+    """
+    child_env = {**os.environ, **(env or {})}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=child_env,
+        cwd=cwd,
+        timeout=timeout
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"Importing {module} failed:\n" + "\n".join(errors[-20:]))
+
+    summary = json.loads(result.stdout.strip().splitlines()[-1])
+    return ImportProfile(
+        module=module,
+        total_seconds=summary["seconds"],
+        peak_rss_mb=summary["peak_rss_kb"] / 1024,
+        modules=parse_importtime(result.stderr),
+        loaded_modules=summary["modules"]
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile the import cost of a module")
+    parser.add_argument("module", nargs="?", default="infra_mind.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=25, help="Number of modules to report")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    profile = profile_import(args.module)
+    if args.json:
+        print(json.dumps(profile.to_dict(args.top), indent=2))
+        return 0
+
+    print(f"import {profile.module}: {profile.total_seconds:.2f}s, "
+          f"peak RSS {profile.peak_rss_mb:.0f} MB, {len(profile.loaded_modules)} modules")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for entry in profile.top(args.top):
+        print(f"{entry.cumulative_us / 1000:>14.1f} {entry.self_us / 1000:>9.1f}  {entry.module}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
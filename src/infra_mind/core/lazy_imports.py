@@ -0,0 +1,65 @@
+"""
+Lazy attribute imports for packages that re-export heavy submodules.
+
+Package ``__init__`` modules that re-export provider clients force every
+provider SDK to load as soon as any submodule is imported, because Python
+always executes the parent package first. ``lazy_exports`` builds module
+level ``__getattr__``/``__dir__`` hooks (PEP 562) so the public names stay
+importable from the package while the submodules load on first access.
+
+Usage:
+```python
+# cloud/__init__.py
+from ..core.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "aws": ["AWSClient", "AWSPricingClient"],
+    "base": ["CloudProvider", "CloudServiceError"],
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _EXPORTS)
+
+# Importing cloud.base no longer loads boto3; this does
+from infra_mind.cloud import AWSClient
+```
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, Iterable[str]]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]], List[str]]:
+    """
+    Build PEP 562 hooks that resolve public names from submodules on demand.
+
+    Args:
+        package: ``__name__`` of the package defining the hooks
+        exports: Mapping of submodule name to the attributes it provides
+
+    Returns:
+        ``(__getattr__, __dir__, __all__)`` for the package module
+    """
+    attribute_modules = {
+        attribute: submodule
+        for submodule, attributes in exports.items()
+        for attribute in attributes
+    }
+    public_names = list(attribute_modules)
+
+    def __getattr__(name: str) -> object:
+        submodule = attribute_modules.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f".{submodule}", package), name)
+        # Cache on the package so later lookups bypass __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(public_names))
+
+    return __getattr__, __dir__, public_names
@@ -24,6 +24,7 @@ from ..core.config import get_settings
 from ..core.cache import cache_manager
 from ..core.database import db
 from ..core.metrics_collector import get_metrics_collector
+from ..llm.token_budget_manager import get_token_budget_manager
 
 logger = logging.getLogger(__name__)
 
@@ -582,9 +583,8 @@ class LLMPromptOptimizer:
         ]
     
     def _count_tokens(self, text: str) -> int:
-        """Estimate token count (simplified)."""
-        # This is a rough approximation - in practice, use tiktoken or similar
-        return len(text.split()) + len(text) // 4
+        """Count tokens using the shared memoized token counter."""
+        return get_token_budget_manager().count_tokens(text)
     
     def optimize_prompt(self, agent_name: str, original_prompt: str) -> Tuple[str, Dict[str, Any]]:
         """
@@ -0,0 +1,384 @@
+"""
+Authenticated principal cache for Infra Mind.
+
+Caches resolved users so that authenticated requests do not re-read the
+user document from MongoDB on every call, and provides a bloom filter that
+lets the token blacklist skip its lookup for tokens that were never revoked.
+"""
+
+import os
+import json
+import math
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Set, Tuple, Any
+
+import redis
+
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_CACHE_ENABLED = os.getenv("PRINCIPAL_CACHE_ENABLED", "true").lower() in {"1", "true", "yes"}
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "10000"))
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+PRINCIPAL_CACHE_REDIS_TTL_SECONDS = int(os.getenv("PRINCIPAL_CACHE_REDIS_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_REVOCATION_POLL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_REVOCATION_POLL_SECONDS", "1"))
+
+# Never written to the shared Redis tier
+CREDENTIAL_FIELDS = frozenset({
+    "hashed_password",
+    "mfa_secret",
+    "mfa_backup_codes",
+    "password_reset_token",
+    "password_reset_expires",
+    "email_verification_token",
+})
+
+# Sorted set of "token:<jti>" / "user:<id>" invalidations scored by wall time
+REVOCATIONS_KEY = "principal:revocations"
+REVOCATION_CLOCK_SKEW_SECONDS = 2.0
+
+
+class BloomFilter:
+    """
+    Fixed-size bloom filter for string keys.
+
+    A negative answer is definitive, a positive answer may be a false positive.
+    Used to prove that a token JTI has not been revoked by this process without
+    consulting the blacklist backend.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        """
+        Initialize bloom filter.
+
+        Args:
+            capacity: Expected number of inserted keys
+            error_rate: Target false positive rate at capacity
+        """
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # Double hashing (Kirsch-Mitzenmacher) from a single digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def clear(self) -> None:
+        """Reset the filter."""
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+
+class PrincipalCache:
+    """
+    Two-tier cache of authenticated principals.
+
+    The first tier is an in-process LRU keyed by user id with a short TTL.
+    The optional second tier stores the user in Redis, without
+    ``CREDENTIAL_FIELDS``, so that workers share warm entries. Users read
+    from it must go through ``load_credentials`` before their password or
+    MFA secrets are checked or the document is saved. Token JTIs that
+    passed the full blacklist check are remembered per user, which lets the
+    hot path skip the blacklist backend until the entry expires or is
+    invalidated.
+
+    Invalidation:
+    - ``invalidate_token`` drops a single session (logout)
+    - ``invalidate_user`` drops the user and all of their sessions
+      (role change, deactivation, any write to the user document)
+
+    Both are published to a shared revocation log in Redis that every
+    process polls at most once per ``revocation_poll_seconds``, so a
+    revocation on another process is honoured within that interval rather
+    than the cache TTL. If the log cannot be read, verified tokens go back
+    to the blacklist backend.
+    """
+
+    def __init__(
+        self,
+        max_size: int = PRINCIPAL_CACHE_MAX_SIZE,
+        ttl_seconds: float = PRINCIPAL_CACHE_TTL_SECONDS,
+        redis_ttl_seconds: int = PRINCIPAL_CACHE_REDIS_TTL_SECONDS,
+        redis_client: Optional[Any] = None,
+        enabled: bool = PRINCIPAL_CACHE_ENABLED,
+        revocation_poll_seconds: float = PRINCIPAL_CACHE_REVOCATION_POLL_SECONDS,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.revocation_poll_seconds = revocation_poll_seconds
+        self.enabled = enabled
+        self._redis_client = redis_client
+        self._redis_initialized = redis_client is not None
+        self._users: "OrderedDict[str, Tuple[float, User]]" = OrderedDict()
+        self._tokens: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._user_tokens: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._revocations_synced_at = 0.0
+        self._next_revocation_poll = 0.0
+        self.stats = {"hits": 0, "redis_hits": 0, "misses": 0, "invalidations": 0}
+
+    @property
+    def redis_client(self):
+        """Lazily connect the optional Redis tier."""
+        if not self._redis_initialized:
+            self._redis_initialized = True
+            redis_url = os.getenv("REDIS_URL")
+            if redis_url:
+                try:
+                    self._redis_client = redis.from_url(redis_url, decode_responses=True)
+                except Exception as e:
+                    logger.warning(f"Principal cache Redis tier disabled: {e}")
+                    self._redis_client = None
+        return self._redis_client
+
+    @staticmethod
+    def _redis_key(user_id: str) -> str:
+        return f"principal:{user_id}"
+
+    @staticmethod
+    def _copy(user: User) -> User:
+        # Hand out copies so request handlers cannot mutate the shared entry
+        model_copy = getattr(user, "model_copy", None)
+        return model_copy(deep=True) if model_copy else user
+
+    def _evict_overflow(self) -> None:
+        while len(self._users) > self.max_size:
+            user_id, _ = self._users.popitem(last=False)
+            self._drop_user_tokens(user_id)
+        while len(self._tokens) > self.max_size:
+            jti, (_, user_id) = self._tokens.popitem(last=False)
+            self._user_tokens.get(user_id, set()).discard(jti)
+
+    def _drop_user_tokens(self, user_id: str) -> None:
+        for jti in self._user_tokens.pop(user_id, set()):
+            self._tokens.pop(jti, None)
+
+    def _drop_token(self, jti: str) -> None:
+        entry = self._tokens.pop(jti, None)
+        if entry:
+            self._user_tokens.get(entry[1], set()).discard(jti)
+
+    def _drop_user(self, user_id: str) -> None:
+        self._users.pop(user_id, None)
+        self._drop_user_tokens(user_id)
+
+    def _publish_revocation(self, event: str) -> None:
+        client = self.redis_client
+        if not client:
+            return
+        try:
+            now = time.time()
+            client.zadd(REVOCATIONS_KEY, {event: now})
+            # Older events only concern entries that have expired everywhere
+            horizon = max(self.ttl_seconds, self.redis_ttl_seconds) + REVOCATION_CLOCK_SKEW_SECONDS
+            client.zremrangebyscore(REVOCATIONS_KEY, "-inf", now - horizon)
+        except Exception as e:
+            logger.warning(f"Principal cache revocation publish failed: {e}")
+
+    def _sync_revocations(self) -> bool:
+        """
+        Apply invalidations published by other processes.
+
+        Returns:
+            False if the shared revocation log could not be read
+        """
+        client = self.redis_client
+        if not client or time.monotonic() < self._next_revocation_poll:
+            return True
+        started = time.time()
+        try:
+            events = client.zrangebyscore(
+                REVOCATIONS_KEY, self._revocations_synced_at - REVOCATION_CLOCK_SKEW_SECONDS, "+inf"
+            )
+        except Exception as e:
+            logger.warning(f"Principal cache revocation sync failed: {e}")
+            return False
+        with self._lock:
+            for event in events:
+                kind, _, key = event.partition(":")
+                if kind == "token":
+                    self._drop_token(key)
+                elif kind == "user":
+                    self._drop_user(key)
+            self._revocations_synced_at = started
+            self._next_revocation_poll = time.monotonic() + self.revocation_poll_seconds
+        return True
+
+    def is_token_verified(self, jti: Optional[str], user_id: str) -> bool:
+        """
+        Check whether a token passed the blacklist check within the TTL.
+
+        Args:
+            jti: JWT ID
+            user_id: Subject of the token
+
+        Returns:
+            True if the token can skip the blacklist backend
+        """
+        if not self.enabled or not jti or not self._sync_revocations():
+            return False
+        with self._lock:
+            entry = self._tokens.get(jti)
+            if not entry:
+                return False
+            expires_at, cached_user_id = entry
+            if expires_at < time.monotonic() or cached_user_id != user_id:
+                self._tokens.pop(jti, None)
+                self._user_tokens.get(cached_user_id, set()).discard(jti)
+                return False
+            self._tokens.move_to_end(jti)
+            return True
+
+    def mark_token_verified(self, jti: Optional[str], user_id: str) -> None:
+        """Remember that a token passed the full blacklist check."""
+        if not self.enabled or not jti:
+            return
+        with self._lock:
+            self._tokens[jti] = (time.monotonic() + self.ttl_seconds, user_id)
+            self._tokens.move_to_end(jti)
+            self._user_tokens.setdefault(user_id, set()).add(jti)
+            self._evict_overflow()
+
+    async def get_user(self, user_id: str) -> Optional[User]:
+        """
+        Resolve a user through the cache tiers, falling back to MongoDB.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            User object or None if the user does not exist. Users served
+            from the Redis tier carry no credentials (see ``load_credentials``).
+        """
+        if not self.enabled:
+            return await User.get(user_id)
+
+        synced = self._sync_revocations()
+        with self._lock:
+            entry = self._users.get(user_id) if synced else None
+            if entry and entry[0] >= time.monotonic():
+                self._users.move_to_end(user_id)
+                self.stats["hits"] += 1
+                return self._copy(entry[1])
+
+        user = self._get_from_redis(user_id)
+        if user is not None:
+            self.stats["redis_hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            user = await User.get(user_id)
+            if user is None:
+                return None
+            self._set_in_redis(user_id, user)
+
+        with self._lock:
+            self._users[user_id] = (time.monotonic() + self.ttl_seconds, user)
+            self._users.move_to_end(user_id)
+            self._evict_overflow()
+        return self._copy(user)
+
+    def _get_from_redis(self, user_id: str) -> Optional[User]:
+        client = self.redis_client
+        if not client:
+            return None
+        try:
+            data = client.get(self._redis_key(user_id))
+            if not data:
+                return None
+            # hashed_password is required; the placeholder never verifies
+            user = User.model_validate({**json.loads(data), "hashed_password": ""})
+            user._credentials_loaded = False
+            return user
+        except Exception as e:
+            logger.warning(f"Principal cache Redis read failed: {e}")
+            return None
+
+    def _set_in_redis(self, user_id: str, user: User) -> None:
+        client = self.redis_client
+        if not client or not hasattr(user, "model_dump_json"):
+            return
+        try:
+            client.setex(
+                self._redis_key(user_id),
+                self.redis_ttl_seconds,
+                user.model_dump_json(exclude=set(CREDENTIAL_FIELDS)),
+            )
+        except Exception as e:
+            logger.warning(f"Principal cache Redis write failed: {e}")
+
+    async def load_credentials(self, user: User) -> Optional[User]:
+        """
+        Return the user with password and MFA fields loaded.
+
+        Users served from the Redis tier are re-read from MongoDB; saving
+        them as-is would overwrite the stored credentials.
+
+        Args:
+            user: User returned by ``get_user``
+
+        Returns:
+            User with credentials, or None if it no longer exists
+        """
+        if getattr(user, "_credentials_loaded", True):
+            return user
+        return await User.get(user.id)
+
+    def invalidate_token(self, jti: Optional[str]) -> None:
+        """Drop a single session from the cache (e.g. on logout)."""
+        if not jti:
+            return
+        with self._lock:
+            self._drop_token(jti)
+        self._publish_revocation(f"token:{jti}")
+
+    def invalidate_user(self, user_id: Optional[str]) -> None:
+        """
+        Drop a user and all of their sessions from every cache tier.
+
+        Called on role change, deactivation and any other write to the user.
+        """
+        if not user_id:
+            return
+        user_id = str(user_id)
+        with self._lock:
+            self._drop_user(user_id)
+            self.stats["invalidations"] += 1
+        client = self.redis_client
+        if client:
+            try:
+                client.delete(self._redis_key(user_id))
+            except Exception as e:
+                logger.warning(f"Principal cache Redis invalidation failed: {e}")
+        self._publish_revocation(f"user:{user_id}")
+
+    def clear(self) -> None:
+        """Clear the in-process tier."""
+        with self._lock:
+            self._users.clear()
+            self._tokens.clear()
+            self._user_tokens.clear()
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache()
@@ -198,6 +198,33 @@ llm_api_errors_total = Counter(
 )
 
 
+# LLM request scheduler (see llm/rate_scheduler.py)
+llm_scheduler_queue_depth = Gauge(
+    'llm_scheduler_queue_depth',
+    'LLM requests waiting for rate budget',
+    ['provider', 'model', 'priority']
+)
+
+llm_scheduler_wait_seconds = Histogram(
+    'llm_scheduler_wait_seconds',
+    'Time LLM requests waited for rate budget in seconds',
+    ['provider', 'model', 'priority'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+
+llm_scheduler_utilization = Gauge(
+    'llm_scheduler_utilization',
+    'Share of the per-minute budget used over the last minute',
+    ['provider', 'model', 'budget']
+)
+
+llm_scheduler_rate_limited_total = Counter(
+    'llm_scheduler_rate_limited_total',
+    'Provider rate-limit errors seen by the LLM scheduler',
+    ['provider', 'model']
+)
+
+
 # ==================== BUSINESS METRICS ====================
 
 # Users
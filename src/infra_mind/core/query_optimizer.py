@@ -40,6 +40,12 @@ from infra_mind.core.query_optimizer import (
 user_loader = batch_loader(User, key_field="id")
 user = await user_loader.load(user_id)
 
+# Request-scoped loaders in endpoints
+@router.get("/reports")
+async def list_reports(loaders: LoadersDep):
+    await loaders.assessments.load_many(assessment_ids)  # 1 query for all items
+    assessment = await loaders.assessments.load(assessment_id)  # cache hit
+
 # Preload relationships
 assessments = await preload_relations(
     Assessment.find_all(),
@@ -132,6 +138,7 @@ class DataLoader(Generic[T]):
         batch_load_fn: Callable[[List[Any]], List[T]],
         max_batch_size: int = 100,
         cache: bool = True,
+        cache_missing: bool = False,
     ):
         """
         Initialize DataLoader.
@@ -140,10 +147,13 @@ class DataLoader(Generic[T]):
             batch_load_fn: Async function that loads items in batch
             max_batch_size: Maximum items per batch
             cache: Enable caching of loaded items
+            cache_missing: Also cache keys that loaded as None (safe for
+                short-lived, request-scoped loaders)
         """
         self.batch_load_fn = batch_load_fn
         self.max_batch_size = max_batch_size
         self.cache_enabled = cache
+        self.cache_missing = cache_missing
 
         # Batching state
         self._queue: List[Tuple[Any, asyncio.Future]] = []
@@ -221,17 +231,15 @@ class DataLoader(Generic[T]):
             results = await self.batch_load_fn(keys)
             execution_time = time.time() - start_time
 
-            # Create result map
-            result_map = {
-                getattr(item, 'id', None) or key: item
-                for key, item in zip(keys, results)
-            }
+            # batch_load_fn returns results in key order; map by the
+            # requested key (item ids may be ObjectIds while keys are strings)
+            result_map = dict(zip(keys, results))
 
             # Cache results
             cached_count = 0
             if self.cache_enabled:
                 for key, result in result_map.items():
-                    if result is not None:
+                    if result is not None or self.cache_missing:
                         self._cache[key] = result
                         cached_count += 1
 
@@ -473,6 +481,109 @@ async def preload_relations(
     return items
 
 
+def _object_id(value: Any) -> Any:
+    """Convert string ids to ObjectId where possible."""
+    from bson import ObjectId
+    if isinstance(value, str) and ObjectId.is_valid(value):
+        return ObjectId(value)
+    return value
+
+
+class RequestLoaders:
+    """
+    Request-scoped DataLoader registry over the injected Motor database.
+
+    One instance is created per request (see ``LoadersDep`` in
+    ``core.dependencies``), so caches never outlive the request and cannot
+    serve stale or another user's data. Loaders are created on first use and
+    return raw MongoDB documents.
+
+    Endpoints that render a list should prime the loaders with every key
+    up front (``load_many``) and then call ``load`` per item; the per-item
+    calls are answered from the cache.
+    """
+
+    def __init__(self, db: Any, max_batch_size: int = 100):
+        """
+        Initialize loader registry.
+
+        Args:
+            db: Motor database for this request
+            max_batch_size: Maximum keys per batched query
+        """
+        self.db = db
+        self.max_batch_size = max_batch_size
+        self._loaders: Dict[str, DataLoader] = {}
+
+    def _get_or_create(self, name: str, batch_load_fn: Callable) -> DataLoader:
+        loader = self._loaders.get(name)
+        if loader is None:
+            loader = DataLoader(
+                batch_load_fn=batch_load_fn,
+                max_batch_size=self.max_batch_size,
+                cache=True,
+                cache_missing=True,
+            )
+            self._loaders[name] = loader
+        return loader
+
+    def _documents_by_id(self, collection_name: str) -> Callable:
+        async def batch_load_fn(keys: List[Any]) -> List[Optional[Dict[str, Any]]]:
+            docs = await self.db[collection_name].find(
+                {"_id": {"$in": [_object_id(key) for key in keys]}}
+            ).to_list(length=None)
+            docs_by_id = {str(doc["_id"]): doc for doc in docs}
+            return [docs_by_id.get(str(key)) for key in keys]
+        return batch_load_fn
+
+    def _counts_by_assessment(self, collection_name: str) -> Callable:
+        async def batch_load_fn(keys: List[Any]) -> List[int]:
+            groups = await self.db[collection_name].aggregate([
+                {"$match": {"assessment_id": {"$in": [str(key) for key in keys]}}},
+                {"$group": {"_id": "$assessment_id", "count": {"$sum": 1}}}
+            ]).to_list(length=None)
+            counts = {group["_id"]: group["count"] for group in groups}
+            return [counts.get(str(key), 0) for key in keys]
+        return batch_load_fn
+
+    @property
+    def users(self) -> DataLoader:
+        """User documents by id."""
+        return self._get_or_create("users", self._documents_by_id("users"))
+
+    @property
+    def assessments(self) -> DataLoader:
+        """Assessment documents by id."""
+        return self._get_or_create("assessments", self._documents_by_id("assessments"))
+
+    @property
+    def recommendations_by_assessment(self) -> DataLoader:
+        """Lists of recommendation documents keyed by assessment id."""
+        async def batch_load_fn(keys: List[Any]) -> List[List[Dict[str, Any]]]:
+            docs = await self.db.recommendations.find(
+                {"assessment_id": {"$in": [str(key) for key in keys]}}
+            ).to_list(length=None)
+            groups = defaultdict(list)
+            for doc in docs:
+                groups[doc.get("assessment_id")].append(doc)
+            return [groups.get(str(key), []) for key in keys]
+        return self._get_or_create("recommendations_by_assessment", batch_load_fn)
+
+    @property
+    def recommendation_counts(self) -> DataLoader:
+        """Number of recommendations keyed by assessment id."""
+        return self._get_or_create("recommendation_counts", self._counts_by_assessment("recommendations"))
+
+    @property
+    def report_counts(self) -> DataLoader:
+        """Number of reports keyed by assessment id."""
+        return self._get_or_create("report_counts", self._counts_by_assessment("reports"))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get metrics for the loaders used in this request."""
+        return {name: loader.get_metrics() for name, loader in self._loaders.items()}
+
+
 async def get_batching_stats() -> Dict[str, Any]:
     """Get query batching statistics."""
     return query_batcher.get_all_metrics()
@@ -6,7 +6,7 @@ permission management with audit logging integration.
 """
 
 from enum import Enum
-from typing import List, Set, Optional, Dict, Any
+from typing import List, Set, Optional, Dict, Any, Iterable
 from functools import wraps
 from datetime import datetime, timezone
 import logging
@@ -325,6 +325,41 @@ class RolePermissions:
         }
     }
     
+    # Compiled bitsets, populated by compile() at import time
+    PERMISSION_BITS: Dict[Permission, int] = {}
+    ROLE_MASKS: Dict[Role, int] = {}
+    
+    @classmethod
+    def compile(cls) -> None:
+        """
+        Compile role permission sets into integer bitmasks.
+        
+        Each permission gets one bit, each role a mask of its permissions,
+        so permission checks become a single AND. Call again after changing
+        ROLE_PERMISSIONS at runtime.
+        """
+        cls.PERMISSION_BITS = {
+            permission: 1 << index
+            for index, permission in enumerate(Permission.get_all_permissions())
+        }
+        cls.ROLE_MASKS = {
+            role: cls.mask_for(cls.ROLE_PERMISSIONS.get(role, set()))
+            for role in Role.get_all_roles()
+        }
+    
+    @classmethod
+    def mask_for(cls, permissions: Iterable[Permission]) -> int:
+        """Build a bitmask from a collection of permissions."""
+        mask = 0
+        for permission in permissions:
+            mask |= cls.PERMISSION_BITS.get(permission, 0)
+        return mask
+    
+    @classmethod
+    def get_permission_mask(cls, role: Role) -> int:
+        """Get the compiled permission bitmask for a role."""
+        return cls.ROLE_MASKS.get(role, 0)
+    
     @classmethod
     def get_permissions(cls, role: Role) -> Set[Permission]:
         """Get permissions for a role."""
@@ -333,7 +368,7 @@ class RolePermissions:
     @classmethod
     def has_permission(cls, role: Role, permission: Permission) -> bool:
         """Check if a role has a specific permission."""
-        return permission in cls.get_permissions(role)
+        return bool(cls.ROLE_MASKS.get(role, 0) & cls.PERMISSION_BITS.get(permission, 0))
     
     @classmethod
     def get_role_hierarchy(cls) -> Dict[Role, int]:
@@ -363,6 +398,50 @@ class RolePermissions:
         return summary
 
 
+RolePermissions.compile()
+
+
+# Permissions that grant access to resources owned by other users
+ALL_RESOURCES_PERMISSION_MAP = {
+    Permission.READ_ASSESSMENT: Permission.READ_ALL_ASSESSMENTS,
+    Permission.UPDATE_ASSESSMENT: Permission.MANAGE_ASSESSMENTS,
+    Permission.DELETE_ASSESSMENT: Permission.MANAGE_ASSESSMENTS,
+    Permission.READ_REPORT: Permission.READ_ALL_REPORTS,
+    Permission.UPDATE_REPORT: Permission.MANAGE_REPORTS,
+    Permission.DELETE_REPORT: Permission.MANAGE_REPORTS,
+    Permission.READ_USER: Permission.READ_ALL_USERS,
+    Permission.UPDATE_USER: Permission.MANAGE_USERS,
+    Permission.DELETE_USER: Permission.MANAGE_USERS,
+}
+
+# Read permissions reported by get_accessible_resources
+ALL_READ_PERMISSION_MAP = {
+    Permission.READ_ASSESSMENT: Permission.READ_ALL_ASSESSMENTS,
+    Permission.READ_REPORT: Permission.READ_ALL_REPORTS,
+    Permission.READ_USER: Permission.READ_ALL_USERS,
+}
+
+
+class PermissionContext:
+    """
+    Resolved permissions for one user, cached for the lifetime of a request.
+    
+    Resolves the user's role and bitmask once so repeated checks within a
+    request are integer operations.
+    """
+    
+    def __init__(self, user: Optional[User]):
+        self.user = user
+        self.user_id = str(user.id) if user is not None else None
+        self.is_active = bool(user is not None and user.is_active)
+        self.role = AccessControl.get_user_role(user)
+        self.mask = RolePermissions.get_permission_mask(self.role) if self.is_active else 0
+    
+    def has_permission(self, permission: Permission) -> bool:
+        """Check a permission against the cached bitmask."""
+        return bool(self.mask & RolePermissions.PERMISSION_BITS.get(permission, 0))
+
+
 class AccessControl:
     """
     Production-grade access control utilities with comprehensive
@@ -408,6 +487,27 @@ class AccessControl:
         user_role = AccessControl.get_user_role(user)
         return RolePermissions.has_permission(user_role, permission)
     
+    @staticmethod
+    def get_permission_context(user: User, request: Optional[Request] = None) -> PermissionContext:
+        """
+        Get resolved permissions for a user, reusing the request-scoped cache.
+        
+        Args:
+            user: User object
+            request: Optional request whose state caches the context
+            
+        Returns:
+            PermissionContext for the user
+        """
+        if request is not None:
+            context = getattr(request.state, "permission_context", None)
+            if context is not None and context.user_id == (str(user.id) if user else None):
+                return context
+        context = PermissionContext(user)
+        if request is not None:
+            request.state.permission_context = context
+        return context
+    
     @staticmethod
     def user_can_access_resource(
         user: User, 
@@ -438,23 +538,11 @@ class AccessControl:
         
         # Users can access their own resources if they have the permission
         if str(user.id) == resource_owner_id:
-            return AccessControl.user_has_permission(user, permission)
+            return RolePermissions.has_permission(user_role, permission)
         
         # Check for "all" permissions for managers and analysts
-        all_permission_map = {
-            Permission.READ_ASSESSMENT: Permission.READ_ALL_ASSESSMENTS,
-            Permission.UPDATE_ASSESSMENT: Permission.MANAGE_ASSESSMENTS,
-            Permission.DELETE_ASSESSMENT: Permission.MANAGE_ASSESSMENTS,
-            Permission.READ_REPORT: Permission.READ_ALL_REPORTS,
-            Permission.UPDATE_REPORT: Permission.MANAGE_REPORTS,
-            Permission.DELETE_REPORT: Permission.MANAGE_REPORTS,
-            Permission.READ_USER: Permission.READ_ALL_USERS,
-            Permission.UPDATE_USER: Permission.MANAGE_USERS,
-            Permission.DELETE_USER: Permission.MANAGE_USERS,
-        }
-        
-        all_permission = all_permission_map.get(permission)
-        if all_permission and AccessControl.user_has_permission(user, all_permission):
+        all_permission = ALL_RESOURCES_PERMISSION_MAP.get(permission)
+        if all_permission and RolePermissions.has_permission(user_role, all_permission):
             return True
         
         return False
@@ -566,19 +654,13 @@ class AccessControl:
         user_role = AccessControl.get_user_role(user)
         
         # Check if user can access their own resources
-        can_access_own = AccessControl.user_has_permission(user, permission)
+        can_access_own = RolePermissions.has_permission(user_role, permission)
         
         # Check if user can access all resources
-        all_permission_map = {
-            Permission.READ_ASSESSMENT: Permission.READ_ALL_ASSESSMENTS,
-            Permission.READ_REPORT: Permission.READ_ALL_REPORTS,
-            Permission.READ_USER: Permission.READ_ALL_USERS,
-        }
-        
-        all_permission = all_permission_map.get(permission)
+        all_permission = ALL_READ_PERMISSION_MAP.get(permission)
         can_access_all = (
             user_role in [Role.SUPER_ADMIN, Role.ADMIN] or
-            (all_permission and AccessControl.user_has_permission(user, all_permission))
+            bool(all_permission and RolePermissions.has_permission(user_role, all_permission))
         )
         
         return {
@@ -638,7 +720,10 @@ def require_permission(permission: Permission, log_access: bool = True):
     ) -> User:
         client_ip = request.client.host if request.client else None
         
-        if not AccessControl.user_has_permission(current_user, permission):
+        # Resolve permissions once per request for downstream checks
+        permission_context = AccessControl.get_permission_context(current_user, request)
+        
+        if not permission_context.has_permission(permission):
             if log_access:
                 log_security_event(
                     AuditEventType.PERMISSION_DENIED,
@@ -646,7 +731,7 @@ def require_permission(permission: Permission, log_access: bool = True):
                     ip_address=client_ip,
                     details={
                         "required_permission": permission.value,
-                        "user_role": AccessControl.get_user_role(current_user).value,
+                        "user_role": permission_context.role.value,
                         "endpoint": str(request.url)
                     },
                     severity=AuditSeverity.HIGH
@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 import json
 import uuid
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict, deque
 import statistics
 
 logger = logging.getLogger(__name__)
@@ -142,6 +142,249 @@ class QualityMetrics:
     monthly_trend: List[float] = field(default_factory=list)
 
 
+@dataclass
+class FeedbackAggregate:
+    """Additive counters over a set of processed feedback entries."""
+    count: int = 0
+    processed_count: int = 0
+    rating_count: int = 0
+    rating_sum: float = 0.0
+    promoters: int = 0
+    detractors: int = 0
+    quality_count: int = 0
+    quality_sum: float = 0.0
+    sentiment_count: int = 0
+    positive_count: int = 0
+    negative_count: int = 0
+    category_quality: Dict[str, List[float]] = field(default_factory=dict)  # value -> [sum, count]
+    channel_counts: Dict[str, int] = field(default_factory=dict)
+    channel_quality: Dict[str, List[float]] = field(default_factory=dict)  # value -> [sum, count]
+    
+    def add(self, feedback: UserFeedback) -> None:
+        """Fold a feedback entry into the counters."""
+        self.count += 1
+        if feedback.processed_at:
+            self.processed_count += 1
+        
+        if feedback.rating is not None:
+            self.rating_count += 1
+            self.rating_sum += feedback.rating
+            if feedback.rating >= 9:
+                self.promoters += 1
+            elif feedback.rating <= 6:
+                self.detractors += 1
+        
+        if feedback.sentiment_score:
+            self.sentiment_count += 1
+            if feedback.sentiment_score in (SentimentScore.POSITIVE, SentimentScore.VERY_POSITIVE):
+                self.positive_count += 1
+            elif feedback.sentiment_score in (SentimentScore.NEGATIVE, SentimentScore.VERY_NEGATIVE):
+                self.negative_count += 1
+        
+        channel = feedback.channel.value
+        self.channel_counts[channel] = self.channel_counts.get(channel, 0) + 1
+        
+        if feedback.quality_score is not None:
+            self.quality_count += 1
+            self.quality_sum += feedback.quality_score
+            for key, totals in (
+                (feedback.category.value, self.category_quality),
+                (channel, self.channel_quality)
+            ):
+                entry = totals.setdefault(key, [0.0, 0])
+                entry[0] += feedback.quality_score
+                entry[1] += 1
+    
+    def merge(self, other: "FeedbackAggregate") -> None:
+        """Add another aggregate's counters into this one."""
+        for name in (
+            "count", "processed_count", "rating_count", "rating_sum", "promoters",
+            "detractors", "quality_count", "quality_sum", "sentiment_count",
+            "positive_count", "negative_count"
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        
+        for key, value in other.channel_counts.items():
+            self.channel_counts[key] = self.channel_counts.get(key, 0) + value
+        for mine, theirs in (
+            (self.category_quality, other.category_quality),
+            (self.channel_quality, other.channel_quality)
+        ):
+            for key, (total, count) in theirs.items():
+                entry = mine.setdefault(key, [0.0, 0])
+                entry[0] += total
+                entry[1] += count
+
+
+class RollingFeedbackAggregates:
+    """
+    Time-bucketed feedback aggregates.
+    
+    Feedback is folded into hourly and daily buckets as it is processed, so
+    window metrics cost O(buckets) regardless of feedback volume. Windows
+    start on an hour boundary: the hour containing the cutoff is included
+    in full.
+    """
+    
+    def __init__(self, hourly_retention_days: int = 31, daily_retention_days: int = 366):
+        """
+        Initialize rolling aggregates.
+        
+        Args:
+            hourly_retention_days: How long hourly buckets are kept
+            daily_retention_days: How long daily buckets are kept
+        """
+        self.hourly_retention = timedelta(days=hourly_retention_days)
+        self.daily_retention = timedelta(days=daily_retention_days)
+        self.hourly: "OrderedDict[datetime, FeedbackAggregate]" = OrderedDict()
+        self.daily: "OrderedDict[datetime, FeedbackAggregate]" = OrderedDict()
+        self.totals = FeedbackAggregate()
+    
+    def add(self, feedback: UserFeedback) -> None:
+        """Fold a processed feedback entry into every bucket tier."""
+        created_at = feedback.created_at
+        hour = created_at.replace(minute=0, second=0, microsecond=0)
+        day = hour.replace(hour=0)
+        
+        self._bucket(self.hourly, hour).add(feedback)
+        self._bucket(self.daily, day).add(feedback)
+        self.totals.add(feedback)
+        
+        now = datetime.now(timezone.utc)
+        self._prune(self.hourly, now - self.hourly_retention)
+        self._prune(self.daily, now - self.daily_retention)
+    
+    @staticmethod
+    def _bucket(buckets: "OrderedDict[datetime, FeedbackAggregate]", key: datetime) -> FeedbackAggregate:
+        bucket = buckets.get(key)
+        if bucket is None:
+            newest = next(reversed(buckets), None)
+            bucket = buckets[key] = FeedbackAggregate()
+            # Keep buckets chronological when feedback arrives out of order
+            if newest is not None and newest > key:
+                for later in [k for k in buckets if k > key]:
+                    buckets.move_to_end(later)
+        return bucket
+    
+    @staticmethod
+    def _prune(buckets: "OrderedDict[datetime, FeedbackAggregate]", cutoff: datetime) -> None:
+        while buckets:
+            oldest = next(iter(buckets))
+            if oldest >= cutoff:
+                break
+            buckets.popitem(last=False)
+    
+    def window(self, since: datetime) -> List[FeedbackAggregate]:
+        """
+        Return the chronological buckets covering feedback created since a time.
+        
+        The partial first day is covered by hourly buckets and every later
+        day by its daily bucket, so a window needs at most 24 + days buckets.
+        """
+        start = since.replace(minute=0, second=0, microsecond=0)
+        first_day = start.replace(hour=0)
+        
+        window = []
+        if start > first_day and start >= datetime.now(timezone.utc) - self.hourly_retention:
+            first_day += timedelta(days=1)
+            hour = start
+            while hour < first_day:
+                bucket = self.hourly.get(hour)
+                if bucket is not None:
+                    window.append(bucket)
+                hour += timedelta(hours=1)
+        
+        daily = []
+        for key in reversed(self.daily):
+            if key < first_day:
+                break
+            daily.append(self.daily[key])
+        daily.reverse()
+        return window + daily
+
+
+class FeedbackIndex:
+    """
+    Bounded in-memory feedback store with secondary indexes.
+    
+    Entries are indexed by id, assessment and user and kept on a
+    time-ordered deque. Once ``max_size`` is exceeded the oldest entries are
+    evicted and returned so the caller can spill them to durable storage.
+    """
+    
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._by_id: Dict[str, UserFeedback] = {}
+        self._by_assessment: Dict[str, Dict[str, UserFeedback]] = {}
+        self._by_user: Dict[str, Dict[str, UserFeedback]] = {}
+        self._timeline: deque = deque()
+    
+    def __len__(self) -> int:
+        return len(self._timeline)
+    
+    def __iter__(self):
+        return iter(list(self._timeline))
+    
+    def add(self, feedback: UserFeedback) -> List[UserFeedback]:
+        """
+        Store a feedback entry.
+        
+        Returns:
+            Entries evicted to stay within ``max_size``
+        """
+        if feedback.id in self._by_id:
+            previous = self._by_id[feedback.id]
+            self._unindex(previous)
+            self._timeline.remove(previous)
+        
+        self._by_id[feedback.id] = feedback
+        if feedback.assessment_id:
+            self._by_assessment.setdefault(feedback.assessment_id, {})[feedback.id] = feedback
+        if feedback.user_id:
+            self._by_user.setdefault(feedback.user_id, {})[feedback.id] = feedback
+        
+        # Entries almost always arrive in creation order; walk back only when they do not
+        position = len(self._timeline)
+        while position > 0 and self._timeline[position - 1].created_at > feedback.created_at:
+            position -= 1
+        self._timeline.insert(position, feedback)
+        
+        evicted = []
+        while len(self._timeline) > self.max_size:
+            oldest = self._timeline.popleft()
+            self._unindex(oldest)
+            evicted.append(oldest)
+        return evicted
+    
+    def _unindex(self, feedback: UserFeedback) -> None:
+        self._by_id.pop(feedback.id, None)
+        for index, key in ((self._by_assessment, feedback.assessment_id), (self._by_user, feedback.user_id)):
+            entries = index.get(key)
+            if entries is not None:
+                entries.pop(feedback.id, None)
+                if not entries:
+                    del index[key]
+    
+    def get(self, feedback_id: str) -> Optional[UserFeedback]:
+        return self._by_id.get(feedback_id)
+    
+    def by_assessment(self, assessment_id: str) -> List[UserFeedback]:
+        return list(self._by_assessment.get(assessment_id, {}).values())
+    
+    def by_user(self, user_id: str) -> List[UserFeedback]:
+        return list(self._by_user.get(user_id, {}).values())
+    
+    def since(self, cutoff: datetime) -> List[UserFeedback]:
+        """Return entries created at or after cutoff, oldest first."""
+        recent = []
+        for feedback in reversed(self._timeline):
+            if feedback.created_at < cutoff:
+                break
+            recent.append(feedback)
+        recent.reverse()
+        return recent
+
+
 class FeedbackCollector:
     """
     Multi-channel feedback collection system.
@@ -150,9 +393,21 @@ class FeedbackCollector:
     standardized processing and storage.
     """
     
-    def __init__(self):
-        """Initialize feedback collector."""
-        self.feedback_storage: List[UserFeedback] = []
+    def __init__(self, max_stored_feedback: int = 10000, spill_collection: str = "feedback_archive",
+                 spill_batch_size: int = 100):
+        """
+        Initialize feedback collector.
+        
+        Args:
+            max_stored_feedback: Maximum feedback entries kept in memory
+            spill_collection: MongoDB collection receiving evicted entries
+            spill_batch_size: Number of evicted entries written per batch
+        """
+        self.feedback_index = FeedbackIndex(max_size=max_stored_feedback)
+        self.aggregates = RollingFeedbackAggregates()
+        self.spill_collection = spill_collection
+        self.spill_batch_size = spill_batch_size
+        self._spill_buffer: List[UserFeedback] = []
         self.collection_handlers: Dict[FeedbackChannel, Callable] = {}
         self.validation_rules: List[Callable] = []
         self.processing_queue: asyncio.Queue = asyncio.Queue()
@@ -160,6 +415,11 @@ class FeedbackCollector:
         
         logger.info("Feedback collector initialized")
     
+    @property
+    def feedback_storage(self) -> List[UserFeedback]:
+        """Feedback entries held in memory, oldest first."""
+        return list(self.feedback_index)
+    
     def register_channel_handler(self, channel: FeedbackChannel, handler: Callable) -> None:
         """
         Register a handler for a specific feedback channel.
@@ -298,6 +558,9 @@ class FeedbackCollector:
             except asyncio.CancelledError:
                 pass
             logger.info("Stopped feedback processing")
+        
+        if self._spill_buffer:
+            await self._spill_feedback()
     
     async def _process_feedback_loop(self) -> None:
         """Background loop for processing feedback."""
@@ -337,14 +600,32 @@ class FeedbackCollector:
             # Mark as processed
             feedback.processed_at = datetime.now(timezone.utc)
             
-            # Store feedback
-            self.feedback_storage.append(feedback)
+            # Store feedback and update rolling aggregates
+            evicted = self.feedback_index.add(feedback)
+            self.aggregates.add(feedback)
             
             logger.debug(f"Processed feedback: {feedback.id}")
             
+            self._spill_buffer.extend(evicted)
+            if len(self._spill_buffer) >= self.spill_batch_size:
+                await self._spill_feedback()
+            
         except Exception as e:
             logger.error(f"Failed to process feedback {feedback.id}: {e}")
     
+    async def _spill_feedback(self) -> None:
+        """Persist feedback evicted from memory to MongoDB in one batch."""
+        batch, self._spill_buffer = self._spill_buffer, []
+        try:
+            from ..core.database import get_database
+            
+            db = await get_database()
+            await db[self.spill_collection].insert_many([f.to_dict() for f in batch])
+            logger.debug(f"Spilled {len(batch)} feedback entries to {self.spill_collection}")
+        except Exception as e:
+            # Aggregates already include these entries; only the raw records are lost
+            logger.warning(f"Failed to spill {len(batch)} feedback entries: {e}")
+    
     async def _analyze_sentiment(self, feedback: UserFeedback) -> None:
         """Analyze sentiment of feedback comment."""
         if not feedback.comment:
@@ -433,20 +714,20 @@ class FeedbackCollector:
     
     def get_feedback_by_id(self, feedback_id: str) -> Optional[UserFeedback]:
         """Get feedback by ID."""
-        return next((f for f in self.feedback_storage if f.id == feedback_id), None)
+        return self.feedback_index.get(feedback_id)
     
     def get_feedback_by_assessment(self, assessment_id: str) -> List[UserFeedback]:
-        """Get all feedback for a specific assessment."""
-        return [f for f in self.feedback_storage if f.assessment_id == assessment_id]
+        """Get all in-memory feedback for a specific assessment."""
+        return self.feedback_index.by_assessment(assessment_id)
     
     def get_feedback_by_user(self, user_id: str) -> List[UserFeedback]:
-        """Get all feedback from a specific user."""
-        return [f for f in self.feedback_storage if f.user_id == user_id]
+        """Get all in-memory feedback from a specific user."""
+        return self.feedback_index.by_user(user_id)
     
     def get_recent_feedback(self, hours: int = 24) -> List[UserFeedback]:
         """Get recent feedback within specified hours."""
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        return [f for f in self.feedback_storage if f.created_at >= cutoff]
+        return self.feedback_index.since(cutoff)
 
 
 class FeedbackAnalyzer:
@@ -466,6 +747,9 @@ class FeedbackAnalyzer:
         """
         Calculate comprehensive quality metrics.
         
+        Metrics are read from the rolling aggregates, so the cost depends on
+        the number of time buckets in the window rather than feedback volume.
+        
         Args:
             days: Number of days to analyze
             
@@ -473,85 +757,66 @@ class FeedbackAnalyzer:
             Quality metrics
         """
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        feedback_data = [
-            f for f in self.collector.feedback_storage
-            if f.created_at >= cutoff_date
-        ]
+        buckets = self.collector.aggregates.window(cutoff_date)
+        
+        totals = FeedbackAggregate()
+        for bucket in buckets:
+            totals.merge(bucket)
         
-        if not feedback_data:
+        if not totals.count:
             return QualityMetrics()
         
         metrics = QualityMetrics()
-        metrics.total_feedback_count = len(feedback_data)
+        metrics.total_feedback_count = totals.count
         
         # Rating-based metrics
-        ratings = [f.rating for f in feedback_data if f.rating is not None]
-        if ratings:
-            metrics.average_rating = statistics.mean(ratings)
+        if totals.rating_count:
+            metrics.average_rating = totals.rating_sum / totals.rating_count
         
         # Sentiment-based metrics
-        sentiment_counts = Counter(f.sentiment_score for f in feedback_data if f.sentiment_score)
-        total_with_sentiment = sum(sentiment_counts.values())
-        
-        if total_with_sentiment > 0:
-            positive_count = (
-                sentiment_counts.get(SentimentScore.POSITIVE, 0) +
-                sentiment_counts.get(SentimentScore.VERY_POSITIVE, 0)
-            )
-            negative_count = (
-                sentiment_counts.get(SentimentScore.NEGATIVE, 0) +
-                sentiment_counts.get(SentimentScore.VERY_NEGATIVE, 0)
-            )
-            
-            metrics.positive_feedback_rate = positive_count / total_with_sentiment
-            metrics.negative_feedback_rate = negative_count / total_with_sentiment
+        if totals.sentiment_count > 0:
+            metrics.positive_feedback_rate = totals.positive_count / totals.sentiment_count
+            metrics.negative_feedback_rate = totals.negative_count / totals.sentiment_count
         
         # Category-specific scores
         for category in FeedbackCategory:
-            category_feedback = [f for f in feedback_data if f.category == category]
-            if category_feedback:
-                category_scores = [f.quality_score for f in category_feedback if f.quality_score is not None]
-                if category_scores:
-                    metrics.category_scores[category.value] = statistics.mean(category_scores)
+            quality_sum, quality_count = totals.category_quality.get(category.value, (0.0, 0))
+            if quality_count:
+                metrics.category_scores[category.value] = quality_sum / quality_count
         
         # Satisfaction score (0-1 scale)
-        quality_scores = [f.quality_score for f in feedback_data if f.quality_score is not None]
-        if quality_scores:
-            metrics.satisfaction_score = statistics.mean(quality_scores)
+        if totals.quality_count:
+            metrics.satisfaction_score = totals.quality_sum / totals.quality_count
         
         # NPS calculation (simplified)
-        if ratings:
-            promoters = sum(1 for r in ratings if r >= 9)
-            detractors = sum(1 for r in ratings if r <= 6)
-            metrics.nps_score = ((promoters - detractors) / len(ratings)) * 100
+        if totals.rating_count:
+            metrics.nps_score = ((totals.promoters - totals.detractors) / totals.rating_count) * 100
         
         # Trend analysis
-        metrics.quality_trend = self._analyze_trend(feedback_data)
+        metrics.quality_trend = self._analyze_trend(buckets)
         
         return metrics
     
-    def _analyze_trend(self, feedback_data: List[UserFeedback]) -> str:
-        """Analyze quality trend over time."""
-        if len(feedback_data) < 10:
+    def _analyze_trend(self, buckets: List[FeedbackAggregate]) -> str:
+        """Analyze quality trend over time from chronological buckets."""
+        total_count = sum(bucket.count for bucket in buckets)
+        if total_count < 10:
             return "insufficient_data"
         
-        # Sort by date
-        sorted_feedback = sorted(feedback_data, key=lambda f: f.created_at)
-        
-        # Split into two halves
-        mid_point = len(sorted_feedback) // 2
-        earlier_half = sorted_feedback[:mid_point]
-        recent_half = sorted_feedback[mid_point:]
+        # Split into two halves by feedback count, at bucket granularity
+        mid_point = total_count // 2
+        earlier_half = FeedbackAggregate()
+        recent_half = FeedbackAggregate()
+        for bucket in buckets:
+            half = earlier_half if earlier_half.count + bucket.count <= mid_point else recent_half
+            half.merge(bucket)
         
         # Calculate average quality scores
-        earlier_scores = [f.quality_score for f in earlier_half if f.quality_score is not None]
-        recent_scores = [f.quality_score for f in recent_half if f.quality_score is not None]
-        
-        if not earlier_scores or not recent_scores:
+        if not earlier_half.quality_count or not recent_half.quality_count:
             return "insufficient_data"
         
-        earlier_avg = statistics.mean(earlier_scores)
-        recent_avg = statistics.mean(recent_scores)
+        earlier_avg = earlier_half.quality_sum / earlier_half.quality_count
+        recent_avg = recent_half.quality_sum / recent_half.quality_count
         
         if recent_avg > earlier_avg + 0.05:
             return "improving"
@@ -570,11 +835,7 @@ class FeedbackAnalyzer:
         Returns:
             Feedback summary and analytics
         """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        feedback_data = [
-            f for f in self.collector.feedback_storage
-            if f.created_at >= cutoff_date
-        ]
+        feedback_data = self.collector.get_recent_feedback(hours=days * 24)
         
         # Basic counts
         total_feedback = len(feedback_data)
@@ -612,31 +873,33 @@ class FeedbackAnalyzer:
         }
     
     def get_analytics_dashboard(self) -> Dict[str, Any]:
-        """Get comprehensive analytics dashboard data."""
+        """
+        Get comprehensive analytics dashboard data.
+        
+        Served entirely from the rolling aggregates; independent of the
+        amount of stored feedback.
+        """
         # Multi-period analysis
         daily_metrics = self.calculate_quality_metrics(days=1)
         weekly_metrics = self.calculate_quality_metrics(days=7)
         monthly_metrics = self.calculate_quality_metrics(days=30)
         
         # Channel performance
-        all_feedback = self.collector.feedback_storage
+        totals = self.collector.aggregates.totals
         channel_performance = {}
         for channel in FeedbackChannel:
-            channel_feedback = [f for f in all_feedback if f.channel == channel]
-            if channel_feedback:
-                avg_quality = statistics.mean([
-                    f.quality_score for f in channel_feedback 
-                    if f.quality_score is not None
-                ])
+            count = totals.channel_counts.get(channel.value, 0)
+            if count:
+                quality_sum, quality_count = totals.channel_quality.get(channel.value, (0.0, 0))
                 channel_performance[channel.value] = {
-                    "count": len(channel_feedback),
-                    "average_quality": avg_quality
+                    "count": count,
+                    "average_quality": quality_sum / quality_count if quality_count else 0.0
                 }
         
         return {
             "overview": {
-                "total_feedback": len(all_feedback),
-                "processed_feedback": len([f for f in all_feedback if f.processed_at]),
+                "total_feedback": totals.count,
+                "processed_feedback": totals.processed_count,
                 "channels_active": len([ch for ch, perf in channel_performance.items() if perf["count"] > 0])
             },
             "quality_trends": {
@@ -5,13 +5,17 @@ Provides smart defaults, auto-completion, contextual help, and progressive discl
 functionality for assessment forms.
 """
 
+import asyncio
 import logging
+import threading
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import json
 import re
 
+from .typeahead import TypeaheadIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,9 +52,9 @@ class SmartDefault:
     source: str = "pattern_analysis"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Suggestion:
-    """Auto-completion suggestion."""
+    """Auto-completion suggestion. Immutable: indexed suggestions are shared by every request."""
     value: str
     label: str
     description: str
@@ -72,15 +76,56 @@ class ContextualHelp:
 class IntelligentFormService:
     """Service providing intelligent form features."""
     
+    # Every form creates a service; the typeahead index is built by the first one and shared
+    _shared_suggestion_index: Optional[TypeaheadIndex] = None
+    _suggestion_index_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize the intelligent form service."""
         self._industry_patterns = self._load_industry_patterns()
         self._company_size_patterns = self._load_company_size_patterns()
         self._common_suggestions = self._load_common_suggestions()
         self._contextual_help = self._load_contextual_help()
+        self._suggestion_index = self._get_suggestion_index()
         
         logger.info("Initialized intelligent form service")
     
+    def _get_suggestion_index(self) -> TypeaheadIndex:
+        """Return the process-wide typeahead index, building it on first use."""
+        cls = type(self)
+        if cls._shared_suggestion_index is None:
+            with cls._suggestion_index_lock:
+                if cls._shared_suggestion_index is None:
+                    cls._shared_suggestion_index = self._build_suggestion_index()
+        return cls._shared_suggestion_index
+    
+    def _build_suggestion_index(self) -> TypeaheadIndex:
+        """Index the common suggestions, with industry patterns as ranking context."""
+        industry_use_cases = {}
+        industry_values = {}
+        for industry, patterns in self._industry_patterns.items():
+            industry_key = getattr(industry, "value", industry)
+            industry_use_cases[industry_key] = [
+                Suggestion(
+                    value=use_case,
+                    label=use_case.replace("_", " ").title(),
+                    description=f"Common in {industry_key} industry",
+                    confidence=0.9,
+                    category="industry_specific"
+                )
+                for use_case in patterns.get("common_ai_use_cases", [])
+            ]
+            industry_values[industry_key] = [
+                value for values in patterns.values() if isinstance(values, list)
+                for value in values if isinstance(value, str)
+            ]
+        
+        return TypeaheadIndex(
+            self._common_suggestions,
+            context_suggestions={"ai_use_cases": industry_use_cases},
+            context_values=industry_values
+        )
+    
     def _load_industry_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Load industry-specific patterns for smart defaults."""
         return {
@@ -421,6 +466,11 @@ class IntelligentFormService:
         """
         Get auto-completion suggestions for a field.
         
+        Suggestions come from the shared typeahead index: words are matched
+        by prefix with a small typo allowance, and suggestions common in the
+        selected industry rank higher (industry-specific AI use cases are
+        only offered for that industry).
+        
         Args:
             field_name: Name of the field
             query: Current user input
@@ -429,48 +479,17 @@ class IntelligentFormService:
         Returns:
             List of matching suggestions
         """
-        suggestions = []
-        
         try:
-            # Get base suggestions for the field
-            base_suggestions = self._common_suggestions.get(field_name, [])
-            
-            # Filter suggestions based on query
-            if query:
-                query_lower = query.lower()
-                for suggestion in base_suggestions:
-                    if (query_lower in suggestion.value.lower() or 
-                        query_lower in suggestion.label.lower() or
-                        query_lower in suggestion.description.lower()):
-                        # Adjust confidence based on match quality
-                        if suggestion.value.lower().startswith(query_lower):
-                            suggestion.confidence *= 1.2  # Boost for prefix match
-                        suggestions.append(suggestion)
-            else:
-                suggestions = base_suggestions.copy()
-            
-            # Add context-aware suggestions
             industry = context.get("industry")
-            if industry and field_name == "ai_use_cases":
-                industry_use_cases = self._industry_patterns.get(industry, {}).get("common_ai_use_cases", [])
-                for use_case in industry_use_cases:
-                    # Create suggestion if not already present
-                    if not any(s.value == use_case for s in suggestions):
-                        suggestions.append(Suggestion(
-                            value=use_case,
-                            label=use_case.replace("_", " ").title(),
-                            description=f"Common in {industry} industry",
-                            confidence=0.9,
-                            category="industry_specific"
-                        ))
-            
-            # Sort by confidence and relevance
-            suggestions.sort(key=lambda x: x.confidence, reverse=True)
-            
+            return list(self._suggestion_index.search(
+                field_name,
+                query,
+                context_key=getattr(industry, "value", industry),
+                limit=10  # Return top 10 suggestions
+            ))
         except Exception as e:
             logger.error(f"Error generating suggestions for {field_name}: {str(e)}")
-        
-        return suggestions[:10]  # Return top 10 suggestions
+            return []
     
     def get_contextual_help(self, field_name: str, context: Dict[str, Any]) -> Optional[ContextualHelp]:
         """
@@ -742,4 +761,14 @@ class FormStateManager:
         # In a real implementation, this would be more sophisticated
         total_fields = 20  # Approximate total fields in assessment form
         filled_fields = len([v for v in form_data.values() if v])
-        return min(100.0, (filled_fields / total_fields) * 100.0)
\ No newline at end of file
+        return min(100.0, (filled_fields / total_fields) * 100.0)
+
+
+async def load_suggestion_index() -> TypeaheadIndex:
+    """
+    Build the shared typeahead index without blocking the event loop.
+
+    The first form service otherwise builds it inline while holding the
+    class lock; warm it at startup so the first form does not wait for it.
+    """
+    return await asyncio.to_thread(lambda: IntelligentFormService()._suggestion_index)
@@ -0,0 +1,531 @@
+"""
+Typeahead index for form field auto-completion.
+
+Suggestions are indexed once per field in a character trie over the words
+of their value, label and description. Every trie node keeps the best
+``candidate_limit`` entries of its subtree, precomputed at build time, so a
+keystroke costs one walk down the typed prefix instead of a scan of every
+suggestion. Entries are immutable; query-time scores are applied to copies.
+
+Ranking, per query word:
+- the word's source: the first word of a value/label (what the old
+  ``startswith`` boost rewarded) > other value/label words > description words
+- typos: a typed word that prefixes nothing is matched against words within
+  a bounded edit distance (first character fixed), with a penalty per edit
+- context: suggestions named in the current industry's patterns are boosted,
+  and industry-specific suggestions are only offered in that industry
+
+Results for hot ``(field, query, context)`` keys are kept in an LRU.
+"""
+
+import heapq
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .intelligent_features import Suggestion
+
+logger = logging.getLogger(__name__)
+
+_TERM_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Weight of a matched word by where it appears in the suggestion
+LEADING_TERM_WEIGHT = 1.2
+LABEL_TERM_WEIGHT = 1.0
+DESCRIPTION_TERM_WEIGHT = 0.6
+
+# Score multiplier per edit of a fuzzy match
+FUZZY_PENALTY = 0.8
+
+# Leading characters of a typed word assumed free of typos; keeps fuzzy
+# matching to one branch of the trie
+FUZZY_PREFIX_LENGTH = 1
+
+# Matches of typed words up to this length are never evicted from the word
+# cache: there are few such prefixes, and each matches a large share of entries
+PINNED_PREFIX_LENGTH = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of ``text``; underscores and punctuation separate words."""
+    return _TERM_PATTERN.findall(text.lower())
+
+
+def allowed_edits(token: str, max_edits: int) -> int:
+    """Typo budget for a typed word: none up to 3 characters, then one per 3 more."""
+    return min(max_edits, (len(token) - 1) // 3)
+
+
+def _next_row(previous: Sequence[int], token: str, char: str) -> List[int]:
+    """Next Levenshtein DP row of ``token`` against a string extended by ``char``."""
+    row = [previous[0] + 1]
+    for i, token_char in enumerate(token, 1):
+        row.append(min(row[i - 1] + 1, previous[i] + 1, previous[i - 1] + (token_char != char)))
+    return row
+
+
+def prefix_edit_distance(token: str, term: str, max_edits: int) -> Optional[int]:
+    """
+    Smallest edit distance between ``token`` and any prefix of ``term``.
+
+    Returns:
+        The distance, or None if it exceeds ``max_edits``
+    """
+    if term.startswith(token):
+        return 0
+    if max_edits <= 0 or not term.startswith(token[:FUZZY_PREFIX_LENGTH]):
+        return None
+    row = list(range(len(token) + 1))
+    best = row[-1]
+    for char in term:
+        row = _next_row(row, token, char)
+        best = min(best, row[-1])
+        if min(row) > max_edits:
+            break
+    return best if best <= max_edits else None
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """An indexed suggestion and the weight of each of its words."""
+    suggestion: "Suggestion"
+    terms: Tuple[Tuple[str, float], ...]
+
+    def exact_weight(self, token: str) -> Optional[float]:
+        """Best weight of a word of this entry starting with ``token``."""
+        best = None
+        for term, weight in self.terms:
+            if term.startswith(token) and (best is None or weight > best):
+                best = weight
+        return best
+
+    def match(self, token: str, max_edits: int) -> Optional[float]:
+        """Best ``weight * penalty`` of a word of this entry matching ``token``."""
+        best = None
+        for term, weight in self.terms:
+            edits = prefix_edit_distance(token, term, max_edits)
+            if edits is not None:
+                score = weight * FUZZY_PENALTY ** edits
+                if best is None or score > best:
+                    best = score
+        return best
+
+
+class _Node:
+    __slots__ = ("children", "weights", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # Entry id -> weight, for words ending at this node
+        self.weights: Dict[int, float] = {}
+        # Best (static score, entry id, word weight) of the whole subtree, highest first
+        self.top: Tuple[Tuple[float, int, float], ...] = ()
+
+
+class _FieldIndex:
+    """Trie and entries of one field (or one field's extras for a context)."""
+
+    def __init__(self, suggestions: Iterable["Suggestion"], candidate_limit: int, word_cache_size: int):
+        self.entries: List[_Entry] = []
+        self.root = _Node()
+        self.ids_by_value: Dict[str, int] = {}
+        # Multi-word queries re-match their leading words on every keystroke
+        self._word_cache: "OrderedDict[Tuple[str, int], Dict[int, float]]" = OrderedDict()
+        self._pinned_words: Dict[str, Dict[int, float]] = {}
+        self._word_cache_size = word_cache_size
+        self._lock = threading.Lock()
+
+        for suggestion in suggestions:
+            entry_id = len(self.entries)
+            terms = self._entry_terms(suggestion)
+            self.entries.append(_Entry(suggestion, tuple(terms.items())))
+            self.ids_by_value.setdefault(suggestion.value, entry_id)
+            for term, weight in terms.items():
+                node = self.root
+                for char in term:
+                    node = node.children.setdefault(char, _Node())
+                node.weights[entry_id] = weight
+
+        self._rank(self.root, candidate_limit)
+        self.by_confidence: Tuple[int, ...] = tuple(sorted(
+            range(len(self.entries)), key=lambda i: -self.entries[i].suggestion.confidence
+        ))
+
+    @staticmethod
+    def _entry_terms(suggestion: "Suggestion") -> Dict[str, float]:
+        terms: Dict[str, float] = {}
+        for text, weight in (
+            (suggestion.value, LABEL_TERM_WEIGHT),
+            (suggestion.label, LABEL_TERM_WEIGHT),
+            (suggestion.description, DESCRIPTION_TERM_WEIGHT),
+        ):
+            for position, term in enumerate(tokenize(text or "")):
+                term_weight = LEADING_TERM_WEIGHT if position == 0 and weight == LABEL_TERM_WEIGHT else weight
+                terms[term] = max(terms.get(term, 0.0), term_weight)
+        return terms
+
+    def _rank(self, node: _Node, candidate_limit: int) -> None:
+        """Fill ``top`` bottom-up from each node's own words and its children's tops."""
+        weights = dict(node.weights)
+        for child in node.children.values():
+            self._rank(child, candidate_limit)
+            for _, entry_id, weight in child.top:
+                if weight > weights.get(entry_id, 0.0):
+                    weights[entry_id] = weight
+        node.top = tuple(heapq.nlargest(candidate_limit, (
+            (self.entries[entry_id].suggestion.confidence * weight, entry_id, weight)
+            for entry_id, weight in weights.items()
+        )))
+
+    def prefix_node(self, token: str) -> Optional[_Node]:
+        node = self.root
+        for char in token:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def fuzzy_nodes(self, token: str, max_edits: int) -> List[Tuple[_Node, int]]:
+        """Nodes whose prefix is within ``max_edits`` of ``token``, with their distance."""
+        # Walk the typo-free leading characters, then search around the rest
+        node: Optional[_Node] = self.root
+        row: Sequence[int] = range(len(token) + 1)
+        for char in token[:FUZZY_PREFIX_LENGTH]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+            row = _next_row(row, token, char)
+
+        matches = []
+        stack = [(child, char, row) for char, child in node.children.items()]
+        while stack:
+            node, char, previous = stack.pop()
+            row = _next_row(previous, token, char)
+            if row[-1] <= max_edits:
+                matches.append((node, row[-1]))
+            if min(row) <= max_edits:
+                stack.extend((child, next_char, row) for next_char, child in node.children.items())
+        return matches
+
+    def word_weights(self, token: str, edits: int) -> Dict[int, float]:
+        """
+        Entry id -> weight of the entries with a word matching prefix ``token``
+        within ``edits``. Cached; callers must not modify the result.
+        """
+        pinned = len(token) <= PINNED_PREFIX_LENGTH and not edits
+        if pinned and token in self._pinned_words:
+            return self._pinned_words[token]
+        key = (token, edits)
+        with self._lock:
+            cached = self._word_cache.get(key)
+            if cached is not None:
+                self._word_cache.move_to_end(key)
+                return cached
+
+        if edits:
+            weights = self.collect(self.fuzzy_nodes(token, edits))
+        else:
+            node = self.prefix_node(token)
+            weights = self.collect([(node, 0)]) if node is not None else {}
+
+        if pinned:
+            self._pinned_words[token] = weights
+            return weights
+        with self._lock:
+            self._word_cache[key] = weights
+            if len(self._word_cache) > self._word_cache_size:
+                self._word_cache.popitem(last=False)
+        return weights
+
+    def collect(self, matches: Iterable[Tuple[_Node, int]]) -> Dict[int, float]:
+        """
+        Entry id -> best ``weight * penalty`` over the subtrees of matched nodes.
+
+        Matches are expanded closest first, so a subtree shared by several
+        matches (a fuzzy match and its descendants) is walked once.
+        """
+        weights: Dict[int, float] = {}
+        visited = set()
+        for node, distance in sorted(matches, key=lambda match: match[1]):
+            penalty = FUZZY_PENALTY ** distance
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                if id(current) in visited:
+                    continue
+                visited.add(id(current))
+                for entry_id, weight in current.weights.items():
+                    weight *= penalty
+                    if weight > weights.get(entry_id, 0.0):
+                        weights[entry_id] = weight
+                stack.extend(current.children.values())
+        return weights
+
+
+class TypeaheadIndex:
+    """
+    Per-field typeahead index over auto-completion suggestions.
+
+    Build once and share: the index is read-only after construction apart
+    from its result cache, which is guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        suggestions: Mapping[str, Iterable["Suggestion"]],
+        context_suggestions: Optional[Mapping[str, Mapping[str, Iterable["Suggestion"]]]] = None,
+        context_values: Optional[Mapping[str, Iterable[str]]] = None,
+        max_edits: int = 2,
+        candidate_limit: int = 64,
+        context_boost: float = 1.25,
+        cache_size: int = 2048,
+        word_cache_size: int = 256
+    ):
+        """
+        Initialize typeahead index.
+
+        Args:
+            suggestions: Field name -> suggestions offered for that field
+            context_suggestions: Field name -> context key -> extra suggestions
+                offered only in that context (skipped if the field already has
+                a suggestion with the same value)
+            context_values: Context key -> suggestion values to boost in that context
+            max_edits: Upper bound on edits per typed word for fuzzy matching
+            candidate_limit: Ranked candidates kept per trie node
+            context_boost: Score multiplier for suggestions boosted by the context
+            cache_size: Cached query results (0 disables the cache)
+            word_cache_size: Cached per-word matches of each field, for multi-word queries
+        """
+        self.max_edits = max_edits
+        self.candidate_limit = candidate_limit
+        self.context_boost = context_boost
+        self.cache_size = cache_size
+
+        self._fields: Dict[Tuple[str, Optional[str]], _FieldIndex] = {
+            (field_name, None): _FieldIndex(field_suggestions, candidate_limit, word_cache_size)
+            for field_name, field_suggestions in suggestions.items()
+        }
+        for field_name, by_context in (context_suggestions or {}).items():
+            base = self._fields.get((field_name, None))
+            for context_key, extras in by_context.items():
+                extras = [s for s in extras if base is None or s.value not in base.ids_by_value]
+                if extras:
+                    self._fields[(field_name, context_key)] = _FieldIndex(extras, candidate_limit, word_cache_size)
+        self._context_values: Dict[str, FrozenSet[str]] = {
+            context_key: frozenset(values) for context_key, values in (context_values or {}).items()
+        }
+
+        self._cache: "OrderedDict[Tuple[str, str, Optional[str], int], Tuple[Suggestion, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+        logger.info(
+            f"Built typeahead index: {len(suggestions)} fields, "
+            f"{sum(len(index.entries) for index in self._fields.values())} entries"
+        )
+
+    def search(
+        self,
+        field_name: str,
+        query: str,
+        context_key: Optional[str] = None,
+        limit: int = 10
+    ) -> Tuple["Suggestion", ...]:
+        """
+        Suggestions for ``field_name`` matching the typed ``query``, best first.
+
+        Every word of the query must prefix-match (within its typo budget)
+        some word of a suggestion. The returned suggestions are copies whose
+        ``confidence`` is the ranking score, capped at 1.0.
+        """
+        tokens = tokenize(query or "")
+        cache_key = (field_name, " ".join(tokens), context_key, limit)
+        if self.cache_size:
+            with self._lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+                    self.stats["hits"] += 1
+                    return cached
+
+        scored: Dict[Tuple[int, int], Tuple[float, "Suggestion"]] = {}
+        for slot, field_key in enumerate(((field_name, None), (field_name, context_key))):
+            if slot and context_key is None:
+                break
+            index = self._fields.get(field_key)
+            if index is None:
+                continue
+            for entry_id, score in self._score(index, tokens, context_key, limit).items():
+                scored[(slot, entry_id)] = (score, index.entries[entry_id].suggestion)
+
+        ranked = heapq.nsmallest(limit, scored.values(), key=lambda item: (-item[0], item[1].label))
+        results = tuple(replace(suggestion, confidence=round(min(1.0, score), 4)) for score, suggestion in ranked)
+
+        if self.cache_size:
+            with self._lock:
+                self.stats["misses"] += 1
+                self._cache[cache_key] = results
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return results
+
+    def _score(
+        self,
+        index: _FieldIndex,
+        tokens: List[str],
+        context_key: Optional[str],
+        limit: int
+    ) -> Dict[int, float]:
+        """Entry id -> score for the entries of one field index matching ``tokens``."""
+        boosted_values = self._context_values.get(context_key, frozenset()) if context_key else frozenset()
+        boosted = [index.ids_by_value[value] for value in boosted_values if value in index.ids_by_value]
+
+        if not tokens:
+            candidates = {entry_id: 1.0 for entry_id in index.by_confidence[:limit]}
+            candidates.update((entry_id, 1.0) for entry_id in boosted)
+        elif len(tokens) == 1:
+            candidates = self._match_single(index, tokens[0], limit)
+        else:
+            candidates = self._match_all(index, tokens, limit)
+
+        # Boosted entries may sit outside the candidate lists kept per node
+        for entry_id in boosted:
+            if entry_id not in candidates and tokens:
+                weight = self._entry_weight(index.entries[entry_id], tokens)
+                if weight is not None:
+                    candidates[entry_id] = weight
+
+        scores = {}
+        for entry_id, weight in candidates.items():
+            score = index.entries[entry_id].suggestion.confidence * weight
+            if entry_id in boosted:
+                score *= self.context_boost
+            scores[entry_id] = score
+        return scores
+
+    def _match_single(self, index: _FieldIndex, token: str, limit: int) -> Dict[int, float]:
+        """Candidates for a one-word query straight from the precomputed node rankings."""
+        candidates: Dict[int, float] = {}
+        node = index.prefix_node(token)
+        if node is not None:
+            candidates.update((entry_id, weight) for _, entry_id, weight in node.top)
+
+        edits = allowed_edits(token, self.max_edits)
+        if not candidates and edits:
+            for fuzzy_node, distance in index.fuzzy_nodes(token, edits):
+                penalty = FUZZY_PENALTY ** distance
+                for _, entry_id, weight in fuzzy_node.top:
+                    if weight * penalty > candidates.get(entry_id, -1.0):
+                        candidates[entry_id] = weight * penalty
+        return candidates
+
+    def _match_all(self, index: _FieldIndex, tokens: List[str], limit: int) -> Dict[int, float]:
+        """Candidates for a multi-word query: entries matched by every word."""
+        nodes = [index.prefix_node(token) for token in tokens]
+        if all(nodes):
+            candidates = self._top_matches(index, tokens, nodes, limit)
+            if candidates is not None:
+                return candidates
+            return self._intersect(index, [index.word_weights(token, 0) for token in tokens], limit)
+
+        # Only words without any exact match are taken to hold a typo
+        return self._intersect(index, [
+            index.word_weights(token, allowed_edits(token, self.max_edits) if node is None else 0)
+            for token, node in zip(tokens, nodes)
+        ], limit)
+
+    @staticmethod
+    def _top_matches(
+        index: _FieldIndex,
+        tokens: List[str],
+        nodes: List[_Node],
+        limit: int
+    ) -> Optional[Dict[int, float]]:
+        """
+        Best ``limit`` entries matching every word, read off the ranked node lists.
+
+        A query's score is the mean of its words' ``confidence * weight``, which
+        is what each node ranks by, so the lists can be merged with the
+        threshold algorithm: once ``limit`` entries score at least the mean of
+        the scores at the current depth, nothing further down can beat them.
+        Common words match thousands of entries; this looks at a few dozen.
+
+        Returns:
+            Entry id -> mean word weight, or None when the ranked lists were
+            truncated before the answer was certain
+        """
+        best: List[Tuple[float, int]] = []
+        candidates: Dict[int, float] = {}
+        seen = set()
+        depth_limit = max(len(node.top) for node in nodes)
+        for depth in range(depth_limit):
+            threshold = 0.0
+            for node in nodes:
+                if depth >= len(node.top):
+                    # A short list holds every entry of its subtree, and all were seen
+                    return candidates
+                score, entry_id, _ = node.top[depth]
+                threshold += score
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                entry = index.entries[entry_id]
+                total = 0.0
+                for token in tokens:
+                    weight = entry.exact_weight(token)
+                    if weight is None:
+                        break
+                    total += weight
+                else:
+                    candidates[entry_id] = total / len(tokens)
+                    heapq.heappush(best, (entry.suggestion.confidence * candidates[entry_id], entry_id))
+                    if len(best) > limit:
+                        heapq.heappop(best)
+            if len(best) == limit and best[0][0] >= threshold / len(nodes):
+                return candidates
+        return None
+
+    @staticmethod
+    def _intersect(index: _FieldIndex, matches: List[Dict[int, float]], limit: int) -> Dict[int, float]:
+        """
+        Best ``limit`` entries matched by every word, with their mean word weight.
+
+        Trimming is safe for context boosts: ``_score`` re-checks boosted
+        entries that are not among the candidates.
+        """
+        ordered = sorted(matches, key=len)
+        common = set(ordered[0]).intersection(*ordered[1:])
+        weights = {entry_id: sum(match[entry_id] for match in matches) / len(matches) for entry_id in common}
+        if len(weights) <= limit:
+            return weights
+        top = heapq.nlargest(limit, weights, key=lambda entry_id: index.entries[entry_id].suggestion.confidence * weights[entry_id])
+        return {entry_id: weights[entry_id] for entry_id in top}
+
+    def _entry_weight(self, entry: _Entry, tokens: List[str]) -> Optional[float]:
+        """Mean match weight over ``tokens``, or None if any word does not match."""
+        total = 0.0
+        for token in tokens:
+            weight = entry.match(token, allowed_edits(token, self.max_edits))
+            if weight is None:
+                return None
+            total += weight
+        return total / len(tokens)
+
+    def clear_cache(self) -> None:
+        """Drop cached results."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Index size and cache counters."""
+        with self._lock:
+            return {
+                "fields": len({field_name for field_name, _ in self._fields}),
+                "entries": sum(len(index.entries) for index in self._fields.values()),
+                "cached_queries": len(self._cache),
+                **self.stats,
+            }
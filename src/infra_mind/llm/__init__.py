@@ -6,7 +6,7 @@ Provides real LLM integrations with OpenAI, Anthropic, and other providers.
 
 from .interface import LLMProviderInterface, LLMResponse, TokenUsage
 from .openai_provider import OpenAIProvider
-from .manager import LLMManager
+from .manager import LLMManager, get_shared_llm_manager
 from .cost_tracker import CostTracker
 from .response_validator import ResponseValidator
 
@@ -16,6 +16,7 @@ __all__ = [
     "TokenUsage",
     "OpenAIProvider",
     "LLMManager",
+    "get_shared_llm_manager",
     "CostTracker",
     "ResponseValidator"
 ]
\ No newline at end of file
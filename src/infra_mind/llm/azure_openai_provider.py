@@ -24,7 +24,8 @@ from .interface import (
     LLMRateLimitError,
     LLMQuotaExceededError,
     LLMModelNotFoundError,
-    LLMTimeoutError
+    LLMTimeoutError,
+    retry_after_seconds
 )
 from ..services.llm_service import llm_service
 
@@ -245,9 +246,13 @@ class AzureOpenAIProvider(LLMProviderInterface):
             if "401" in error_message or "invalid_api_key" in error_message.lower():
                 logger.error(f"Azure OpenAI authentication failed: {error_message}")
                 raise LLMAuthenticationError(f"Azure OpenAI authentication failed: {error_message}", LLMProvider.AZURE_OPENAI)
-            elif "429" in error_message or "rate_limit" in error_message.lower():
+            elif getattr(e, "status_code", None) == 429 or "429" in error_message or "rate_limit" in error_message.lower():
                 logger.warning(f"Azure OpenAI rate limited: {error_message}")
-                raise LLMRateLimitError(f"Azure OpenAI rate limited: {error_message}", LLMProvider.AZURE_OPENAI)
+                raise LLMRateLimitError(
+                    f"Azure OpenAI rate limited: {error_message}",
+                    LLMProvider.AZURE_OPENAI,
+                    retry_after=retry_after_seconds(e)
+                )
             elif "quota" in error_message.lower():
                 logger.error(f"Azure OpenAI quota exceeded: {error_message}")
                 raise LLMQuotaExceededError(f"Azure OpenAI quota exceeded: {error_message}", LLMProvider.AZURE_OPENAI)
@@ -126,14 +126,17 @@ class CostTracker:
     - Export capabilities
     """
     
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(self, storage_path: Optional[str] = None, max_entries: int = 100_000):
         """
         Initialize cost tracker.
         
         Args:
             storage_path: Path to store cost data (optional)
+            max_entries: Most recent entries kept in memory (the tracker is
+                shared for the life of the process)
         """
         self.storage_path = storage_path
+        self.max_entries = max_entries
         self.cost_entries: List[CostEntry] = []
         self.budget_alerts: List[BudgetAlert] = []
         self._daily_budgets: Dict[str, float] = {}  # date -> budget
@@ -163,6 +166,8 @@ class CostTracker:
         )
         
         self.cost_entries.append(entry)
+        if len(self.cost_entries) > self.max_entries * 1.1:
+            del self.cost_entries[:-self.max_entries]
         
         # Check budget alerts
         self._check_budget_alerts()
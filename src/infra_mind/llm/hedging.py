@@ -0,0 +1,164 @@
+"""
+Hedged LLM requests.
+
+A provider that is slow but healthy never triggers failover, so its tail
+latency reaches users unchanged. With hedging, when the primary call has not
+returned within the provider's observed p90 latency, a duplicate request is
+sent (to the next healthy provider, or to the same provider when it is the
+only one) and the first valid response wins; the other call is cancelled.
+
+Hedges cost extra tokens, so they are capped by a spend budget: the
+estimated cost of all hedges may not exceed ``budget_ratio`` of the cost of
+regular requests. Only requests with a small ``max_tokens`` are hedged by
+default, since duplicating long generations is expensive and rarely helps.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from .interface import LLMRequest
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _percentile(values, percentile: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class HedgingPolicy:
+    """Latency statistics, hedge budget and the hedged call itself."""
+
+    MIN_SAMPLES = 20
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        percentile: float = 90.0,
+        budget_ratio: float = 0.05,
+        max_tokens: int = 1000,
+        history_size: int = 200
+    ):
+        """
+        Args:
+            enabled: Hedge eligible requests unless they opt out with ``context["hedge"] = False``
+            percentile: Latency percentile of the primary provider after which to hedge
+            budget_ratio: Maximum hedge spend as a share of regular spend
+            max_tokens: Largest ``max_tokens`` of a request that may be hedged
+            history_size: Latency samples kept per provider
+        """
+        self.enabled = enabled
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.max_tokens = max_tokens
+        self.history_size = history_size
+        self._latencies: Dict[Any, Deque[float]] = {}
+        self.primary_spend = 0.0
+        self.hedge_spend = 0.0
+        self.counters = {"hedged": 0, "hedge_wins": 0, "primary_wins": 0, "budget_denied": 0}
+
+    def record_latency(self, provider: Any, seconds: float) -> None:
+        samples = self._latencies.get(provider)
+        if samples is None:
+            samples = self._latencies[provider] = deque(maxlen=self.history_size)
+        samples.append(seconds)
+
+    def record_cancelled_latency(self, provider: Any, seconds: float) -> None:
+        """
+        Elapsed time of a call cancelled before it answered.
+
+        The call would have taken at least this long, so it counts as no
+        faster than the current hedge delay instead of pulling p90 down. Calls
+        cancelled before hedging was possible are not latency samples at all.
+        """
+        delay = self.delay_for(provider)
+        if delay is not None:
+            self.record_latency(provider, max(seconds, delay))
+
+    def record_spend(self, cost: float) -> None:
+        """Cost of a regular (non-hedge) response, which funds the hedge budget."""
+        self.primary_spend += cost
+
+    def record_hedge_spend(self, cost: float, estimated_cost: float) -> None:
+        """Replace the estimate charged when a winning hedge started with its actual cost."""
+        self.hedge_spend += cost - estimated_cost
+
+    def delay_for(self, provider: Any) -> Optional[float]:
+        """Seconds to wait on ``provider`` before hedging; None without enough samples."""
+        samples = self._latencies.get(provider)
+        if not samples or len(samples) < self.MIN_SAMPLES:
+            return None
+        return _percentile(samples, self.percentile)
+
+    def should_hedge(self, request: LLMRequest) -> bool:
+        return bool(request.context.get("hedge", self.enabled)) and (request.max_tokens or 0) <= self.max_tokens
+
+    def _take_budget(self, estimated_cost: float) -> bool:
+        if self.hedge_spend + estimated_cost > self.primary_spend * self.budget_ratio:
+            self.counters["budget_denied"] += 1
+            return False
+        self.hedge_spend += estimated_cost
+        self.counters["hedged"] += 1
+        return True
+
+    async def run(
+        self,
+        provider: Any,
+        estimated_cost: float,
+        primary: Callable[[], Awaitable[T]],
+        hedge: Callable[[], Awaitable[T]],
+        accept: Callable[[T], bool] = lambda result: True
+    ) -> Tuple[T, bool]:
+        """
+        Await ``primary()``, starting ``hedge()`` if it outlasts the provider's p90.
+
+        Returns the first accepted result, and whether the hedge produced it;
+        the other call is cancelled. When neither is accepted the primary's
+        outcome is returned (or raised).
+        """
+        delay = self.delay_for(provider)
+        first = asyncio.ensure_future(primary())
+        second = None
+        try:
+            if delay is None:
+                return await first, False
+            done, _ = await asyncio.wait({first}, timeout=delay)
+            if done or not self._take_budget(estimated_cost):
+                return await first, False
+
+            logger.debug(f"Hedging request on {provider} after {delay:.2f}s")
+            second = asyncio.ensure_future(hedge())
+            pending = {first, second}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and accept(task.result()):
+                        self.counters["hedge_wins" if task is second else "primary_wins"] += 1
+                        return task.result(), task is second
+            if first.exception() is None:
+                return first.result(), False
+            raise first.exception()
+        finally:
+            for task in (first, second):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "enabled": self.enabled,
+            "budget_ratio": self.budget_ratio,
+            "primary_spend": round(self.primary_spend, 4),
+            "hedge_spend": round(self.hedge_spend, 4),
+            "delays": {
+                str(getattr(provider, "value", provider)): round(delay, 3)
+                for provider in self._latencies
+                if (delay := self.delay_for(provider)) is not None
+            }
+        }
+
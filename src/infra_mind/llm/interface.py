@@ -5,6 +5,7 @@ Defines the abstract interface that all LLM providers must implement.
 """
 
 from abc import ABC, abstractmethod
+import inspect
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
@@ -180,6 +181,14 @@ class LLMProviderInterface(ABC):
         self._total_cost += token_usage.estimated_cost
         self._request_count += 1
     
+    async def close(self) -> None:
+        """Close the provider's HTTP client and its connection pool."""
+        client = getattr(self, "client", None)
+        if client is not None and hasattr(client, "close"):
+            result = client.close()
+            if inspect.isawaitable(result):
+                await result
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform health check on the provider.
@@ -230,6 +239,19 @@ class LLMRateLimitError(LLMError):
         self.retry_after = retry_after
 
 
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Seconds to wait from a provider error's Retry-After headers, if it has them."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
 class LLMQuotaExceededError(LLMError):
     """Quota exceeded error."""
     pass
@@ -3,10 +3,18 @@ LLM Manager for coordinating multiple LLM providers.
 
 Provides unified interface for managing multiple LLM providers,
 load balancing, failover, and cost optimization.
+
+Agents, workflows and the chat API should use ``get_shared_llm_manager()``
+rather than constructing their own ``LLMManager``: the shared instance keeps
+one set of provider clients (and HTTP connection pools) per process, with a
+single response cache, budget and cost tracker.
 """
 
 import asyncio
 import logging
+import os
+import threading
+import time
 from typing import Dict, Any, List, Optional, Type
 from datetime import datetime, timezone
 from enum import Enum
@@ -20,16 +28,18 @@ from .interface import (
     LLMError,
     LLMAuthenticationError,
     LLMRateLimitError,
-    LLMQuotaExceededError
+    LLMQuotaExceededError,
+    retry_after_seconds
 )
 from .openai_provider import OpenAIProvider
 from .azure_openai_provider import AzureOpenAIProvider
-from .gemini_provider import GeminiProvider
-from openai import AzureOpenAI
 from .cost_tracker import CostTracker
 from .response_validator import ResponseValidator, ValidationResult
 from .prompt_formatter import prompt_formatter
 from .usage_optimizer import LLMUsageOptimizer, OptimizationStrategy, UsageLimits
+from .rate_scheduler import LLMRequestScheduler, get_llm_scheduler
+from .hedging import HedgingPolicy
+from .token_budget_manager import get_token_budget_manager
 from ..core.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -62,28 +72,47 @@ class LLMManager:
     - Usage analytics and monitoring
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        cost_tracker: Optional[CostTracker] = None,
+        usage_optimizer: Optional[LLMUsageOptimizer] = None,
+        scheduler: Optional[LLMRequestScheduler] = None
+    ):
         """
         Initialize LLM manager.
         
         Args:
             config: Manager configuration
+            cost_tracker: Cost tracker to share with other managers (optional)
+            usage_optimizer: Usage optimizer and response cache to share (optional)
+            scheduler: Rate budget scheduler (defaults to the process-wide one)
         """
         self.config = config or {}
         self.settings = get_settings()
         
         # Initialize components
         self.providers: Dict[LLMProvider, LLMProviderInterface] = {}
-        self.cost_tracker = CostTracker()
+        self.cost_tracker = cost_tracker or CostTracker()
         self.response_validator = ResponseValidator({})
         
         # Initialize usage optimizer
         optimization_strategy = OptimizationStrategy.BALANCED
-        self.usage_optimizer = LLMUsageOptimizer(
+        self.usage_optimizer = usage_optimizer or LLMUsageOptimizer(
             cost_tracker=self.cost_tracker,
             strategy=optimization_strategy
         )
         
+        # Provider quotas are per account, so every manager paces against the same budgets
+        self.scheduler = scheduler or get_llm_scheduler()
+        
+        # Duplicate slow requests past the provider's p90 (off unless configured)
+        self.hedging = HedgingPolicy(
+            enabled=self.config.get("hedging_enabled", self.settings.llm_hedging_enabled),
+            budget_ratio=self.settings.llm_hedge_budget_ratio,
+            max_tokens=self.settings.llm_hedge_max_tokens
+        )
+        
         # Set usage limits - skip for now to avoid config errors
         # usage_limits_config = self.config.get("usage_limits", {})
         
@@ -162,11 +191,6 @@ class LLMManager:
                     self._provider_performance[LLMProvider.OPENAI] = 1.0
                     
                     # Also keep Azure OpenAI reference for specific handling
-                    self.azure_client = AzureOpenAI(
-                        api_key=azure_creds["api_key"],
-                        azure_endpoint=azure_creds["endpoint"],
-                        api_version=azure_creds["api_version"]
-                    )
                     self.providers["azure_openai"] = azure_provider
                     self._provider_health["azure_openai"] = True
                     self._provider_performance["azure_openai"] = 1.0
@@ -199,8 +223,9 @@ class LLMManager:
             if request.system_prompt:
                 messages.insert(0, {"role": "system", "content": request.system_prompt})
             
-            # Make the API call
-            response = self.azure_client.chat.completions.create(
+            # Make the API call on the provider's pooled async client
+            azure_client = self.providers["azure_openai"].client
+            response = await azure_client.chat.completions.create(
                 model=deployment,
                 messages=messages,
                 temperature=request.temperature,
@@ -240,8 +265,17 @@ class LLMManager:
             return llm_response
             
         except Exception as e:
-            logger.error(f"Azure OpenAI API call failed: {str(e)}")
-            raise LLMError(f"Azure OpenAI error: {str(e)}", LLMProvider.OPENAI)
+            error_message = str(e)
+            if getattr(e, "status_code", None) == 429 or "429" in error_message or "rate_limit" in error_message.lower():
+                # Let the rate scheduler pause this deployment's budget
+                logger.warning(f"Azure OpenAI rate limited: {error_message}")
+                raise LLMRateLimitError(
+                    f"Azure OpenAI rate limited: {error_message}",
+                    LLMProvider.AZURE_OPENAI,
+                    retry_after=retry_after_seconds(e)
+                )
+            logger.error(f"Azure OpenAI API call failed: {error_message}")
+            raise LLMError(f"Azure OpenAI error: {error_message}", LLMProvider.OPENAI)
     
     async def generate_response(
         self, 
@@ -293,25 +327,24 @@ class LLMManager:
         provider_order = self._get_provider_order(request)
         
         last_exception = None
+        # Providers registered under several keys are one deployment; don't
+        # retry one that just rate limited us under another key
+        rate_limited = set()
         
         for provider_type in provider_order:
             provider = self.providers.get(provider_type)
-            if not provider or not self._provider_health.get(provider_type, False):
+            if not provider or not self._provider_health.get(provider_type, False) or id(provider) in rate_limited:
                 continue
             
             try:
                 provider_name = provider_type if isinstance(provider_type, str) else provider_type.value
                 logger.debug(f"Attempting request with {provider_name} provider")
                 
-                # Handle Azure OpenAI separately
-                if provider_type == "azure_openai" and hasattr(self, 'azure_client'):
-                    response = await self._generate_azure_openai_response(request)
+                if self.hedging.should_hedge(request):
+                    response, answered_by = await self._generate_hedged_response(provider_type, provider_order, request)
                 else:
-                    # Format request for the specific provider
-                    formatted_request = prompt_formatter.format_request_for_provider(request, provider_type)
-                    
-                    # Generate response
-                    response = await provider.generate_response(formatted_request)
+                    response, answered_by = await self._call_provider(provider_type, request), provider_type
+                    self.hedging.record_spend(response.token_usage.estimated_cost)
                 
                 # Track cost
                 self.cost_tracker.track_usage(
@@ -350,8 +383,8 @@ class LLMManager:
                             provider_type
                         )
                 
-                # Update provider performance
-                self._update_provider_performance(provider_type, response.response_time, True)
+                # Update performance of the provider that answered (a hedge may have)
+                self._update_provider_performance(answered_by, response.response_time, True)
                 
                 # Add optimization metadata to response
                 if enable_optimization:
@@ -384,6 +417,7 @@ class LLMManager:
                 provider_name = provider_type if isinstance(provider_type, str) else provider_type.value
                 logger.warning(f"{provider_name} rate limited: {str(e)}")
                 # Don't mark as unhealthy for rate limits, just try next provider
+                rate_limited.add(id(provider))
                 last_exception = e
                 continue
                 
@@ -407,6 +441,85 @@ class LLMManager:
         logger.error(error_msg)
         raise LLMError(error_msg, list(self.providers.keys())[0] if self.providers else LLMProvider.OPENAI)
     
+    async def _call_provider(self, provider_type, request: LLMRequest) -> LLMResponse:
+        """Send one request to one provider within its rate budget, recording latency."""
+        provider = self.providers[provider_type]
+        budget_provider, budget_model, endpoint = self._rate_budget_key(provider, request)
+        
+        # Wait for the budget of the deployment the call actually reaches
+        async with self.scheduler.reserve(budget_provider, budget_model, request, endpoint=endpoint) as reservation:
+            started = time.monotonic()
+            try:
+                # Handle Azure OpenAI separately
+                if provider_type == "azure_openai":
+                    response = await self._generate_azure_openai_response(request)
+                else:
+                    # Format request for the specific provider
+                    formatted_request = prompt_formatter.format_request_for_provider(request, provider_type)
+                    
+                    # Generate response
+                    response = await provider.generate_response(formatted_request)
+            except asyncio.CancelledError:
+                # Lost to a hedge: it would have taken at least this long
+                self.hedging.record_cancelled_latency(provider_type, time.monotonic() - started)
+                raise
+            self.hedging.record_latency(provider_type, time.monotonic() - started)
+            reservation.settle(response.token_usage.total_tokens)
+        
+        return response
+    
+    @staticmethod
+    def _rate_budget_key(provider: LLMProviderInterface, request: LLMRequest) -> tuple:
+        """
+        ``(provider, model, endpoint)`` the scheduler budgets a call under.
+
+        Keyed by the provider object rather than its ``self.providers`` key,
+        since one Azure deployment is registered under two keys but has a
+        single quota. Azure calls always go to the configured deployment.
+        """
+        endpoint = getattr(provider, "azure_endpoint", None)
+        if endpoint:
+            return LLMProvider.AZURE_OPENAI.value, provider.model, endpoint
+        return provider.provider_name.value, request.model or provider.model, None
+    
+    async def _generate_hedged_response(self, provider_type, provider_order: List, request: LLMRequest) -> tuple:
+        """
+        Call ``provider_type``, hedging on the next healthy provider (or the
+        same one, when it is the only one) if it outlasts its p90 latency.
+
+        Returns the response and the provider that generated it. Only primary
+        responses fund the hedge budget; a winning hedge is hedge spend.
+        """
+        hedge_type = next(
+            (p for p in provider_order if p != provider_type and self._provider_health.get(p, False)),
+            provider_type
+        )
+        estimated_cost = self._estimate_request_cost(hedge_type, request)
+        response, hedge_won = await self.hedging.run(
+            provider_type,
+            estimated_cost,
+            lambda: self._call_provider(provider_type, request),
+            lambda: self._call_provider(hedge_type, request),
+            accept=lambda response: response.is_valid
+        )
+        if hedge_won:
+            self.hedging.record_hedge_spend(response.token_usage.estimated_cost, estimated_cost)
+            return response, hedge_type
+        self.hedging.record_spend(response.token_usage.estimated_cost)
+        return response, provider_type
+    
+    def _estimate_request_cost(self, provider_type, request: LLMRequest) -> float:
+        """Estimated cost of a request if ``provider_type`` generates all of ``max_tokens``."""
+        provider = self.providers[provider_type]
+        budget_manager = get_token_budget_manager(request.model or provider.model)
+        prompt_tokens = budget_manager.count_tokens(request.prompt or "")
+        if request.system_prompt:
+            prompt_tokens += budget_manager.count_tokens(request.system_prompt)
+        try:
+            return provider.estimate_cost(prompt_tokens, request.max_tokens or 0, request.model or provider.model)
+        except Exception:
+            return 0.0
+    
     def _get_provider_order(self, request: LLMRequest) -> List:
         """
         Get provider order based on load balancing strategy.
@@ -556,6 +669,7 @@ class LLMManager:
             
             stats["providers"][provider_name] = provider_stats
         
+        stats["hedging"] = self.hedging.get_stats()
         return stats
     
     def get_cost_summary(self) -> Dict[str, Any]:
@@ -1064,4 +1178,78 @@ class LLMManager:
             except Exception as e:
                 logger.warning(f"Failed to export cost data: {str(e)}")
         
-        logger.info("LLM manager shutdown complete")
\ No newline at end of file
+        logger.info("LLM manager shutdown complete")
+
+
+_shared_managers: Dict[str, LLMManager] = {}
+_shared_cost_tracker: Optional[CostTracker] = None
+_shared_usage_optimizer: Optional[LLMUsageOptimizer] = None
+_shared_pid: Optional[int] = None
+_shared_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    global _shared_cost_tracker, _shared_usage_optimizer, _shared_pid
+    if _shared_pid != os.getpid():
+        # Connection pools must not be shared with a parent process
+        _shared_managers.clear()
+        _shared_cost_tracker = None
+        _shared_usage_optimizer = None
+        _shared_pid = os.getpid()
+
+
+def get_shared_cost_tracker() -> CostTracker:
+    """Get the process-wide cost tracker used by all shared LLM managers."""
+    global _shared_cost_tracker
+    with _shared_lock:
+        _reset_after_fork()
+        if _shared_cost_tracker is None:
+            _shared_cost_tracker = CostTracker()
+        return _shared_cost_tracker
+
+
+def get_shared_llm_manager(preferred_provider: Optional[str] = None) -> LLMManager:
+    """
+    Get the process-wide LLM manager.
+
+    There is one manager per provider preference (the configured
+    ``llm_provider`` by default), and all of them share one cost tracker and
+    one usage optimizer, so the response cache, usage limits and cost
+    accounting are unified. Pass ``agent_name`` on requests to keep
+    per-agent attribution.
+
+    Args:
+        preferred_provider: Provider to prefer, e.g. "azure_openai"
+
+    Returns:
+        Shared LLMManager instance
+    """
+    global _shared_usage_optimizer
+    settings = get_settings()
+    provider = str(preferred_provider or getattr(settings, "llm_provider", None) or "openai").lower()
+
+    cost_tracker = get_shared_cost_tracker()
+    with _shared_lock:
+        manager = _shared_managers.get(provider)
+        if manager is None:
+            if _shared_usage_optimizer is None:
+                _shared_usage_optimizer = LLMUsageOptimizer(
+                    cost_tracker=cost_tracker,
+                    strategy=OptimizationStrategy.BALANCED
+                )
+            manager = LLMManager(
+                {"preferred_provider": provider},
+                cost_tracker=cost_tracker,
+                usage_optimizer=_shared_usage_optimizer
+            )
+            _shared_managers[provider] = manager
+        return manager
+
+
+async def shutdown_shared_llm_managers() -> None:
+    """Close the shared managers' provider clients."""
+    with _shared_lock:
+        managers = list(_shared_managers.values())
+        _shared_managers.clear()
+    for manager in managers:
+        await manager.shutdown()
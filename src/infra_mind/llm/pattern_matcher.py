@@ -0,0 +1,243 @@
+"""
+Multi-pattern matcher for LLM input and output scanning.
+
+Finds every rule that matches a text in one pass over it, so prompt
+sanitization and response validation do not rescan the same content once
+per pattern or keyword.
+"""
+
+import re
+import logging
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from dataclasses import dataclass
+
+# Optional C implementation of Aho-Corasick - will use graceful fallback
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_REGEX_METACHARS = ".^$*+?{}[]|()"
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """A single rule match."""
+    rule: str
+    pattern: str
+    start: int
+    end: int
+
+
+def _leading_literal(pattern: str) -> str:
+    """
+    Extract the literal prefix every match of a regex must start with.
+
+    Returns an empty string when no safe prefix exists (leading group,
+    class, anchor or top-level alternation).
+    """
+    depth = 0
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return ""
+
+    literal = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            if i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+                value, step = pattern[i + 1], 2
+            else:
+                break
+        elif char in _REGEX_METACHARS:
+            break
+        else:
+            value, step = char, 1
+
+        following = pattern[i + step] if i + step < len(pattern) else ""
+        if following in "*?{":
+            break
+        literal.append(value)
+        i += step
+        if following == "+":
+            break
+    return "".join(literal)
+
+
+class MultiPatternMatcher:
+    """
+    Match many literal keywords and regex rules against a text at once.
+
+    Literals are matched with an Aho-Corasick automaton when the
+    ``pyahocorasick`` extension is installed, otherwise with C-level
+    substring search per literal (faster than a pure-Python automaton for
+    small keyword sets). Regex rules are indexed by their literal prefix:
+    a single alternation over all prefixes locates candidate positions and
+    only those rules are tried there. Rules without a usable prefix fall
+    back to an individual search.
+
+    Matching is case-insensitive; the text is lowercased once per scan.
+    """
+
+    def __init__(
+        self,
+        literals: Optional[Iterable[Tuple[str, str]]] = None,
+        patterns: Optional[Iterable[Tuple[str, str]]] = None,
+        flags: int = re.MULTILINE
+    ):
+        """
+        Initialize matcher.
+
+        Args:
+            literals: (keyword, rule) pairs matched as plain substrings
+            patterns: (regex, rule) pairs
+            flags: Extra regex flags for the pattern rules (IGNORECASE is implied)
+        """
+        self._rule_order: Dict[str, int] = {}
+        self._literals: List[Tuple[str, str]] = []
+        for keyword, rule in literals or []:
+            self._register(rule)
+            self._literals.append((keyword.lower(), rule))
+
+        self._anchored: Dict[str, List[Tuple[re.Pattern, str, str]]] = {}
+        self._unanchored: List[Tuple[re.Pattern, str, str]] = []
+        for pattern, rule in patterns or []:
+            self._register(rule)
+            compiled = re.compile(pattern, flags | re.IGNORECASE)
+            prefix = _leading_literal(pattern).lower()
+            if prefix:
+                self._anchored.setdefault(prefix, []).append((compiled, pattern, rule))
+            else:
+                self._unanchored.append((compiled, pattern, rule))
+
+        self._prefix_regex = None
+        if self._anchored:
+            prefixes = sorted(self._anchored, key=len, reverse=True)
+            self._prefix_regex = re.compile("|".join(re.escape(p) for p in prefixes))
+            self._prefixes_by_length = sorted({len(p) for p in prefixes}, reverse=True)
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self._literals:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, rule in self._literals:
+                self._automaton.add_word(keyword, (keyword, rule))
+            self._automaton.make_automaton()
+
+    def _register(self, rule: str) -> None:
+        self._rule_order.setdefault(rule, len(self._rule_order))
+
+    def scan(self, text: str, all_matches: bool = False) -> List[PatternMatch]:
+        """
+        Find rule matches in text.
+
+        Args:
+            text: Text to scan
+            all_matches: Report every occurrence instead of the first per
+                keyword/pattern
+
+        Returns:
+            Matches ordered by rule definition order, then position
+        """
+        if not text:
+            return []
+
+        text_lower = text.lower()
+        matches: List[PatternMatch] = []
+        matches.extend(self._scan_literals(text_lower, all_matches))
+        matches.extend(self._scan_patterns(text_lower, all_matches))
+        matches.sort(key=lambda m: (self._rule_order[m.rule], m.start))
+        return matches
+
+    def matched_rules(self, text: str) -> List[str]:
+        """Return the distinct rules matching text, in definition order."""
+        seen = []
+        for match in self.scan(text):
+            if match.rule not in seen:
+                seen.append(match.rule)
+        return seen
+
+    def matched_keywords(self, text: str, rule: Optional[str] = None) -> List[str]:
+        """Return the distinct keywords/patterns that matched, optionally for one rule."""
+        seen = []
+        for match in self.scan(text):
+            if (rule is None or match.rule == rule) and match.pattern not in seen:
+                seen.append(match.pattern)
+        return seen
+
+    def _scan_literals(self, text_lower: str, all_matches: bool) -> List[PatternMatch]:
+        matches = []
+        if self._automaton is not None:
+            seen = set()
+            for end, (keyword, rule) in self._automaton.iter(text_lower):
+                if not all_matches and keyword in seen:
+                    continue
+                seen.add(keyword)
+                matches.append(PatternMatch(rule, keyword, end - len(keyword) + 1, end + 1))
+            return matches
+
+        for keyword, rule in self._literals:
+            start = text_lower.find(keyword)
+            while start != -1:
+                matches.append(PatternMatch(rule, keyword, start, start + len(keyword)))
+                if not all_matches:
+                    break
+                start = text_lower.find(keyword, start + 1)
+        return matches
+
+    def _scan_patterns(self, text_lower: str, all_matches: bool) -> List[PatternMatch]:
+        matches = []
+        done = set()
+
+        if self._prefix_regex is not None:
+            total = sum(len(rules) for rules in self._anchored.values())
+            # search() from the next character so overlapping prefixes are not skipped
+            candidate = self._prefix_regex.search(text_lower)
+            while candidate is not None and (all_matches or len(done) < total):
+                position = candidate.start()
+                # Shorter prefixes may also start here (e.g. "system" vs "sys")
+                for length in self._prefixes_by_length:
+                    rules = self._anchored.get(text_lower[position:position + length])
+                    if not rules:
+                        continue
+                    for compiled, pattern, rule in rules:
+                        if not all_matches and pattern in done:
+                            continue
+                        found = compiled.match(text_lower, position)
+                        if found:
+                            done.add(pattern)
+                            matches.append(PatternMatch(rule, pattern, found.start(), found.end()))
+                candidate = self._prefix_regex.search(text_lower, position + 1)
+
+        for compiled, pattern, rule in self._unanchored:
+            if all_matches:
+                matches.extend(
+                    PatternMatch(rule, pattern, m.start(), m.end())
+                    for m in compiled.finditer(text_lower)
+                )
+            else:
+                found = compiled.search(text_lower)
+                if found:
+                    matches.append(PatternMatch(rule, pattern, found.start(), found.end()))
+        return matches
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get matcher configuration statistics."""
+        return {
+            "literals": len(self._literals),
+            "anchored_patterns": sum(len(rules) for rules in self._anchored.values()),
+            "unanchored_patterns": len(self._unanchored),
+            "aho_corasick": self._automaton is not None,
+        }
@@ -12,10 +12,14 @@ Provides comprehensive prompt lifecycle management including:
 import hashlib
 import json
 import logging
+import os
+import time
 import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Callable
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Any, List, Optional, Callable, Tuple, Hashable
 from enum import Enum
 import re
 
@@ -65,6 +69,71 @@ class PromptVersion:
         return cls(**data)
 
 
+# Value types whose str.format() output depends only on their value and type
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
+
+class CompiledPrompt:
+    """
+    Prompt template pre-split into literal and variable segments.
+
+    Rendering joins the literal segments with the substituted values instead
+    of re-parsing the template on every call, and identical renders of the
+    same template are served from an LRU. Templates using format features
+    beyond plain ``{name}`` fields (format specs, conversions, attribute or
+    index access) fall back to ``str.format`` so output stays identical.
+    """
+
+    def __init__(self, content: str, render_cache_size: int = 256):
+        self.content = content
+        self.segments: List[Tuple[str, Optional[str]]] = []
+        self.simple = True
+
+        try:
+            for literal, field_name, format_spec, conversion in Formatter().parse(content):
+                if field_name is not None and (
+                    format_spec or conversion or not field_name.isidentifier()
+                ):
+                    self.simple = False
+                self.segments.append((literal, field_name))
+        except ValueError:
+            # Malformed template: let str.format raise the same error on render
+            self.simple = False
+
+        self.field_names: Tuple[str, ...] = tuple(dict.fromkeys(
+            name for _, name in self.segments if name is not None
+        ))
+        self._render_cached = lru_cache(maxsize=render_cache_size, typed=True)(self._render_values)
+
+    def _render_values(self, *values: Any) -> str:
+        lookup = dict(zip(self.field_names, values))
+        parts = []
+        for literal, name in self.segments:
+            parts.append(literal)
+            if name is not None:
+                parts.append(format(lookup[name], ""))
+        return "".join(parts)
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        Render the template.
+
+        Raises:
+            KeyError: If a template variable is missing
+        """
+        if not self.simple:
+            return self.content.format(**variables)
+
+        values = tuple(variables[name] for name in self.field_names)
+        if all(type(value) in _CACHEABLE_TYPES for value in values):
+            return self._render_cached(*values)
+        return self._render_values(*values)
+
+    def cache_info(self):
+        """Rendered-output cache statistics."""
+        return self._render_cached.cache_info()
+
+
 @dataclass
 class ABTestResult:
     """Result of A/B test comparison."""
@@ -262,12 +331,26 @@ class PromptStorage:
         """Update prompt version (for metrics)."""
         raise NotImplementedError
 
+    def get_revision(self, template_id: str) -> Optional[Hashable]:
+        """
+        Get a token that changes whenever a template's versions change.
+
+        Used to invalidate cached prompts. None means the backend does not
+        track changes and cached prompts stay valid until activation.
+        """
+        return None
+
 
 class InMemoryPromptStorage(PromptStorage):
     """In-memory storage for prompt templates (for development/testing)."""
 
     def __init__(self):
         self.prompts: Dict[str, Dict[str, PromptVersion]] = {}
+        self._revisions: Dict[str, int] = {}
+
+    def get_revision(self, template_id: str) -> Optional[Hashable]:
+        """Get the change counter for a template."""
+        return self._revisions.get(template_id, 0)
 
     def save_prompt(self, prompt: PromptVersion) -> None:
         """Save prompt version to memory."""
@@ -275,6 +358,7 @@ class InMemoryPromptStorage(PromptStorage):
             self.prompts[prompt.template_id] = {}
 
         self.prompts[prompt.template_id][prompt.version] = prompt
+        self._revisions[prompt.template_id] = self._revisions.get(prompt.template_id, 0) + 1
         logger.debug(f"Saved prompt {prompt.template_id} v{prompt.version} to memory")
 
     def get_prompt_version(self, template_id: str, version: str) -> Optional[PromptVersion]:
@@ -304,21 +388,58 @@ class InMemoryPromptStorage(PromptStorage):
         """Update prompt version in memory."""
         if prompt.template_id in self.prompts:
             self.prompts[prompt.template_id][prompt.version] = prompt
+            self._revisions[prompt.template_id] = self._revisions.get(prompt.template_id, 0) + 1
 
 
 class FilePromptStorage(PromptStorage):
-    """File-based storage for prompt templates (for production)."""
+    """
+    File-based storage for prompt templates (for production).
+
+    Parsed versions are cached per file and revalidated by file mtime, and
+    the directory is rescanned at most once per ``revalidate_interval``
+    seconds, so hot lookups do not touch the filesystem.
+    """
 
-    def __init__(self, base_path: str = "./data/prompts"):
-        import os
+    def __init__(self, base_path: str = "./data/prompts", revalidate_interval: float = 1.0):
         self.base_path = base_path
+        self.revalidate_interval = revalidate_interval
         os.makedirs(base_path, exist_ok=True)
 
+        # filename -> ((mtime_ns, size), PromptVersion)
+        self._file_cache: Dict[str, Tuple[Tuple[int, int], PromptVersion]] = {}
+        # filename -> (mtime_ns, size) from the last directory scan
+        self._file_stats: Dict[str, Tuple[int, int]] = {}
+        self._last_scan = 0.0
+
     def _get_file_path(self, template_id: str, version: str) -> str:
         """Get file path for prompt version."""
-        import os
         return os.path.join(self.base_path, f"{template_id}_{version}.json")
 
+    def _scan(self, force: bool = False) -> Dict[str, Tuple[int, int]]:
+        """Stat prompt files, reusing the last scan within the revalidate interval."""
+        now = time.monotonic()
+        if force or now - self._last_scan >= self.revalidate_interval:
+            stats = {}
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        stats[entry.name] = (stat.st_mtime_ns, stat.st_size)
+            self._file_stats = stats
+            self._last_scan = now
+        return self._file_stats
+
+    def _load(self, filename: str, stamp: Tuple[int, int]) -> PromptVersion:
+        """Load a prompt file, reusing the parsed version if unchanged."""
+        cached = self._file_cache.get(filename)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        with open(os.path.join(self.base_path, filename), 'r') as f:
+            prompt = PromptVersion.from_dict(json.load(f))
+        self._file_cache[filename] = (stamp, prompt)
+        return prompt
+
     def save_prompt(self, prompt: PromptVersion) -> None:
         """Save prompt version to file."""
         file_path = self._get_file_path(prompt.template_id, prompt.version)
@@ -326,20 +447,21 @@ class FilePromptStorage(PromptStorage):
         with open(file_path, 'w') as f:
             json.dump(prompt.to_dict(), f, indent=2)
 
+        # Our own writes are visible immediately
+        self._scan(force=True)
+
         logger.debug(f"Saved prompt {prompt.template_id} v{prompt.version} to {file_path}")
 
     def get_prompt_version(self, template_id: str, version: str) -> Optional[PromptVersion]:
         """Get specific prompt version from file."""
-        import os
         file_path = self._get_file_path(template_id, version)
 
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             return None
 
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-
-        return PromptVersion.from_dict(data)
+        return self._load(os.path.basename(file_path), (stat.st_mtime_ns, stat.st_size))
 
     def get_latest_prompt(self, template_id: str) -> Optional[PromptVersion]:
         """Get latest active prompt version."""
@@ -353,16 +475,20 @@ class FilePromptStorage(PromptStorage):
 
     def list_versions(self, template_id: str) -> List[PromptVersion]:
         """List all versions of a template."""
-        import os
-        versions = []
-
-        for filename in os.listdir(self.base_path):
-            if filename.startswith(f"{template_id}_") and filename.endswith(".json"):
-                with open(os.path.join(self.base_path, filename), 'r') as f:
-                    data = json.load(f)
-                    versions.append(PromptVersion.from_dict(data))
-
-        return versions
+        prefix = f"{template_id}_"
+        return [
+            self._load(filename, stamp)
+            for filename, stamp in sorted(self._scan().items())
+            if filename.startswith(prefix)
+        ]
+
+    def get_revision(self, template_id: str) -> Optional[Hashable]:
+        """Get the set of file stamps for a template."""
+        prefix = f"{template_id}_"
+        return tuple(
+            (filename, stamp) for filename, stamp in sorted(self._scan().items())
+            if filename.startswith(prefix)
+        )
 
     def update_prompt(self, prompt: PromptVersion) -> None:
         """Update prompt version in file."""
@@ -391,6 +517,9 @@ class PromptManager:
         self.storage = storage_backend or InMemoryPromptStorage()
         self.active_experiments: Dict[str, ABTest] = {}
         self.version_cache: Dict[str, PromptVersion] = {}  # Cache for performance
+        self._version_revisions: Dict[str, Hashable] = {}
+        # (template_id, version) -> compiled template registry
+        self.compiled_prompts: Dict[Tuple[str, str], CompiledPrompt] = {}
 
         logger.info(f"PromptManager initialized with {type(self.storage).__name__}")
 
@@ -510,17 +639,39 @@ class PromptManager:
         if version:
             return self.storage.get_prompt_version(template_id, version)
 
-        # Check cache first
-        if template_id in self.version_cache:
+        # Check cache first (invalidated when the storage revision changes)
+        revision = self.storage.get_revision(template_id)
+        if (template_id in self.version_cache
+                and self._version_revisions.get(template_id) == revision):
             return self.version_cache[template_id]
 
         # Get latest from storage
         latest = self.storage.get_latest_prompt(template_id)
         if latest:
             self.version_cache[template_id] = latest
+            self._version_revisions[template_id] = revision
 
         return latest
 
+    def get_compiled_prompt(self, prompt: PromptVersion) -> CompiledPrompt:
+        """
+        Get the compiled renderer for a prompt version.
+
+        Compiled once per version and recompiled only if its content changes.
+
+        Args:
+            prompt: Prompt version
+
+        Returns:
+            CompiledPrompt for the version
+        """
+        key = (prompt.template_id, prompt.version)
+        compiled = self.compiled_prompts.get(key)
+        if compiled is None or compiled.content != prompt.content:
+            compiled = CompiledPrompt(prompt.content)
+            self.compiled_prompts[key] = compiled
+        return compiled
+
     def render_prompt(
         self,
         template_id: str,
@@ -548,7 +699,7 @@ class PromptManager:
             raise ValueError(f"Prompt template '{template_id}' not found")
 
         try:
-            rendered = prompt.content.format(**variables)
+            rendered = self.get_compiled_prompt(prompt).render(variables)
             return rendered, prompt.version
 
         except KeyError as e:
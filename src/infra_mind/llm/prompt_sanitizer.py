@@ -11,6 +11,8 @@ from typing import Dict, Any, List, Union, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from .pattern_matcher import MultiPatternMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -94,6 +96,9 @@ class PromptSanitizer:
         (r'\[/INST\]', "llama_close"),
     ]
 
+    # Compiled matchers, keyed by the pattern list they were built from
+    _matchers: Dict[tuple, MultiPatternMatcher] = {}
+
     # Maximum input lengths (characters)
     MAX_INPUT_LENGTH_STRICT = 2000
     MAX_INPUT_LENGTH_BALANCED = 5000
@@ -130,6 +135,20 @@ class PromptSanitizer:
 
         logger.info(f"PromptSanitizer initialized with {self.security_level} security level")
 
+    @classmethod
+    def get_matcher(cls) -> MultiPatternMatcher:
+        """
+        Get the compiled matcher for INJECTION_PATTERNS.
+
+        Built once per pattern list and shared by all instances.
+        """
+        key = tuple(cls.INJECTION_PATTERNS)
+        matcher = PromptSanitizer._matchers.get(key)
+        if matcher is None:
+            matcher = MultiPatternMatcher(patterns=cls.INJECTION_PATTERNS)
+            PromptSanitizer._matchers[key] = matcher
+        return matcher
+
     def sanitize_dict(
         self,
         data: Dict[str, Any],
@@ -294,20 +313,18 @@ class PromptSanitizer:
             max_chars = self.max_tokens * 4
             text = text[:max_chars] + "..."
 
-        # Step 3: Check for injection patterns
-        text_lower = text.lower()
-        for pattern, violation_type in self.INJECTION_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
-                violations.append(violation_type)
-                logger.warning(
-                    f"Potential prompt injection detected: {violation_type}"
-                )
+        # Step 3: Check for injection patterns (single pass over the text)
+        for match in self.get_matcher().scan(text):
+            violations.append(match.rule)
+            logger.warning(
+                f"Potential prompt injection detected: {match.rule}"
+            )
 
-                if raise_on_violation:
-                    raise PromptInjectionError(
-                        f"Prompt injection detected: {violation_type}. "
-                        f"Input contains suspicious pattern '{pattern}'"
-                    )
+            if raise_on_violation:
+                raise PromptInjectionError(
+                    f"Prompt injection detected: {match.rule}. "
+                    f"Input contains suspicious pattern '{match.pattern}'"
+                )
 
         # Step 4: Remove or escape dangerous characters (strict mode only)
         if self.strict_mode:
@@ -399,14 +416,7 @@ class PromptSanitizer:
         if not text:
             return []
 
-        violations = []
-        text_lower = text.lower()
-
-        for pattern, violation_type in self.INJECTION_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
-                violations.append(violation_type)
-
-        return violations
+        return [match.rule for match in self.get_matcher().scan(text)]
 
 
 # Convenience functions for common use cases
@@ -0,0 +1,452 @@
+"""
+Token-rate-aware scheduling of LLM requests.
+
+Providers enforce tokens-per-minute (TPM) and requests-per-minute (RPM)
+quotas per model. Without pacing, a burst of agent calls exceeds the quota,
+every request gets a 429 and the provider clients' retry backoff turns it
+into a storm. ``LLMRequestScheduler`` sits in front of the provider calls
+of every ``LLMManager`` in the process:
+
+1. Each request reserves its estimated tokens before it is sent: the prompt
+   counted with ``TokenBudgetManager`` plus ``max_tokens`` (providers count
+   the completion limit against TPM). After the response the reservation is
+   settled to the real usage, refunding or charging the difference.
+2. TPM and RPM budgets are token buckets per ``(provider, model)`` that
+   refill continuously, so requests are paced to the quota instead of
+   bursting at the top of each minute. Deployments reached through their
+   own endpoint (Azure OpenAI) also key their bucket by the endpoint.
+3. Waiting requests are queued per priority class. Interactive requests
+   (chat) are always dispatched first, and batch requests (assessment
+   agents) may not take the last ``interactive_reserve`` share of the token
+   bucket. Batch requests that have waited longer than
+   ``batch_max_wait_seconds`` are promoted so they cannot starve.
+4. A rate-limit error from a provider pauses its budget for the provider's
+   ``retry_after`` (or ``rate_limit_backoff_seconds``), so queued requests
+   wait instead of piling onto the exhausted quota.
+
+Budgets are per process. With several API or worker processes sharing one
+API key, configure each with its share of the account quota.
+
+Queue depth, wait times, utilization and rate-limit errors are exported to
+Prometheus through ``core.prometheus_metrics`` when ``prometheus_client`` is
+installed, and are available from ``get_metrics()`` either way.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+from .interface import LLMRateLimitError, LLMRequest
+from .token_budget_manager import get_token_budget_manager
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(str, Enum):
+    """Scheduling class of an LLM request."""
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+def request_priority(request: LLMRequest) -> RequestPriority:
+    """Priority from ``request.context["priority"]``; batch when unset."""
+    try:
+        return RequestPriority(request.context.get("priority", RequestPriority.BATCH))
+    except ValueError:
+        return RequestPriority.BATCH
+
+
+@dataclass(frozen=True)
+class RateBudget:
+    """Per-minute quota of one provider model."""
+    tokens_per_minute: int
+    requests_per_minute: int
+
+
+class _TokenBucket:
+    """Continuously refilling bucket; the level may go negative on debt."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(1, per_minute))
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def seconds_until(self, amount: float, now: float) -> float:
+        self.refill(now)
+        return max(0.0, (amount - self.level) / self.rate)
+
+
+@dataclass
+class _Waiter:
+    tokens: int
+    priority: RequestPriority
+    enqueued_at: float
+    granted: asyncio.Future
+    cancelled: bool = False
+
+
+@dataclass
+class _ModelState:
+    provider: str
+    model: str
+    endpoint: Optional[str]
+    budget: RateBudget
+    tokens: _TokenBucket
+    requests: _TokenBucket
+    queues: Dict[RequestPriority, Deque[_Waiter]] = field(
+        default_factory=lambda: {priority: deque() for priority in RequestPriority}
+    )
+    blocked_until: float = 0.0
+    timer: Optional[asyncio.TimerHandle] = None
+    in_flight: int = 0
+    usage: Deque[Tuple[float, int]] = field(default_factory=deque)
+    waits: Dict[RequestPriority, Deque[float]] = field(
+        default_factory=lambda: {priority: deque(maxlen=1000) for priority in RequestPriority}
+    )
+    counters: Dict[str, int] = field(
+        default_factory=lambda: {"dispatched": 0, "rate_limited": 0, "promoted": 0, "cancelled": 0}
+    )
+
+
+class Reservation:
+    """Tokens held for one provider call until it is settled."""
+
+    def __init__(self, scheduler: Optional["LLMRequestScheduler"], state: Optional[_ModelState], tokens: int):
+        self._scheduler = scheduler
+        self._state = state
+        self.tokens = tokens
+        self.settled = False
+
+    def settle(self, actual_tokens: int) -> None:
+        """Replace the estimate with the tokens the provider actually charged."""
+        if self.settled:
+            return
+        self.settled = True
+        if self._scheduler is not None:
+            self._scheduler._settle(self._state, self.tokens, actual_tokens)
+
+
+class LLMRequestScheduler:
+    """
+    Paces LLM requests to per-provider TPM/RPM budgets with priority queues.
+
+    State changes happen on the calling event loop; waiters belonging to a
+    loop that has since been closed are dropped.
+    """
+
+    def __init__(
+        self,
+        default_budget: RateBudget = RateBudget(tokens_per_minute=90_000, requests_per_minute=500),
+        budgets: Optional[Dict[str, RateBudget]] = None,
+        interactive_reserve: float = 0.1,
+        batch_max_wait_seconds: float = 120.0,
+        rate_limit_backoff_seconds: float = 10.0,
+        enabled: bool = True
+    ):
+        """
+        Args:
+            default_budget: Budget of models without an explicit entry
+            budgets: Budgets keyed by ``"provider:model"`` or ``"provider"``
+            interactive_reserve: Share of each token bucket batch requests may not use
+            batch_max_wait_seconds: Wait after which a batch request is promoted
+            rate_limit_backoff_seconds: Pause after a 429 without ``retry_after``
+            enabled: When False requests are passed through unscheduled
+        """
+        self.default_budget = default_budget
+        self.budgets = dict(budgets or {})
+        self.interactive_reserve = min(max(interactive_reserve, 0.0), 0.9)
+        self.batch_max_wait_seconds = batch_max_wait_seconds
+        self.rate_limit_backoff_seconds = rate_limit_backoff_seconds
+        self.enabled = enabled
+        self._states: Dict[Tuple[str, str, Optional[str]], _ModelState] = {}
+
+    def budget_for(self, provider: str, model: str) -> RateBudget:
+        return self.budgets.get(f"{provider}:{model}") or self.budgets.get(provider) or self.default_budget
+
+    def estimate_tokens(self, request: LLMRequest) -> int:
+        """Prompt tokens plus the completion limit, as providers count them."""
+        budget_manager = get_token_budget_manager(request.model or "gpt-4")
+        prompt_tokens = budget_manager.count_tokens(request.prompt or "")
+        if request.system_prompt:
+            prompt_tokens += budget_manager.count_tokens(request.system_prompt)
+        return prompt_tokens + (request.max_tokens or 0)
+
+    def _state(self, provider: str, model: str, endpoint: Optional[str] = None) -> _ModelState:
+        key = (provider, model, endpoint)
+        state = self._states.get(key)
+        if state is None:
+            budget = self.budget_for(provider, model)
+            state = _ModelState(
+                provider=provider,
+                model=model,
+                endpoint=endpoint,
+                budget=budget,
+                tokens=_TokenBucket(budget.tokens_per_minute),
+                requests=_TokenBucket(budget.requests_per_minute)
+            )
+            self._states[key] = state
+        return state
+
+    @asynccontextmanager
+    async def reserve(
+        self,
+        provider: str,
+        model: str,
+        request: LLMRequest,
+        endpoint: Optional[str] = None
+    ) -> AsyncIterator[Reservation]:
+        """
+        Wait for rate budget, then hold it for one provider call.
+
+        Call ``reservation.settle(total_tokens)`` once the response is in;
+        an unsettled reservation (failed call) is refunded on exit.
+
+        Args:
+            provider: Provider the budget is configured under, e.g. "azure_openai"
+            model: Model, or the deployment for providers bound to one
+            request: Request to reserve tokens for
+            endpoint: Endpoint of the deployment, when a provider can reach several
+        """
+        if not self.enabled:
+            yield Reservation(None, None, 0)
+            return
+
+        state = self._state(provider, model, endpoint)
+        priority = request_priority(request)
+        # An oversized request still runs, once the bucket is full
+        tokens = min(self.estimate_tokens(request), int(state.tokens.capacity))
+        waiter = _Waiter(tokens, priority, time.monotonic(), asyncio.get_running_loop().create_future())
+        state.queues[priority].append(waiter)
+        self._dispatch(state)
+
+        try:
+            await waiter.granted
+        except BaseException:
+            if waiter.granted.done() and not waiter.granted.cancelled():
+                self._settle(state, tokens, 0)
+            else:
+                waiter.cancelled = True
+                state.counters["cancelled"] += 1
+                self._dispatch(state)
+            raise
+
+        wait = time.monotonic() - waiter.enqueued_at
+        state.waits[priority].append(wait)
+        _export_wait(state, priority, wait)
+
+        reservation = Reservation(self, state, tokens)
+        try:
+            yield reservation
+        except LLMRateLimitError as e:
+            self.penalize(state, e.retry_after)
+            raise
+        finally:
+            reservation.settle(0)
+
+    def penalize(self, state: _ModelState, retry_after: Optional[float] = None) -> None:
+        """Pause a model's budget after the provider rejected a request for rate."""
+        pause = retry_after if retry_after else self.rate_limit_backoff_seconds
+        state.blocked_until = max(state.blocked_until, time.monotonic() + pause)
+        state.tokens.level = min(state.tokens.level, 0.0)
+        state.counters["rate_limited"] += 1
+        logger.warning(
+            f"{state.provider}:{state.model} rate limited by provider; "
+            f"pausing for {pause:.1f}s with {self.queue_length(state)} requests queued"
+        )
+        _export_rate_limited(state)
+        self._dispatch(state)
+
+    def _settle(self, state: _ModelState, reserved: int, actual: int) -> None:
+        now = time.monotonic()
+        state.in_flight -= 1
+        state.tokens.refill(now)
+        state.tokens.level = min(state.tokens.capacity, state.tokens.level + reserved - actual)
+        if actual:
+            state.usage.append((now, actual))
+        else:
+            # The request was never answered; give its request slot back too
+            state.requests.refill(now)
+            state.requests.level = min(state.requests.capacity, state.requests.level + 1)
+        self._dispatch(state)
+
+    @staticmethod
+    def _head(state: _ModelState, priority: RequestPriority) -> Optional[_Waiter]:
+        queue = state.queues[priority]
+        while queue and (
+            queue[0].cancelled or queue[0].granted.done() or queue[0].granted.get_loop().is_closed()
+        ):
+            queue.popleft()
+        return queue[0] if queue else None
+
+    def _next_waiter(self, state: _ModelState, now: float) -> Tuple[Optional[_Waiter], float, bool]:
+        """The waiter to dispatch next, the tokens it must leave in the bucket and whether it was promoted."""
+        interactive = self._head(state, RequestPriority.INTERACTIVE)
+        batch = self._head(state, RequestPriority.BATCH)
+
+        if batch is not None and now - batch.enqueued_at > self.batch_max_wait_seconds:
+            return batch, 0.0, True
+        if interactive is not None:
+            return interactive, 0.0, False
+        return batch, state.tokens.capacity * self.interactive_reserve, False
+
+    def _dispatch(self, state: _ModelState) -> None:
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+
+        while True:
+            now = time.monotonic()
+            waiter, reserve, promoted = self._next_waiter(state, now)
+            if waiter is None:
+                break
+
+            delay = max(
+                state.blocked_until - now,
+                state.tokens.seconds_until(waiter.tokens + reserve, now),
+                state.requests.seconds_until(1, now)
+            )
+            if delay > 0:
+                state.timer = asyncio.get_running_loop().call_later(delay, self._dispatch, state)
+                break
+
+            state.queues[waiter.priority].popleft()
+            if promoted:
+                state.counters["promoted"] += 1
+            state.tokens.level -= waiter.tokens
+            state.requests.level -= 1
+            state.in_flight += 1
+            state.counters["dispatched"] += 1
+            waiter.granted.set_result(True)
+
+        _export_state(state, self._utilization(state, time.monotonic()))
+
+    @staticmethod
+    def queue_length(state: _ModelState, priority: Optional[RequestPriority] = None) -> int:
+        priorities = [priority] if priority else list(RequestPriority)
+        return sum(
+            1 for p in priorities for w in state.queues[p]
+            if not w.cancelled and not w.granted.done()
+        )
+
+    @staticmethod
+    def _utilization(state: _ModelState, now: float) -> Dict[str, float]:
+        while state.usage and now - state.usage[0][0] > 60.0:
+            state.usage.popleft()
+        return {
+            "tokens": sum(tokens for _, tokens in state.usage) / state.budget.tokens_per_minute,
+            "requests": len(state.usage) / state.budget.requests_per_minute
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Budgets, queue depth, wait times and utilization per provider model."""
+        now = time.monotonic()
+        models = {}
+        for (provider, model, endpoint), state in self._states.items():
+            utilization = self._utilization(state, now)
+            models[f"{provider}:{model}" + (f"@{endpoint}" if endpoint else "")] = {
+                **state.counters,
+                "tokens_per_minute": state.budget.tokens_per_minute,
+                "requests_per_minute": state.budget.requests_per_minute,
+                "tokens_available": int(state.tokens.level),
+                "in_flight": state.in_flight,
+                "paused_seconds": round(max(0.0, state.blocked_until - now), 1),
+                "queued": {p.value: self.queue_length(state, p) for p in RequestPriority},
+                "wait_seconds": {
+                    p.value: {
+                        "mean": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                        "max": round(max(waits, default=0.0), 3)
+                    }
+                    for p, waits in state.waits.items()
+                },
+                "utilization": {name: round(value, 3) for name, value in utilization.items()}
+            }
+        return {
+            "enabled": self.enabled,
+            "interactive_reserve": self.interactive_reserve,
+            "models": models
+        }
+
+
+_prometheus_metrics: Any = None
+
+
+def _prometheus():
+    """``core.prometheus_metrics`` module, or None when prometheus_client is missing."""
+    global _prometheus_metrics
+
+    if _prometheus_metrics is None:
+        try:
+            from ..core import prometheus_metrics
+            _prometheus_metrics = prometheus_metrics
+        except ImportError:
+            _prometheus_metrics = False
+    return _prometheus_metrics or None
+
+
+def _export_wait(state: _ModelState, priority: RequestPriority, wait: float) -> None:
+    metrics = _prometheus()
+    if metrics:
+        metrics.llm_scheduler_wait_seconds.labels(
+            provider=state.provider, model=state.model, priority=priority.value
+        ).observe(wait)
+
+
+def _export_rate_limited(state: _ModelState) -> None:
+    metrics = _prometheus()
+    if metrics:
+        metrics.llm_scheduler_rate_limited_total.labels(provider=state.provider, model=state.model).inc()
+
+
+def _export_state(state: _ModelState, utilization: Dict[str, float]) -> None:
+    metrics = _prometheus()
+    if not metrics:
+        return
+    for priority in RequestPriority:
+        metrics.llm_scheduler_queue_depth.labels(
+            provider=state.provider, model=state.model, priority=priority.value
+        ).set(LLMRequestScheduler.queue_length(state, priority))
+    metrics.llm_scheduler_utilization.labels(
+        provider=state.provider, model=state.model, budget="tokens_per_minute"
+    ).set(utilization["tokens"])
+    metrics.llm_scheduler_utilization.labels(
+        provider=state.provider, model=state.model, budget="requests_per_minute"
+    ).set(utilization["requests"])
+
+
+_scheduler: Optional[LLMRequestScheduler] = None
+
+
+def get_llm_scheduler() -> LLMRequestScheduler:
+    """Get or create the process-wide LLM request scheduler."""
+    global _scheduler
+
+    if _scheduler is None:
+        from ..core.config import settings
+
+        _scheduler = LLMRequestScheduler(
+            default_budget=RateBudget(
+                tokens_per_minute=settings.llm_tokens_per_minute,
+                requests_per_minute=settings.llm_requests_per_minute
+            ),
+            budgets={
+                key: RateBudget(
+                    tokens_per_minute=limits.get("tokens_per_minute", settings.llm_tokens_per_minute),
+                    requests_per_minute=limits.get("requests_per_minute", settings.llm_requests_per_minute)
+                )
+                for key, limits in settings.llm_rate_budgets.items()
+            },
+            interactive_reserve=settings.llm_interactive_token_reserve,
+            enabled=settings.llm_scheduler_enabled
+        )
+
+    return _scheduler
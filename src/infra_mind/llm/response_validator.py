@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from .interface import LLMResponse, LLMValidationError
+from .pattern_matcher import MultiPatternMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -115,8 +116,37 @@ class ResponseValidator:
             "violence", "harm", "illegal", "dangerous", "weapon", "drug"
         }
         
+        # Keyword matcher, rebuilt when the keyword sets change
+        self._keyword_matcher: Optional[MultiPatternMatcher] = None
+        self._keyword_matcher_key: Optional[tuple] = None
+        self._last_keyword_scan: Optional[tuple] = None
+        
         logger.info("Response validator initialized")
     
+    def _scan_keywords(self, content: str) -> Dict[str, List[str]]:
+        """
+        Find safety and profanity keywords in one pass over the content.
+        
+        The result for the most recent content is reused, so the safety and
+        profanity checks of one response share a single scan.
+        """
+        key = (frozenset(self.safety_keywords), frozenset(self.profanity_words))
+        if self._keyword_matcher is None or self._keyword_matcher_key != key:
+            literals = [(keyword, "safety") for keyword in sorted(self.safety_keywords)]
+            literals += [(word, "profanity") for word in sorted(self.profanity_words)]
+            self._keyword_matcher = MultiPatternMatcher(literals=literals)
+            self._keyword_matcher_key = key
+            self._last_keyword_scan = None
+        
+        if self._last_keyword_scan and self._last_keyword_scan[0] is content:
+            return self._last_keyword_scan[1]
+        
+        found: Dict[str, List[str]] = {"safety": [], "profanity": []}
+        for match in self._keyword_matcher.scan(content):
+            found[match.rule].append(match.pattern)
+        self._last_keyword_scan = (content, found)
+        return found
+    
     def validate_response(self, response: LLMResponse, context: Optional[Dict[str, Any]] = None) -> ValidationResult:
         """
         Validate LLM response comprehensively.
@@ -309,11 +339,8 @@ class ResponseValidator:
         if not content:
             return issues
             
-        content_lower = content.lower()
-        
         # Check for safety keywords
-        found_keywords = [keyword for keyword in self.safety_keywords 
-                         if keyword in content_lower]
+        found_keywords = self._scan_keywords(content)["safety"]
         
         if found_keywords:
             issues.append(ValidationIssue(
@@ -342,9 +369,7 @@ class ResponseValidator:
         if not content:
             return issues
             
-        content_lower = content.lower()
-        found_profanity = [word for word in self.profanity_words 
-                          if word in content_lower]
+        found_profanity = self._scan_keywords(content)["profanity"]
         
         if found_profanity:
             issues.append(ValidationIssue(
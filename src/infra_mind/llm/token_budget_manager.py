@@ -12,6 +12,11 @@ except Exception:  # pragma: no cover - optional dependency
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from collections import OrderedDict
+from bisect import bisect_right
+from itertools import accumulate
+import hashlib
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,11 +25,70 @@ logger = logging.getLogger(__name__)
 class _FallbackEncoder:
     """Simple encoder used when tiktoken isn't available/offline."""
 
+    name = "fallback"
+
     def encode(self, text: str) -> List[int]:
         approx_tokens = max(1, len(text) // 4)
         return list(range(approx_tokens))
 
 
+class TokenCountCache:
+    """
+    Bounded LRU of token counts keyed by encoding and content hash.
+
+    Shared by every TokenBudgetManager so the same context block is only
+    encoded once per process, whichever agent or optimizer counts it.
+    """
+
+    def __init__(self, max_entries: int = 50_000):
+        self.max_entries = max_entries
+        self._counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(encoding_name: str, text: str) -> Tuple[str, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return encoding_name, digest
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[int]:
+        with self._lock:
+            count = self._counts.get(key)
+            if count is None:
+                self.misses += 1
+                return None
+            self._counts.move_to_end(key)
+            self.hits += 1
+            return count
+
+    def set(self, key: Tuple[str, bytes], count: int) -> None:
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.max_entries:
+                self._counts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._counts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# Process-wide token count cache
+token_count_cache = TokenCountCache()
+
+
 class TruncationStrategy(Enum):
     """Strategies for truncating content when exceeding token budget."""
     HEAD = "head"  # Keep start, truncate end
@@ -176,22 +240,101 @@ class TokenBudgetManager:
             logger.warning(f"Failed to get encoder for {model_name}: {e}")
             return _FallbackEncoder()
 
+    @property
+    def encoding_name(self) -> str:
+        """Name of the encoding, used to key the shared count cache."""
+        return getattr(self.encoder, "name", type(self.encoder).__name__)
+
     def count_tokens(self, text: str) -> int:
         """
         Count tokens in text using tiktoken.
 
+        Counts are memoized by content hash in the shared token count cache.
+
         Args:
             text: Text to count tokens for
 
         Returns:
             Number of tokens
         """
+        if not text:
+            return 0
+        key = token_count_cache.make_key(self.encoding_name, text)
+        count = token_count_cache.get(key)
+        if count is not None:
+            return count
         try:
-            return len(self.encoder.encode(text))
+            count = len(self.encoder.encode(text))
         except Exception as e:
             logger.error(f"Token counting failed: {e}")
             # Fallback to rough estimate
             return len(text) // 4
+        token_count_cache.set(key, count)
+        return count
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for many texts at once.
+
+        Cached counts are reused; the remaining texts are encoded in one
+        batch (tiktoken's encode_batch runs them in parallel threads).
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Token counts in the same order as texts
+        """
+        counts: List[Optional[int]] = [None] * len(texts)
+        pending: Dict[Tuple[str, bytes], List[int]] = {}
+        pending_texts: List[str] = []
+
+        for index, text in enumerate(texts):
+            if not text:
+                counts[index] = 0
+                continue
+            key = token_count_cache.make_key(self.encoding_name, text)
+            cached = token_count_cache.get(key)
+            if cached is not None:
+                counts[index] = cached
+            elif key in pending:
+                pending[key].append(index)
+            else:
+                pending[key] = [index]
+                pending_texts.append(text)
+
+        if pending_texts:
+            try:
+                encode_batch = getattr(self.encoder, "encode_batch", None)
+                if encode_batch is not None:
+                    encoded_lengths = [len(tokens) for tokens in encode_batch(pending_texts)]
+                else:
+                    encoded_lengths = [len(self.encoder.encode(text)) for text in pending_texts]
+            except Exception as e:
+                logger.error(f"Batch token counting failed: {e}")
+                encoded_lengths = [len(text) // 4 for text in pending_texts]
+            else:
+                for key, length in zip(pending, encoded_lengths):
+                    token_count_cache.set(key, length)
+
+            for indexes, length in zip(pending.values(), encoded_lengths):
+                for index in indexes:
+                    counts[index] = length
+
+        return counts
+
+    def _encode(self, text: str) -> List[int]:
+        """Encode text once and seed the count cache with the result."""
+        tokens = self.encoder.encode(text)
+        token_count_cache.set(token_count_cache.make_key(self.encoding_name, text), len(tokens))
+        return tokens
+
+    def _decode(self, text: str, tokens: List[int], start: int, end: int) -> str:
+        """Decode tokens[start:end], slicing characters for the fallback encoder."""
+        if isinstance(self.encoder, _FallbackEncoder):
+            chars_per_token = len(text) / max(1, len(tokens))
+            return text[int(start * chars_per_token):int(end * chars_per_token)]
+        return self.encoder.decode(tokens[start:end])
 
     def check_budget(
         self,
@@ -211,7 +354,7 @@ class TokenBudgetManager:
             Tuple of (fits_budget, total_tokens, available_tokens)
         """
         system_tokens = self.count_tokens(system_prompt)
-        message_tokens = sum(self.count_tokens(msg) for msg in user_messages)
+        message_tokens = sum(self.count_tokens_batch(user_messages))
         total_tokens = system_tokens + message_tokens
 
         available = self.model_config.available_for_context
@@ -274,27 +417,25 @@ class TokenBudgetManager:
 
     def _truncate_head(self, text: str, max_tokens: int) -> str:
         """Keep start of text, truncate end."""
-        tokens = self.encoder.encode(text)
+        tokens = self._encode(text)
         if len(tokens) <= max_tokens:
             return text
 
-        truncated_tokens = tokens[:max_tokens]
-        result = self.encoder.decode(truncated_tokens)
+        result = self._decode(text, tokens, 0, max_tokens)
         return result + "\n\n[... content truncated ...]"
 
     def _truncate_tail(self, text: str, max_tokens: int) -> str:
         """Keep end of text, truncate start."""
-        tokens = self.encoder.encode(text)
+        tokens = self._encode(text)
         if len(tokens) <= max_tokens:
             return text
 
-        truncated_tokens = tokens[-max_tokens:]
-        result = self.encoder.decode(truncated_tokens)
+        result = self._decode(text, tokens, len(tokens) - max_tokens, len(tokens))
         return "[... earlier content truncated ...]\n\n" + result
 
     def _truncate_middle(self, text: str, max_tokens: int) -> str:
         """Keep start and end, truncate middle."""
-        tokens = self.encoder.encode(text)
+        tokens = self._encode(text)
         if len(tokens) <= max_tokens:
             return text
 
@@ -302,11 +443,8 @@ class TokenBudgetManager:
         keep_start = int(max_tokens * 0.4)
         keep_end = max_tokens - keep_start
 
-        start_tokens = tokens[:keep_start]
-        end_tokens = tokens[-keep_end:]
-
-        start_text = self.encoder.decode(start_tokens)
-        end_text = self.encoder.decode(end_tokens)
+        start_text = self._decode(text, tokens, 0, keep_start)
+        end_text = self._decode(text, tokens, len(tokens) - keep_end, len(tokens))
 
         return start_text + "\n\n[... middle content truncated ...]\n\n" + end_text
 
@@ -353,16 +491,21 @@ class TokenBudgetManager:
         result = "\n\n".join(preserved_sections)
         current_tokens = self.count_tokens(result)
 
-        # Add optional sections until budget exhausted
-        for section in optional_sections:
-            section_tokens = self.count_tokens(section)
-            if current_tokens + section_tokens <= max_tokens:
-                result += "\n\n" + section
-                current_tokens += section_tokens
-            else:
-                # Add truncation marker
-                result += "\n\n[... additional content omitted due to length ...]"
-                break
+        if current_tokens > max_tokens:
+            # Preserved content alone is over budget: cut it on token boundaries
+            return self._truncate_head(result, max_tokens)
+
+        # Count all optional sections in one batch, then binary-search the
+        # prefix sums for how many fit (same result as adding them one by one)
+        section_tokens = self.count_tokens_batch(optional_sections)
+        cumulative = list(accumulate(section_tokens))
+        fitting = bisect_right(cumulative, max_tokens - current_tokens)
+
+        if fitting:
+            result += "\n\n" + "\n\n".join(optional_sections[:fitting])
+        if fitting < len(optional_sections):
+            # Add truncation marker
+            result += "\n\n[... additional content omitted due to length ...]"
 
         return result
 
@@ -388,6 +531,13 @@ class TokenBudgetManager:
             system_tokens = self.count_tokens(system_prompt)
             max_context_tokens = self.model_config.available_for_context - system_tokens
 
+        # Stringify and count every block once, in a single batch
+        value_strs = {key: str(value) for key, value in context_data.items()}
+        value_tokens_by_key = dict(zip(
+            value_strs,
+            self.count_tokens_batch(list(value_strs.values()))
+        ))
+
         optimized = {}
         priority_keys = [
             "summary",
@@ -401,8 +551,8 @@ class TokenBudgetManager:
         tokens_used = 0
         for key in priority_keys:
             if key in context_data:
-                value_str = str(context_data[key])
-                value_tokens = self.count_tokens(value_str)
+                value_str = value_strs[key]
+                value_tokens = value_tokens_by_key[key]
 
                 if tokens_used + value_tokens <= max_context_tokens:
                     optimized[key] = context_data[key]
@@ -423,8 +573,7 @@ class TokenBudgetManager:
         # Add remaining keys if space available
         for key, value in context_data.items():
             if key not in optimized:
-                value_str = str(value)
-                value_tokens = self.count_tokens(value_str)
+                value_tokens = value_tokens_by_key[key]
 
                 if tokens_used + value_tokens <= max_context_tokens:
                     optimized[key] = value
@@ -20,6 +20,7 @@ import re
 
 from .interface import LLMRequest, LLMResponse, LLMProvider, TokenUsage
 from .cost_tracker import CostTracker, BudgetAlert, CostPeriod
+from .token_budget_manager import get_token_budget_manager
 from ..core.cache import ProductionCacheManager, CacheConfig
 
 logger = logging.getLogger(__name__)
@@ -574,8 +575,9 @@ class LLMUsageOptimizer:
             "model": request.model or "",
             "temperature": request.temperature or 0.7,
             "max_tokens": request.max_tokens or 2000,
-            # Include relevant context that affects the response
-            "agent_name": request.agent_name or "",
+            # Include relevant context that affects the response. The agent
+            # name is not part of the key (identical prompts share one entry
+            # across agents); it is kept as a cache tag for attribution.
             "context_keys": sorted(request.context.keys()) if request.context else []
         }
         
@@ -618,6 +620,13 @@ class LLMUsageOptimizer:
                 if not self._is_cache_entry_valid(cache_entry):
                     continue
                 
+                # The cache is shared by all agents: only near-match the
+                # requesting agent's own entries with the same system prompt
+                if request.agent_name and request.agent_name not in cache_entry.tags:
+                    continue
+                if cache_entry.response.metadata.get("original_system_prompt") != request.system_prompt:
+                    continue
+                
                 # Get original request from cache entry
                 cached_prompt = cache_entry.response.metadata.get("original_prompt")
                 cached_words = set((cached_prompt or "").lower().split())
@@ -790,8 +799,8 @@ class LLMUsageOptimizer:
         Returns:
             Estimated token count
         """
-        # Rough estimation: ~4 characters per token for English text
-        return max(1, len(text) // 4)
+        # Shared memoized counts (tiktoken, or ~4 chars per token offline)
+        return max(1, get_token_budget_manager().count_tokens(text))
     
     def set_usage_limits(self, limits: UsageLimits) -> None:
         """
@@ -19,11 +19,14 @@ from loguru import logger
 from .core.config import settings
 from .core.database import init_database, close_database
 from .core.logging import setup_logging
-from .core.dependencies import cleanup_dependencies  # NEW: Dependency injection cleanup
+from .core.dependencies import cleanup_dependencies, get_event_manager  # NEW: Dependency injection cleanup
 from .core.tracing import setup_tracing, instrument_fastapi, instrument_httpx, instrument_redis  # NEW: Distributed tracing
-from .api.routes import api_router
+from .api.routes import api_router, LAZY_ROUTERS
+from .api.lazy_routes import LazyRouterLoader, LazyRouterMiddleware
 from .api.documentation import get_enhanced_openapi_schema
-from .orchestration.events import EventManager
+from .agents.intent_classifier import load_intent_classifier
+from .forms.intelligent_features import load_suggestion_index
+from .orchestration.events import AgentEvent, EventManager, EventType
 from .orchestration.monitoring import initialize_workflow_monitoring
 from .services.workflow_monitor import start_workflow_monitoring, stop_workflow_monitoring
 
@@ -80,6 +83,19 @@ async def lifespan(app: FastAPI):
         asyncio.create_task(start_workflow_monitoring())
         logger.success("✅ Proactive workflow monitoring started")
 
+        if settings.preload_lazy_routers:
+            asyncio.create_task(app.state.lazy_routers.preload())
+
+        # Report sections are generated in Celery workers; the shared (Redis)
+        # event manager carries them to this instance's /ws connections
+        await app.state.subscribe_report_sections(await get_event_manager())
+
+        # Train the chat intent classifier off the loop before the first message
+        asyncio.create_task(load_intent_classifier())
+
+        # Likewise the form typeahead index, built by the first form otherwise
+        asyncio.create_task(load_suggestion_index())
+
     logger.success("✅ Application startup complete")
 
     yield  # Application runs here
@@ -124,6 +140,14 @@ def create_app() -> FastAPI:
     # Add routes
     app.include_router(api_router, prefix="/api")
     
+    # Rarely used routers are mounted on their first request
+    lazy_routers = LazyRouterLoader(app, LAZY_ROUTERS, api_prefix="/api")
+    app.state.lazy_routers = lazy_routers
+    if settings.lazy_routers:
+        app.add_middleware(LazyRouterMiddleware, loader=lazy_routers)
+    else:
+        lazy_routers.load_all()
+    
     # Add WebSocket endpoint
     setup_websocket(app)
     
@@ -131,7 +155,12 @@ def create_app() -> FastAPI:
     setup_exception_handlers(app)
     
     # Configure enhanced OpenAPI documentation
-    app.openapi = lambda: get_enhanced_openapi_schema(app)
+    def openapi():
+        # The schema documents every router, including unmounted lazy ones
+        lazy_routers.load_all()
+        return get_enhanced_openapi_schema(app)
+    
+    app.openapi = openapi
     
     # Instrument FastAPI for distributed tracing
     instrument_fastapi(app)
@@ -250,13 +279,13 @@ def setup_websocket(app: FastAPI) -> None:
                 logger.info(f"Cleaned up WebSocket connection: {connection_id}")
     
     # Helper function to broadcast workflow updates
-    async def broadcast_workflow_update(assessment_id: str, update_data: dict):
+    async def broadcast_workflow_update(assessment_id: str, update_data: dict, message_type: str = "workflow_progress"):
         """Broadcast workflow updates to subscribed clients."""
         if not websocket_connections:
             return
             
         message = json.dumps({
-            "type": "workflow_progress",
+            "type": message_type,
             "assessment_id": assessment_id,
             "data": update_data,
             "timestamp": time.time()
@@ -282,6 +311,27 @@ def setup_websocket(app: FastAPI) -> None:
         for conn_id in disconnected:
             websocket_connections.pop(conn_id, None)
     
+    async def forward_report_section(event: AgentEvent):
+        """Stream a report section generated by any worker to the assessment's subscribers."""
+        assessment_id = event.data.get("assessment_id")
+        if not assessment_id:
+            return
+        await broadcast_workflow_update(
+            assessment_id,
+            {
+                "report_id": event.data.get("report_id"),
+                "report_type": event.data.get("report_type"),
+                "section": event.data.get("section"),
+                "completed_sections": event.data.get("completed_sections"),
+                "total_sections": event.data.get("total_sections")
+            },
+            message_type="report_section"
+        )
+    
+    async def subscribe_report_sections(event_manager):
+        """Forward report sections published on ``event_manager`` to ``/ws`` clients."""
+        await event_manager.subscribe(EventType.REPORT_SECTION_GENERATED, forward_report_section)
+    
     # Dashboard cache and broadcasting functions
     dashboard_cache = {}  # Simple in-memory cache for dashboard data
     
@@ -318,6 +368,7 @@ def setup_websocket(app: FastAPI) -> None:
     
     # Make functions available to other modules
     app.state.broadcast_workflow_update = broadcast_workflow_update
+    app.state.subscribe_report_sections = subscribe_report_sections
     app.state.invalidate_dashboard_cache = invalidate_dashboard_cache
     app.state.broadcast_dashboard_update = broadcast_dashboard_update
     app.state.dashboard_cache = dashboard_cache
@@ -353,7 +404,7 @@ def setup_middleware(app: FastAPI) -> None:
             "X-Fresh-Data",
             "X-No-Cache"
         ],
-        expose_headers=["X-Process-Time", "X-Request-ID"],
+        expose_headers=["X-Process-Time", "X-Request-ID", "X-Total-Count", "X-Total-Count-Approximate", "X-Next-Cursor"],
     )
     
     # Trusted host middleware for security
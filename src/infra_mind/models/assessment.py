@@ -6,7 +6,7 @@ Defines the infrastructure assessment document structure using our Pydantic sche
 
 from datetime import datetime
 from typing import Optional, Dict, Any, Annotated
-from beanie import Document, Indexed
+from beanie import Document, Indexed, after_event, Insert, Save, Replace, SaveChanges, Update, Delete
 from pydantic import Field
 from pymongo import IndexModel, ASCENDING, DESCENDING, TEXT
 
@@ -130,6 +130,18 @@ class Assessment(Document):
         # Note: Indexes are managed by database_optimization.py to avoid conflicts during init
         # indexes = []
     
+    @after_event(Insert, Save, Replace, SaveChanges, Update)
+    async def update_dashboard_stats(self) -> None:
+        """Keep the owner's materialized dashboard counters in step with this document."""
+        from ..services.dashboard_stats import record_model_change
+        await record_model_change(self)
+
+    @after_event(Delete)
+    async def remove_from_dashboard_stats(self) -> None:
+        """Take this document's contribution off the owner's dashboard counters."""
+        from ..services.dashboard_stats import record_model_change
+        await record_model_change(self, deleted=True)
+    
     def __str__(self) -> str:
         """String representation of the assessment."""
         return f"Assessment(title={self.title}, status={self.status.value})"
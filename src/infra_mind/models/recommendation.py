@@ -7,7 +7,7 @@ Defines the AI agent recommendation document structure with enhanced validation.
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
-from beanie import Document, Indexed
+from beanie import Document, Indexed, after_event, Insert, Save, Replace, SaveChanges, Update, Delete
 from pydantic import BaseModel, Field, field_validator
 from bson import Decimal128
 
@@ -230,6 +230,18 @@ class Recommendation(Document):
             [("total_estimated_monthly_cost", 1)],  # Query by cost
         ]
     
+    @after_event(Insert, Save, Replace, SaveChanges, Update)
+    async def update_dashboard_stats(self) -> None:
+        """Keep the owner's materialized dashboard counters in step with this document."""
+        from ..services.dashboard_stats import record_model_change
+        await record_model_change(self)
+
+    @after_event(Delete)
+    async def remove_from_dashboard_stats(self) -> None:
+        """Take this document's contribution off the owner's dashboard counters."""
+        from ..services.dashboard_stats import record_model_change
+        await record_model_change(self, deleted=True)
+    
     def __str__(self) -> str:
         """String representation of the recommendation."""
         return f"Recommendation(agent={self.agent_name}, confidence={self.confidence_level.value})"
@@ -7,7 +7,7 @@ Defines generated report document structure and metadata.
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 from enum import Enum
-from beanie import Document, Indexed
+from beanie import Document, Indexed, after_event, Insert, Save, Replace, SaveChanges, Update, Delete
 from pydantic import Field, field_validator
 
 from ..schemas.base import Priority
@@ -293,6 +293,18 @@ class Report(Document):
             [("status", 1), ("priority", 1)],  # Query by status and priority
         ]
     
+    @after_event(Insert, Save, Replace, SaveChanges, Update)
+    async def update_dashboard_stats(self) -> None:
+        """Keep the owner's materialized dashboard counters in step with this document."""
+        from ..services.dashboard_stats import record_model_change
+        await record_model_change(self)
+
+    @after_event(Delete)
+    async def remove_from_dashboard_stats(self) -> None:
+        """Take this document's contribution off the owner's dashboard counters."""
+        from ..services.dashboard_stats import record_model_change
+        await record_model_change(self, deleted=True)
+    
     @field_validator('progress_percentage')
     @classmethod
     def validate_progress(cls, v):
@@ -6,8 +6,8 @@ Defines user authentication and profile data structure.
 
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Annotated
-from beanie import Document, Indexed
-from pydantic import Field, EmailStr, field_validator
+from beanie import Document, Indexed, after_event, before_event, Save, Replace, SaveChanges, Update, Delete
+from pydantic import Field, EmailStr, PrivateAttr, field_validator
 import bcrypt
 import secrets
 import pyotp
@@ -80,6 +80,9 @@ class User(Document):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
+    # False for principals served from the shared cache tier without credentials
+    _credentials_loaded: bool = PrivateAttr(default=True)
+    
     class Settings:
         """Beanie document settings."""
         name = "users"
@@ -223,6 +226,18 @@ class User(Document):
         self.mfa_backup_codes = []
         self.updated_at = datetime.utcnow()
 
+    @before_event(Save, Replace)
+    def ensure_credentials_loaded(self) -> None:
+        """Refuse to overwrite stored credentials with a cached principal that omits them."""
+        if not self._credentials_loaded:
+            raise ValueError("User was loaded without credentials; use principal_cache.load_credentials before saving")
+
+    @after_event(Save, Replace, SaveChanges, Update, Delete)
+    def invalidate_principal_cache(self) -> None:
+        """Drop cached copies of this user after any write (role change, deactivation, ...)."""
+        from ..core.principal_cache import principal_cache
+        principal_cache.invalidate_user(str(self.id))
+
     def __str__(self) -> str:
         """String representation of the user."""
         return f"User(email={self.email}, name={self.full_name})"
\ No newline at end of file
@@ -0,0 +1,458 @@
+"""
+Admission control for assessment workflows.
+
+Every started assessment runs eleven LLM-backed agents, so a handful of
+bulk re-runs can hold all LLM quota and agent capacity while an interactive
+user waits for a first result. The admission controller sits in front of
+workflow execution in each process that runs workflows (the API process for
+local execution, each Celery worker process otherwise):
+
+1. ``AssessmentCostEstimator`` predicts the token and wall-time cost of an
+   assessment from its requirements (counted with ``TokenBudgetManager``),
+   historical completion sizes from a ``CostTracker`` and a correction
+   learned from predicted-vs-actual observations.
+2. Admission requests are queued per workload class. Interactive work is
+   always dispatched ahead of batch work, and batch work can never take the
+   slots reserved for interactive requests. Batch requests that have waited
+   longer than ``batch_max_wait_seconds`` are promoted so they cannot starve.
+3. Within a class, tenants share capacity by weighted fair queueing: each
+   request gets a virtual finish time of ``start + estimated_tokens / weight``
+   and the smallest finish time is admitted first, so one tenant's burst
+   does not delay another tenant's single request.
+
+Usage:
+```python
+async with admit_assessment(assessment, WorkloadClass.INTERACTIVE) as admission:
+    result = await workflow.execute(assessment)
+    admission.record_actual_tokens(tokens_used)
+```
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+from ..llm.token_budget_manager import get_token_budget_manager
+
+logger = logging.getLogger(__name__)
+
+
+class WorkloadClass(str, Enum):
+    """Scheduling class of an assessment run."""
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+# Celery message priority per class (Redis transport: lower runs first)
+CELERY_PRIORITIES = {
+    WorkloadClass.INTERACTIVE: 0,
+    WorkloadClass.BATCH: 9,
+}
+
+
+@dataclass
+class CostEstimate:
+    """Predicted cost of one assessment workflow run."""
+    tokens: int
+    seconds: float
+    base_tokens: int  # Estimate before the learned correction
+    prompt_tokens: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tokens": self.tokens,
+            "seconds": round(self.seconds, 1),
+            "prompt_tokens": self.prompt_tokens
+        }
+
+
+class AssessmentCostEstimator:
+    """
+    Predicts token and time cost of an assessment workflow.
+
+    The base estimate is ``agents * (context + system prompt + completion)``,
+    where context is the tokenized assessment requirements and completion is
+    the historical mean from the cost tracker (or half the model's output
+    budget without history). Observed runs adjust an exponentially weighted
+    actual/predicted token ratio and the observed token throughput.
+    """
+
+    def __init__(
+        self,
+        agent_count: int = 11,
+        model_name: str = "gpt-4",
+        cost_tracker=None,
+        tokens_per_second: float = 50.0,
+        smoothing: float = 0.2
+    ):
+        self.agent_count = agent_count
+        self.budget_manager = get_token_budget_manager(model_name)
+        self.cost_tracker = cost_tracker
+        self.smoothing = smoothing
+        self.token_ratio = 1.0
+        self.tokens_per_second = tokens_per_second
+        self.observations = 0
+
+    def _completion_tokens_per_call(self) -> int:
+        entries = getattr(self.cost_tracker, "cost_entries", None)
+        if entries:
+            recent = entries[-500:]
+            return max(1, int(sum(e.completion_tokens for e in recent) / len(recent)))
+        return self.budget_manager.model_config.max_output_tokens // 2
+
+    def estimate(self, assessment: Any, reused_agents: int = 0) -> CostEstimate:
+        """
+        Estimate the cost of running the workflow for ``assessment``.
+
+        Args:
+            assessment: Assessment to run
+            reused_agents: Agents an incremental re-run will reuse instead
+                of calling the LLM
+        """
+        context = json.dumps(
+            {
+                "business_requirements": getattr(assessment, "business_requirements", None) or {},
+                "technical_requirements": getattr(assessment, "technical_requirements", None) or {},
+            },
+            default=str,
+            sort_keys=True
+        )
+        prompt_tokens = self.budget_manager.count_tokens(context)
+        per_agent = (
+            prompt_tokens
+            + self.budget_manager.model_config.system_prompt_budget
+            + self._completion_tokens_per_call()
+        )
+        base_tokens = per_agent * max(0, self.agent_count - reused_agents)
+        tokens = max(1, int(base_tokens * self.token_ratio))
+        return CostEstimate(
+            tokens=tokens,
+            seconds=tokens / self.tokens_per_second,
+            base_tokens=base_tokens,
+            prompt_tokens=prompt_tokens
+        )
+
+    def observe(self, estimate: CostEstimate, actual_tokens: Optional[int], actual_seconds: float) -> None:
+        """Update the correction factors from a completed run."""
+        alpha = self.smoothing
+        if actual_tokens:
+            ratio = actual_tokens / max(1, estimate.base_tokens)
+            self.token_ratio = (1 - alpha) * self.token_ratio + alpha * ratio
+        if actual_seconds > 0:
+            throughput = (actual_tokens or estimate.tokens) / actual_seconds
+            self.tokens_per_second = (1 - alpha) * self.tokens_per_second + alpha * throughput
+        self.observations += 1
+
+
+@dataclass
+class Admission:
+    """A granted admission; closes when the workflow finishes."""
+    ticket_id: str
+    tenant: str
+    workload_class: WorkloadClass
+    estimate: CostEstimate
+    queue_wait_seconds: float
+    started_at: float = field(default_factory=time.monotonic)
+    actual_tokens: Optional[int] = None
+
+    def record_actual_tokens(self, tokens: int) -> None:
+        self.actual_tokens = tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workload_class": self.workload_class.value,
+            "queue_wait_seconds": round(self.queue_wait_seconds, 3),
+            "predicted": self.estimate.to_dict(),
+            "actual_tokens": self.actual_tokens
+        }
+
+
+@dataclass(order=True)
+class _Ticket:
+    virtual_finish: float
+    sequence: int
+    ticket_id: str = field(compare=False)
+    tenant: str = field(compare=False)
+    workload_class: WorkloadClass = field(compare=False)
+    estimate: CostEstimate = field(compare=False)
+    virtual_start: float = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    granted: asyncio.Future = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class AdmissionController:
+    """
+    Priority- and cost-aware admission queue for assessment workflows.
+
+    Must be used from a single event loop (the API loop or a worker's
+    persistent loop); all state changes happen on that loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        interactive_reserved_slots: int = 1,
+        max_tokens_in_flight: int = 400_000,
+        batch_max_wait_seconds: float = 300.0,
+        estimator: Optional[AssessmentCostEstimator] = None,
+        history_size: int = 1000
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.interactive_reserved_slots = min(interactive_reserved_slots, self.max_concurrent - 1)
+        self.max_tokens_in_flight = max_tokens_in_flight
+        self.batch_max_wait_seconds = batch_max_wait_seconds
+        self.estimator = estimator or AssessmentCostEstimator()
+
+        self._queues: Dict[WorkloadClass, List[_Ticket]] = {cls: [] for cls in WorkloadClass}
+        self._virtual_time: Dict[WorkloadClass, float] = {cls: 0.0 for cls in WorkloadClass}
+        self._tenant_finish: Dict[tuple, float] = {}
+        self._tenant_weights: Dict[str, float] = {}
+        self._running: Dict[int, _Ticket] = {}
+        self._sequence = itertools.count()
+        self.tokens_in_flight = 0
+
+        self._queue_waits: Dict[WorkloadClass, Deque[float]] = {
+            cls: deque(maxlen=history_size) for cls in WorkloadClass
+        }
+        self._token_errors: Deque[float] = deque(maxlen=history_size)
+        self._time_errors: Deque[float] = deque(maxlen=history_size)
+        self.counters = {"admitted": 0, "completed": 0, "cancelled": 0, "promoted": 0}
+
+    def set_tenant_weight(self, tenant: str, weight: float) -> None:
+        """Give ``tenant`` a larger (or smaller) share of capacity."""
+        self._tenant_weights[tenant] = max(0.01, weight)
+
+    def queue_length(self, workload_class: Optional[WorkloadClass] = None) -> int:
+        classes = [workload_class] if workload_class else list(WorkloadClass)
+        return sum(1 for cls in classes for t in self._queues[cls] if not t.cancelled)
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        ticket_id: str,
+        tenant: str,
+        workload_class: WorkloadClass,
+        estimate: CostEstimate
+    ) -> AsyncIterator[Admission]:
+        """Wait for admission, then hold the slot until the block exits."""
+        ticket = self._enqueue(ticket_id, tenant, WorkloadClass(workload_class), estimate)
+        self._dispatch()
+        try:
+            await ticket.granted
+        except BaseException:
+            if ticket.granted.done() and not ticket.granted.cancelled():
+                self._release(ticket)
+            else:
+                ticket.cancelled = True
+                self.counters["cancelled"] += 1
+            self._dispatch()
+            raise
+
+        admission = Admission(
+            ticket_id=ticket_id,
+            tenant=tenant,
+            workload_class=ticket.workload_class,
+            estimate=estimate,
+            queue_wait_seconds=time.monotonic() - ticket.enqueued_at
+        )
+        self._queue_waits[ticket.workload_class].append(admission.queue_wait_seconds)
+        try:
+            yield admission
+        finally:
+            self._release(ticket)
+            self._observe(admission)
+            self._dispatch()
+
+    def _enqueue(self, ticket_id: str, tenant: str, workload_class: WorkloadClass, estimate: CostEstimate) -> _Ticket:
+        weight = self._tenant_weights.get(tenant, 1.0)
+        key = (workload_class, tenant)
+        virtual_start = max(self._virtual_time[workload_class], self._tenant_finish.get(key, 0.0))
+        virtual_finish = virtual_start + estimate.tokens / weight
+        self._tenant_finish[key] = virtual_finish
+
+        ticket = _Ticket(
+            virtual_finish=virtual_finish,
+            sequence=next(self._sequence),
+            ticket_id=ticket_id,
+            tenant=tenant,
+            workload_class=workload_class,
+            estimate=estimate,
+            virtual_start=virtual_start,
+            enqueued_at=time.monotonic(),
+            granted=asyncio.get_running_loop().create_future()
+        )
+        heapq.heappush(self._queues[workload_class], ticket)
+        logger.debug(
+            f"Queued {workload_class.value} assessment {ticket_id} for tenant {tenant} "
+            f"(~{estimate.tokens} tokens, queue={self.queue_length()})"
+        )
+        return ticket
+
+    def _head(self, workload_class: WorkloadClass) -> Optional[_Ticket]:
+        queue = self._queues[workload_class]
+        while queue and queue[0].cancelled:
+            heapq.heappop(queue)
+        return queue[0] if queue else None
+
+    def _fits(self, ticket: _Ticket) -> bool:
+        # An oversized request still runs when nothing else is in flight
+        return not self._running or self.tokens_in_flight + ticket.estimate.tokens <= self.max_tokens_in_flight
+
+    def _next_ticket(self) -> Optional[_Ticket]:
+        running = len(self._running)
+        if running >= self.max_concurrent:
+            return None
+
+        interactive = self._head(WorkloadClass.INTERACTIVE)
+        batch = self._head(WorkloadClass.BATCH)
+        batch_running = sum(1 for t in self._running.values() if t.workload_class == WorkloadClass.BATCH)
+        batch_slots = self.max_concurrent - self.interactive_reserved_slots
+        batch_aged = batch is not None and time.monotonic() - batch.enqueued_at > self.batch_max_wait_seconds
+
+        if batch_aged and self._fits(batch):
+            self.counters["promoted"] += 1
+            return batch
+        if interactive is not None:
+            return interactive if self._fits(interactive) else None
+        if batch is not None and batch_running < batch_slots and self._fits(batch):
+            return batch
+        return None
+
+    def _dispatch(self) -> None:
+        while True:
+            ticket = self._next_ticket()
+            if ticket is None:
+                return
+            heapq.heappop(self._queues[ticket.workload_class])
+            if ticket.granted.done():
+                continue
+            self._virtual_time[ticket.workload_class] = max(
+                self._virtual_time[ticket.workload_class], ticket.virtual_start
+            )
+            self._running[id(ticket)] = ticket
+            self.tokens_in_flight += ticket.estimate.tokens
+            self.counters["admitted"] += 1
+            ticket.granted.set_result(True)
+
+    def _release(self, ticket: _Ticket) -> None:
+        if self._running.pop(id(ticket), None) is not None:
+            self.tokens_in_flight -= ticket.estimate.tokens
+
+    def _observe(self, admission: Admission) -> None:
+        actual_seconds = time.monotonic() - admission.started_at
+        estimate = admission.estimate
+        if admission.actual_tokens:
+            self._token_errors.append(admission.actual_tokens / max(1, estimate.tokens))
+        if actual_seconds > 0 and estimate.seconds > 0:
+            self._time_errors.append(actual_seconds / estimate.seconds)
+        self.estimator.observe(estimate, admission.actual_tokens, actual_seconds)
+        self.counters["completed"] += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue, wait-time and prediction accuracy metrics."""
+        def ratio_stats(ratios: Deque[float]) -> Dict[str, Any]:
+            values = list(ratios)
+            if not values:
+                return {"samples": 0}
+            return {
+                "samples": len(values),
+                "mean_actual_to_predicted": round(sum(values) / len(values), 3),
+                "mean_absolute_pct_error": round(100 * sum(abs(v - 1) for v in values) / len(values), 1)
+            }
+
+        return {
+            **self.counters,
+            "running": len(self._running),
+            "max_concurrent": self.max_concurrent,
+            "interactive_reserved_slots": self.interactive_reserved_slots,
+            "tokens_in_flight": self.tokens_in_flight,
+            "max_tokens_in_flight": self.max_tokens_in_flight,
+            "queued": {cls.value: self.queue_length(cls) for cls in WorkloadClass},
+            "queue_wait_seconds": {
+                cls.value: {
+                    "p50": round(_percentile(list(waits), 50), 3),
+                    "p95": round(_percentile(list(waits), 95), 3),
+                    "max": round(max(waits, default=0.0), 3)
+                }
+                for cls, waits in self._queue_waits.items()
+            },
+            "prediction": {
+                "tokens": ratio_stats(self._token_errors),
+                "seconds": ratio_stats(self._time_errors),
+                "token_correction": round(self.estimator.token_ratio, 3),
+                "tokens_per_second": round(self.estimator.tokens_per_second, 1)
+            }
+        }
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get or create the process-wide admission controller."""
+    global _admission_controller
+
+    if _admission_controller is None:
+        from ..core.config import settings
+        from ..llm.manager import get_shared_cost_tracker
+
+        _admission_controller = AdmissionController(
+            max_concurrent=settings.assessment_max_concurrent,
+            interactive_reserved_slots=settings.assessment_interactive_reserved_slots,
+            max_tokens_in_flight=settings.assessment_max_tokens_in_flight,
+            batch_max_wait_seconds=settings.assessment_batch_max_wait_seconds,
+            estimator=AssessmentCostEstimator(cost_tracker=get_shared_cost_tracker())
+        )
+
+    return _admission_controller
+
+
+def admit_assessment(
+    assessment: Any,
+    workload_class: WorkloadClass = WorkloadClass.INTERACTIVE,
+    controller: Optional[AdmissionController] = None,
+    reused_agents: int = 0
+):
+    """Admission context for running ``assessment``'s workflow."""
+    controller = controller or get_admission_controller()
+    return controller.admit(
+        ticket_id=str(getattr(assessment, "id", "")),
+        tenant=str(getattr(assessment, "user_id", None) or "anonymous"),
+        workload_class=WorkloadClass(workload_class),
+        estimate=controller.estimator.estimate(assessment, reused_agents=reused_agents)
+    )
+
+
+def workflow_tokens_used(workflow_result: Any) -> Optional[int]:
+    """
+    LLM tokens spent by a workflow run, from its agent metrics.
+
+    Results reused from a previous run carry that run's metrics and are
+    skipped, since this run made no LLM calls for them.
+    """
+    final_data = getattr(workflow_result, "final_data", None) or {}
+    agent_results = final_data.get("agent_results") or getattr(workflow_result, "agent_results", None) or {}
+    total = 0
+    for result in agent_results.values():
+        if (result.get("reused") if isinstance(result, dict) else getattr(result, "reused", False)):
+            continue
+        metrics = result.get("metrics") if isinstance(result, dict) else getattr(result, "metrics", None)
+        total += (metrics or {}).get("llm_tokens_used", 0) or 0
+    return total or None
@@ -28,6 +28,7 @@ class EventType(str, Enum):
     USER_INPUT_RECEIVED = "user_input_received"
     RECOMMENDATION_GENERATED = "recommendation_generated"
     REPORT_GENERATED = "report_generated"
+    REPORT_SECTION_GENERATED = "report_section_generated"
 
 
 @dataclass
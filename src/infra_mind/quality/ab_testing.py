@@ -111,6 +111,54 @@ class ExperimentAssignment:
     context: Dict[str, Any] = field(default_factory=dict)
 
 
+# Pseudo event name under which variant participant counts are stored
+ASSIGNMENT_EVENT = "_assignment"
+
+# Raw records stamped just before an experiment's counters took over may
+# still be in flight; the backfill waits this long before trusting them
+COUNTER_BACKFILL_GRACE = timedelta(minutes=1)
+
+
+@dataclass
+class EventStatistics:
+    """Sufficient statistics for one event name within one variant."""
+    count: int = 0
+    value_count: int = 0
+    value_sum: float = 0.0
+    value_sum_sq: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.value_sum / self.value_count if self.value_count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the recorded values."""
+        if self.value_count < 2:
+            return 0.0
+        squared_deviation = self.value_sum_sq - self.value_sum ** 2 / self.value_count
+        return max(0.0, squared_deviation / (self.value_count - 1))
+
+    @classmethod
+    def from_document(cls, document: Dict[str, Any]) -> "EventStatistics":
+        """Read a counter document, adding its backfilled ``baseline`` if any."""
+        baseline = document.get("baseline") or {}
+        return cls(
+            count=int(document.get("count", 0)) + int(baseline.get("count", 0)),
+            value_count=int(document.get("value_count", 0)) + int(baseline.get("value_count", 0)),
+            value_sum=float(document.get("value_sum", 0.0)) + float(baseline.get("value_sum", 0.0)),
+            value_sum_sq=float(document.get("value_sum_sq", 0.0)) + float(baseline.get("value_sum_sq", 0.0))
+        )
+
+
+def _numeric_event_value(event_data: Dict[str, Any]) -> Optional[float]:
+    """Return the event's numeric ``value`` field, if it has one."""
+    value = (event_data or {}).get("value")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
 class ABTestingFramework:
     """A/B testing framework for recommendation strategies."""
     
@@ -121,6 +169,9 @@ class ABTestingFramework:
         
         # Strategy registry for different recommendation approaches
         self.strategy_registry: Dict[str, Callable] = {}
+        
+        # experiment_id -> when its incremental counters took over (immutable once set)
+        self._counters_since: Dict[str, datetime] = {}
     
     async def initialize(self):
         """Initialize database connection."""
@@ -168,7 +219,10 @@ class ABTestingFramework:
                 "created_by": experiment.created_by,
                 "created_at": experiment.created_at,
                 "updated_at": experiment.updated_at,
-                "metadata": experiment.metadata
+                "metadata": experiment.metadata,
+                # New experiments are counted incrementally from the start
+                "counters_since": datetime.utcnow(),
+                "counters_complete": True
             }
             
             await self.db.experiments.insert_one(experiment_doc)
@@ -234,7 +288,10 @@ class ABTestingFramework:
                 )
                 
                 await self.db.experiment_assignments.insert_one(assignment.__dict__)
-                
+                await self._increment_variant_statistics(
+                    experiment_id, variant_id, ASSIGNMENT_EVENT, assignment.assigned_at
+                )
+
                 self.logger.info(f"Assigned user {user_id} to variant {variant_id} in experiment {experiment_id}")
                 return variant_id
             
@@ -277,7 +334,7 @@ class ABTestingFramework:
                     )
                     
                     if variant:
-                        strategy_name = variant["configuration"]smart_get("strategy_name")
+                        strategy_name = variant["configuration"].get("strategy_name")
                         self.logger.info(f"Using strategy {strategy_name} for user {user_id}")
                         return strategy_name
                 else:
@@ -295,7 +352,7 @@ class ABTestingFramework:
                         )
                         
                         if variant:
-                            strategy_name = variant["configuration"]smart_get("strategy_name")
+                            strategy_name = variant["configuration"].get("strategy_name")
                             return strategy_name
             
             # Default strategy if no experiments apply
@@ -320,27 +377,215 @@ class ABTestingFramework:
                 await self.initialize()
             
             # Get user's active experiment assignments
-            assignments = await self.db.experiment_assignments.find({
-                "user_id": user_id
-            }).to_list(length=None)
+            assignments = await self.db.experiment_assignments.find(
+                {"user_id": user_id},
+                {"experiment_id": 1, "variant_id": 1}
+            ).to_list(length=None)
             
+            value = _numeric_event_value(event_data)
             for assignment in assignments:
                 # Record event for each active experiment
+                timestamp = datetime.utcnow()
                 event_record = {
-                    "event_id": f"{assignment['experiment_id']}_{user_id}_{event_name}_{datetime.utcnow().timestamp()}",
+                    "event_id": f"{assignment['experiment_id']}_{user_id}_{event_name}_{timestamp.timestamp()}",
                     "experiment_id": assignment["experiment_id"],
                     "variant_id": assignment["variant_id"],
                     "user_id": user_id,
                     "event_name": event_name,
                     "event_data": event_data,
-                    "timestamp": datetime.utcnow()
+                    "timestamp": timestamp
                 }
                 
                 await self.db.experiment_events.insert_one(event_record)
+                await self._increment_variant_statistics(
+                    assignment["experiment_id"], assignment["variant_id"], event_name, timestamp, value
+                )
             
         except Exception as e:
             self.logger.error(f"Failed to record experiment event: {e}")
     
+    async def _get_counters_since(self, experiment_id: str) -> datetime:
+        """
+        When the incremental counters took over for an experiment.
+        
+        The first write after deploy sets it; the backfill counts the raw
+        records stamped before it and the counters everything from it on,
+        so every observation is counted exactly once.
+        """
+        since = self._counters_since.get(experiment_id)
+        if since is None:
+            await self.db.experiments.update_one(
+                {"experiment_id": experiment_id, "counters_since": {"$exists": False}},
+                {"$set": {"counters_since": datetime.utcnow()}}
+            )
+            # Re-read: a concurrent writer may have set it first, and MongoDB
+            # truncates it to the millisecond the raw timestamps are compared at
+            experiment = await self.db.experiments.find_one(
+                {"experiment_id": experiment_id}, {"counters_since": 1}
+            )
+            since = (experiment or {}).get("counters_since") or datetime.utcnow()
+            self._counters_since[experiment_id] = since
+        return since
+    
+    async def _increment_variant_statistics(self, experiment_id: str, variant_id: str,
+                                            event_name: str, observed_at: datetime,
+                                            value: Optional[float] = None):
+        """Fold one observation into the variant's sufficient-statistics counters."""
+        if observed_at < await self._get_counters_since(experiment_id):
+            # Predates the counters; the backfill counts it
+            return
+        
+        increments = {"count": 1}
+        if value is not None:
+            increments.update({"value_count": 1, "value_sum": value, "value_sum_sq": value * value})
+        
+        await self.db.experiment_variant_stats.update_one(
+            {"experiment_id": experiment_id, "variant_id": variant_id, "event_name": event_name},
+            {"$inc": increments, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+    
+    async def _aggregate_variant_statistics(
+        self, experiment_id: str, before: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, EventStatistics]]:
+        """
+        Compute per-variant statistics from raw assignments and events.
+        
+        Grouping runs inside MongoDB, so only one document per
+        (variant, event name) pair is transferred.
+        
+        Args:
+            experiment_id: ID of the experiment
+            before: Only count records stamped before this time
+        """
+        assignment_match: Dict[str, Any] = {"experiment_id": experiment_id}
+        event_match: Dict[str, Any] = {"experiment_id": experiment_id}
+        if before is not None:
+            assignment_match["assigned_at"] = {"$lt": before}
+            event_match["timestamp"] = {"$lt": before}
+        
+        assignment_pipeline = [
+            {"$match": assignment_match},
+            {"$group": {"_id": "$variant_id", "count": {"$sum": 1}}}
+        ]
+        event_pipeline = [
+            {"$match": event_match},
+            {"$project": {
+                "variant_id": 1,
+                "event_name": 1,
+                "value": {
+                    "$cond": [{"$isNumber": "$event_data.value"}, "$event_data.value", None]
+                }
+            }},
+            {"$group": {
+                "_id": {"variant_id": "$variant_id", "event_name": "$event_name"},
+                "count": {"$sum": 1},
+                "value_count": {"$sum": {"$cond": [{"$eq": ["$value", None]}, 0, 1]}},
+                "value_sum": {"$sum": "$value"},
+                "value_sum_sq": {"$sum": {"$multiply": ["$value", "$value"]}}
+            }}
+        ]
+        
+        statistics_by_variant: Dict[str, Dict[str, EventStatistics]] = {}
+        async for row in self.db.experiment_assignments.aggregate(assignment_pipeline):
+            statistics_by_variant.setdefault(row["_id"], {})[ASSIGNMENT_EVENT] = \
+                EventStatistics(count=row["count"])
+        
+        async for row in self.db.experiment_events.aggregate(event_pipeline):
+            group = row["_id"]
+            statistics_by_variant.setdefault(group["variant_id"], {})[group["event_name"]] = \
+                EventStatistics.from_document(row)
+        
+        return statistics_by_variant
+    
+    async def _load_variant_statistics(self, experiment_id: str) -> Dict[str, Dict[str, EventStatistics]]:
+        """
+        Load per-variant statistics, preferring the incremental counters.
+        
+        The counters are only complete once the experiment's records from
+        before they took over have been backfilled (``counters_complete``).
+        Until then, and during the backfill grace period, the raw
+        collections are aggregated instead.
+        """
+        state = await self.db.experiments.find_one(
+            {"experiment_id": experiment_id}, {"counters_since": 1, "counters_complete": 1}
+        ) or {}
+        if not state.get("counters_complete"):
+            since = state.get("counters_since")
+            if (
+                since is None
+                or datetime.utcnow() < since + COUNTER_BACKFILL_GRACE
+                or not await self.rebuild_experiment_statistics(experiment_id)
+            ):
+                return await self._aggregate_variant_statistics(experiment_id)
+        
+        statistics_by_variant: Dict[str, Dict[str, EventStatistics]] = {}
+        async for document in self.db.experiment_variant_stats.find({"experiment_id": experiment_id}):
+            statistics_by_variant.setdefault(document["variant_id"], {})[document["event_name"]] = \
+                EventStatistics.from_document(document)
+        
+        return statistics_by_variant
+    
+    async def rebuild_experiment_statistics(self, experiment_id: str) -> bool:
+        """
+        Backfill an experiment's counters from its raw assignments and events.
+        
+        Records stamped before the counters took over are aggregated into a
+        ``baseline`` stored next to the live counters. Setting it never
+        touches the fields concurrent writers ``$inc``, so the rebuild is
+        safe while the experiment is running and can be repeated. Marks the
+        experiment ``counters_complete`` when done. Events removed by
+        retention cleanup are not recoverable.
+        
+        Args:
+            experiment_id: ID of the experiment
+            
+        Returns:
+            True if the counters were rebuilt
+        """
+        try:
+            if not self.db:
+                await self.initialize()
+            
+            since = await self._get_counters_since(experiment_id)
+            statistics_by_variant = await self._aggregate_variant_statistics(experiment_id, before=since)
+            
+            rebuilt = []
+            for variant_id, events in statistics_by_variant.items():
+                for event_name, stats in events.items():
+                    key = {"experiment_id": experiment_id, "variant_id": variant_id, "event_name": event_name}
+                    await self.db.experiment_variant_stats.update_one(
+                        key,
+                        {"$set": {
+                            "baseline": {
+                                "count": stats.count,
+                                "value_count": stats.value_count,
+                                "value_sum": stats.value_sum,
+                                "value_sum_sq": stats.value_sum_sq
+                            },
+                            "updated_at": datetime.utcnow()
+                        }},
+                        upsert=True
+                    )
+                    rebuilt.append({"variant_id": variant_id, "event_name": event_name})
+            
+            # Drop baselines whose raw records are gone
+            stale = {"experiment_id": experiment_id, "baseline": {"$exists": True}}
+            if rebuilt:
+                stale["$nor"] = rebuilt
+            await self.db.experiment_variant_stats.update_many(stale, {"$unset": {"baseline": ""}})
+            
+            await self.db.experiments.update_one(
+                {"experiment_id": experiment_id}, {"$set": {"counters_complete": True}}
+            )
+            
+            self.logger.info(f"Rebuilt statistics for experiment {experiment_id} ({len(rebuilt)} counters)")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to rebuild experiment statistics: {e}")
+            return False
+    
     async def analyze_experiment(self, experiment_id: str) -> Dict[str, Any]:
         """
         Analyze experiment results and calculate statistical significance.
@@ -360,29 +605,16 @@ class ABTestingFramework:
             if not experiment:
                 return {"error": "Experiment not found"}
             
-            # Get all assignments and events for this experiment
-            assignments = await self.db.experiment_assignments.find({
-                "experiment_id": experiment_id
-            }).to_list(length=None)
-            
-            events = await self.db.experiment_events.find({
-                "experiment_id": experiment_id
-            }).to_list(length=None)
+            # Per-variant sufficient statistics, one entry per event name
+            statistics_by_variant = await self._load_variant_statistics(experiment_id)
             
             # Analyze each variant
             variant_results = {}
             for variant in experiment["variants"]:
                 variant_id = variant["variant_id"]
                 
-                # Get assignments for this variant
-                variant_assignments = [a for a in assignments if a["variant_id"] == variant_id]
-                
-                # Get events for this variant
-                variant_events = [e for e in events if e["variant_id"] == variant_id]
-                
-                # Calculate metrics
-                result = await self._calculate_variant_metrics(
-                    variant_id, variant_assignments, variant_events, experiment["metrics"]
+                result = self._calculate_variant_metrics(
+                    variant_id, statistics_by_variant.get(variant_id, {}), experiment["metrics"]
                 )
                 
                 variant_results[variant_id] = result
@@ -403,7 +635,7 @@ class ABTestingFramework:
                 "status": experiment["status"],
                 "start_date": experiment.get("start_date"),
                 "analysis_date": datetime.utcnow(),
-                "total_participants": len(assignments),
+                "total_participants": sum(result.sample_size for result in variant_results.values()),
                 "variant_results": variant_results,
                 "statistical_significance": significance_results,
                 "recommendations": recommendations,
@@ -501,10 +733,10 @@ class ABTestingFramework:
         control_variant = next((v for v in variants if v.get("is_control")), None)
         return control_variant["variant_id"] if control_variant else None
     
-    async def _calculate_variant_metrics(self, variant_id: str, assignments: List[Dict], 
-                                       events: List[Dict], metrics: List[Dict]) -> ExperimentResult:
-        """Calculate metrics for a variant."""
-        sample_size = len(assignments)
+    def _calculate_variant_metrics(self, variant_id: str, event_statistics: Dict[str, EventStatistics],
+                                   metrics: List[Dict]) -> ExperimentResult:
+        """Calculate metrics for a variant from its sufficient statistics."""
+        sample_size = event_statistics.get(ASSIGNMENT_EVENT, EventStatistics()).count
         
         if sample_size == 0:
             return ExperimentResult(
@@ -512,14 +744,14 @@ class ABTestingFramework:
                 sample_size=0
             )
         
+        events = {name: stats for name, stats in event_statistics.items() if name != ASSIGNMENT_EVENT}
+        
         # Calculate conversion rate (example metric)
-        conversion_events = [e for e in events if e["event_name"] == "conversion"]
-        conversion_rate = len(conversion_events) / sample_size if sample_size > 0 else 0.0
+        conversion = events.get("conversion", EventStatistics())
+        conversion_rate = conversion.count / sample_size
         
         # Calculate average value (example metric)
-        value_events = [e for e in events if e["event_name"] == "value" and "value" in e["event_data"]]
-        values = [e["event_data"]["value"] for e in value_events]
-        average_value = statistics.mean(values) if values else 0.0
+        value = events.get("value", EventStatistics())
         
         # Calculate confidence interval for conversion rate
         confidence_interval = self._calculate_confidence_interval(conversion_rate, sample_size)
@@ -528,12 +760,22 @@ class ABTestingFramework:
             variant_id=variant_id,
             sample_size=sample_size,
             conversion_rate=conversion_rate,
-            average_value=average_value,
+            average_value=value.mean,
             confidence_interval=confidence_interval,
             metrics={
-                "total_events": len(events),
-                "conversion_events": len(conversion_events),
-                "value_events": len(value_events)
+                "total_events": sum(stats.count for stats in events.values()),
+                "conversion_events": conversion.count,
+                "value_events": value.value_count,
+                "value_variance": value.variance,
+                "event_statistics": {
+                    name: {
+                        "count": stats.count,
+                        "value_count": stats.value_count,
+                        "mean": stats.mean,
+                        "variance": stats.variance
+                    }
+                    for name, stats in events.items()
+                }
             }
         )
     
@@ -576,6 +818,7 @@ class ABTestingFramework:
             
             # Calculate statistical significance (simplified z-test)
             significance = self._calculate_z_test(control_result, result)
+            significance["value_test"] = self._calculate_mean_difference_test(control_result, result)
             significance_results[variant_id] = significance
         
         return significance_results
@@ -633,6 +876,43 @@ class ABTestingFramework:
             "effect_size": effect_size
         }
     
+    def _calculate_mean_difference_test(self, control: ExperimentResult,
+                                        treatment: ExperimentResult) -> Dict[str, Any]:
+        """Welch z-test on average value, computed from count, mean and variance."""
+        n1 = control.metrics.get("value_events", 0)
+        n2 = treatment.metrics.get("value_events", 0)
+        if n1 < 2 or n2 < 2:
+            return {"p_value": 1.0, "significance": StatisticalSignificance.NOT_SIGNIFICANT.value}
+        
+        mean1 = control.average_value or 0.0
+        mean2 = treatment.average_value or 0.0
+        standard_error = (
+            control.metrics.get("value_variance", 0.0) / n1 +
+            treatment.metrics.get("value_variance", 0.0) / n2
+        ) ** 0.5
+        
+        if standard_error == 0:
+            return {"p_value": 1.0, "significance": StatisticalSignificance.NOT_SIGNIFICANT.value}
+        
+        z_score = (mean2 - mean1) / standard_error
+        p_value = 2 * (1 - self._normal_cdf(abs(z_score)))
+        
+        if p_value < 0.001:
+            significance = StatisticalSignificance.HIGHLY_SIGNIFICANT
+        elif p_value < 0.01:
+            significance = StatisticalSignificance.SIGNIFICANT
+        elif p_value < 0.05:
+            significance = StatisticalSignificance.MARGINALLY_SIGNIFICANT
+        else:
+            significance = StatisticalSignificance.NOT_SIGNIFICANT
+        
+        return {
+            "p_value": p_value,
+            "z_score": z_score,
+            "significance": significance.value,
+            "effect_size": (mean2 - mean1) / mean1 if mean1 else 0.0
+        }
+    
     def _normal_cdf(self, x: float) -> float:
         """Simplified normal CDF approximation."""
         # Abramowitz and Stegun approximation
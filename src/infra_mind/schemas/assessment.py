@@ -249,6 +249,8 @@ class AssessmentSummary(BaseSchema):
     # Status indicators
     recommendations_generated: bool
     reports_generated: bool
+    recommendations_count: int = Field(default=0, description="Number of stored recommendations")
+    reports_count: int = Field(default=0, description="Number of stored reports")
 
 
 class AssessmentResponse(Assessment):
@@ -263,6 +265,9 @@ class AssessmentListResponse(BaseSchema):
     page: int
     limit: int
     pages: int
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page, if any")
+    has_more: bool = False
+    total_is_approximate: bool = Field(default=False, description="Total was read from cached stats")
 
 
 # Workflow-related schemas
@@ -274,6 +279,14 @@ class StartAssessmentRequest(BaseSchema):
         default=None,
         description="Custom configuration for agents"
     )
+    batch: bool = Field(
+        default=False,
+        description="Bulk re-run; scheduled behind interactive assessments"
+    )
+    full_rerun: bool = Field(
+        default=False,
+        description="Re-run every agent instead of reusing results whose inputs are unchanged"
+    )
 
 
 class AssessmentStatusUpdate(BaseSchema):
@@ -122,7 +122,7 @@ class ConversationStateManager:
             Summary text
         """
         try:
-            from ..llm.manager import LLMManager
+            from ..llm.manager import get_shared_llm_manager
             from ..llm.interface import LLMRequest
 
             # Build conversation text
@@ -144,7 +144,7 @@ class ConversationStateManager:
             """
 
             # Generate summary
-            llm_manager = LLMManager()
+            llm_manager = get_shared_llm_manager()
             llm_request = LLMRequest(
                 prompt=summary_prompt,
                 model="gpt-4",
@@ -0,0 +1,547 @@
+"""
+Materialized per-user dashboard statistics.
+
+Keeps one ``user_dashboard_stats`` document per user that is updated
+incrementally when assessments, recommendations and reports are written,
+so the dashboard overview is a single ``_id`` lookup instead of three
+aggregation pipelines.
+
+How the counters stay consistent:
+- Every tracked document has an entry in ``dashboard_stat_contributions``
+  holding the counters it currently contributes and a digest of its list
+  summary. A write atomically swaps that entry and ``$inc``s the stats
+  document by the difference, so status changes move a count from one
+  bucket to another. Saves that change neither the counters nor the
+  summary skip the stats document entirely.
+- The bounded "recent" / "top" lists are maintained with a pipeline update
+  (filter out, append, ``$sortArray``, ``$slice``), which needs MongoDB 5.2+.
+- Writes that bypass the Beanie document hooks (bulk ``update_many``, raw
+  Motor writes, manual fixes) are corrected by ``reconcile_user`` /
+  ``reconcile_all``, which the ``reconcile_dashboard_stats`` Celery task runs
+  periodically.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Any, Optional, Callable, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReplaceOne, ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+STATS_COLLECTION = "user_dashboard_stats"
+CONTRIBUTIONS_COLLECTION = "dashboard_stat_contributions"
+
+
+def _value(value: Any) -> Any:
+    """Unwrap enums to their stored value."""
+    return getattr(value, "value", value)
+
+
+def _number(value: Any) -> Optional[float]:
+    """Coerce stored numerics (int, float, Decimal, Decimal128) to float."""
+    if value is None or isinstance(value, bool):
+        return None
+    if hasattr(value, "to_decimal"):
+        value = value.to_decimal()
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+    return None
+
+
+def _key(value: Any, default: str = "unknown") -> str:
+    """Make a value safe to use as a MongoDB field name."""
+    value = _value(value)
+    if value is None or value == "":
+        return default
+    return str(value).replace(".", "_").lstrip("$") or default
+
+
+def _assessment_counters(doc: Dict[str, Any]) -> Dict[str, float]:
+    counters = {
+        "assessments.total": 1,
+        f"assessments.status.{_key(doc.get('status'))}": 1,
+    }
+    completion = _number(doc.get("completion_percentage"))
+    if completion is not None:
+        counters["assessments.completion_sum"] = completion
+        counters["assessments.completion_count"] = 1
+    return counters
+
+
+def _recommendation_counters(doc: Dict[str, Any]) -> Dict[str, float]:
+    counters = {
+        "recommendations.total": 1,
+        f"recommendations.priority.{_key(doc.get('priority'))}": 1,
+        f"recommendations.category.{_key(doc.get('category'))}": 1,
+    }
+    for field, path in (
+        ("estimated_cost", "recommendations.estimated_cost_sum"),
+        ("estimated_cost_savings", "recommendations.savings_sum"),
+    ):
+        amount = _number(doc.get(field))
+        if amount:
+            counters[path] = amount
+    confidence = _number(doc.get("confidence_score"))
+    if confidence is not None:
+        counters["recommendations.confidence_sum"] = confidence
+        counters["recommendations.confidence_count"] = 1
+    return counters
+
+
+def _report_counters(doc: Dict[str, Any]) -> Dict[str, float]:
+    return {
+        "reports.total": 1,
+        f"reports.type.{_key(doc.get('report_type'))}": 1,
+        f"reports.status.{_key(doc.get('status'))}": 1,
+    }
+
+
+def _assessment_summary(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": str(doc.get("_id")),
+        "title": doc.get("title"),
+        "status": _value(doc.get("status")),
+        "completion_percentage": _number(doc.get("completion_percentage")),
+        "created_at": doc.get("created_at"),
+        "updated_at": doc.get("updated_at"),
+    }
+
+
+def _recommendation_summary(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": str(doc.get("_id")),
+        "title": doc.get("title"),
+        "category": doc.get("category"),
+        "priority": _value(doc.get("priority")),
+        "confidence_score": _number(doc.get("confidence_score")),
+        "estimated_cost_savings": _number(doc.get("estimated_cost_savings")),
+    }
+
+
+def _report_summary(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": str(doc.get("_id")),
+        "title": doc.get("title"),
+        "report_type": _value(doc.get("report_type")),
+        "status": _value(doc.get("status")),
+        "created_at": doc.get("created_at"),
+    }
+
+
+@dataclass(frozen=True)
+class _TrackedCollection:
+    """How one source collection feeds the stats document."""
+    name: str
+    counters: Callable[[Dict[str, Any]], Dict[str, float]]
+    summary: Callable[[Dict[str, Any]], Dict[str, Any]]
+    list_path: str
+    sort: Tuple[Tuple[str, int], ...]
+    limit: int
+    projection: Tuple[str, ...]
+
+
+TRACKED_COLLECTIONS: Dict[str, _TrackedCollection] = {
+    spec.name: spec for spec in (
+        _TrackedCollection(
+            name="assessments",
+            counters=_assessment_counters,
+            summary=_assessment_summary,
+            list_path="assessments.recent",
+            sort=(("created_at", -1),),
+            limit=10,
+            projection=("user_id", "title", "status", "completion_percentage", "created_at", "updated_at"),
+        ),
+        _TrackedCollection(
+            name="recommendations",
+            counters=_recommendation_counters,
+            summary=_recommendation_summary,
+            list_path="recommendations.top",
+            sort=(("confidence_score", -1), ("priority", -1)),
+            limit=5,
+            projection=(
+                "user_id", "assessment_id", "title", "category", "priority",
+                "confidence_score", "estimated_cost", "estimated_cost_savings",
+            ),
+        ),
+        _TrackedCollection(
+            name="reports",
+            counters=_report_counters,
+            summary=_report_summary,
+            list_path="reports.recent",
+            sort=(("created_at", -1),),
+            limit=5,
+            projection=("user_id", "title", "report_type", "status", "created_at"),
+        ),
+    )
+}
+
+
+# Document field -> counter bucket, for filters answerable from the counters
+COUNTER_BUCKETS: Dict[str, Dict[str, str]] = {
+    "assessments": {"status": "status"},
+    "recommendations": {"priority": "priority", "category": "category"},
+    "reports": {"status": "status", "report_type": "type"},
+}
+
+
+def _counter_delta(old: Dict[str, float], new: Dict[str, float]) -> Dict[str, float]:
+    delta = {}
+    for path in old.keys() | new.keys():
+        change = new.get(path, 0) - old.get(path, 0)
+        if change:
+            delta[path] = change
+    return delta
+
+
+def _summary_digest(summary: Optional[Dict[str, Any]]) -> Optional[str]:
+    if summary is None:
+        return None
+    return hashlib.sha1(json.dumps(summary, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _breakdown(section: Dict[str, Any], field: str) -> Dict[str, int]:
+    # Buckets that dropped to zero are kept by $inc; hide them
+    return {key: count for key, count in (section.get(field) or {}).items() if count}
+
+
+def _average(total: float, count: float) -> float:
+    return total / count if count else 0
+
+
+class DashboardStatsStore:
+    """
+    Reads and maintains the materialized ``user_dashboard_stats`` documents.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        """
+        Initialize stats store.
+
+        Args:
+            db: MongoDB database instance
+        """
+        self.db = db
+        self.stats = db[STATS_COLLECTION]
+        self.contributions = db[CONTRIBUTIONS_COLLECTION]
+
+    async def get_user_stats(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Point read of the materialized stats document."""
+        return await self.stats.find_one({"_id": user_id})
+
+    async def approximate_count(self, user_id: str, collection_name: str, **filters: Any) -> Optional[int]:
+        """
+        Count a user's documents from the materialized counters.
+
+        Counters can briefly lag writes that bypass the document hooks, so
+        list endpoints use this only when the caller opts into approximate
+        totals.
+
+        Args:
+            user_id: User ID
+            collection_name: Tracked collection ("assessments", "recommendations", "reports")
+            **filters: Equality filters; at most one, and only on a field with
+                its own counter bucket (``None`` values are ignored)
+
+        Returns:
+            The count, or None if the filters cannot be answered from the
+            counters or the user has no stats document yet
+        """
+        filters = {field: value for field, value in filters.items() if value is not None}
+        if collection_name not in TRACKED_COLLECTIONS or len(filters) > 1:
+            return None
+
+        path = f"{collection_name}.total"
+        if filters:
+            (field, value), = filters.items()
+            if field not in COUNTER_BUCKETS.get(collection_name, ()):
+                return None
+            path = f"{collection_name}.{COUNTER_BUCKETS[collection_name][field]}.{_key(value)}"
+
+        stats = await self.stats.find_one({"_id": user_id}, {path: 1})
+        if stats is None:
+            # Not materialized yet (new user or before the first reconcile)
+            return None
+        value: Any = stats
+        for part in path.split("."):
+            value = value.get(part, 0) if isinstance(value, dict) else 0
+        return int(value or 0)
+
+    async def record_change(
+        self,
+        collection_name: str,
+        doc: Dict[str, Any],
+        deleted: bool = False
+    ) -> None:
+        """
+        Apply a document write to its owner's stats.
+
+        Args:
+            collection_name: Source collection ("assessments", "recommendations", "reports")
+            doc: Document as stored (``_id`` plus the tracked fields)
+            deleted: The document was removed
+        """
+        spec = TRACKED_COLLECTIONS[collection_name]
+        contribution_id = f"{collection_name}:{doc['_id']}"
+
+        if deleted:
+            previous = await self.contributions.find_one_and_delete({"_id": contribution_id})
+            if not previous:
+                return
+            user_id = previous["user_id"]
+            new_counters: Dict[str, float] = {}
+        else:
+            user_id = await self._resolve_user_id(collection_name, doc)
+            if not user_id:
+                return
+            new_counters = spec.counters(doc)
+            summary = spec.summary(doc)
+            digest = _summary_digest(summary)
+            previous = await self.contributions.find_one_and_replace(
+                {"_id": contribution_id},
+                {
+                    "user_id": user_id,
+                    "counters": list(new_counters.items()),
+                    "summary_digest": digest,
+                    "updated_at": datetime.utcnow()
+                },
+                upsert=True,
+                return_document=ReturnDocument.BEFORE
+            )
+
+        old_counters = dict(previous["counters"]) if previous else {}
+        if (
+            not deleted
+            and previous
+            and previous["user_id"] == user_id
+            and previous.get("summary_digest") == digest
+            and old_counters == new_counters
+        ):
+            # Nothing the dashboard shows changed (e.g. a progress-only save)
+            return
+
+        if previous and previous["user_id"] != user_id:
+            # Ownership moved: take the old contribution off the previous owner
+            await self._inc(previous["user_id"], _counter_delta(old_counters, {}))
+            await self._update_list(previous["user_id"], spec, str(doc["_id"]), None)
+            old_counters = {}
+
+        await self._inc(user_id, _counter_delta(old_counters, new_counters))
+        await self._update_list(user_id, spec, str(doc["_id"]), None if deleted else summary)
+
+        if deleted:
+            await self._refill_list(user_id, spec)
+
+    async def _resolve_user_id(self, collection_name: str, doc: Dict[str, Any]) -> Optional[str]:
+        user_id = doc.get("user_id")
+        if user_id or collection_name != "recommendations" or not doc.get("assessment_id"):
+            return str(user_id) if user_id else None
+
+        # Recommendations are owned through their assessment
+        from bson import ObjectId
+        assessment_id = doc["assessment_id"]
+        lookup = ObjectId(assessment_id) if ObjectId.is_valid(assessment_id) else assessment_id
+        assessment = await self.db.assessments.find_one({"_id": lookup}, {"user_id": 1})
+        return str(assessment["user_id"]) if assessment and assessment.get("user_id") else None
+
+    async def _inc(self, user_id: str, delta: Dict[str, float]) -> None:
+        if not delta:
+            return
+        await self.stats.update_one(
+            {"_id": user_id},
+            {"$inc": delta, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+    async def _update_list(
+        self,
+        user_id: str,
+        spec: _TrackedCollection,
+        doc_id: str,
+        summary: Optional[Dict[str, Any]]
+    ) -> None:
+        current = {"$ifNull": [f"${spec.list_path}", []]}
+        others = {"$filter": {"input": current, "cond": {"$ne": ["$$this.id", doc_id]}}}
+        merged = {"$concatArrays": [others, [{"$literal": summary}]]} if summary else others
+        await self.stats.update_one(
+            {"_id": user_id},
+            [{"$set": {
+                spec.list_path: {
+                    "$slice": [{"$sortArray": {"input": merged, "sortBy": dict(spec.sort)}}, spec.limit]
+                }
+            }}],
+            upsert=summary is not None
+        )
+
+    async def _refill_list(self, user_id: str, spec: _TrackedCollection) -> None:
+        """A delete can leave a list short; reload it from the source collection."""
+        query = await self._owner_query(spec.name, user_id)
+        cursor = self.db[spec.name].find(query, list(spec.projection)).sort(list(spec.sort)).limit(spec.limit)
+        summaries = [spec.summary(doc) async for doc in cursor]
+        await self.stats.update_one({"_id": user_id}, {"$set": {spec.list_path: summaries}})
+
+    async def _owner_query(self, collection_name: str, user_id: str) -> Dict[str, Any]:
+        if collection_name != "recommendations":
+            return {"user_id": user_id}
+        assessment_ids = [
+            str(doc["_id"]) async for doc in self.db.assessments.find({"user_id": user_id}, {"_id": 1})
+        ]
+        return {"$or": [{"user_id": user_id}, {"assessment_id": {"$in": assessment_ids}}]}
+
+    async def reconcile_user(self, user_id: str, batch_size: int = 500) -> Dict[str, Any]:
+        """
+        Rebuild a user's stats and contribution entries from the source collections.
+
+        Writes racing with a reconciliation may be applied twice or not at all;
+        the next run corrects them.
+
+        Args:
+            user_id: User ID
+            batch_size: Contribution entries per bulk write
+
+        Returns:
+            The rebuilt stats document
+        """
+        started_at = datetime.utcnow()
+        stats: Dict[str, Any] = {"_id": user_id}
+        totals: Dict[str, float] = {}
+
+        for spec in TRACKED_COLLECTIONS.values():
+            query = await self._owner_query(spec.name, user_id)
+            operations = []
+            async for doc in self.db[spec.name].find(query, list(spec.projection)):
+                counters = spec.counters(doc)
+                for path, value in counters.items():
+                    totals[path] = totals.get(path, 0) + value
+                operations.append(ReplaceOne(
+                    {"_id": f"{spec.name}:{doc['_id']}"},
+                    {
+                        "user_id": user_id,
+                        "counters": list(counters.items()),
+                        "summary_digest": _summary_digest(spec.summary(doc)),
+                        "updated_at": started_at
+                    },
+                    upsert=True
+                ))
+                if len(operations) >= batch_size:
+                    await self.contributions.bulk_write(operations, ordered=False)
+                    operations = []
+            if operations:
+                await self.contributions.bulk_write(operations, ordered=False)
+
+            cursor = self.db[spec.name].find(query, list(spec.projection)).sort(list(spec.sort)).limit(spec.limit)
+            self._set_path(stats, spec.list_path, [spec.summary(doc) async for doc in cursor])
+
+        for path, value in totals.items():
+            self._set_path(stats, path, value)
+        stats["updated_at"] = started_at
+        stats["reconciled_at"] = started_at
+
+        await self.stats.replace_one({"_id": user_id}, stats, upsert=True)
+        # Entries neither rewritten above nor by a concurrent hook belong to deleted documents
+        await self.contributions.delete_many({"user_id": user_id, "updated_at": {"$lt": started_at}})
+        return stats
+
+    async def reconcile_all(self) -> Dict[str, Any]:
+        """
+        Reconcile every user that owns tracked documents or has a stats document.
+
+        Returns:
+            Summary with the number of users reconciled and failures
+        """
+        user_ids = set()
+        for collection_name in ("assessments", "reports", "recommendations"):
+            user_ids.update(str(u) for u in await self.db[collection_name].distinct("user_id") if u)
+        user_ids.update(str(u) for u in await self.stats.distinct("_id"))
+
+        summary = {"users": 0, "failed": 0, "started_at": datetime.utcnow().isoformat()}
+        for user_id in sorted(user_ids):
+            try:
+                await self.reconcile_user(user_id)
+                summary["users"] += 1
+            except Exception as e:
+                summary["failed"] += 1
+                logger.error(f"Dashboard stats reconciliation failed for {user_id}: {e}")
+        summary["completed_at"] = datetime.utcnow().isoformat()
+        return summary
+
+    @staticmethod
+    def _set_path(target: Dict[str, Any], path: str, value: Any) -> None:
+        *parents, leaf = path.split(".")
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+
+    @staticmethod
+    def build_sections(stats: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Shape a stats document like the former aggregation results.
+
+        Returns:
+            Dict with "assessments", "recommendations" and "reports" sections
+        """
+        assessments = stats.get("assessments") or {}
+        assessment_status = _breakdown(assessments, "status")
+        recommendations = stats.get("recommendations") or {}
+        priority = _breakdown(recommendations, "priority")
+        reports = stats.get("reports") or {}
+        report_status = _breakdown(reports, "status")
+
+        return {
+            "assessments": {
+                "total": assessments.get("total", 0),
+                "completed": assessment_status.get("completed", 0),
+                "in_progress": assessment_status.get("in_progress", 0),
+                "draft": assessment_status.get("draft", 0),
+                "status_breakdown": assessment_status,
+                "avg_completion": _average(
+                    assessments.get("completion_sum", 0), assessments.get("completion_count", 0)
+                ),
+                "recent": assessments.get("recent", [])
+            },
+            "recommendations": {
+                "total": recommendations.get("total", 0),
+                "high_priority": priority.get("high", 0),
+                "medium_priority": priority.get("medium", 0),
+                "low_priority": priority.get("low", 0),
+                "by_category": _breakdown(recommendations, "category"),
+                "total_estimated_cost": recommendations.get("estimated_cost_sum", 0),
+                "total_potential_savings": recommendations.get("savings_sum", 0),
+                "avg_confidence": _average(
+                    recommendations.get("confidence_sum", 0), recommendations.get("confidence_count", 0)
+                ),
+                "top_recommendations": recommendations.get("top", [])
+            },
+            "reports": {
+                "total": reports.get("total", 0),
+                "by_type": _breakdown(reports, "type"),
+                "by_status": report_status,
+                "completed": report_status.get("completed", 0),
+                "pending": report_status.get("pending", 0),
+                "recent_reports": reports.get("recent", [])
+            }
+        }
+
+
+async def record_model_change(document, deleted: bool = False) -> None:
+    """
+    Beanie event hook entry point for tracked document models.
+
+    Failures are logged and swallowed: the source write already succeeded and
+    the periodic reconciliation repairs any missed update.
+    """
+    try:
+        collection = document.get_motor_collection()
+        spec = TRACKED_COLLECTIONS[collection.name]
+        if document.id is None:
+            return
+        doc = document.model_dump(include=set(spec.projection))
+        doc["_id"] = document.id
+        await DashboardStatsStore(collection.database).record_change(collection.name, doc, deleted=deleted)
+    except Exception as e:
+        logger.warning(f"Dashboard stats update failed for {type(document).__name__} {document.id}: {e}")
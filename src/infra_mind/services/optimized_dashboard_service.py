@@ -2,8 +2,7 @@
 Optimized Dashboard Service with Caching and Aggregation.
 
 Addresses critical performance issues:
-- Redis caching layer (30-60s TTL)
-- MongoDB aggregation pipelines (no loading all docs into memory)
+- Materialized per-user stats, updated on write (overview is one point read)
 - Indexed queries for fast lookups
 - Pagination support
 - Async batch operations
@@ -13,7 +12,8 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorDatabase
-import json
+
+from .dashboard_stats import DashboardStatsStore
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +23,8 @@ class OptimizedDashboardService:
     High-performance dashboard data service.
 
     Features:
+    - Materialized per-user counters (no recompute on cache miss)
     - Multi-layer caching (Redis + in-memory)
-    - MongoDB aggregation pipelines
     - Batch operations
     - Smart query optimization
     - Automatic cache invalidation
@@ -40,9 +40,9 @@ class OptimizedDashboardService:
         """
         self.db = db
         self.cache_manager = cache_manager
+        self.stats_store = DashboardStatsStore(db)
 
-        # Cache TTLs
-        self.OVERVIEW_CACHE_TTL = 60  # 1 minute
+        # Cache TTLs (the overview is read from materialized stats, not cached)
         self.METRICS_CACHE_TTL = 30  # 30 seconds
         self.RECENT_CACHE_TTL = 20  # 20 seconds
 
@@ -54,42 +54,34 @@ class OptimizedDashboardService:
         force_refresh: bool = False
     ) -> Dict[str, Any]:
         """
-        Get dashboard overview with caching and optimized queries.
+        Get dashboard overview from the materialized per-user stats document.
+
+        The counters are maintained incrementally by the document write hooks
+        (see ``dashboard_stats``), so this is a single ``_id`` lookup. A user
+        without a stats document yet, or a forced refresh, is reconciled from
+        the source collections first.
 
         Args:
             user_id: User ID
-            force_refresh: Bypass cache
+            force_refresh: Rebuild the stats from the source collections
 
         Returns:
             Dashboard overview data
         """
-        # Check cache first
-        cache_key = f"dashboard:overview:{user_id}"
-
-        if not force_refresh and self.cache_manager:
-            try:
-                cached = await self.cache_manager.get(cache_key)
-                if cached:
-                    logger.debug(f"✅ Cache hit for dashboard overview: {user_id}")
-                    return json.loads(cached)
-            except Exception as e:
-                logger.warning(f"Cache retrieval failed: {e}")
-
-        # Cache miss - fetch from database using aggregation
-        logger.debug(f"📊 Fetching dashboard overview from DB: {user_id}")
-
         try:
-            # Use parallel aggregations for different collections
-            assessments_stats, recommendations_stats, reports_stats = await asyncio.gather(
-                self._aggregate_assessments_stats(user_id),
-                self._aggregate_recommendations_stats(user_id),
-                self._aggregate_reports_stats(user_id)
-            )
+            stats = None if force_refresh else await self.stats_store.get_user_stats(user_id)
+            if stats is None:
+                logger.debug(f"📊 Reconciling dashboard stats from DB: {user_id}")
+                stats = await self.stats_store.reconcile_user(user_id)
 
-            # Build overview
-            overview = {
+            sections = self.stats_store.build_sections(stats)
+            assessments_stats = sections["assessments"]
+            recommendations_stats = sections["recommendations"]
+            reports_stats = sections["reports"]
+
+            return {
                 "user_id": user_id,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": stats.get("updated_at", datetime.utcnow()).isoformat(),
                 "assessments": assessments_stats,
                 "recommendations": recommendations_stats,
                 "reports": reports_stats,
@@ -106,230 +98,10 @@ class OptimizedDashboardService:
                 }
             }
 
-            # Cache the result
-            if self.cache_manager:
-                try:
-                    await self.cache_manager.set(
-                        cache_key,
-                        json.dumps(overview),
-                        ttl=self.OVERVIEW_CACHE_TTL
-                    )
-                    logger.debug(f"💾 Cached dashboard overview: {user_id}")
-                except Exception as e:
-                    logger.warning(f"Cache storage failed: {e}")
-
-            return overview
-
         except Exception as e:
             logger.error(f"Failed to fetch dashboard overview: {e}")
             raise
 
-    async def _aggregate_assessments_stats(self, user_id: str) -> Dict[str, Any]:
-        """
-        Aggregate assessment statistics using MongoDB pipeline.
-
-        Args:
-            user_id: User ID
-
-        Returns:
-            Assessment statistics
-        """
-        pipeline = [
-            {"$match": {"user_id": user_id}},
-            {
-                "$facet": {
-                    # Total count
-                    "total": [{"$count": "count"}],
-
-                    # Status breakdown
-                    "by_status": [
-                        {"$group": {
-                            "_id": "$status",
-                            "count": {"$sum": 1}
-                        }}
-                    ],
-
-                    # Recent assessments (last 10)
-                    "recent": [
-                        {"$sort": {"created_at": -1}},
-                        {"$limit": 10},
-                        {"$project": {
-                            "id": {"$toString": "$_id"},
-                            "title": 1,
-                            "status": 1,
-                            "completion_percentage": 1,
-                            "created_at": 1,
-                            "updated_at": 1
-                        }}
-                    ],
-
-                    # Completion stats
-                    "completion": [
-                        {"$group": {
-                            "_id": None,
-                            "avg_completion": {"$avg": "$completion_percentage"},
-                            "completed_count": {
-                                "$sum": {
-                                    "$cond": [{"$eq": ["$status", "completed"]}, 1, 0]
-                                }
-                            }
-                        }}
-                    ]
-                }
-            }
-        ]
-
-        result = await self.db.assessments.aggregate(pipeline).to_list(length=1)
-
-        if not result:
-            return {"total": 0}
-
-        data = result[0]
-
-        # Parse results
-        total = data["total"][0]["count"] if data["total"] else 0
-        status_breakdown = {item["_id"]: item["count"] for item in data["by_status"]}
-        recent = data["recent"]
-        completion_data = data["completion"][0] if data["completion"] else {}
-
-        return {
-            "total": total,
-            "completed": status_breakdown.get("completed", 0),
-            "in_progress": status_breakdown.get("in_progress", 0),
-            "draft": status_breakdown.get("draft", 0),
-            "status_breakdown": status_breakdown,
-            "avg_completion": completion_data.get("avg_completion", 0),
-            "recent": recent
-        }
-
-    async def _aggregate_recommendations_stats(self, user_id: str) -> Dict[str, Any]:
-        """Aggregate recommendation statistics."""
-        pipeline = [
-            {"$match": {"user_id": user_id}},
-            {
-                "$facet": {
-                    "total": [{"$count": "count"}],
-
-                    "by_priority": [
-                        {"$group": {
-                            "_id": "$priority",
-                            "count": {"$sum": 1}
-                        }}
-                    ],
-
-                    "by_category": [
-                        {"$group": {
-                            "_id": "$category",
-                            "count": {"$sum": 1}
-                        }}
-                    ],
-
-                    "cost_summary": [
-                        {"$group": {
-                            "_id": None,
-                            "total_estimated_cost": {"$sum": "$estimated_cost"},
-                            "total_savings": {"$sum": "$estimated_cost_savings"},
-                            "avg_confidence": {"$avg": "$confidence_score"}
-                        }}
-                    ],
-
-                    "top_recommendations": [
-                        {"$sort": {"confidence_score": -1, "priority": -1}},
-                        {"$limit": 5},
-                        {"$project": {
-                            "id": {"$toString": "$_id"},
-                            "title": 1,
-                            "category": 1,
-                            "priority": 1,
-                            "confidence_score": 1,
-                            "estimated_cost_savings": 1
-                        }}
-                    ]
-                }
-            }
-        ]
-
-        result = await self.db.recommendations.aggregate(pipeline).to_list(length=1)
-
-        if not result:
-            return {"total": 0}
-
-        data = result[0]
-
-        total = data["total"][0]["count"] if data["total"] else 0
-        priority_breakdown = {item["_id"]: item["count"] for item in data["by_priority"]}
-        category_breakdown = {item["_id"]: item["count"] for item in data["by_category"]}
-        cost_data = data["cost_summary"][0] if data["cost_summary"] else {}
-
-        return {
-            "total": total,
-            "high_priority": priority_breakdown.get("high", 0),
-            "medium_priority": priority_breakdown.get("medium", 0),
-            "low_priority": priority_breakdown.get("low", 0),
-            "by_category": category_breakdown,
-            "total_estimated_cost": cost_data.get("total_estimated_cost", 0),
-            "total_potential_savings": cost_data.get("total_savings", 0),
-            "avg_confidence": cost_data.get("avg_confidence", 0),
-            "top_recommendations": data["top_recommendations"]
-        }
-
-    async def _aggregate_reports_stats(self, user_id: str) -> Dict[str, Any]:
-        """Aggregate report statistics."""
-        pipeline = [
-            {"$match": {"user_id": user_id}},
-            {
-                "$facet": {
-                    "total": [{"$count": "count"}],
-
-                    "by_type": [
-                        {"$group": {
-                            "_id": "$report_type",
-                            "count": {"$sum": 1}
-                        }}
-                    ],
-
-                    "by_status": [
-                        {"$group": {
-                            "_id": "$status",
-                            "count": {"$sum": 1}
-                        }}
-                    ],
-
-                    "recent_reports": [
-                        {"$sort": {"created_at": -1}},
-                        {"$limit": 5},
-                        {"$project": {
-                            "id": {"$toString": "$_id"},
-                            "title": 1,
-                            "report_type": 1,
-                            "status": 1,
-                            "created_at": 1
-                        }}
-                    ]
-                }
-            }
-        ]
-
-        result = await self.db.reports.aggregate(pipeline).to_list(length=1)
-
-        if not result:
-            return {"total": 0}
-
-        data = result[0]
-
-        total = data["total"][0]["count"] if data["total"] else 0
-        type_breakdown = {item["_id"]: item["count"] for item in data["by_type"]}
-        status_breakdown = {item["_id"]: item["count"] for item in data["by_status"]}
-
-        return {
-            "total": total,
-            "by_type": type_breakdown,
-            "by_status": status_breakdown,
-            "completed": status_breakdown.get("completed", 0),
-            "pending": status_breakdown.get("pending", 0),
-            "recent_reports": data["recent_reports"]
-        }
-
     async def get_recent_activity(
         self,
         user_id: str,
@@ -420,7 +192,6 @@ class OptimizedDashboardService:
             return
 
         cache_keys = [
-            f"dashboard:overview:{user_id}",
             f"dashboard:metrics:{user_id}",
             f"dashboard:recent:{user_id}"
         ]
@@ -0,0 +1,393 @@
+"""
+Offloaded, cached rendering of report downloads.
+
+Rendering a report to PDF with reportlab is CPU-bound and takes long enough
+on large reports to stall every request sharing the event loop. Downloads
+therefore go through ``ReportRenderer``, which:
+
+- renders PDF, HTML and markdown in a process pool; the worker writes the
+  artifact straight to the cache so the bytes are never pickled back
+- admits at most ``max_workers + max_queue`` renders at a time and rejects
+  the rest with ``RenderQueueFullError`` instead of queueing without bound
+- shares one render between concurrent requests for the same artifact
+- caches artifacts on local disk, addressed by (report_id, version, format),
+  so repeat downloads are a file read; the address doubles as the ETag
+"""
+
+import asyncio
+import hashlib
+import html
+import logging
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "html": "text/html; charset=utf-8",
+    "markdown": "text/markdown; charset=utf-8",
+}
+EXTENSIONS = {"pdf": "pdf", "html": "html", "markdown": "md"}
+
+
+class RenderQueueFullError(Exception):
+    """Raised when too many renders are already running or waiting."""
+
+
+@dataclass
+class RenderedArtifact:
+    path: str
+    etag: str
+    format: str
+    size: int
+
+    @property
+    def media_type(self) -> str:
+        return MEDIA_TYPES[self.format]
+
+
+def _sections(report_data: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+    for section in report_data.get("sections", []):
+        if isinstance(section, dict):
+            yield section.get("title", "Untitled Section"), section.get("content") or ""
+        elif isinstance(section, str):
+            yield section, ""
+
+
+def render_markdown(report_data: Dict[str, Any]) -> str:
+    """Render report data as a markdown document."""
+    lines = [f"# {report_data.get('title', 'Infrastructure Assessment Report')}", ""]
+    lines.append(f"**Report ID:** {report_data.get('report_id', 'N/A')}")
+    lines.append(f"**Report Type:** {str(report_data.get('report_type', '')).replace('_', ' ').title()}")
+    created_at = report_data.get("created_at")
+    if created_at:
+        lines.append(f"**Generated:** {str(created_at)[:19]}")
+    lines.extend(["", "---", ""])
+    for title, content in _sections(report_data):
+        lines.extend([f"## {title}", "", content, ""])
+    return "\n".join(lines)
+
+
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+
+
+def _markdown_to_html(text: str) -> str:
+    """Small markdown subset used by generated sections: headings, bullets, bold."""
+    parts, in_list = [], False
+    for line in text.splitlines():
+        stripped = line.strip()
+        escaped = _BOLD.sub(r"<strong>\1</strong>", html.escape(stripped))
+        is_item = stripped.startswith(("- ", "* ", "• "))
+        if in_list and not is_item:
+            parts.append("</ul>")
+            in_list = False
+        if is_item:
+            if not in_list:
+                parts.append("<ul>")
+                in_list = True
+            parts.append(f"<li>{escaped[2:].strip()}</li>")
+        elif stripped.startswith("#"):
+            level = min(6, len(stripped) - len(stripped.lstrip("#")) + 2)
+            parts.append(f"<h{level}>{escaped.lstrip('#').strip()}</h{level}>")
+        elif stripped:
+            parts.append(f"<p>{escaped}</p>")
+    if in_list:
+        parts.append("</ul>")
+    return "\n".join(parts)
+
+
+def render_html(report_data: Dict[str, Any]) -> str:
+    """Render report data as a standalone HTML document."""
+    title = html.escape(report_data.get("title", "Infrastructure Assessment Report"))
+    sections = "\n".join(
+        f'<div class="section">\n<h2>{html.escape(section_title)}</h2>\n{_markdown_to_html(content)}\n</div>'
+        for section_title, content in _sections(report_data)
+    )
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+    body {{ font-family: Arial, sans-serif; margin: 40px; }}
+    .header {{ color: #1976d2; border-bottom: 2px solid #1976d2; padding-bottom: 10px; }}
+    .section {{ margin: 20px 0; }}
+</style>
+</head>
+<body>
+<div class="header">
+<h1>{title}</h1>
+<p>Assessment ID: {html.escape(str(report_data.get('assessment_id', '')))} | Report ID: {html.escape(str(report_data.get('report_id', '')))}</p>
+</div>
+{sections}
+</body>
+</html>
+"""
+
+
+def render_to_file(format: str, report_data: Dict[str, Any], path: str) -> int:
+    """
+    Render ``report_data`` to ``path`` and return the artifact size.
+
+    Runs in a worker process. The file is written under a temporary name
+    and renamed, so readers never see a partial artifact.
+    """
+    if format == "pdf":
+        from .pdf_generator import generate_report_pdf
+        content = generate_report_pdf(report_data)
+    elif format == "html":
+        content = render_html(report_data).encode("utf-8")
+    elif format == "markdown":
+        content = render_markdown(report_data).encode("utf-8")
+    else:
+        raise ValueError(f"Unsupported render format: {format}")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(content)
+
+
+class ReportRenderer:
+    """Process-pool report renderer with a content-addressed disk cache."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_workers: int = 2,
+        max_queue: int = 16,
+        max_cache_bytes: int = 2 * 1024 ** 3
+    ):
+        """
+        Args:
+            cache_dir: Directory for rendered artifacts
+            max_workers: Render processes
+            max_queue: Renders allowed to wait for a free process
+            max_cache_bytes: Cache size above which the oldest artifacts are removed
+        """
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.max_cache_bytes = max_cache_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._cache_bytes: Optional[int] = None
+        self._cache_lock = threading.Lock()
+        self.stats = {"hits": 0, "renders": 0, "shared": 0, "rejected": 0, "failures": 0}
+
+    @staticmethod
+    def cache_key(report_id: str, version: str, format: str) -> str:
+        return hashlib.sha256(f"{report_id}\x1f{version}\x1f{format}".encode("utf-8")).hexdigest()
+
+    def artifact_path(self, key: str, format: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{EXTENSIONS[format]}")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Forking a process with a running event loop and client threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def cached(self, report_id: str, version: str, format: str) -> Optional[RenderedArtifact]:
+        """The cached artifact, if it has been rendered before."""
+        key = self.cache_key(report_id, version, format)
+        path = self.artifact_path(key, format)
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            return None
+        return RenderedArtifact(path=path, etag=key, format=format, size=size)
+
+    async def render(
+        self,
+        report_id: str,
+        version: str,
+        format: str,
+        report_data: Dict[str, Any]
+    ) -> RenderedArtifact:
+        """
+        Get the artifact for a report version, rendering it if needed.
+
+        Raises:
+            RenderQueueFullError: If the render queue is full
+        """
+        if format not in MEDIA_TYPES:
+            raise ValueError(f"Unsupported render format: {format}")
+
+        artifact = self.cached(report_id, version, format)
+        if artifact:
+            self.stats["hits"] += 1
+            try:
+                # mtime orders cache eviction, so mark the artifact as recently used
+                os.utime(artifact.path)
+            except OSError:
+                pass
+            return artifact
+
+        key = self.cache_key(report_id, version, format)
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats["shared"] += 1
+        else:
+            if len(self._in_flight) >= self.max_workers + self.max_queue:
+                self.stats["rejected"] += 1
+                raise RenderQueueFullError(f"{len(self._in_flight)} report renders already pending")
+            future = asyncio.ensure_future(self._render(key, format, report_data))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # A disconnecting client must not cancel a render other requests share
+        size = await asyncio.shield(future)
+        return RenderedArtifact(path=self.artifact_path(key, format), etag=key, format=format, size=size)
+
+    async def _render(self, key: str, format: str, report_data: Dict[str, Any]) -> int:
+        path = self.artifact_path(key, format)
+        loop = asyncio.get_running_loop()
+        try:
+            size = await loop.run_in_executor(self._get_executor(), render_to_file, format, report_data, path)
+        except BrokenProcessPool:
+            self.stats["failures"] += 1
+            logger.error("Report render process pool broke; it will be recreated")
+            self._executor = None
+            raise
+        except Exception:
+            self.stats["failures"] += 1
+            raise
+
+        self.stats["renders"] += 1
+        await asyncio.to_thread(self._account, size)
+        return size
+
+    def _account(self, size: int) -> None:
+        """Track cache size and drop the least recently used artifacts when over budget."""
+        with self._cache_lock:
+            self._account_locked(size)
+
+    def _account_locked(self, size: int) -> None:
+        if self._cache_bytes is None:
+            self._cache_bytes = sum(size for _, size, _ in self._artifacts())
+        else:
+            self._cache_bytes += size
+        if self._cache_bytes <= self.max_cache_bytes:
+            return
+
+        for path, size, _ in sorted(self._artifacts(), key=lambda artifact: artifact[2]):
+            if self._cache_bytes <= self.max_cache_bytes * 0.8:
+                break
+            try:
+                os.unlink(path)
+                self._cache_bytes -= size
+            except FileNotFoundError:
+                pass
+
+    def _artifacts(self) -> Iterator[Tuple[str, int, float]]:
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "in_flight": len(self._in_flight),
+            "max_pending": self.max_workers + self.max_queue,
+            "cache_bytes": self._cache_bytes
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_report_renderer: Optional[ReportRenderer] = None
+
+
+def get_report_renderer() -> ReportRenderer:
+    """Get the process-wide report renderer."""
+    global _report_renderer
+
+    if _report_renderer is None:
+        from ..core.config import settings
+
+        _report_renderer = ReportRenderer(
+            cache_dir=settings.report_cache_dir,
+            max_workers=settings.report_render_workers,
+            max_queue=settings.report_render_queue_size,
+            max_cache_bytes=settings.report_cache_max_mb * 1024 * 1024
+        )
+    return _report_renderer
+
+
+def shutdown_report_renderer() -> None:
+    """Stop the render processes, if any were started."""
+    if _report_renderer is not None:
+        _report_renderer.shutdown()
+
+
+def parse_byte_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range ``Range`` header into inclusive (start, end).
+
+    Returns None when the header should be ignored (not bytes, several
+    ranges, malformed) and the whole artifact served instead.
+
+    Raises:
+        ValueError: If the range cannot be satisfied for ``size`` bytes
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length <= 0:
+                raise ValueError(f"Unsatisfiable range: {header}")
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    except ValueError as e:
+        if "Unsatisfiable" in str(e):
+            raise
+        return None
+    if start >= size or start > end:
+        raise ValueError(f"Unsatisfiable range: {header}")
+    return start, end
+
+
+def read_file_range(path: str, start: int, end: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield bytes ``start``..``end`` (inclusive) of a file in chunks."""
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = handle.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
@@ -0,0 +1,46 @@
+"""
+Dashboard Maintenance Background Tasks
+
+Periodic reconciliation of the materialized per-user dashboard statistics.
+"""
+
+from typing import Dict, Any
+from loguru import logger
+
+from .celery_app import celery_app
+from .worker_loop import run_in_worker_loop
+from ..models.assessment import Assessment
+from ..services.dashboard_stats import DashboardStatsStore
+
+
+@celery_app.task(
+    bind=True,
+    name="reconcile_dashboard_stats",
+    max_retries=1,
+    default_retry_delay=300
+)
+def reconcile_dashboard_stats(self) -> Dict[str, Any]:
+    """
+    Rebuild every user's dashboard stats from the source collections.
+
+    Corrects drift from writes that bypassed the document event hooks.
+
+    Returns:
+        Reconciliation summary
+    """
+    logger.info("📊 Reconciling materialized dashboard stats")
+
+    try:
+        result = run_in_worker_loop(_reconcile_all())
+
+        logger.info(f"✅ Dashboard stats reconciled: {result}")
+        return result
+
+    except Exception as e:
+        logger.error(f"❌ Dashboard stats reconciliation failed: {e}")
+        raise
+
+
+async def _reconcile_all() -> Dict[str, Any]:
+    database = Assessment.get_motor_collection().database
+    return await DashboardStatsStore(database).reconcile_all()
@@ -11,6 +11,7 @@ from loguru import logger
 from datetime import datetime
 
 from .celery_app import celery_app
+from .worker_loop import run_in_worker_loop
 from ..models.assessment import Assessment
 from beanie import PydanticObjectId
 
@@ -39,15 +40,15 @@ def generate_assessment_reports(self, assessment_id: str) -> Dict[str, Any]:
     )
 
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        result = loop.run_until_complete(_generate_reports(
-            assessment_id=assessment_id,
-            task_instance=self
-        ))
+        result = run_in_worker_loop(
+            _generate_reports(
+                assessment_id=assessment_id,
+                task_instance=self,
+                task_id=self.request.id
+            ),
+            timeout=self.soft_time_limit or celery_app.conf.task_soft_time_limit,
+            hard_timeout=self.time_limit or celery_app.conf.task_time_limit
+        )
 
         return result
 
@@ -58,9 +59,15 @@ def generate_assessment_reports(self, assessment_id: str) -> Dict[str, Any]:
 
 async def _generate_reports(
     assessment_id: str,
-    task_instance: Task
+    task_instance: Task,
+    task_id: str
 ) -> Dict[str, Any]:
-    """Generate reports asynchronously."""
+    """
+    Generate reports asynchronously.
+
+    Runs in the worker loop thread, where Celery's per-thread request
+    context is empty, so progress updates pass ``task_id`` explicitly.
+    """
     from ..api.endpoints.assessments import generate_actual_reports
 
     assessment = await Assessment.get(PydanticObjectId(assessment_id))
@@ -68,7 +75,9 @@ async def _generate_reports(
     if not assessment:
         raise ValueError(f"Assessment {assessment_id} not found")
 
-    task_instance.update_state(
+    await asyncio.to_thread(
+        task_instance.update_state,
+        task_id=task_id,
         state="PROGRESS",
         meta={"assessment_id": assessment_id, "progress": 30}
     )
@@ -76,7 +85,9 @@ async def _generate_reports(
     # Generate reports
     await generate_actual_reports(assessment)
 
-    task_instance.update_state(
+    await asyncio.to_thread(
+        task_instance.update_state,
+        task_id=task_id,
         state="PROGRESS",
         meta={"assessment_id": assessment_id, "progress": 100}
     )
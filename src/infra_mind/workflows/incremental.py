@@ -0,0 +1,279 @@
+"""
+Incremental assessment re-runs.
+
+When an assessment is edited and started again, most agents see exactly the
+same inputs as in the previous run. Each workflow stage is fingerprinted by
+the subset of assessment fields it depends on (plus the fingerprints of its
+upstream stages); a stage whose fingerprint matches the stored snapshot of a
+successful run is skipped and its stored output reused.
+
+Field dependencies are declared per agent as groups of requirement keys.
+Requirement keys that are not in any group are treated as inputs of every
+stage, so new or free-form fields invalidate conservatively.
+
+Snapshots live in the ``agent_result_snapshots`` collection, one document
+per ``(assessment, stage)``, expiring after ``SNAPSHOT_TTL_DAYS``.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ReplaceOne
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_COLLECTION = "agent_result_snapshots"
+SNAPSHOT_TTL_DAYS = 30
+
+# Bump when agent prompts or result formats change to invalidate all snapshots
+FINGERPRINT_VERSION = 1
+
+VALIDATION_STAGE = "data_validation"
+POST_PROCESSING_STAGE = "post_processing"
+
+_REQUIREMENT_SECTIONS = ("business_requirements", "technical_requirements")
+_CONTEXT_FIELDS = ("description", "business_goal")
+
+
+def _paths(section: str, keys: str) -> Tuple[str, ...]:
+    return tuple(f"{section}.{key}" for key in keys.split())
+
+
+INPUT_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "profile": _paths(
+        "business_requirements",
+        "company_size industry industry_other geographic_regions customer_base_size growth_stage team_structure"
+    ) + _paths("technical_requirements", "technical_team_size"),
+    "strategy": (
+        "description",
+        "business_goal",
+    ) + _paths(
+        "business_requirements",
+        "business_goals growth_projection revenue_model key_competitors mission_critical_systems "
+        "project_timeline_months urgency_level current_pain_points success_criteria"
+    ),
+    "budget": _paths("business_requirements", "budget_constraints") + _paths(
+        "technical_requirements",
+        "monthly_budget budget_flexibility cost_optimization_priority total_budget_range migration_budget "
+        "operational_budget_split roi_expectations payment_model"
+    ),
+    "compliance": _paths(
+        "business_requirements", "compliance_requirements data_residency_requirements"
+    ) + _paths(
+        "technical_requirements",
+        "data_classification security_incident_history access_control_requirements encryption_requirements "
+        "security_monitoring vulnerability_management security_requirements"
+    ),
+    "cloud": _paths(
+        "business_requirements", "cloud_provider_preference multi_cloud_acceptable"
+    ) + _paths(
+        "technical_requirements",
+        "current_cloud_providers current_services preferred_cloud_services managed_services_preference "
+        "open_source_preference"
+    ),
+    "architecture": _paths(
+        "technical_requirements",
+        "infrastructure_age current_architecture data_storage_solutions network_setup disaster_recovery_setup "
+        "monitoring_tools application_types development_frameworks programming_languages database_types "
+        "integration_patterns deployment_strategy containerization orchestration_platform cicd_tools "
+        "version_control_system workload_types architecture_preference deployment_model "
+        "preferred_programming_languages database_preferences integration_requirements "
+        "containerization_preference monitoring_requirements backup_requirements maintenance_window_hours "
+        "ci_cd_requirements testing_environment_requirements current_infrastructure technical_constraints"
+    ),
+    "performance": _paths(
+        "technical_requirements",
+        "current_user_load peak_traffic_patterns expected_growth_rate response_time_requirements "
+        "availability_requirements global_distribution load_patterns failover_requirements scaling_triggers "
+        "scaling_timeline performance_requirements scalability_requirements"
+    ),
+    "ai": _paths(
+        "technical_requirements",
+        "ai_use_cases current_ai_maturity expected_data_volume data_types real_time_requirements ml_model_types "
+        "training_frequency inference_volume data_processing_needs ai_integration_complexity "
+        "existing_ml_infrastructure"
+    ),
+}
+
+ALL_GROUPS = tuple(INPUT_GROUPS)
+
+# Input groups each stage depends on, keyed by agent role value
+STAGE_INPUTS: Dict[str, Tuple[str, ...]] = {
+    VALIDATION_STAGE: ALL_GROUPS,
+    "cto": ALL_GROUPS,
+    "cloud_engineer": ("profile", "budget", "compliance", "cloud", "architecture", "performance"),
+    "research": ("profile", "cloud", "architecture"),
+    "mlops": ("profile", "ai", "architecture"),
+    "infrastructure": ("profile", "budget", "cloud", "architecture", "performance"),
+    "compliance": ("profile", "compliance", "cloud"),
+    "ai_consultant": ("profile", "strategy", "budget", "ai"),
+    "web_research": ("profile", "cloud"),
+    "simulation": ("profile", "budget", "architecture", "performance"),
+    "chatbot": ("profile", "strategy"),
+    POST_PROCESSING_STAGE: ALL_GROUPS,
+}
+
+_GROUP_OF_PATH = {path: group for group, paths in INPUT_GROUPS.items() for path in paths}
+
+
+def digest(value: Any) -> str:
+    """Stable short hash of a JSON-compatible value."""
+    encoded = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def input_digests(assessment: Any) -> Dict[str, str]:
+    """Digest of every top-level requirement key and context field."""
+    digests = {}
+    for section in _REQUIREMENT_SECTIONS:
+        values = getattr(assessment, section, None) or {}
+        for key, value in values.items():
+            digests[f"{section}.{key}"] = digest(value)
+    for name in _CONTEXT_FIELDS:
+        value = getattr(assessment, name, None)
+        if value is not None:
+            digests[name] = digest(value)
+    return digests
+
+
+def _to_document(value: Any) -> Any:
+    """Make a stage result BSON-safe (enums, Decimals, custom objects)."""
+    return json.loads(json.dumps(value, default=str))
+
+
+@dataclass
+class StageDecision:
+    """Whether a stage is reused or executed, and why."""
+    stage: str
+    fingerprint: str
+    inputs: Dict[str, str]
+    action: str  # "reused" or "executed"
+    reason: str
+    changed_inputs: List[str] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+
+    @property
+    def reused(self) -> bool:
+        return self.action == "reused"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "action": self.action,
+            "reason": self.reason,
+            "changed_inputs": self.changed_inputs[:20],
+            "fingerprint": self.fingerprint
+        }
+
+
+class IncrementalPlan:
+    """
+    Reuse/execute decisions for one workflow run.
+
+    Stages must be decided upstream first: a stage whose upstream stage was
+    executed is executed as well.
+    """
+
+    def __init__(self, assessment: Any, snapshots: Dict[str, Dict[str, Any]], force: bool = False):
+        self.digests = input_digests(assessment)
+        self.snapshots = snapshots
+        self.force = force
+        self.decisions: Dict[str, StageDecision] = {}
+
+    def _stage_inputs(self, stage: str) -> Dict[str, str]:
+        groups = set(STAGE_INPUTS.get(stage, ALL_GROUPS))
+        return {
+            path: value
+            for path, value in self.digests.items()
+            if _GROUP_OF_PATH.get(path) in groups or path not in _GROUP_OF_PATH
+        }
+
+    def decide(self, stage: str, operation: str = "", upstream: Iterable[str] = ()) -> StageDecision:
+        upstream = list(upstream)
+        inputs = self._stage_inputs(stage)
+        fingerprint = digest({
+            "version": FINGERPRINT_VERSION,
+            "stage": stage,
+            "operation": operation,
+            "inputs": inputs,
+            "upstream": [self.decisions[name].fingerprint for name in upstream if name in self.decisions]
+        })
+        snapshot = self.snapshots.get(stage)
+
+        def executed(reason: str, changed: Optional[List[str]] = None) -> StageDecision:
+            return StageDecision(stage, fingerprint, inputs, "executed", reason, changed or [])
+
+        if self.force:
+            decision = executed("forced")
+        elif snapshot is None:
+            decision = executed("no_snapshot")
+        elif any(not self.decisions[name].reused for name in upstream if name in self.decisions):
+            decision = executed("upstream_changed")
+        elif snapshot.get("fingerprint") != fingerprint:
+            previous = snapshot.get("inputs") or {}
+            changed = sorted(
+                path for path in set(previous) | set(inputs)
+                if previous.get(path) != inputs.get(path)
+            )
+            decision = executed("inputs_changed" if changed else "version_changed", changed)
+        else:
+            decision = StageDecision(stage, fingerprint, inputs, "reused", "unchanged", result=snapshot.get("result"))
+
+        self.decisions[stage] = decision
+        return decision
+
+    def summary(self) -> Dict[str, Any]:
+        reused = [name for name, d in self.decisions.items() if d.reused]
+        return {
+            "reused_stages": reused,
+            "executed_stages": [name for name, d in self.decisions.items() if not d.reused],
+            "forced": self.force,
+            "decisions": {name: d.to_dict() for name, d in self.decisions.items()}
+        }
+
+
+class StageSnapshotStore:
+    """Stored results of successful stages, one document per assessment and stage."""
+
+    def __init__(self, database):
+        self.collection = database[SNAPSHOT_COLLECTION]
+
+    @classmethod
+    def for_document(cls, document) -> "StageSnapshotStore":
+        return cls(document.get_motor_collection().database)
+
+    async def load(self, assessment_id: str) -> Dict[str, Dict[str, Any]]:
+        snapshots = {}
+        async for doc in self.collection.find({"assessment_id": assessment_id}):
+            snapshots[doc["stage"]] = doc
+        return snapshots
+
+    async def save(self, assessment_id: str, decisions: Iterable[Tuple[StageDecision, Dict[str, Any]]]) -> int:
+        """Store results of executed stages; returns how many were written."""
+        now = datetime.utcnow()
+        operations = [
+            ReplaceOne(
+                {"_id": f"{assessment_id}:{decision.stage}"},
+                {
+                    "assessment_id": assessment_id,
+                    "stage": decision.stage,
+                    "fingerprint": decision.fingerprint,
+                    "inputs": decision.inputs,
+                    "result": _to_document(result),
+                    "updated_at": now
+                },
+                upsert=True
+            )
+            for decision, result in decisions
+            if not decision.reused
+        ]
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+        return len(operations)
+
+    async def clear(self, assessment_id: str) -> int:
+        result = await self.collection.delete_many({"assessment_id": assessment_id})
+        return result.deleted_count
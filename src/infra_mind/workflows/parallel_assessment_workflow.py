@@ -9,6 +9,8 @@ Key improvements:
 - Proper error handling with partial success support
 - Progress tracking for real-time updates
 - Backwards compatible with existing AssessmentWorkflow
+- Incremental re-runs: stages whose inputs are unchanged since the last
+  successful run reuse their stored results (see ``incremental.py``)
 """
 
 import asyncio
@@ -27,9 +29,27 @@ from ..services.advanced_compliance_engine import AdvancedComplianceEngine, Comp
 from ..services.predictive_cost_modeling import PredictiveCostModeling, CostScenario
 from ..llm.advanced_prompt_engineering import AdvancedPromptEngineer, PromptTemplate, PromptContext
 from ..orchestration.events import EventManager, EventType
+from .incremental import (
+    IncrementalPlan, StageSnapshotStore, VALIDATION_STAGE, POST_PROCESSING_STAGE
+)
 
 logger = logging.getLogger(__name__)
 
+# (role, operation, timeout seconds) of the agents run in parallel
+AGENT_CONFIGS: List[Tuple[AgentRole, str, int]] = [
+    (AgentRole.CTO, "strategic_analysis", 300),
+    (AgentRole.CLOUD_ENGINEER, "technical_analysis", 300),
+    (AgentRole.RESEARCH, "market_research", 180),
+    (AgentRole.MLOPS, "mlops_pipeline", 240),
+    (AgentRole.INFRASTRUCTURE, "infrastructure_optimization", 240),
+    (AgentRole.COMPLIANCE, "compliance_analysis", 200),
+    (AgentRole.AI_CONSULTANT, "ai_ml_integration", 240),
+    (AgentRole.WEB_RESEARCH, "web_intelligence", 180),
+    (AgentRole.SIMULATION, "performance_simulation", 300),
+    (AgentRole.CHATBOT, "support_setup", 120),
+    # Note: 11th agent can be added here
+]
+
 
 class ParallelAssessmentWorkflow(BaseWorkflow):
     """
@@ -62,11 +82,16 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
         self.cost_modeling = PredictiveCostModeling()
         self.professional_report_generator = ReportGeneratorAgent()
 
+        # Stored stage results for incremental re-runs (resolved from the
+        # assessment's database when not set)
+        self.snapshot_store: Optional[StageSnapshotStore] = None
+
         # Track execution metrics
         self.execution_metrics = {
             "total_agents": 0,
             "completed_agents": 0,
             "failed_agents": 0,
+            "reused_agents": 0,
             "total_time": 0.0,
             "phase_times": {
                 "validation": 0.0,
@@ -107,7 +132,8 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
 
         Args:
             assessment: Assessment to process
-            context: Optional execution context
+            context: Optional execution context; ``full_rerun=True`` ignores
+                stored stage results
 
         Returns:
             WorkflowResult with all recommendations and metadata
@@ -118,9 +144,18 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
         logger.info(f"Starting parallel workflow for assessment {assessment.id}")
 
         try:
+            plan, store = await self._plan_incremental_run(assessment, context.get("full_rerun", False))
+            stage_results: List[Tuple[Any, Dict[str, Any]]] = []
+
             # Phase 1: Data Validation (prerequisite for all agents)
             phase1_start = time.time()
-            validation_result = await self._execute_data_validation(assessment, context)
+            validation_decision = plan.decide(VALIDATION_STAGE, "validate_requirements")
+            if validation_decision.reused:
+                validation_result = validation_decision.result
+            else:
+                validation_result = await self._execute_data_validation(assessment, context)
+                if validation_result["success"]:
+                    stage_results.append((validation_decision, validation_result))
             self.execution_metrics["phase_times"]["validation"] = time.time() - phase1_start
 
             if not validation_result["success"]:
@@ -134,31 +169,61 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
 
             # Phase 2: Execute all agents in PARALLEL (10x faster!)
             phase2_start = time.time()
-            agent_results = await self._execute_agents_parallel(assessment, context, validation_result)
+            agent_results = await self._execute_agents_parallel(assessment, context, validation_result, plan)
             self.execution_metrics["phase_times"]["agents"] = time.time() - phase2_start
-
-            # Phase 3: Synthesis (depends on all agents)
-            phase3_start = time.time()
-            synthesis_result = await self._execute_synthesis(assessment, agent_results)
-            self.execution_metrics["phase_times"]["synthesis"] = time.time() - phase3_start
-
-            # Phase 4: Professional services in parallel
-            phase4_start = time.time()
-            professional_results = await self._execute_professional_services_parallel(
-                assessment, synthesis_result
+            stage_results.extend(
+                (plan.decisions[name], result)
+                for name, result in agent_results.items()
+                if result.get("status") == "completed"
             )
-            self.execution_metrics["phase_times"]["professional_services"] = time.time() - phase4_start
 
-            # Phase 5: Report generation
-            phase5_start = time.time()
-            report_results = await self._execute_report_generation(
-                assessment, synthesis_result, professional_results
+            # Phases 3-5 depend on every agent; reused only if no agent re-ran
+            post_decision = plan.decide(
+                POST_PROCESSING_STAGE,
+                upstream=[role.value for role, _, _ in AGENT_CONFIGS]
             )
-            self.execution_metrics["phase_times"]["reports"] = time.time() - phase5_start
+            if post_decision.reused:
+                logger.info(f"Reusing synthesis, professional services and reports for assessment {assessment.id}")
+                synthesis_result = post_decision.result["synthesis"]
+                professional_results = post_decision.result["professional_services"]
+                report_results = post_decision.result["reports"]
+            else:
+                # Phase 3: Synthesis (depends on all agents)
+                phase3_start = time.time()
+                synthesis_result = await self._execute_synthesis(assessment, agent_results)
+                self.execution_metrics["phase_times"]["synthesis"] = time.time() - phase3_start
+
+                # Phase 4: Professional services in parallel
+                phase4_start = time.time()
+                professional_results = await self._execute_professional_services_parallel(
+                    assessment, synthesis_result
+                )
+                self.execution_metrics["phase_times"]["professional_services"] = time.time() - phase4_start
+
+                # Phase 5: Report generation
+                phase5_start = time.time()
+                report_results = await self._execute_report_generation(
+                    assessment, synthesis_result, professional_results
+                )
+                self.execution_metrics["phase_times"]["reports"] = time.time() - phase5_start
+
+                if not any("error" in phase for phase in (synthesis_result, report_results)):
+                    stage_results.append((post_decision, {
+                        "synthesis": synthesis_result,
+                        "professional_services": professional_results,
+                        "reports": report_results
+                    }))
+
+            await self._save_stage_results(assessment, store, stage_results)
+            incremental_summary = plan.summary()
 
             # Set feature flags to indicate workflow completion
             assessment.recommendations_generated = True
             assessment.reports_generated = True
+            assessment.metadata = assessment.metadata or {}
+            assessment.metadata["incremental_run"] = {
+                key: incremental_summary[key] for key in ("reused_stages", "executed_stages", "forced")
+            }
             await assessment.save()
             logger.info(f"Set feature flags for assessment {assessment.id}")
 
@@ -184,7 +249,8 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
                     "synthesis": synthesis_result,
                     "professional_services": professional_results,
                     "reports": report_results,
-                    "execution_metrics": self.execution_metrics
+                    "execution_metrics": self.execution_metrics,
+                    "incremental": incremental_summary
                 },
                 execution_time=total_time,
                 node_count=len(agent_results),
@@ -216,6 +282,53 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
                 failed_nodes=self.execution_metrics.get("failed_agents", 0)
             )
 
+    async def _plan_incremental_run(
+        self,
+        assessment: Assessment,
+        force: bool
+    ) -> Tuple[IncrementalPlan, Optional[StageSnapshotStore]]:
+        """Load stored stage results and build the reuse/execute plan."""
+        store = self.snapshot_store
+        snapshots: Dict[str, Dict[str, Any]] = {}
+        try:
+            store = store or StageSnapshotStore.for_document(assessment)
+            if not force:
+                snapshots = await store.load(str(assessment.id))
+        except Exception as e:
+            logger.warning(f"Stage snapshots unavailable, running all stages: {e}")
+            store = None
+
+        return IncrementalPlan(assessment, snapshots, force=force), store
+
+    async def predict_reused_agents(self, assessment: Assessment, full_rerun: bool = False) -> List[str]:
+        """
+        Agents a run of ``assessment`` would reuse from stored results.
+
+        Decides the same stages ``execute`` does, so admission control can
+        discount them from the run's cost estimate before it starts.
+        """
+        plan, _ = await self._plan_incremental_run(assessment, full_rerun)
+        plan.decide(VALIDATION_STAGE, "validate_requirements")
+        return [
+            role.value for role, operation, _ in AGENT_CONFIGS
+            if plan.decide(role.value, operation).reused
+        ]
+
+    async def _save_stage_results(
+        self,
+        assessment: Assessment,
+        store: Optional[StageSnapshotStore],
+        stage_results: List[Tuple[Any, Dict[str, Any]]]
+    ) -> None:
+        """Store results of successfully executed stages for the next run."""
+        if store is None:
+            return
+        try:
+            saved = await store.save(str(assessment.id), stage_results)
+            logger.info(f"Stored {saved} stage snapshots for assessment {assessment.id}")
+        except Exception as e:
+            logger.warning(f"Failed to store stage snapshots for assessment {assessment.id}: {e}")
+
     async def _execute_data_validation(
         self,
         assessment: Assessment,
@@ -263,7 +376,8 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
         self,
         assessment: Assessment,
         context: Dict[str, Any],
-        validation_result: Dict[str, Any]
+        validation_result: Dict[str, Any],
+        plan: Optional[IncrementalPlan] = None
     ) -> Dict[str, Any]:
         """
         Execute all 11 agents in PARALLEL for 10x speedup.
@@ -272,24 +386,11 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
         Parallel execution: max of agent times ≈ 1-2 minutes
 
         Uses asyncio.gather() to run agents concurrently with proper error handling.
+        Agents the incremental ``plan`` marks as unchanged are not executed;
+        their stored results are returned with ``reused=True``.
         """
         logger.info("Phase 2: Executing 11 agents in parallel (10x faster!)")
 
-        # Define all agents with their configurations
-        agent_configs = [
-            (AgentRole.CTO, "strategic_analysis", 300),
-            (AgentRole.CLOUD_ENGINEER, "technical_analysis", 300),
-            (AgentRole.RESEARCH, "market_research", 180),
-            (AgentRole.MLOPS, "mlops_pipeline", 240),
-            (AgentRole.INFRASTRUCTURE, "infrastructure_optimization", 240),
-            (AgentRole.COMPLIANCE, "compliance_analysis", 200),
-            (AgentRole.AI_CONSULTANT, "ai_ml_integration", 240),
-            (AgentRole.WEB_RESEARCH, "web_intelligence", 180),
-            (AgentRole.SIMULATION, "performance_simulation", 300),
-            (AgentRole.CHATBOT, "support_setup", 120),
-            # Note: 11th agent can be added here
-        ]
-
         # Prepare context with validation results
         agent_context = {
             **context,
@@ -300,8 +401,15 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
         # Create tasks for parallel execution
         agent_tasks = []
         agent_names = []
+        agent_results = {}
+
+        for agent_role, operation, timeout in AGENT_CONFIGS:
+            if plan is not None and plan.decide(agent_role.value, operation).reused:
+                agent_results[agent_role.value] = {**plan.decisions[agent_role.value].result, "reused": True}
+                self.execution_metrics["reused_agents"] += 1
+                self.execution_metrics["completed_agents"] += 1
+                continue
 
-        for agent_role, operation, timeout in agent_configs:
             task = self._execute_single_agent(
                 assessment,
                 agent_role,
@@ -312,17 +420,19 @@ class ParallelAssessmentWorkflow(BaseWorkflow):
             agent_tasks.append(task)
             agent_names.append(agent_role.value)
 
-        self.execution_metrics["total_agents"] = len(agent_tasks)
+        self.execution_metrics["total_agents"] = len(AGENT_CONFIGS)
 
         # Execute all agents in parallel with progress tracking
-        logger.info(f"Launching {len(agent_tasks)} agents in parallel...")
+        logger.info(
+            f"Launching {len(agent_tasks)} agents in parallel "
+            f"({len(agent_results)} reused from the previous run)..."
+        )
 
         # Use asyncio.gather with return_exceptions to handle partial failures
         results = await asyncio.gather(*agent_tasks, return_exceptions=True)
 
         # Process results
-        agent_results = {}
-        successful_agents = []
+        successful_agents = list(agent_results)
         failed_agents = []
 
         for agent_name, result in zip(agent_names, results):
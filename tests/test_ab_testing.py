@@ -0,0 +1,189 @@
+"""
+Tests for A/B experiment statistics counters and their backfill.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.infra_mind.quality import ab_testing
+from src.infra_mind.quality.ab_testing import ASSIGNMENT_EVENT, ABTestingFramework, EventStatistics
+
+
+def _matches(document, query):
+    """Evaluate the subset of MongoDB filters the framework uses."""
+    for key, condition in query.items():
+        if key == "$nor":
+            if any(_matches(document, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict) and "$exists" in condition:
+            if (key in document) != condition["$exists"]:
+                return False
+        elif isinstance(condition, dict) and "$lt" in condition:
+            if not document.get(key) < condition["$lt"]:
+                return False
+        elif document.get(key) != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+    async def to_list(self, length=None):
+        return self.documents
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents = []
+
+    async def insert_one(self, document):
+        self.documents.append(dict(document))
+
+    async def find_one(self, query, projection=None):
+        return next((dict(d) for d in self.documents if _matches(d, query)), None)
+
+    def find(self, query, projection=None):
+        return FakeCursor([dict(d) for d in self.documents if _matches(d, query)])
+
+    async def update_one(self, query, update, upsert=False):
+        document = next((d for d in self.documents if _matches(d, query)), None)
+        if document is None:
+            if not upsert:
+                return
+            document = {k: v for k, v in query.items() if not isinstance(v, dict)}
+            self.documents.append(document)
+        self._apply(document, update)
+
+    async def update_many(self, query, update):
+        for document in [d for d in self.documents if _matches(d, query)]:
+            self._apply(document, update)
+
+    @staticmethod
+    def _apply(document, update):
+        for key, amount in update.get("$inc", {}).items():
+            document[key] = document.get(key, 0) + amount
+        document.update(update.get("$set", {}))
+        for key in update.get("$unset", {}):
+            document.pop(key, None)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.experiments = FakeCollection()
+        self.experiment_assignments = FakeCollection()
+        self.experiment_events = FakeCollection()
+        self.experiment_variant_stats = FakeCollection()
+
+
+@pytest.fixture
+def framework():
+    framework = ABTestingFramework(cache_manager=None)
+    framework.db = db = FakeDatabase()
+    framework.aggregations = 0
+
+    async def aggregate(experiment_id, before=None):
+        # What the $group pipelines compute, over the fake collections
+        framework.aggregations += 1
+        result = {}
+        for assignment in db.experiment_assignments.documents:
+            if assignment["experiment_id"] == experiment_id and (before is None or assignment["assigned_at"] < before):
+                stats = result.setdefault(assignment["variant_id"], {}).setdefault(ASSIGNMENT_EVENT, EventStatistics())
+                stats.count += 1
+        for event in db.experiment_events.documents:
+            if event["experiment_id"] == experiment_id and (before is None or event["timestamp"] < before):
+                stats = result.setdefault(event["variant_id"], {}).setdefault(event["event_name"], EventStatistics())
+                stats.count += 1
+                value = event["event_data"].get("value")
+                if value is not None:
+                    stats.value_count += 1
+                    stats.value_sum += value
+                    stats.value_sum_sq += value * value
+        return result
+
+    framework._aggregate_variant_statistics = aggregate
+    return framework
+
+
+def _seed_running_experiment(db, users=4):
+    """An experiment with assignments and events recorded before the counters existed."""
+    earlier = datetime.utcnow() - timedelta(hours=1)
+    db.experiments.documents.append({"experiment_id": "exp", "name": "Experiment"})
+    for i in range(users):
+        variant_id = "control" if i % 2 else "treatment"
+        db.experiment_assignments.documents.append({
+            "experiment_id": "exp", "user_id": f"u{i}", "variant_id": variant_id, "assigned_at": earlier
+        })
+        db.experiment_events.documents.append({
+            "experiment_id": "exp", "variant_id": variant_id, "user_id": f"u{i}",
+            "event_name": "conversion", "event_data": {"value": i}, "timestamp": earlier
+        })
+
+
+def _counts(statistics_by_variant):
+    return {
+        variant_id: {event_name: (stats.count, stats.value_sum) for event_name, stats in events.items()}
+        for variant_id, events in statistics_by_variant.items()
+    }
+
+
+@pytest.mark.asyncio
+async def test_first_counter_write_does_not_hide_earlier_records(framework, monkeypatch):
+    _seed_running_experiment(framework.db)
+
+    await framework.record_experiment_event("u0", "conversion", {"value": 10})
+    expected = _counts(await framework._aggregate_variant_statistics("exp"))
+    assert expected["treatment"]["conversion"] == (3, 12.0)
+
+    # Inside the grace period the raw collections are still authoritative
+    assert _counts(await framework._load_variant_statistics("exp")) == expected
+    assert not (await framework.db.experiments.find_one({"experiment_id": "exp"})).get("counters_complete")
+
+    monkeypatch.setattr(ab_testing, "COUNTER_BACKFILL_GRACE", timedelta(0))
+    assert _counts(await framework._load_variant_statistics("exp")) == expected
+    assert (await framework.db.experiments.find_one({"experiment_id": "exp"}))["counters_complete"]
+
+    # Later reads come from the counters alone
+    await framework.record_experiment_event("u1", "conversion", {"value": 5})
+    aggregations = framework.aggregations
+    statistics = _counts(await framework._load_variant_statistics("exp"))
+    assert framework.aggregations == aggregations
+    assert statistics["control"]["conversion"] == (3, 9.0)
+    assert statistics["control"][ASSIGNMENT_EVENT] == (2, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_keeps_concurrent_increments_and_is_repeatable(framework):
+    _seed_running_experiment(framework.db)
+    for value in (1, 2, 3):
+        await framework.record_experiment_event("u0", "conversion", {"value": value})
+
+    assert await framework.rebuild_experiment_statistics("exp")
+    # An increment landing between rebuilds is kept
+    await framework.record_experiment_event("u0", "conversion", {"value": 4})
+    assert await framework.rebuild_experiment_statistics("exp")
+
+    statistics = _counts(await framework._load_variant_statistics("exp"))
+    assert statistics["treatment"]["conversion"] == (6, 12.0)
+    assert statistics == _counts(await framework._aggregate_variant_statistics("exp"))
+
+
+@pytest.mark.asyncio
+async def test_observations_before_the_counters_are_left_to_the_backfill(framework):
+    framework.db.experiments.documents.append({"experiment_id": "exp"})
+    since = await framework._get_counters_since("exp")
+
+    await framework._increment_variant_statistics("exp", "control", "click", since - timedelta(milliseconds=1))
+    await framework._increment_variant_statistics("exp", "control", "click", since, 2.0)
+
+    (counter,) = framework.db.experiment_variant_stats.documents
+    assert counter["count"] == 1 and counter["value_sum"] == 2.0
@@ -0,0 +1,171 @@
+"""
+Tests for priority- and cost-aware assessment admission control.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.infra_mind.orchestration.admission_control import (
+    AdmissionController,
+    AssessmentCostEstimator,
+    CostEstimate,
+    WorkloadClass,
+    workflow_tokens_used,
+)
+
+
+def _estimate(tokens: int = 1000) -> CostEstimate:
+    return CostEstimate(tokens=tokens, seconds=1.0, base_tokens=tokens, prompt_tokens=100)
+
+
+async def _run(controller, order, name, tenant, workload_class, release, tokens=1000):
+    async with controller.admit(name, tenant, workload_class, _estimate(tokens)) as admission:
+        order.append(name)
+        await release.wait()
+        admission.record_actual_tokens(tokens)
+
+
+@pytest.mark.asyncio
+async def test_interactive_admitted_before_queued_batch():
+    controller = AdmissionController(max_concurrent=1, interactive_reserved_slots=0)
+    order, release = [], asyncio.Event()
+
+    tasks = [asyncio.create_task(_run(controller, order, "batch-0", "a", WorkloadClass.BATCH, release))]
+    await asyncio.sleep(0)
+    tasks += [
+        asyncio.create_task(_run(controller, order, f"batch-{i}", "a", WorkloadClass.BATCH, release))
+        for i in range(1, 4)
+    ]
+    tasks.append(asyncio.create_task(_run(controller, order, "interactive", "b", WorkloadClass.INTERACTIVE, release)))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert order[:2] == ["batch-0", "interactive"]
+    assert controller.get_metrics()["completed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_batch_never_uses_reserved_interactive_slots():
+    controller = AdmissionController(max_concurrent=3, interactive_reserved_slots=1)
+    order, release = [], asyncio.Event()
+
+    tasks = [
+        asyncio.create_task(_run(controller, order, f"batch-{i}", "a", WorkloadClass.BATCH, release))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert order == ["batch-0", "batch-1"]
+
+    tasks.append(asyncio.create_task(_run(controller, order, "interactive", "b", WorkloadClass.INTERACTIVE, release)))
+    await asyncio.sleep(0)
+    assert order[-1] == "interactive"
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_tenants_share_capacity_fairly():
+    controller = AdmissionController(max_concurrent=1, interactive_reserved_slots=0)
+    order, release = [], asyncio.Event()
+
+    tasks = [
+        asyncio.create_task(_run(controller, order, f"a-{i}", "tenant-a", WorkloadClass.INTERACTIVE, release))
+        for i in range(4)
+    ]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(_run(controller, order, "b-0", "tenant-b", WorkloadClass.INTERACTIVE, release)))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    # tenant-b's single request is not queued behind tenant-a's whole burst
+    assert order.index("b-0") == 1
+
+
+@pytest.mark.asyncio
+async def test_token_budget_limits_concurrent_admissions():
+    controller = AdmissionController(max_concurrent=4, interactive_reserved_slots=0, max_tokens_in_flight=1500)
+    order, release = [], asyncio.Event()
+
+    tasks = [
+        asyncio.create_task(_run(controller, order, f"run-{i}", "a", WorkloadClass.INTERACTIVE, release))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert order == ["run-0"]
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert controller.tokens_in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    controller = AdmissionController(max_concurrent=1, interactive_reserved_slots=0)
+    order, release = [], asyncio.Event()
+
+    running = asyncio.create_task(_run(controller, order, "running", "a", WorkloadClass.INTERACTIVE, release))
+    waiting = asyncio.create_task(_run(controller, order, "waiting", "a", WorkloadClass.INTERACTIVE, release))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    release.set()
+    await running
+    metrics = controller.get_metrics()
+    assert metrics["cancelled"] == 1
+    assert metrics["queued"] == {"interactive": 0, "batch": 0}
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_queue_wait_and_prediction_error():
+    controller = AdmissionController(max_concurrent=1, interactive_reserved_slots=0)
+
+    async with controller.admit("one", "a", WorkloadClass.INTERACTIVE, _estimate(1000)) as admission:
+        admission.record_actual_tokens(1500)
+
+    metrics = controller.get_metrics()
+    assert metrics["queue_wait_seconds"]["interactive"]["p95"] >= 0
+    assert metrics["prediction"]["tokens"]["samples"] == 1
+    assert metrics["prediction"]["tokens"]["mean_actual_to_predicted"] == 1.5
+    assert metrics["prediction"]["token_correction"] > 1.0
+
+
+def test_estimator_scales_with_requirements_and_learns():
+    estimator = AssessmentCostEstimator(agent_count=11)
+    small = SimpleNamespace(business_requirements={"company_size": "small"}, technical_requirements={})
+    large = SimpleNamespace(
+        business_requirements={"goals": ["reduce cost"] * 200},
+        technical_requirements={"workloads": ["web", "ml", "batch"] * 100}
+    )
+
+    small_estimate = estimator.estimate(small)
+    assert estimator.estimate(large).tokens > small_estimate.tokens
+
+    estimator.observe(small_estimate, actual_tokens=small_estimate.base_tokens * 2, actual_seconds=10.0)
+    assert estimator.estimate(small).tokens > small_estimate.tokens
+
+
+def test_estimator_discounts_reused_agents():
+    estimator = AssessmentCostEstimator(agent_count=10)
+    assessment = SimpleNamespace(business_requirements={"company_size": "small"}, technical_requirements={})
+
+    full = estimator.estimate(assessment)
+    incremental = estimator.estimate(assessment, reused_agents=8)
+
+    assert incremental.base_tokens == full.base_tokens // 10 * 2
+    assert estimator.estimate(assessment, reused_agents=10).tokens == 1
+
+
+def test_reused_agent_results_do_not_count_as_spent_tokens():
+    result = SimpleNamespace(final_data={"agent_results": {
+        "cto": {"status": "completed", "metrics": {"llm_tokens_used": 1200}},
+        "research": {"status": "completed", "reused": True, "metrics": {"llm_tokens_used": 900}},
+    }})
+
+    assert workflow_tokens_used(result) == 1200
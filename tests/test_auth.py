@@ -7,7 +7,10 @@ Tests JWT token management, password hashing, and authentication flows.
 import asyncio
 import pytest
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import List, Optional
 import jwt
+from pydantic import BaseModel, PrivateAttr
 from unittest.mock import patch, AsyncMock
 
 from src.infra_mind.core.auth import (
@@ -19,6 +22,7 @@ from src.infra_mind.core.auth import (
     SECRET_KEY,
     ALGORITHM,
 )
+from src.infra_mind.core.principal_cache import BloomFilter, PrincipalCache
 from src.infra_mind.core.rbac import Role, Permission, AccessControl, RolePermissions
 
 
@@ -40,6 +44,46 @@ class DummyUser:
         self.is_active = is_active
 
 
+class StoredUser(BaseModel):
+    """Pydantic stand-in for the User document (Beanie needs a database to validate)."""
+
+    id: str = "user123"
+    email: str = "test@example.com"
+    is_active: bool = True
+    hashed_password: str
+    mfa_secret: Optional[str] = None
+    mfa_backup_codes: List[str] = []
+    _credentials_loaded: bool = PrivateAttr(default=True)
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the principal cache uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.sorted_sets = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def zadd(self, key, mapping):
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+
+    def zrangebyscore(self, key, low, high):
+        return [member for member, score in self.sorted_sets.get(key, {}).items() if score >= low]
+
+    def zremrangebyscore(self, key, low, high):
+        members = self.sorted_sets.get(key, {})
+        for member in [member for member, score in members.items() if score <= high]:
+            del members[member]
+
+
 @pytest.fixture
 def token_manager() -> TokenManager:
     """Provide a TokenManager instance for tests."""
@@ -294,6 +338,17 @@ class TestAccessControl:
         ) is True
 
 
+class TestPermissionBitsets:
+    """Test compiled permission bitmasks."""
+    
+    def test_masks_match_permission_sets(self):
+        """Test compiled masks agree with the permission sets."""
+        for role in Role:
+            for permission in Permission:
+                expected = permission in RolePermissions.get_permissions(role)
+                assert RolePermissions.has_permission(role, permission) is expected
+
+
 class TestAuthenticationIntegration:
     """Test authentication integration scenarios."""
     
@@ -373,3 +428,116 @@ class TestAuthenticationIntegration:
         assert AccessControl.user_has_permission(manager, Permission.CREATE_ASSESSMENT) is True
         assert AccessControl.user_has_permission(user, Permission.CREATE_ASSESSMENT) is True
         assert AccessControl.user_has_permission(viewer, Permission.CREATE_ASSESSMENT) is False
+
+
+class TestPrincipalCache:
+    """Test cached principal resolution."""
+    
+    def test_bloom_filter_membership(self):
+        """Test bloom filter has no false negatives."""
+        bloom = BloomFilter(capacity=1000)
+        keys = [f"jti-{i}" for i in range(500)]
+        for key in keys:
+            bloom.add(key)
+        
+        assert all(key in bloom for key in keys)
+        false_positives = sum(f"other-{i}" in bloom for i in range(1000))
+        assert false_positives < 20
+    
+    @pytest.mark.asyncio
+    async def test_get_user_hits_cache(self, monkeypatch):
+        """Test repeated lookups only read the database once."""
+        user = DummyUser()
+        user_get = AsyncMock(return_value=user)
+        monkeypatch.setattr("src.infra_mind.core.principal_cache.User.get", user_get)
+        cache = PrincipalCache(redis_client=None, enabled=True)
+        
+        assert await cache.get_user("user123") is user
+        assert await cache.get_user("user123") is user
+        assert user_get.await_count == 1
+        
+        cache.invalidate_user("user123")
+        await cache.get_user("user123")
+        assert user_get.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_get_current_user_skips_blacklist_when_cached(self, monkeypatch):
+        """Test hot path bypasses the blacklist until the token is revoked."""
+        user = DummyUser()
+        monkeypatch.setattr(
+            "src.infra_mind.core.principal_cache.User.get",
+            AsyncMock(return_value=user),
+        )
+        service = AuthService()
+        service.principal_cache = PrincipalCache(redis_client=None, enabled=True)
+        monkeypatch.setattr("src.infra_mind.core.auth.principal_cache", service.principal_cache)
+        token = service.token_manager.create_access_token(user)
+        is_blacklisted = AsyncMock(return_value=False)
+        monkeypatch.setattr(service.token_manager.blacklist, "is_blacklisted", is_blacklisted)
+        
+        assert await service.get_current_user(token) is user
+        assert await service.get_current_user(token) is user
+        assert is_blacklisted.await_count == 1
+        
+        await service.token_manager.revoke_token(token)
+        is_blacklisted.return_value = True
+        with pytest.raises(AuthenticationError, match="Token has been revoked"):
+            await service.get_current_user(token)
+    
+    @pytest.mark.asyncio
+    async def test_redis_tier_never_stores_credentials(self, monkeypatch):
+        """Test the shared tier holds a projection and writers re-read credentials."""
+        user_get = AsyncMock(return_value=StoredUser(
+            hashed_password="$2b$12$hash", mfa_secret="TOTPSECRET", mfa_backup_codes=["code-hash"]
+        ))
+        monkeypatch.setattr("src.infra_mind.core.principal_cache.User", SimpleNamespace(
+            get=user_get, model_validate=StoredUser.model_validate
+        ))
+        redis = FakeRedis()
+        
+        await PrincipalCache(redis_client=redis, enabled=True).get_user("user123")
+        payload = redis.values["principal:user123"]
+        assert "TOTPSECRET" not in payload and "$2b$12$hash" not in payload and "code-hash" not in payload
+        
+        # Another process is served from Redis without touching MongoDB
+        cached = await PrincipalCache(redis_client=redis, enabled=True).get_user("user123")
+        assert cached.email == "test@example.com" and cached.mfa_secret is None
+        assert cached.hashed_password == ""
+        assert user_get.await_count == 1
+        
+        full = await PrincipalCache(redis_client=redis, enabled=True).load_credentials(cached)
+        assert full.mfa_secret == "TOTPSECRET"
+        assert user_get.await_count == 2
+    
+    def test_revocation_on_another_process_ends_the_blacklist_bypass(self, monkeypatch):
+        """Test a logout elsewhere is honoured within the poll interval, not the cache TTL."""
+        clock = SimpleNamespace(monotonic=lambda: clock.now, time=lambda: 1_000_000 + clock.now, now=0.0)
+        monkeypatch.setattr("src.infra_mind.core.principal_cache.time", clock)
+        redis = FakeRedis()
+        cache = PrincipalCache(redis_client=redis, enabled=True, ttl_seconds=30, revocation_poll_seconds=1)
+        other = PrincipalCache(redis_client=redis, enabled=True, ttl_seconds=30, revocation_poll_seconds=1)
+        cache.mark_token_verified("jti-1", "user123")
+        cache.mark_token_verified("jti-2", "user123")
+        assert cache.is_token_verified("jti-1", "user123")
+        
+        clock.now = 0.2
+        other.invalidate_token("jti-1")
+        # Still inside the poll interval
+        assert cache.is_token_verified("jti-1", "user123")
+        
+        clock.now = 1.1
+        assert not cache.is_token_verified("jti-1", "user123")
+        assert cache.is_token_verified("jti-2", "user123")
+        
+        other.invalidate_user("user123")
+        clock.now = 2.2
+        assert not cache.is_token_verified("jti-2", "user123")
+    
+    def test_unreadable_revocation_log_disables_the_bypass(self):
+        """Test verified tokens go back to the blacklist when Redis cannot be read."""
+        redis = FakeRedis()
+        redis.zrangebyscore = lambda *args: (_ for _ in ()).throw(ConnectionError("down"))
+        cache = PrincipalCache(redis_client=redis, enabled=True)
+        cache.mark_token_verified("jti-1", "user123")
+        
+        assert not cache.is_token_verified("jti-1", "user123")
@@ -0,0 +1,98 @@
+"""
+Offline roundtrip tests for the chunked backup format and resumable restore.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import bson
+import pytest
+from bson.raw_bson import RawBSONDocument
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from backup_restore import (  # noqa: E402
+    BackupRestoreManager,
+    ChunkedCollectionWriter,
+    iter_chunk_batches,
+)
+
+
+class InsertResult:
+    def __init__(self, inserted_ids):
+        self.inserted_ids = inserted_ids
+
+
+class FakeCollection:
+    def __init__(self, fail_after=None):
+        self.documents = []
+        self.fail_after = fail_after
+
+    def with_options(self, codec_options=None):
+        return self
+
+    async def drop(self):
+        self.documents.clear()
+
+    async def insert_many(self, documents, ordered=True):
+        if self.fail_after is not None and len(self.documents) >= self.fail_after:
+            raise ConnectionError("connection lost")
+        self.documents.extend(bson.decode(document.raw) for document in documents)
+        return InsertResult([document["_id"] for document in documents])
+
+
+def _write_backup(backup_dir, documents, compression):
+    writer = ChunkedCollectionWriter(backup_dir, "items", compression=compression, chunk_documents=4)
+    for start in range(0, len(documents), 3):
+        writer.write_batch([RawBSONDocument(bson.encode(d)) for d in documents[start:start + 3]])
+    chunks = writer.close()
+    metadata = {
+        "backup_id": "backup_test",
+        "timestamp": "2024-01-01T00:00:00",
+        "collections": {
+            "items": {"chunks": chunks, "format": "bson", "compression": compression, "document_count": len(documents)}
+        },
+    }
+    (backup_dir / "backup_metadata.json").write_text(json.dumps(metadata))
+    return chunks
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_chunks_roundtrip_in_batches(tmp_path, compression):
+    documents = [{"_id": i, "name": f"item-{i}"} for i in range(10)]
+
+    chunks = _write_backup(tmp_path, documents, compression)
+
+    assert [chunk["document_count"] for chunk in chunks] == [4, 4, 2]
+    read = [
+        bson.decode(document.raw)
+        for chunk in chunks
+        for batch in iter_chunk_batches(tmp_path / chunk["file"], "bson", compression, batch_size=3)
+        for document in batch
+    ]
+    assert read == documents
+
+
+@pytest.mark.asyncio
+async def test_interrupted_restore_resumes_from_checkpoint(tmp_path):
+    documents = [{"_id": i} for i in range(10)]
+    _write_backup(tmp_path, documents, "gzip")
+    manager = BackupRestoreManager("restore_test", batch_size=2)
+    collection = FakeCollection(fail_after=4)
+    manager.database = {"items": collection}
+
+    result = await manager.restore_backup(str(tmp_path))
+
+    assert result["errors"]
+    checkpoint = json.loads((tmp_path / "restore_checkpoint_restore_test.json").read_text())
+    assert checkpoint["collections"]["items"]["completed_chunks"] == ["items.00000.bson.gz"]
+
+    collection.fail_after = None
+    result = await manager.restore_backup(str(tmp_path), drop_existing=True)
+
+    assert not result["errors"]
+    assert result["collections"]["items"]["chunks_skipped"] == 1
+    assert result["total_documents_restored"] == 10
+    assert sorted(d["_id"] for d in collection.documents) == list(range(10))
+    assert not (tmp_path / "restore_checkpoint_restore_test.json").exists()
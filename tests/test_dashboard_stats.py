@@ -0,0 +1,189 @@
+"""
+Tests for the materialized dashboard counters.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.infra_mind.services.dashboard_stats import DashboardStatsStore
+
+
+def _matches(document, query):
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(_matches(document, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict) and "$in" in condition:
+            if document.get(key) not in condition["$in"]:
+                return False
+        elif isinstance(condition, dict) and "$lt" in condition:
+            if not document.get(key) < condition["$lt"]:
+                return False
+        elif document.get(key) != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            self.documents.sort(key=lambda d: d.get(field) or 0, reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents = {}
+        self.updates = []
+
+    def find(self, query, projection=None):
+        return FakeCursor([dict(d) for d in self.documents.values() if _matches(d, query)])
+
+    async def find_one(self, query, projection=None):
+        return next((dict(d) for d in self.documents.values() if _matches(d, query)), None)
+
+    async def find_one_and_replace(self, query, replacement, upsert=False, return_document=None):
+        previous = self.documents.get(query["_id"])
+        self.documents[query["_id"]] = {**replacement, "_id": query["_id"]}
+        return previous
+
+    async def find_one_and_delete(self, query):
+        return self.documents.pop(query["_id"], None)
+
+    async def replace_one(self, query, replacement, upsert=False):
+        self.documents[query["_id"]] = {**replacement, "_id": query["_id"]}
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            await self.replace_one(operation._filter, operation._doc)
+
+    async def delete_many(self, query):
+        for key in [k for k, d in self.documents.items() if _matches(d, query)]:
+            del self.documents[key]
+
+    async def update_one(self, query, update, upsert=False):
+        self.updates.append(update)
+        document = self.documents.setdefault(query["_id"], {"_id": query["_id"]})
+        if isinstance(update, list):
+            # Pipeline list updates: keep the literal summary, if any, for assertions
+            (stage,) = update
+            for path, expression in stage["$set"].items():
+                merged = expression["$slice"][0]["$sortArray"]["input"]
+                literal = merged["$concatArrays"][1][0]["$literal"] if "$concatArrays" in merged else None
+                document[path] = literal
+            return
+        for path, amount in update.get("$inc", {}).items():
+            document[path] = document.get(path, 0) + amount
+        document.update(update.get("$set", {}))
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+    def __getattr__(self, name):
+        return self[name]
+
+
+@pytest.fixture
+def store():
+    return DashboardStatsStore(FakeDatabase())
+
+
+def _assessment(**overrides):
+    return {
+        "_id": "a1", "user_id": "u1", "title": "Migration", "status": "draft",
+        "completion_percentage": 10.0, "created_at": datetime(2024, 1, 1), "updated_at": datetime(2024, 1, 1),
+        **overrides,
+    }
+
+
+@pytest.mark.asyncio
+async def test_status_change_moves_the_count_between_buckets(store):
+    await store.record_change("assessments", _assessment())
+    await store.record_change("assessments", _assessment(status="completed", completion_percentage=100.0))
+
+    stats = store.stats.documents["u1"]
+    assert stats["assessments.total"] == 1
+    assert stats["assessments.status.draft"] == 0
+    assert stats["assessments.status.completed"] == 1
+    assert stats["assessments.completion_sum"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_unchanged_save_skips_the_stats_document(store):
+    await store.record_change("assessments", _assessment())
+    writes = len(store.stats.updates)
+
+    await store.record_change("assessments", _assessment())
+
+    assert len(store.stats.updates) == writes
+
+
+@pytest.mark.asyncio
+async def test_summary_only_change_updates_the_list_without_inc(store):
+    await store.record_change("assessments", _assessment())
+    writes = len(store.stats.updates)
+
+    await store.record_change("assessments", _assessment(title="Renamed"))
+
+    (update,) = store.stats.updates[writes:]
+    assert isinstance(update, list)
+    assert store.stats.documents["u1"]["assessments.recent"]["title"] == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_delete_takes_the_contribution_off(store):
+    await store.record_change("reports", {"_id": "r1", "user_id": "u1", "report_type": "full", "status": "completed"})
+    await store.record_change("reports", {"_id": "r1"}, deleted=True)
+
+    stats = store.stats.documents["u1"]
+    assert stats["reports.total"] == 0
+    assert stats["reports.recent"] == []
+    assert store.contributions.documents == {}
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rebuilds_stats_and_contributions(store):
+    db = store.db
+    db.assessments.documents = {
+        "a1": _assessment(),
+        "a2": _assessment(_id="a2", status="completed", completion_percentage=100.0),
+    }
+    db.recommendations.documents = {
+        "rec1": {"_id": "rec1", "assessment_id": "a1", "priority": "high", "category": "cost", "confidence_score": 0.8},
+    }
+    # Drifted counters and an entry for a document that no longer exists
+    store.stats.documents["u1"] = {"_id": "u1", "assessments": {"total": 7}}
+    store.contributions.documents["assessments:gone"] = {
+        "_id": "assessments:gone", "user_id": "u1", "counters": [], "updated_at": datetime(2000, 1, 1)
+    }
+
+    stats = await store.reconcile_user("u1")
+
+    assert stats["assessments"]["total"] == 2
+    assert stats["assessments"]["status"] == {"draft": 1, "completed": 1}
+    assert stats["recommendations"]["priority"] == {"high": 1}
+    assert [summary["id"] for summary in stats["recommendations"]["top"]] == ["rec1"]
+    assert set(store.contributions.documents) == {"assessments:a1", "assessments:a2", "recommendations:rec1"}
+
+    # Contributions written by the reconcile let the next unchanged save skip the stats
+    writes = len(store.stats.updates)
+    await store.record_change("assessments", _assessment())
+    assert len(store.stats.updates) == writes
@@ -0,0 +1,168 @@
+"""
+Tests for the pipelined collection migration and its checkpoint resume.
+"""
+
+import asyncio
+
+import pytest
+from bson.objectid import ObjectId
+
+from src.infra_mind.core.data_migration import (
+    DataMigrationManager,
+    MigrationConfig,
+    _BSON_SORT_ORDER,
+    _bson_sort_rank,
+    _resume_query,
+)
+
+
+def _sort_key(value):
+    return _bson_sort_rank(value), value
+
+
+def _matches(document, query):
+    """Evaluate the resume queries the migration issues."""
+    if not query:
+        return True
+    if "$or" in query:
+        return any(_matches(document, clause) for clause in query["$or"])
+    condition = query["_id"]
+    value = document["_id"]
+    if "$type" in condition:
+        return _BSON_SORT_ORDER[_bson_sort_rank(value)][0] in condition["$type"]
+    last = condition["$gt"]
+    return _bson_sort_rank(value) == _bson_sort_rank(last) and value > last
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key, direction):
+        self.documents.sort(key=lambda d: _sort_key(d[key]), reverse=direction < 0)
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+
+class FakeCollection:
+    def __init__(self, documents=None):
+        self.documents = list(documents or [])
+        self.fail_on_id = None
+
+    async def count_documents(self, query):
+        return len(self.documents)
+
+    def find(self, query):
+        return FakeCursor([dict(d) for d in self.documents if _matches(d, query)])
+
+    async def find_one(self, query):
+        return next((dict(d) for d in self.documents if d["_id"] == query["_id"]), None)
+
+    async def replace_one(self, query, document, upsert=False):
+        await self.delete_one(query)
+        self.documents.append({**document, "_id": query["_id"]})
+
+    async def delete_one(self, query):
+        self.documents = [d for d in self.documents if d["_id"] != query["_id"]]
+
+    async def bulk_write(self, requests, ordered=True):
+        documents = [request._doc for request in requests]
+        if any(document["_id"] == self.fail_on_id for document in documents):
+            raise ConnectionError("connection lost")
+        written = {document["_id"] for document in documents}
+        self.documents = [d for d in self.documents if d["_id"] not in written] + documents
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+
+def _manager(source_documents, **overrides):
+    config = MigrationConfig(
+        source_database="source", target_database="target", backup_enabled=False, **overrides
+    )
+    manager = DataMigrationManager(config)
+    manager.source_db = FakeDatabase(items=FakeCollection(source_documents))
+    manager.target_db = FakeDatabase()
+    return manager
+
+
+def _mark_migrated(document):
+    return {**document, "migrated": True}
+
+
+def test_resume_query_includes_later_bson_types():
+    assert _resume_query(None) == {}
+    query = _resume_query("m")
+    assert query["$or"][0] == {"_id": {"$gt": "m"}}
+    assert {"objectId", "bool", "date"} <= set(query["$or"][1]["_id"]["$type"])
+    assert "number" not in query["$or"][1]["_id"]["$type"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_migrates_every_document_and_clears_the_checkpoint():
+    documents = [{"_id": i, "value": i} for i in range(23)]
+    manager = _manager(documents, batch_size=4, transform_workers=3, queue_size=1)
+
+    result = await manager.migrate_collection("items", _mark_migrated)
+
+    assert result.success
+    assert result.records_processed == result.records_migrated == 23
+    target = manager.target_db["items"].documents
+    assert sorted(d["_id"] for d in target) == list(range(23))
+    assert all(d["migrated"] for d in target)
+    assert manager.target_db["_migration_checkpoints"].documents == []
+
+
+@pytest.mark.asyncio
+async def test_interrupted_migration_resumes_across_id_types():
+    object_ids = [ObjectId() for _ in range(5)]
+    documents = [{"_id": f"s{i}"} for i in range(5)] + [{"_id": oid} for oid in object_ids]
+    manager = _manager(documents, batch_size=4, transform_workers=1)
+    target = manager.target_db["items"]
+    target.fail_on_id = object_ids[0]
+
+    result = await manager.migrate_collection("items", _mark_migrated)
+
+    assert not result.success
+    (checkpoint,) = manager.target_db["_migration_checkpoints"].documents
+    assert checkpoint["last_id"] == "s3" and checkpoint["processed"] == 4
+
+    target.fail_on_id = None
+    result = await manager.migrate_collection("items", _mark_migrated)
+
+    assert result.success
+    assert result.records_processed == 10
+    assert {d["_id"] for d in target.documents} == {d["_id"] for d in documents}
+
+
+@pytest.mark.asyncio
+async def test_async_transforms_within_a_batch_run_concurrently():
+    running = 0
+    peak = 0
+
+    async def transformer(document):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return document
+
+    manager = _manager([{"_id": i} for i in range(8)], batch_size=4, transform_workers=1)
+
+    result = await manager.migrate_collection("items", transformer)
+
+    assert result.records_migrated == 8
+    assert peak == 4
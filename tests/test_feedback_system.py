@@ -0,0 +1,94 @@
+"""
+Tests for the in-memory feedback index and rolling feedback aggregates.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.infra_mind.feedback.system import (
+    FeedbackAnalyzer,
+    FeedbackCollector,
+    FeedbackIndex,
+    UserFeedback,
+)
+
+
+def _feedback(hours_ago=0.0, **kwargs):
+    created_at = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return UserFeedback(created_at=created_at, **kwargs)
+
+
+def test_index_lookups_and_eviction():
+    index = FeedbackIndex(max_size=3)
+    entries = [
+        _feedback(hours_ago=4 - i, user_id=f"u{i % 2}", assessment_id="a1" if i < 2 else "a2")
+        for i in range(4)
+    ]
+    evicted = [e for entry in entries for e in index.add(entry)]
+
+    assert evicted == [entries[0]]
+    assert index.get(entries[0].id) is None
+    assert index.by_assessment("a1") == [entries[1]]
+    assert index.by_user("u0") == [entries[2]]
+    assert len(index) == 3
+
+
+def test_index_keeps_timeline_ordered_and_replaces_by_id():
+    index = FeedbackIndex()
+    late, early, middle = _feedback(hours_ago=1), _feedback(hours_ago=5), _feedback(hours_ago=3)
+    for entry in (late, early, middle):
+        index.add(entry)
+    index.add(late)
+
+    assert list(index) == [early, middle, late]
+    assert index.since(datetime.now(timezone.utc) - timedelta(hours=4)) == [middle, late]
+
+
+@pytest.mark.asyncio
+async def test_window_metrics_match_a_scan_of_the_raw_feedback():
+    collector = FeedbackCollector()
+    for i in range(120):
+        feedback = _feedback(hours_ago=i * 1.7, rating=1 + i % 10, comment="great and helpful" if i % 3 else "bad")
+        await collector._process_feedback(feedback)
+    analyzer = FeedbackAnalyzer(collector)
+
+    for days in (1, 3, 7):
+        # Windows start on the hour containing the cutoff
+        start = (datetime.now(timezone.utc) - timedelta(days=days)).replace(minute=0, second=0, microsecond=0)
+        in_window = [f for f in collector.feedback_storage if f.created_at >= start]
+        ratings = [f.rating for f in in_window]
+
+        metrics = analyzer.calculate_quality_metrics(days=days)
+
+        assert metrics.total_feedback_count == len(in_window)
+        assert metrics.average_rating == pytest.approx(sum(ratings) / len(ratings))
+        assert metrics.satisfaction_score == pytest.approx(
+            sum(f.quality_score for f in in_window) / len(in_window)
+        )
+        promoters = sum(r >= 9 for r in ratings)
+        detractors = sum(r <= 6 for r in ratings)
+        assert metrics.nps_score == pytest.approx((promoters - detractors) / len(ratings) * 100)
+
+
+@pytest.mark.asyncio
+async def test_evicted_feedback_is_spilled_in_batches(monkeypatch):
+    spilled = []
+
+    class Archive:
+        async def insert_many(self, documents):
+            spilled.append([d["id"] for d in documents])
+
+    async def get_database():
+        return {"feedback_archive": Archive()}
+
+    monkeypatch.setattr("src.infra_mind.core.database.get_database", get_database)
+    collector = FeedbackCollector(max_stored_feedback=2, spill_batch_size=2)
+    entries = [_feedback(hours_ago=5 - i, rating=4) for i in range(5)]
+    for entry in entries:
+        await collector._process_feedback(entry)
+
+    assert spilled == [[entries[0].id, entries[1].id]]
+    assert collector._spill_buffer == [entries[2]]
+    # Aggregates still include evicted entries
+    assert collector.aggregates.totals.count == 5
@@ -0,0 +1,95 @@
+"""
+Startup cost tests for the API.
+
+``import infra_mind.main`` is profiled in a fresh interpreter so the result
+does not depend on what the test session has already imported. Budgets can
+be tightened per CI runner with INFRA_MIND_IMPORT_BUDGET_SECONDS and
+INFRA_MIND_IMPORT_BUDGET_MB.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.infra_mind.core.import_profiler import parse_importtime, profile_import
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_BUDGET_SECONDS = float(os.getenv("INFRA_MIND_IMPORT_BUDGET_SECONDS", "10"))
+IMPORT_BUDGET_MB = float(os.getenv("INFRA_MIND_IMPORT_BUDGET_MB", "600"))
+
+# Loaded only by lazily mounted routers or on first use of a provider
+LAZY_DEPENDENCIES = [
+    "boto3",
+    "botocore",
+    "azure.mgmt",
+    "azure.identity",
+    "googleapiclient",
+    "google.generativeai",
+    "reportlab",
+    "lightgbm",
+    "src.infra_mind.api.endpoints.cloud_services",
+    "src.infra_mind.api.endpoints.advanced_analytics",
+    "src.infra_mind.api.endpoints.quality",
+]
+
+
+@pytest.fixture(scope="module")
+def main_import_profile():
+    return profile_import(
+        "src.infra_mind.main",
+        env={"INFRA_MIND_TESTING": "1"},
+        cwd=str(REPO_ROOT)
+    )
+
+
+def test_main_import_within_budget(main_import_profile):
+    slowest = ", ".join(
+        f"{entry.module} {entry.cumulative_us / 1000:.0f}ms"
+        for entry in main_import_profile.top(5)
+    )
+    assert main_import_profile.total_seconds <= IMPORT_BUDGET_SECONDS, f"slowest imports: {slowest}"
+    assert main_import_profile.peak_rss_mb <= IMPORT_BUDGET_MB
+
+
+def test_main_import_skips_lazy_dependencies(main_import_profile):
+    loaded = [name for name in LAZY_DEPENDENCIES if main_import_profile.loaded(name)]
+    assert loaded == []
+
+
+def test_parse_importtime_skips_header_and_other_output():
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   _io",
+        "2024-01-01 | INFO | unrelated log line",
+        "import time:      2400 |       5300 | infra_mind.main",
+    ])
+
+    costs = parse_importtime(output)
+
+    assert [(c.module, c.self_us, c.cumulative_us) for c in costs] == [
+        ("_io", 120, 120),
+        ("infra_mind.main", 2400, 5300),
+    ]
+
+
+def test_lazy_router_mounts_on_first_request(client, app):
+    loader = app.state.lazy_routers
+    assert "scenarios" in loader.pending
+    assert not any(getattr(route, "path", "").startswith("/api/v2/scenarios") for route in app.routes)
+
+    client.get("/api/v2/scenarios/")
+
+    assert "scenarios" not in loader.pending
+    paths = [getattr(route, "path", "") for route in app.routes]
+    assert any(path.startswith("/api/v1/scenarios") for path in paths)
+    assert any(path.startswith("/api/v2/scenarios") for path in paths)
+    assert any(path.startswith("/api/scenarios") for path in paths)
+
+
+def test_openapi_schema_includes_lazy_routers(app):
+    schema = app.openapi()
+
+    assert any(path.startswith("/api/v2/vendor-lockin") for path in schema["paths"])
+    assert any(path.startswith("/api/v1/vendor-lockin") for path in schema["paths"])
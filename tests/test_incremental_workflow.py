@@ -0,0 +1,132 @@
+"""
+Tests for incremental assessment re-runs (stage fingerprinting).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.infra_mind.workflows.incremental import (
+    IncrementalPlan,
+    POST_PROCESSING_STAGE,
+    StageSnapshotStore,
+    VALIDATION_STAGE,
+)
+
+AGENTS = [
+    "cto", "cloud_engineer", "research", "mlops", "infrastructure", "compliance",
+    "ai_consultant", "web_research", "simulation", "chatbot",
+]
+
+
+def _assessment(**business_overrides):
+    business = {
+        "company_size": "startup",
+        "industry": "technology",
+        "budget_constraints": {"total_budget_range": "10k_50k"},
+        "compliance_requirements": ["gdpr"],
+        **business_overrides,
+    }
+    return SimpleNamespace(
+        id="a1",
+        business_requirements=business,
+        technical_requirements={"workload_types": ["web_application"], "ai_use_cases": []},
+        description="Move to the cloud",
+        business_goal=None,
+    )
+
+
+def _plan(assessment, snapshots=None, force=False):
+    plan = IncrementalPlan(assessment, snapshots or {}, force=force)
+    plan.decide(VALIDATION_STAGE, "validate_requirements")
+    for agent in AGENTS:
+        plan.decide(agent)
+    plan.decide(POST_PROCESSING_STAGE, upstream=AGENTS)
+    return plan
+
+
+def _snapshots(plan):
+    return {
+        name: {"fingerprint": d.fingerprint, "inputs": d.inputs, "result": {"status": "completed", "agent": name}}
+        for name, d in plan.decisions.items()
+    }
+
+
+def test_first_run_executes_everything():
+    plan = _plan(_assessment())
+
+    assert all(d.reason == "no_snapshot" for d in plan.decisions.values())
+
+
+def test_unchanged_assessment_reuses_every_stage():
+    previous = _plan(_assessment())
+    plan = _plan(_assessment(), _snapshots(previous))
+
+    assert plan.summary()["executed_stages"] == []
+    assert plan.decisions["cto"].result == {"status": "completed", "agent": "cto"}
+
+
+def test_budget_change_reruns_only_budget_dependents():
+    previous = _plan(_assessment())
+    plan = _plan(
+        _assessment(budget_constraints={"total_budget_range": "50k_100k"}),
+        _snapshots(previous)
+    )
+
+    executed = set(plan.summary()["executed_stages"])
+    assert executed == {
+        VALIDATION_STAGE, "cto", "cloud_engineer", "infrastructure", "ai_consultant", "simulation",
+        POST_PROCESSING_STAGE,
+    }
+    assert plan.decisions["cto"].changed_inputs == ["business_requirements.budget_constraints"]
+    assert plan.decisions[POST_PROCESSING_STAGE].reason == "upstream_changed"
+    assert plan.decisions["compliance"].reused
+
+
+def test_unclassified_field_invalidates_all_agents():
+    previous = _plan(_assessment())
+    plan = _plan(_assessment(custom_notes="new free-form field"), _snapshots(previous))
+
+    assert plan.summary()["reused_stages"] == []
+    assert plan.decisions["chatbot"].changed_inputs == ["business_requirements.custom_notes"]
+
+
+def test_full_rerun_ignores_snapshots():
+    previous = _plan(_assessment())
+    plan = _plan(_assessment(), _snapshots(previous), force=True)
+
+    assert plan.summary()["reused_stages"] == []
+    assert plan.decisions["research"].reason == "forced"
+
+
+class _FakeCollection:
+    def __init__(self):
+        self.docs = {}
+
+    async def bulk_write(self, operations, ordered=True):
+        for op in operations:
+            self.docs[op._filter["_id"]] = {"_id": op._filter["_id"], **op._doc}
+
+    def find(self, query):
+        docs = [d for d in self.docs.values() if d["assessment_id"] == query["assessment_id"]]
+
+        async def iterate():
+            for doc in docs:
+                yield doc
+        return iterate()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_store_saves_executed_stages_only():
+    collection = _FakeCollection()
+    store = StageSnapshotStore({"agent_result_snapshots": collection})
+
+    first = _plan(_assessment())
+    saved = await store.save("a1", [(first.decisions["cto"], {"status": "completed"})])
+    snapshots = await store.load("a1")
+    second = _plan(_assessment(), snapshots)
+    saved_again = await store.save("a1", [(second.decisions["cto"], {"status": "completed"})])
+
+    assert saved == 1
+    assert second.decisions["cto"].reused
+    assert saved_again == 0
@@ -0,0 +1,121 @@
+"""
+Tests for the chatbot's local intent classifier.
+"""
+
+import threading
+
+import pytest
+
+from src.infra_mind.agents import intent_classifier
+from src.infra_mind.agents.intent_classifier import (
+    IntentClassifier,
+    SEED_EXAMPLES,
+    featurize,
+    get_intent_classifier,
+    load_intent_classifier,
+    load_logged_intents,
+    normalize_label,
+)
+
+
+@pytest.mark.parametrize("message,intent", [
+    ("hello there!", "greeting"),
+    ("how much does the enterprise plan cost per month?", "pricing_inquiry"),
+    ("I want to speak to a real human", "escalation_request"),
+    ("the report download keeps failing with an error", "technical_issue"),
+    ("goodbye, thanks", "goodbye"),
+])
+def test_seed_model_classifies_common_messages(message, intent):
+    label, confidence = get_intent_classifier().predict(message)
+
+    assert label == intent
+    assert confidence >= 0.5
+
+
+def test_features_are_normalized_and_stable():
+    features = featurize("Is there a free tier?")
+
+    assert features == featurize("is there a FREE tier?")
+    assert abs(sum(v * v for v in features.values()) - 1.0) < 1e-9
+
+
+def test_online_learning_raises_confidence_for_new_phrasing():
+    classifier = IntentClassifier(list(SEED_EXAMPLES)).fit(
+        [(text, label) for label, texts in SEED_EXAMPLES.items() for text in texts]
+    )
+    message = "my grafana panel integration shows nothing"
+    before = dict(zip(classifier.labels, classifier._probabilities(featurize(message))))["technical_issue"]
+
+    for _ in range(5):
+        classifier.learn(message, "technical_issue")
+
+    label, confidence = classifier.predict(message)
+    assert label == "technical_issue"
+    assert confidence > before
+
+
+def test_normalize_label_accepts_llm_variations():
+    assert normalize_label(' "Pricing". ') == "pricing_inquiry"
+    assert normalize_label("help") == "help_request"
+    assert normalize_label("something else") is None
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, *args):
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    def __aiter__(self):
+        async def iterate():
+            for doc in self.docs:
+                yield doc
+        return iterate()
+
+
+class _Collection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.query = None
+
+    def find(self, query, projection):
+        self.query = query
+        return _Cursor(self.docs)
+
+
+@pytest.mark.asyncio
+async def test_logged_intents_use_llm_labels_only():
+    collection = _Collection([
+        {"user_message": {"content": "what's on the roadmap?"}, "bot_message": {"intent": "feature"}},
+        {"user_message": {"content": "hmm"}, "bot_message": {"intent": "unknown"}},
+    ])
+    database = type("Database", (), {"conversation_history": collection})()
+
+    examples = await load_logged_intents(database)
+
+    assert collection.query == {"bot_message.intent_source": "llm"}
+    assert examples == [("what's on the roadmap?", "feature_inquiry")]
+
+
+@pytest.mark.asyncio
+async def test_seed_model_is_trained_off_the_event_loop(monkeypatch):
+    monkeypatch.setattr(intent_classifier, "_classifier", None)
+    threads = []
+    train = intent_classifier._train
+
+    def recording_train(examples):
+        threads.append(threading.current_thread())
+        return train(examples)
+
+    monkeypatch.setattr(intent_classifier, "_train", recording_train)
+
+    classifier = await load_intent_classifier()
+
+    assert threads and threads[0] is not threading.main_thread()
+    assert await load_intent_classifier() is classifier is get_intent_classifier()
+    assert len(threads) == 1
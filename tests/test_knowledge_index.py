@@ -0,0 +1,175 @@
+"""
+Tests for the chatbot's local knowledge retrieval index.
+"""
+
+import pytest
+
+from src.infra_mind.agents.knowledge_index import (
+    KnowledgeDocument,
+    KnowledgeIndex,
+    faq_documents,
+    load_resolved_conversation_answers,
+    tokenize,
+    web_documents,
+)
+
+FAQ = [
+    {
+        "question": "What cloud providers do you support?",
+        "answer": "We support AWS, Microsoft Azure, and Google Cloud Platform (GCP).",
+        "keywords": ["cloud providers", "aws", "azure", "gcp", "google cloud"],
+    },
+    {
+        "question": "How much does it cost?",
+        "answer": "Our pricing varies based on your needs and usage.",
+        "keywords": ["cost", "price", "pricing", "how much"],
+    },
+    {
+        "question": "How do I create an assessment?",
+        "answer": "Go to the Dashboard and click 'New Assessment'.",
+        "keywords": ["create assessment", "new assessment", "how to assess"],
+    },
+]
+
+
+def _index() -> KnowledgeIndex:
+    index = KnowledgeIndex()
+    index.sync_source("faq", faq_documents(FAQ))
+    return index
+
+
+@pytest.mark.parametrize("query,question", [
+    ("which cloud providers are supported?", "What cloud providers do you support?"),
+    ("how much does it cost", "How much does it cost?"),
+    ("how can I create a new assessment", "How do I create an assessment?"),
+])
+def test_paraphrased_questions_are_answered_confidently(query, question):
+    hit = _index().best_answer(query)
+
+    assert hit is not None
+    assert hit.document.title == question
+
+
+def test_unrelated_or_partial_queries_are_not_answered():
+    index = _index()
+
+    assert index.best_answer("my terraform export to jira is broken") is None
+    assert index.best_answer("what does the cost of a gpu cluster on aws depend on") is None
+
+
+def test_sync_only_reindexes_changes_and_drops_removed_documents():
+    index = _index()
+    edited = [dict(FAQ[0], answer="We support AWS, Azure, GCP and Alibaba Cloud."), FAQ[1]]
+
+    changed, removed = index.sync_source("faq", faq_documents(edited))
+
+    assert (changed, removed) == (1, 1)
+    assert len(index) == 2
+    assert "Alibaba" in index.best_answer("what cloud providers do you support").document.body
+    assert all(hit.document.source == "faq" and "assess" not in hit.document.title
+               for hit in index.search("create assessment"))
+
+
+def test_web_results_are_searchable_but_never_direct_answers():
+    index = _index()
+    index.upsert(web_documents([
+        {"title": "AWS us-east-1 outage update", "snippet": "EC2 instances degraded.", "url": "https://x/1"},
+    ]))
+
+    hits = index.search("aws outage", sources=("web",))
+
+    assert hits[0].document.metadata["url"] == "https://x/1"
+    assert index.best_answer("aws us-east-1 outage update") is None
+
+
+def test_dense_vectors_rank_synonyms(tmp_path):
+    pytest.importorskip("numpy")
+    vocabulary = ["bill", "cost", "cloud"]
+
+    def embed(texts):
+        return [[float(word in text.lower() or (word == "cost" and "invoice" in text.lower()))
+                 for word in vocabulary] for text in texts]
+
+    index = KnowledgeIndex(embed=embed, vector_path=str(tmp_path / "vectors.f32"), vector_dimensions=3)
+    index.sync_source("faq", faq_documents(FAQ))
+
+    hits = index.search("invoice", limit=1)
+
+    assert hits[0].document.title == "How much does it cost?"
+    assert hits[0].confidence > 0.9
+
+
+def test_tokenize_stems_common_suffixes():
+    assert tokenize("Pricing for the prices") == tokenize("price price")
+    assert tokenize("supported providers") == ["support", "provider"]
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, *args):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def __aiter__(self):
+        async def iterate():
+            for doc in self.docs:
+                yield doc
+        return iterate()
+
+
+class _Collection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.query = None
+
+    def find(self, query, projection):
+        self.query = query
+        return _Cursor(self.docs)
+
+
+@pytest.mark.asyncio
+async def test_resolved_conversations_yield_question_answer_pairs():
+    collection = _Collection([{
+        "_id": "c1",
+        "user_id": "u1",
+        "messages": [
+            {"role": "user", "content": "Can I export a report to PDF?"},
+            {"role": "assistant", "content": "Yes, use the Export button.", "metadata": {"knowledge_source": "llm"}},
+            {"role": "user", "content": "I want a human"},
+            {"role": "assistant", "content": "Connecting you.", "metadata": {"escalation_triggered": True}},
+        ],
+    }])
+    database = type("Database", (), {"conversations": collection})()
+
+    documents = await load_resolved_conversation_answers(database)
+
+    assert collection.query["status"] == "resolved"
+    assert collection.query["assessment_id"] is None
+    assert documents == [KnowledgeDocument(
+        doc_id="conversation:c1:0",
+        source="conversation",
+        title="Can I export a report to PDF?",
+        body="Yes, use the Export button.",
+    )]
+    assert documents[0].metadata == {"user_id": "u1"}
+
+
+def test_past_answers_are_only_returned_to_their_owner():
+    index = _index()
+    index.upsert([KnowledgeDocument(
+        doc_id="conversation:c1:0",
+        source="conversation",
+        title="Can I export my Q3 migration report to PDF?",
+        body="Yes, your Q3 migration report for Acme is under Reports.",
+        metadata={"user_id": "u1"},
+    )])
+    query = "can I export my q3 migration report to pdf"
+
+    assert index.best_answer(query, user_id="u1").document.doc_id == "conversation:c1:0"
+    assert index.best_answer(query, user_id="u2") is None
+    assert index.best_answer(query) is None
+    assert all(hit.document.source != "conversation" for hit in index.search(query, user_id="u2"))
@@ -0,0 +1,123 @@
+"""
+Tests for hedged LLM requests.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.infra_mind.llm.hedging import HedgingPolicy
+from src.infra_mind.llm.interface import LLMRequest
+from src.infra_mind.llm.manager import LLMManager
+
+
+def _policy(p90: float = 0.02, **kwargs) -> HedgingPolicy:
+    policy = HedgingPolicy(enabled=True, **kwargs)
+    for _ in range(HedgingPolicy.MIN_SAMPLES):
+        policy.record_latency("openai", p90)
+    policy.record_spend(1.0)
+    return policy
+
+
+def _call(result, delay, calls, name):
+    async def run():
+        calls.append(name)
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return run
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    policy, calls = _policy(), []
+    primary = _call("slow", 5.0, calls, "primary")
+
+    started = asyncio.get_running_loop().time()
+    result, hedge_won = await policy.run("openai", 0.01, primary, _call("fast", 0.01, calls, "hedge"))
+
+    assert (result, hedge_won) == ("fast", True)
+    assert calls == ["primary", "hedge"]
+    assert asyncio.get_running_loop().time() - started < 1.0
+    assert policy.get_stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    policy, calls = _policy(p90=0.5), []
+
+    result, hedge_won = await policy.run("openai", 0.01, _call("ok", 0.0, calls, "primary"), _call("x", 0.0, calls, "hedge"))
+
+    assert (result, hedge_won) == ("ok", False)
+    assert calls == ["primary"]
+    assert policy.counters["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedges_are_capped_by_budget():
+    policy, calls = _policy(budget_ratio=0.05), []
+
+    # 0.05 of 1.0 regular spend allows a single 0.04 hedge
+    for _ in range(2):
+        await policy.run("openai", 0.04, _call("slow", 0.05, calls, "primary"), _call("fast", 0.0, calls, "hedge"))
+
+    assert calls.count("hedge") == 1
+    assert policy.counters["budget_denied"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_hedge_falls_back_to_primary():
+    policy, calls = _policy(), []
+
+    result, hedge_won = await policy.run(
+        "openai", 0.01,
+        _call("slow but fine", 0.1, calls, "primary"),
+        _call(RuntimeError("boom"), 0.0, calls, "hedge")
+    )
+
+    assert (result, hedge_won) == ("slow but fine", False)
+    assert policy.counters["primary_wins"] == 1
+
+
+def test_eligibility_requires_samples_and_small_requests():
+    policy = HedgingPolicy(enabled=True, max_tokens=100)
+
+    assert policy.delay_for("openai") is None
+    assert policy.should_hedge(LLMRequest(prompt="classify", model="gpt-4", max_tokens=50))
+    assert not policy.should_hedge(LLMRequest(prompt="write", model="gpt-4", max_tokens=2000))
+    assert not policy.should_hedge(LLMRequest(prompt="x", model="gpt-4", max_tokens=50, context={"hedge": False}))
+
+
+def test_cancelled_calls_do_not_lower_the_hedge_delay():
+    policy = _policy(p90=0.5)
+
+    # A loser cancelled after 0.1s would have taken at least the p90
+    for _ in range(HedgingPolicy.MIN_SAMPLES):
+        policy.record_cancelled_latency("openai", 0.1)
+    assert policy.delay_for("openai") == 0.5
+
+    # Without a hedge delay there was no hedge, so nothing is recorded
+    policy.record_cancelled_latency("gemini", 0.1)
+    assert policy.delay_for("gemini") is None
+
+
+@pytest.mark.asyncio
+async def test_winning_hedge_is_hedge_spend_and_answers_for_its_provider():
+    manager = object.__new__(LLMManager)
+    manager.hedging = _policy()
+    manager._provider_health = {"openai": True, "gemini": True}
+    manager._estimate_request_cost = lambda provider_type, request: 0.01
+
+    async def call_provider(provider_type, request):
+        await asyncio.sleep(5.0 if provider_type == "openai" else 0.0)
+        return SimpleNamespace(is_valid=True, token_usage=SimpleNamespace(estimated_cost=0.004))
+    manager._call_provider = call_provider
+
+    request = LLMRequest(prompt="classify", model="gpt-4", max_tokens=50)
+    response, answered_by = await manager._generate_hedged_response("openai", ["openai", "gemini"], request)
+
+    assert answered_by == "gemini"
+    assert manager.hedging.primary_spend == 1.0
+    assert manager.hedging.hedge_spend == pytest.approx(0.004)
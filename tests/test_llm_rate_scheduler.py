@@ -0,0 +1,142 @@
+"""
+Tests for the token-rate-aware LLM request scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from src.infra_mind.llm.interface import LLMProvider, LLMRateLimitError, LLMRequest
+from src.infra_mind.llm.rate_scheduler import LLMRequestScheduler, RateBudget
+
+
+def _request(max_tokens: int, priority: str = "batch") -> LLMRequest:
+    return LLMRequest(prompt="hi", model="gpt-4", max_tokens=max_tokens, context={"priority": priority})
+
+
+def _scheduler(tokens_per_minute: int = 600_000, **kwargs) -> LLMRequestScheduler:
+    return LLMRequestScheduler(
+        default_budget=RateBudget(tokens_per_minute=tokens_per_minute, requests_per_minute=60_000),
+        **kwargs
+    )
+
+
+async def _call(scheduler, order, name, request, used=None, hold=None):
+    async with scheduler.reserve("openai", "gpt-4", request) as reservation:
+        order.append(name)
+        if hold is not None:
+            await hold.wait()
+        if used is not None:
+            reservation.settle(used)
+
+
+@pytest.mark.asyncio
+async def test_interactive_dispatched_before_queued_batch():
+    scheduler = _scheduler(interactive_reserve=0.0)
+    order = []
+
+    # Drain the bucket so everything else has to queue (refill is 10k tokens/s)
+    await _call(scheduler, order, "first", _request(600_000), used=600_000)
+    tasks = [asyncio.create_task(_call(scheduler, order, f"batch-{i}", _request(500), used=500)) for i in range(2)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(_call(scheduler, order, "chat", _request(500, "interactive"), used=500)))
+    await asyncio.gather(*tasks)
+
+    assert order[:2] == ["first", "chat"]
+    assert scheduler.get_metrics()["models"]["openai:gpt-4"]["dispatched"] == 4
+
+
+@pytest.mark.asyncio
+async def test_batch_leaves_interactive_reserve():
+    scheduler = _scheduler(interactive_reserve=0.5)
+    order, hold = [], asyncio.Event()
+
+    tasks = [asyncio.create_task(_call(scheduler, order, f"batch-{i}", _request(140_000), hold=hold)) for i in range(3)]
+    await asyncio.sleep(0)
+    assert order == ["batch-0", "batch-1"]
+
+    tasks.append(asyncio.create_task(_call(scheduler, order, "chat", _request(140_000, "interactive"), hold=hold)))
+    await asyncio.sleep(0)
+    assert order[-1] == "chat"
+
+    hold.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_settling_refunds_unused_tokens():
+    scheduler = _scheduler(interactive_reserve=0.0)
+    order = []
+
+    await _call(scheduler, order, "overestimated", _request(500_000), used=100)
+    started = asyncio.get_running_loop().time()
+    await _call(scheduler, order, "next", _request(500_000), used=100)
+
+    assert asyncio.get_running_loop().time() - started < 0.5
+    assert scheduler.get_metrics()["models"]["openai:gpt-4"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_pauses_budget():
+    scheduler = _scheduler(interactive_reserve=0.0, rate_limit_backoff_seconds=0.2)
+    order = []
+
+    with pytest.raises(LLMRateLimitError):
+        async with scheduler.reserve("openai", "gpt-4", _request(10)):
+            raise LLMRateLimitError("429", LLMProvider.OPENAI)
+
+    started = asyncio.get_running_loop().time()
+    await _call(scheduler, order, "after", _request(10), used=10)
+
+    metrics = scheduler.get_metrics()["models"]["openai:gpt-4"]
+    assert asyncio.get_running_loop().time() - started >= 0.15
+    assert metrics["rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_per_model_budgets_and_disabled_passthrough():
+    scheduler = _scheduler(budgets={"openai:gpt-4": RateBudget(tokens_per_minute=120_000, requests_per_minute=60)})
+    assert scheduler.budget_for("openai", "gpt-4").tokens_per_minute == 120_000
+    assert scheduler.budget_for("openai", "gpt-3.5-turbo").tokens_per_minute == 600_000
+
+    disabled = _scheduler(enabled=False)
+    async with disabled.reserve("openai", "gpt-4", _request(10_000_000)) as reservation:
+        reservation.settle(10)
+    assert disabled.get_metrics()["models"] == {}
+
+
+@pytest.mark.asyncio
+async def test_azure_aliases_share_one_deployment_budget():
+    from types import SimpleNamespace
+
+    from src.infra_mind.llm.interface import retry_after_seconds
+    from src.infra_mind.llm.manager import LLMManager
+
+    scheduler = _scheduler(interactive_reserve=0.0)
+    # The same Azure provider is registered as "openai" and "azure_openai"
+    azure = SimpleNamespace(
+        azure_endpoint="https://example.openai.azure.com/",
+        model="gpt-4-deployment",
+        provider_name=LLMProvider.OPENAI,
+    )
+    key = LLMManager._rate_budget_key(azure, _request(10))
+    assert key == ("azure_openai", "gpt-4-deployment", "https://example.openai.azure.com/")
+
+    error = Exception("Error code: 429")
+    error.response = SimpleNamespace(headers={"retry-after-ms": "200"})
+    provider, model, endpoint = key
+    with pytest.raises(LLMRateLimitError):
+        async with scheduler.reserve(provider, model, _request(10), endpoint=endpoint):
+            raise LLMRateLimitError("429", LLMProvider.AZURE_OPENAI, retry_after=retry_after_seconds(error))
+
+    started = asyncio.get_running_loop().time()
+    async with scheduler.reserve(provider, model, _request(10), endpoint=endpoint) as reservation:
+        reservation.settle(10)
+
+    models = scheduler.get_metrics()["models"]
+    assert asyncio.get_running_loop().time() - started >= 0.15
+    assert list(models) == ["azure_openai:gpt-4-deployment@https://example.openai.azure.com/"]
+    assert models[list(models)[0]]["rate_limited"] == 1
+
+    openai = SimpleNamespace(model="gpt-4", provider_name=LLMProvider.OPENAI)
+    assert LLMManager._rate_budget_key(openai, _request(10)) == ("openai", "gpt-4", None)
@@ -0,0 +1,90 @@
+"""
+Tests for the process-wide LLM managers and their shared response cache.
+"""
+
+import asyncio
+
+import pytest
+
+from src.infra_mind.llm import manager as llm_manager
+from src.infra_mind.llm.cost_tracker import CostTracker
+from src.infra_mind.llm.interface import LLMRequest
+from src.infra_mind.llm.usage_optimizer import LLMUsageOptimizer
+
+
+class FakeManager:
+    def __init__(self, config=None, cost_tracker=None, usage_optimizer=None):
+        self.config = config
+        self.cost_tracker = cost_tracker
+        self.usage_optimizer = usage_optimizer
+        self.closed = False
+
+    async def shutdown(self):
+        self.closed = True
+
+
+@pytest.fixture
+def shared(monkeypatch):
+    monkeypatch.setattr(llm_manager, "LLMManager", FakeManager)
+    monkeypatch.setattr(llm_manager, "_shared_managers", {})
+    monkeypatch.setattr(llm_manager, "_shared_cost_tracker", None)
+    monkeypatch.setattr(llm_manager, "_shared_usage_optimizer", None)
+    monkeypatch.setattr(llm_manager, "_shared_pid", None)
+    return llm_manager
+
+
+def test_one_manager_per_provider_preference(shared):
+    openai = shared.get_shared_llm_manager("openai")
+    gemini = shared.get_shared_llm_manager("Gemini")
+
+    assert shared.get_shared_llm_manager("OPENAI") is openai
+    assert shared.get_shared_llm_manager("gemini") is gemini
+    assert openai is not gemini
+    assert gemini.config == {"preferred_provider": "gemini"}
+
+
+def test_managers_share_cost_tracker_and_usage_optimizer(shared):
+    openai = shared.get_shared_llm_manager("openai")
+    gemini = shared.get_shared_llm_manager("gemini")
+
+    assert isinstance(openai.cost_tracker, CostTracker)
+    assert openai.cost_tracker is gemini.cost_tracker is shared.get_shared_cost_tracker()
+    assert isinstance(openai.usage_optimizer, LLMUsageOptimizer)
+    assert openai.usage_optimizer is gemini.usage_optimizer
+    assert openai.usage_optimizer.cost_tracker is openai.cost_tracker
+
+
+def test_singletons_are_rebuilt_after_fork(shared, monkeypatch):
+    parent = shared.get_shared_llm_manager("openai")
+    parent_tracker = shared.get_shared_cost_tracker()
+
+    # A forked child sees the parent's module state under a new pid
+    monkeypatch.setattr(shared.os, "getpid", lambda: -1)
+    child = shared.get_shared_llm_manager("openai")
+
+    assert child is not parent
+    assert child.cost_tracker is not parent_tracker
+    assert child.usage_optimizer is not parent.usage_optimizer
+    assert shared.get_shared_llm_manager("openai") is child
+
+
+def test_shutdown_closes_and_forgets_managers(shared):
+    manager = shared.get_shared_llm_manager("openai")
+
+    asyncio.run(shared.shutdown_shared_llm_managers())
+
+    assert manager.closed
+    assert shared.get_shared_llm_manager("openai") is not manager
+
+
+def test_cache_key_ignores_agent_name():
+    optimizer = LLMUsageOptimizer(cost_tracker=CostTracker())
+
+    def request(**overrides):
+        return LLMRequest(prompt="Summarize the plan", model="gpt-4", context={"assessment": 1}, **overrides)
+
+    cto = optimizer._generate_request_hash(request(agent_name="cto_agent"))
+    cloud = optimizer._generate_request_hash(request(agent_name="cloud_engineer_agent"))
+
+    assert cto == cloud == optimizer._generate_request_hash(request())
+    assert optimizer._generate_request_hash(request(temperature=0.2)) != cto
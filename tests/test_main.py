@@ -5,9 +5,14 @@ Learning Note: These tests verify that our FastAPI application
 starts correctly and responds to basic requests.
 """
 
+import json
+
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from src.infra_mind.main import app
+from src.infra_mind.main import app, setup_websocket
+from src.infra_mind.orchestration.events import AgentEvent, EventType
+from src.infra_mind.orchestration.redis_event_manager import RedisEventManager
 
 # Create test client
 client = TestClient(app)
@@ -47,4 +52,43 @@ def test_api_docs_available_in_debug():
 def test_nonexistent_endpoint():
     """Test that nonexistent endpoints return 404."""
     response = client.get("/nonexistent")
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+def test_report_sections_are_streamed_to_ws_subscribers():
+    """Sections published by a worker over Redis reach /ws clients of the assessment."""
+    ws_app = FastAPI()
+    setup_websocket(ws_app)
+    event_manager = RedisEventManager("redis://localhost:6379/0")
+    event = AgentEvent(
+        event_type=EventType.REPORT_SECTION_GENERATED,
+        agent_name="report_generator",
+        data={
+            "assessment_id": "assessment-1",
+            "report_id": "report-1",
+            "report_type": "full",
+            "section": {"title": "Executive Summary", "content": "..."},
+            "completed_sections": 1,
+            "total_sections": 6
+        }
+    )
+
+    with TestClient(ws_app) as ws_client:
+        ws_client.portal.call(ws_app.state.subscribe_report_sections, event_manager)
+        with ws_client.websocket_connect("/ws") as websocket:
+            assert websocket.receive_json()["type"] == "connection"
+            websocket.send_json({"type": "subscribe", "data": {"assessment_id": "assessment-1"}})
+            assert websocket.receive_json()["type"] == "subscription_confirmed"
+
+            # As delivered by the Redis listener from another process
+            ws_client.portal.call(event_manager._handle_message, {
+                "channel": "events:report_section_generated",
+                "data": json.dumps(event.to_dict())
+            })
+
+            message = websocket.receive_json()
+
+    assert message["type"] == "report_section"
+    assert message["assessment_id"] == "assessment-1"
+    assert message["data"]["report_id"] == "report-1"
+    assert message["data"]["section"]["title"] == "Executive Summary"
+    assert message["data"]["completed_sections"] == 1
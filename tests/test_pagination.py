@@ -0,0 +1,132 @@
+"""
+Tests for keyset (cursor) pagination.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from src.infra_mind.api.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_query,
+    keyset_sort,
+    split_page,
+)
+from src.infra_mind.services.dashboard_stats import DashboardStatsStore
+
+
+def _documents(count):
+    start = datetime(2025, 1, 1)
+    # Pairs share a timestamp so the _id tie-breaker matters
+    return [{"_id": ObjectId(), "created_at": start + timedelta(minutes=i // 2)} for i in range(count)]
+
+
+def _matches(document, query):
+    """Evaluate the subset of MongoDB query operators keyset_query produces."""
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(_matches(document, clause) for clause in condition):
+                return False
+        elif key == "$and":
+            if not all(_matches(document, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            if not document[key] < condition["$lt"]:
+                return False
+        elif document.get(key) != condition:
+            return False
+    return True
+
+
+def _page(documents, query, cursor, limit):
+    keyed = keyset_query(query, cursor)
+    ordered = sorted(documents, key=lambda d: (d["created_at"], d["_id"]), reverse=True)
+    return split_page([d for d in ordered if _matches(d, keyed)][:limit + 1], limit)
+
+
+def test_cursor_round_trip():
+    document = {"_id": ObjectId(), "created_at": datetime(2025, 3, 4, 5, 6, 7, 123000)}
+
+    assert decode_cursor(encode_cursor(document)) == (document["created_at"], document["_id"])
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "e30"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_cursor_is_bound_to_its_sort_field():
+    cursor = encode_cursor({"_id": ObjectId(), "last_activity": datetime(2025, 1, 1)}, "last_activity")
+
+    with pytest.raises(HTTPException) as exc:
+        keyset_query({"user_id": "u1"}, cursor)
+    assert exc.value.status_code == 400
+
+
+def test_walking_cursors_visits_every_document_once():
+    documents = _documents(23)
+    seen, cursor = [], None
+    while True:
+        page, cursor = _page(documents, {}, cursor, limit=5)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert len(seen) == 23
+    assert len({d["_id"] for d in seen}) == 23
+    assert [d["created_at"] for d in seen] == sorted((d["created_at"] for d in documents), reverse=True)
+
+
+def test_keyset_query_keeps_existing_filters():
+    cursor = encode_cursor(_documents(1)[0])
+
+    query = keyset_query({"user_id": "u1", "status": "completed"}, cursor)
+    assert query["user_id"] == "u1" and query["status"] == "completed" and "$or" in query
+
+    query = keyset_query({"$or": [{"a": 1}, {"b": 1}]}, cursor)
+    assert query["$and"][0] == {"$or": [{"a": 1}, {"b": 1}]}
+
+    assert keyset_query({"user_id": "u1"}, None) == {"user_id": "u1"}
+    assert keyset_sort("last_activity") == [("last_activity", -1), ("_id", -1)]
+
+
+class _StatsCollection:
+    def __init__(self, document):
+        self.document = document
+
+    async def find_one(self, query, projection=None):
+        return self.document
+
+
+class _Database(dict):
+    def __missing__(self, name):
+        return _StatsCollection(None)
+
+
+@pytest.mark.asyncio
+async def test_approximate_count_reads_materialized_counters():
+    stats = {"assessments": {"total": 12, "status": {"completed": 5}}, "reports": {"type": {"executive_summary": 2}}}
+    db = _Database(user_dashboard_stats=_StatsCollection(stats))
+    store = DashboardStatsStore(db)
+
+    assert await store.approximate_count("u1", "assessments") == 12
+    assert await store.approximate_count("u1", "assessments", status="completed") == 5
+    assert await store.approximate_count("u1", "assessments", status="draft") == 0
+    assert await store.approximate_count("u1", "reports", report_type="executive_summary") == 2
+    # Filters without a counter bucket need an exact count
+    assert await store.approximate_count("u1", "assessments", priority="high") is None
+    assert await store.approximate_count("u1", "reports", status="completed", report_type="full") is None
+    assert await store.approximate_count("u1", "conversations") is None
+
+
+@pytest.mark.asyncio
+async def test_approximate_count_is_unknown_without_a_stats_document():
+    store = DashboardStatsStore(_Database(user_dashboard_stats=_StatsCollection(None)))
+
+    assert await store.approximate_count("new-user", "assessments") is None
+    assert await store.approximate_count("new-user", "reports", status="completed") is None
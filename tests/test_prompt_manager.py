@@ -11,7 +11,8 @@ from src.infra_mind.llm.prompt_manager import (
     ABTest,
     ABTestResult,
     InMemoryPromptStorage,
-    FilePromptStorage
+    FilePromptStorage,
+    CompiledPrompt
 )
 
 
@@ -498,5 +499,45 @@ class TestIntegrationScenarios:
         assert report["active_version"]["version"] == v2.version
 
 
+class TestCompiledPrompt:
+    """Test compiled prompt rendering and caching."""
+
+    @pytest.mark.parametrize("content", [
+        "Hello {name}, welcome to {place}!",
+        "Literal {{braces}} and {name}",
+        "Budget: {amount:,.2f} for {name!r}",
+        "No variables at all",
+    ])
+    def test_render_matches_str_format(self, content):
+        """Test compiled rendering is identical to str.format."""
+        variables = {"name": "Alice", "place": "Wonderland", "amount": 12345.5}
+
+        assert CompiledPrompt(content).render(variables) == content.format(**variables)
+
+    def test_render_cache_hits(self):
+        """Test identical renders are served from the cache."""
+        compiled = CompiledPrompt("Hello {name}")
+
+        compiled.render({"name": "Alice"})
+        compiled.render({"name": "Alice", "unused": [1, 2]})
+
+        assert compiled.cache_info().hits == 1
+
+    def test_file_storage_picks_up_external_changes(self, tmp_path):
+        """Test file storage revalidates cached versions by mtime."""
+        storage = FilePromptStorage(base_path=str(tmp_path), revalidate_interval=0)
+        manager = PromptManager(storage_backend=storage)
+        prompt = manager.create_prompt("greeting", "Hello {name}")
+        manager.activate_prompt("greeting", prompt.version)
+        assert manager.render_prompt("greeting", {"name": "A"})[0] == "Hello A"
+
+        # Simulate another process editing the stored version
+        edited = FilePromptStorage(base_path=str(tmp_path)).get_prompt_version("greeting", prompt.version)
+        edited.content = "Hi {name}"
+        FilePromptStorage(base_path=str(tmp_path)).save_prompt(edited)
+
+        assert manager.render_prompt("greeting", {"name": "A"})[0] == "Hi A"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,189 @@
+"""
+Query-count tests for request-scoped batching.
+
+``CountingDatabase`` is a minimal in-memory stand-in for a Motor database
+that records every query it receives. The endpoint tests assert that the
+number of queries does not grow with the number of items rendered, so an
+endpoint that regresses into one query per item (N+1) fails here.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from bson import ObjectId
+
+from src.infra_mind.core.query_optimizer import DataLoader, RequestLoaders
+
+
+def _matches(doc, query):
+    for field, condition in query.items():
+        value = doc.get(field)
+        if isinstance(condition, dict) and "$in" in condition:
+            if value not in condition["$in"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def skip(self, count):
+        self._docs = self._docs[count:]
+        return self
+
+    def limit(self, count):
+        self._docs = self._docs[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return list(self._docs)
+
+
+class _CountingCollection:
+    def __init__(self, name, database):
+        self.name = name
+        self.database = database
+        self.docs = []
+
+    def find(self, query=None, projection=None):
+        self.database.queries.append((self.name, "find"))
+        return _Cursor([doc for doc in self.docs if _matches(doc, query or {})])
+
+    async def find_one(self, query=None, projection=None):
+        self.database.queries.append((self.name, "find_one"))
+        return next((doc for doc in self.docs if _matches(doc, query or {})), None)
+
+    def aggregate(self, pipeline):
+        self.database.queries.append((self.name, "aggregate"))
+        docs = [doc for doc in self.docs if _matches(doc, pipeline[0].get("$match", {}))]
+        group_field = pipeline[1]["$group"]["_id"].lstrip("$")
+        counts = {}
+        for doc in docs:
+            counts[doc.get(group_field)] = counts.get(doc.get(group_field), 0) + 1
+        return _Cursor([{"_id": key, "count": count} for key, count in counts.items()])
+
+
+class CountingDatabase:
+    """In-memory Motor database stand-in that counts queries."""
+
+    def __init__(self):
+        self.queries = []
+        self._collections = {}
+
+    def __getitem__(self, name):
+        if name not in self._collections:
+            self._collections[name] = _CountingCollection(name, self)
+        return self._collections[name]
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    def reset(self):
+        self.queries.clear()
+
+
+def seed_user_reports(db, user_id, count):
+    """Create ``count`` assessments, each with one report and two recommendations."""
+    for i in range(count):
+        assessment_id = ObjectId()
+        db.assessments.docs.append({
+            "_id": assessment_id,
+            "user_id": user_id,
+            "title": f"Assessment {i}",
+            "business_requirements": {"company_name": f"Company {i}", "industry": "technology"},
+            "current_infrastructure": {"current_monthly_spend": 10000},
+        })
+        for priority in ("high", "medium"):
+            db.recommendations.docs.append({
+                "_id": ObjectId(),
+                "assessment_id": str(assessment_id),
+                "title": f"Recommendation {i} {priority}",
+                "priority": priority,
+                "category": "cost",
+                "confidence_score": 0.8,
+            })
+        db.reports.docs.append({
+            "_id": ObjectId(),
+            "user_id": user_id,
+            "assessment_id": str(assessment_id),
+            "title": f"Report {i}",
+            "report_type": "executive_summary",
+            "status": "completed",
+        })
+
+
+@pytest.mark.asyncio
+async def test_dataloader_batches_concurrent_loads():
+    calls = []
+
+    async def batch_load(keys):
+        calls.append(list(keys))
+        return [f"value-{key}" for key in keys]
+
+    loader = DataLoader(batch_load)
+    results = await asyncio.gather(*(loader.load(key) for key in range(5)))
+
+    assert results == [f"value-{key}" for key in range(5)]
+    assert calls == [[0, 1, 2, 3, 4]]
+
+    # Cached keys do not hit the batch function again
+    assert await loader.load(3) == "value-3"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_loaders_issue_one_query_per_loader():
+    db = CountingDatabase()
+    seed_user_reports(db, "user-1", 6)
+    assessment_ids = [str(doc["_id"]) for doc in db.assessments.docs]
+    loaders = RequestLoaders(db)
+
+    assessments = await loaders.assessments.load_many(assessment_ids + ["missing"])
+    recommendation_counts = await loaders.recommendation_counts.load_many(assessment_ids)
+    report_counts = await loaders.report_counts.load_many(assessment_ids)
+    recommendations = await loaders.recommendations_by_assessment.load_many(assessment_ids)
+
+    assert [str(doc["_id"]) for doc in assessments[:-1]] == assessment_ids
+    assert assessments[-1] is None
+    assert recommendation_counts == [2] * 6
+    assert report_counts == [1] * 6
+    assert all(len(group) == 2 for group in recommendations)
+    assert len(db.queries) == 4
+
+    # Per-item loads after priming, including the missing key, are cache hits
+    for assessment_id in assessment_ids + ["missing"]:
+        await loaders.assessments.load(assessment_id)
+    assert len(db.queries) == 4
+
+
+@pytest.mark.asyncio
+async def test_all_user_reports_query_count_is_independent_of_report_count():
+    from src.infra_mind.api.endpoints.reports import get_all_user_reports
+
+    class OfflineLLMManager:
+        async def initialize_providers(self):
+            raise RuntimeError("LLM providers disabled in tests")
+
+    async def query_count(report_count):
+        db = CountingDatabase()
+        seed_user_reports(db, "user-1", report_count)
+        with patch("src.infra_mind.llm.manager.LLMManager", OfflineLLMManager):
+            reports = await get_all_user_reports(
+                db=db,
+                loaders=RequestLoaders(db),
+                current_user=SimpleNamespace(id="user-1")
+            )
+        assert len(reports) == report_count
+        return len(db.queries)
+
+    assert await query_count(1) == await query_count(8)
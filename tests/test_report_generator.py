@@ -28,9 +28,12 @@ def stub_report_agent_dependencies(monkeypatch):
             "competitive_analysis": {},
         }
 
-    async def fake_store(self, report, assessment):
+    async def fake_store(self, report, assessment, db_report_id=None):
         return "mock_report_id"
 
+    async def fake_publish(self, report, section, db_report_id):
+        return None
+
     monkeypatch.setattr(
         ReportGeneratorAgent,
         "_collect_research_data",
@@ -41,6 +44,11 @@ def stub_report_agent_dependencies(monkeypatch):
         "_store_report_in_database",
         fake_store,
     )
+    monkeypatch.setattr(
+        ReportGeneratorAgent,
+        "_publish_section",
+        fake_publish,
+    )
 
 
 class TestReportSection:
@@ -417,6 +425,100 @@ class TestReportGeneratorAgent:
         assert "Investment Overview" in section.content
         assert "Cost Breakdown by Priority" in section.content
     
+    @pytest.mark.asyncio
+    async def test_sections_generate_concurrently_after_dependencies(self, monkeypatch):
+        """Test sections run in parallel and dependent sections wait for theirs."""
+        agent = ReportGeneratorAgent(AgentConfig(
+            name="Test Report Generator",
+            role=AgentRole.REPORT_GENERATOR,
+            metrics_enabled=False
+        ))
+        finished = []
+
+        async def slow_section(self, title, order, assessment, recommendations, research_data=None, dependencies=None):
+            await asyncio.sleep(0.05)
+            finished.append(title)
+            return ReportSection(title=title, content=title, order=order)
+
+        monkeypatch.setattr(ReportGeneratorAgent, "_generate_section", slow_section)
+        streamed = []
+
+        async def on_section(report, section):
+            streamed.append(section.title)
+
+        assessment = agent._dict_to_assessment(self.create_sample_assessment())
+        started = asyncio.get_running_loop().time()
+        report = await agent._generate_report(assessment, [], "full", on_section=on_section)
+        elapsed = asyncio.get_running_loop().time() - started
+
+        # 10 sections at 0.05s each, 4 at a time, summary waits for three others
+        assert elapsed < 0.3
+        assert [s.order for s in report.sections] == list(range(1, 11))
+        assert finished.index("Executive Summary") > max(
+            finished.index(t) for t in ("Recommendations Overview", "Cost Analysis", "Risk Assessment & Mitigation")
+        )
+        assert finished.index("Next Steps") > finished.index("Implementation Roadmap")
+        assert sorted(streamed) == sorted(finished)
+
+    @pytest.mark.asyncio
+    async def test_executive_summary_receives_its_dependency_sections(self):
+        """Test the summary is generated from the sections it depends on."""
+        agent = ReportGeneratorAgent(AgentConfig(
+            name="Test Report Generator",
+            role=AgentRole.REPORT_GENERATOR,
+            metrics_enabled=False
+        ))
+        assessment = agent._dict_to_assessment(self.create_sample_assessment())
+        recommendations = [agent._dict_to_recommendation(rec) for rec in self.create_sample_recommendations()]
+
+        report = await agent._generate_report(assessment, recommendations, "full")
+
+        summary = next(s for s in report.sections if s.title == "Executive Summary")
+        cost = next(s for s in report.sections if s.title == "Cost Analysis")
+        assert "*Cost Analysis*" in summary.content
+        assert cost.content.strip().splitlines()[0].strip() in summary.content
+        assert "*Business Context & Goals*" not in summary.content
+
+    @pytest.mark.asyncio
+    async def test_streamed_sections_reference_the_stored_report(self, monkeypatch):
+        """Test sections are published under the id the report is stored with."""
+        agent = ReportGeneratorAgent(AgentConfig(
+            name="Test Report Generator",
+            role=AgentRole.REPORT_GENERATOR,
+            metrics_enabled=False
+        ))
+        published, stored = set(), []
+
+        async def publish(self, report, section, db_report_id):
+            published.add(db_report_id)
+
+        async def store(self, report, assessment, db_report_id=None):
+            stored.append(db_report_id)
+            return db_report_id
+
+        monkeypatch.setattr(ReportGeneratorAgent, "_publish_section", publish)
+        monkeypatch.setattr(ReportGeneratorAgent, "_store_report_in_database", store)
+        agent.context = {"assessment": self.create_sample_assessment(), "recommendations": [], "report_type": "executive"}
+
+        result = await agent._execute_main_logic()
+
+        assert published == set(stored) == {result.data["db_report_id"]}
+        assert result.data["db_report_id"] != result.data["report_id"]
+
+    def test_section_dependency_cycles_are_rejected(self):
+        """Test circular section dependencies raise instead of deadlocking."""
+        agent = ReportGeneratorAgent(AgentConfig(
+            name="Test Report Generator",
+            role=AgentRole.REPORT_GENERATOR,
+            metrics_enabled=False
+        ))
+
+        with pytest.raises(ValueError):
+            agent._order_section_dependencies([
+                {"title": "A", "order": 1, "depends_on": ["B"]},
+                {"title": "B", "order": 2, "depends_on": ["A"]},
+            ])
+
     def test_dict_to_assessment(self):
         """Test converting dictionary to assessment object."""
         config = AgentConfig(
@@ -0,0 +1,107 @@
+"""
+Tests for offloaded, cached report rendering.
+"""
+
+import asyncio
+
+import pytest
+
+from src.infra_mind.services.report_renderer import (
+    RenderQueueFullError,
+    ReportRenderer,
+    parse_byte_range,
+    read_file_range,
+    render_html,
+)
+
+REPORT = {
+    "report_id": "r1",
+    "assessment_id": "a1",
+    "title": "Infrastructure Assessment <Acme>",
+    "report_type": "comprehensive",
+    "sections": [
+        {"title": "Executive Summary", "content": "We recommend **AWS**.\n- Save 20%\n- Scale out"},
+        {"title": "Next Steps", "content": "### Phase 1\nMigrate."},
+    ],
+}
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    renderer = ReportRenderer(str(tmp_path), max_workers=1, max_queue=0)
+    yield renderer
+    renderer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_render_runs_in_worker_and_is_cached(renderer):
+    artifact = await renderer.render("r1", "1.0", "markdown", REPORT)
+
+    with open(artifact.path, encoding="utf-8") as handle:
+        content = handle.read()
+    assert "## Executive Summary" in content
+    assert artifact.size == len(content.encode("utf-8"))
+
+    again = await renderer.render("r1", "1.0", "markdown", {})
+    assert again.etag == artifact.etag
+    assert renderer.stats["renders"] == 1
+    assert renderer.stats["hits"] == 1
+
+    other_version = await renderer.render("r1", "1.1", "markdown", REPORT)
+    assert other_version.etag != artifact.etag
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_render_and_excess_is_rejected(renderer, monkeypatch):
+    release = asyncio.Event()
+
+    async def slow_render(key, format, report_data):
+        await release.wait()
+        return 42
+
+    monkeypatch.setattr(renderer, "_render", slow_render)
+
+    first = asyncio.ensure_future(renderer.render("r1", "1.0", "pdf", REPORT))
+    second = asyncio.ensure_future(renderer.render("r1", "1.0", "pdf", REPORT))
+    await asyncio.sleep(0)
+
+    with pytest.raises(RenderQueueFullError):
+        await renderer.render("r2", "1.0", "pdf", REPORT)
+
+    release.set()
+    assert [a.size for a in await asyncio.gather(first, second)] == [42, 42]
+    assert renderer.stats["shared"] == 1
+    assert renderer.stats["rejected"] == 1
+
+
+def test_html_escapes_content_and_renders_markdown_subset():
+    document = render_html(REPORT)
+
+    assert "Infrastructure Assessment &lt;Acme&gt;" in document
+    assert "<strong>AWS</strong>" in document
+    assert "<ul>\n<li>Save 20%</li>\n<li>Scale out</li>\n</ul>" in document
+    assert "<h5>Phase 1</h5>" in document
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=900-", (900, 999)),
+    ("bytes=-100", (900, 999)),
+    ("bytes=990-2000", (990, 999)),
+    ("bytes=0-1,5-9", None),
+    ("items=0-1", None),
+])
+def test_parse_byte_range(header, expected):
+    assert parse_byte_range(header, 1000) == expected
+
+
+def test_unsatisfiable_range_raises():
+    with pytest.raises(ValueError):
+        parse_byte_range("bytes=1000-", 1000)
+
+
+def test_read_file_range(tmp_path):
+    path = tmp_path / "artifact.bin"
+    path.write_bytes(bytes(range(200)))
+
+    assert b"".join(read_file_range(str(path), 10, 149, chunk_size=32)) == bytes(range(10, 150))
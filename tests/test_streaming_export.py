@@ -0,0 +1,136 @@
+"""
+Tests for streaming NDJSON/CSV exports.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+from bson import Decimal128, ObjectId
+
+from src.infra_mind.api import streaming_export
+from src.infra_mind.api.streaming_export import export_projection, stream_export
+
+COLUMNS = {"id": "_id", "title": "title", "company": "business_requirements.company_name", "created_at": "created_at"}
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+        self.consumed = 0
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    def __aiter__(self):
+        async def iterate():
+            for doc in self.docs:
+                self.consumed += 1
+                yield doc
+        return iterate()
+
+
+def _docs(count):
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"Assessment {i}",
+            "business_requirements": {"company_name": "Acme, Inc."},
+            "created_at": datetime(2025, 1, 1, 12, 0, i % 60),
+            "cost": Decimal128("10.5"),
+        }
+        for i in range(count)
+    ]
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_rows_are_projected_and_serializable():
+    docs = _docs(3)
+
+    chunks = await _collect(stream_export(_Cursor(docs), COLUMNS, "ndjson"))
+    rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+
+    assert rows[0] == {
+        "id": str(docs[0]["_id"]),
+        "title": "Assessment 0",
+        "company": "Acme, Inc.",
+        "created_at": "2025-01-01T12:00:00",
+    }
+    assert len(rows) == 3
+
+
+@pytest.mark.asyncio
+async def test_csv_header_is_sent_before_the_cursor_is_read():
+    cursor = _Cursor(_docs(2))
+    stream = stream_export(cursor, COLUMNS, "csv")
+
+    header = await stream.__anext__()
+    assert header == b"id,title,company,created_at\r\n"
+    assert cursor.consumed == 0
+
+    body = header + b"".join(await _collect(stream))
+    rows = list(csv.DictReader(io.StringIO(body.decode())))
+    assert [row["company"] for row in rows] == ["Acme, Inc.", "Acme, Inc."]
+
+
+@pytest.mark.asyncio
+async def test_output_is_chunked_while_reading(monkeypatch):
+    monkeypatch.setattr(streaming_export, "CHUNK_SIZE", 1024)
+    cursor = _Cursor(_docs(500))
+    stream = stream_export(cursor, COLUMNS, "ndjson")
+
+    await stream.__anext__()
+    await stream.__anext__()
+    # Chunks go out long before the whole result set has been read
+    assert cursor.consumed < 50
+
+    chunks = await _collect(stream)
+    assert max(len(chunk) for chunk in chunks) < 2048
+
+
+@pytest.mark.asyncio
+async def test_csv_cells_that_look_like_formulas_are_escaped():
+    docs = [{"_id": 1, "title": title} for title in ("=HYPERLINK(\"http://x\")", "+1", "-2", "@SUM(A1)", "Plain")]
+    docs.append({"_id": 2, "title": -3})
+
+    body = b"".join(await _collect(stream_export(_Cursor(docs), {"id": "_id", "title": "title"}, "csv")))
+    titles = [row["title"] for row in csv.DictReader(io.StringIO(body.decode()))]
+
+    assert titles == ["'=HYPERLINK(\"http://x\")", "'+1", "'-2", "'@SUM(A1)", "Plain", "-3"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_closed_when_the_client_disconnects():
+    cursor = _Cursor(_docs(10))
+    stream = stream_export(cursor, COLUMNS, "csv")
+
+    await stream.__anext__()
+    await stream.__anext__()
+    await stream.aclose()
+
+    assert cursor.closed
+    assert cursor.consumed < 10
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_closed_after_a_full_export():
+    cursor = _Cursor(_docs(3))
+
+    await _collect(stream_export(cursor, COLUMNS, "ndjson"))
+
+    assert cursor.closed
+
+
+def test_projection_only_fetches_exported_fields():
+    assert export_projection({"title": "title", "company": "business_requirements.company_name"}) == {
+        "title": 1,
+        "business_requirements.company_name": 1,
+        "_id": 0,
+    }
@@ -0,0 +1,111 @@
+"""
+Tests for memoized token counting and smart truncation.
+"""
+
+import pytest
+
+from src.infra_mind.llm.token_budget_manager import (
+    TokenBudgetManager,
+    TruncationStrategy,
+    token_count_cache,
+)
+
+
+class WordEncoder:
+    """Deterministic encoder: one token per whitespace-separated word."""
+
+    name = "words"
+
+    def __init__(self):
+        self.encoded = []
+        self.batches = []
+
+    def encode(self, text):
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts):
+        self.batches.append(list(texts))
+        return [text.split() for text in texts]
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+@pytest.fixture
+def manager():
+    token_count_cache.clear()
+    manager = TokenBudgetManager("gpt-4")
+    manager.encoder = WordEncoder()
+    yield manager
+    token_count_cache.clear()
+
+
+def test_counts_are_memoized_per_encoding(manager):
+    assert manager.count_tokens("one two three") == 3
+    assert manager.count_tokens("one two three") == 3
+    assert manager.encoder.encoded == ["one two three"]
+    assert token_count_cache.get_stats()["hits"] == 1
+
+    class OtherEncoder(WordEncoder):
+        name = "other"
+
+    manager.encoder = OtherEncoder()
+    manager.count_tokens("one two three")
+    assert manager.encoder.encoded == ["one two three"]
+
+
+def test_batch_counts_only_encode_misses_once(manager):
+    manager.count_tokens("cached text")
+
+    counts = manager.count_tokens_batch(["a b", "cached text", "", "c d e", "a b"])
+
+    assert counts == [2, 2, 0, 3, 2]
+    assert manager.encoder.batches == [["a b", "c d e"]]
+    assert manager.count_tokens_batch(["c d e"]) == [3]
+    assert len(manager.encoder.batches) == 1
+
+
+def _truncate_incrementally(manager, text, max_tokens):
+    """The section-by-section loop the prefix-sum search replaced."""
+    markers = ["IMPORTANT:", "Key Metrics:", "Summary:", "Recommendations:", "Critical:"]
+    preserved, optional = [], []
+    for section in text.split("\n\n"):
+        keep = (
+            any(marker in section for marker in markers)
+            or section.strip().startswith("#")
+            or section.strip().isupper()
+            or (any(char.isdigit() for char in section) and len(section) < 200)
+        )
+        (preserved if keep else optional).append(section)
+    result = "\n\n".join(preserved)
+    current = manager.count_tokens(result)
+    for section in optional:
+        section_tokens = manager.count_tokens(section)
+        if current + section_tokens > max_tokens:
+            return result + "\n\n[... additional content omitted due to length ...]"
+        result += "\n\n" + section
+        current += section_tokens
+    return result
+
+
+@pytest.mark.parametrize("max_tokens", [6, 9, 12, 15, 40])
+def test_smart_truncation_matches_incremental_fill(manager, max_tokens):
+    text = "\n\n".join([
+        "# Overview",
+        "alpha beta gamma",
+        "Summary: costs are down",
+        "delta epsilon",
+        "zeta eta theta iota",
+        "kappa",
+    ])
+
+    assert manager._truncate_smart(text, max_tokens) == _truncate_incrementally(manager, text, max_tokens)
+
+
+def test_smart_truncation_cuts_oversized_preserved_content(manager):
+    text = "IMPORTANT: " + " ".join(f"w{i}" for i in range(20)) + "\n\nfiller words here"
+
+    truncated = manager.truncate_text(text, 5, TruncationStrategy.SMART)
+
+    assert truncated == "IMPORTANT: w0 w1 w2 w3\n\n[... content truncated ...]"
@@ -0,0 +1,116 @@
+"""
+Tests for the form typeahead index.
+"""
+
+import dataclasses
+
+import pytest
+
+from src.infra_mind.forms.intelligent_features import IntelligentFormService, Suggestion, load_suggestion_index
+from src.infra_mind.forms.typeahead import TypeaheadIndex, prefix_edit_distance
+
+SUGGESTIONS = {
+    "cloud_services": [
+        Suggestion("compute_instances", "Compute Instances", "Virtual machines for general workloads", 0.9, "compute"),
+        Suggestion("managed_databases", "Managed Databases", "Fully managed database services", 0.8, "database"),
+        Suggestion("container_orchestration", "Container Orchestration", "Kubernetes and container management", 0.7, "containers"),
+        Suggestion("api_gateway", "API Gateway", "Manage and secure API endpoints", 0.7, "networking"),
+    ]
+}
+
+
+@pytest.fixture
+def index():
+    return TypeaheadIndex(
+        SUGGESTIONS,
+        context_suggestions={"cloud_services": {"finance": [
+            Suggestion("hsm", "Hardware Security Module", "Common in finance industry", 0.9, "industry_specific"),
+        ]}},
+        context_values={"finance": ["api_gateway"]},
+        cache_size=2
+    )
+
+
+def _values(results):
+    return [suggestion.value for suggestion in results]
+
+
+@pytest.mark.parametrize("token,term,max_edits,expected", [
+    ("kube", "kubernetes", 1, 0),
+    ("kbue", "kubernetes", 1, None),
+    ("kbue", "kubernetes", 2, 2),
+    ("kubr", "kubernetes", 1, 1),
+    ("xyz", "kubernetes", 0, None),
+])
+def test_prefix_edit_distance(token, term, max_edits, expected):
+    assert prefix_edit_distance(token, term, max_edits) == expected
+
+
+def test_leading_word_matches_outrank_description_matches(index):
+    results = index.search("cloud_services", "man")
+
+    # Ties are broken by label
+    assert _values(results) == ["managed_databases", "api_gateway", "container_orchestration"]
+    assert results[0].confidence == pytest.approx(0.96)
+
+
+def test_typos_are_matched_with_a_penalty(index):
+    assert _values(index.search("cloud_services", "databsae")) == ["managed_databases"]
+    assert index.search("cloud_services", "databsae")[0].confidence < index.search("cloud_services", "database")[0].confidence
+    # Too short to allow a typo
+    assert _values(index.search("cloud_services", "cmo")) == []
+
+
+def test_every_query_word_must_match(index):
+    assert _values(index.search("cloud_services", "container kube")) == ["container_orchestration"]
+    assert _values(index.search("cloud_services", "container gateway")) == []
+
+
+def test_industry_context_boosts_and_adds_suggestions(index):
+    assert "hsm" not in _values(index.search("cloud_services", ""))
+
+    results = index.search("cloud_services", "", context_key="finance")
+    assert _values(results)[:2] == ["compute_instances", "hsm"]
+    assert results[_values(results).index("api_gateway")].confidence == pytest.approx(0.875)
+    assert _values(index.search("cloud_services", "hardware", context_key="finance")) == ["hsm"]
+
+
+def test_results_are_cached_per_query_and_evicted_lru(index):
+    first = index.search("cloud_services", "Man")
+    assert index.search("cloud_services", "man ") is first
+    index.search("cloud_services", "comp")
+    index.search("cloud_services", "api")
+
+    assert index.search("cloud_services", "man") is not first
+    assert index.get_stats()["hits"] == 1
+
+
+def test_suggestion_confidence_does_not_compound_across_requests():
+    service = IntelligentFormService()
+
+    first = service.get_suggestions("ai_use_cases", "predictive", {})
+    service._suggestion_index.clear_cache()
+    second = service.get_suggestions("ai_use_cases", "predictive", {})
+
+    assert first[0].confidence == second[0].confidence == pytest.approx(0.96)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first[0].confidence = 1.0
+    assert IntelligentFormService()._suggestion_index is service._suggestion_index
+
+
+def test_industry_use_cases_follow_the_form_context():
+    service = IntelligentFormService()
+
+    assert "hipaa" not in _values(service.get_suggestions("ai_use_cases", "", {"industry": "healthcare"}))
+    assert "nlp" in _values(service.get_suggestions("ai_use_cases", "", {"industry": "healthcare"}))
+    assert "nlp" not in _values(service.get_suggestions("ai_use_cases", "", {"industry": "retail"}))
+
+
+@pytest.mark.asyncio
+async def test_suggestion_index_is_warmed_off_the_loop(monkeypatch):
+    monkeypatch.setattr(IntelligentFormService, "_shared_suggestion_index", None)
+
+    index = await load_suggestion_index()
+
+    assert isinstance(index, TypeaheadIndex)
+    assert IntelligentFormService()._suggestion_index is index
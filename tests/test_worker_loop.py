@@ -0,0 +1,121 @@
+"""
+Tests for the persistent Celery worker event loop.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infra_mind.tasks.worker_loop import WorkerEventLoop, WorkerTimeLimitExceeded
+
+
+@pytest.fixture
+def worker_loop():
+    initialized = []
+
+    async def initializer():
+        initialized.append(asyncio.get_running_loop())
+
+    loop = WorkerEventLoop(max_concurrency=2, initializer=initializer)
+    loop.initialized = initialized
+    yield loop
+    loop.stop()
+
+
+def test_tasks_share_one_loop_and_initialize_once(worker_loop):
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    loops = {worker_loop.run(current_loop()) for _ in range(5)}
+
+    assert len(loops) == 1
+    assert worker_loop.initialized == list(loops)
+    assert worker_loop.get_stats()["completed_tasks"] == 5
+
+
+def test_concurrent_tasks_are_limited(worker_loop):
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    async def io_bound_task():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        with lock:
+            running -= 1
+        return True
+
+    # Simulates a threads pool submitting several tasks at once
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(lambda _: worker_loop.run(io_bound_task()), range(6)))
+
+    assert all(results)
+    assert peak == 2
+
+
+def test_timeout_cancels_coroutine(worker_loop):
+    cancelled = threading.Event()
+
+    async def slow_task():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(asyncio.TimeoutError):
+        worker_loop.run(slow_task(), timeout=0.05)
+
+    assert cancelled.wait(1)
+
+
+def test_hard_timeout_releases_the_thread_when_cancellation_is_ignored(worker_loop):
+    async def stubborn_task():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0.5)  # keeps running after the soft limit
+        return "late"
+
+    with pytest.raises(WorkerTimeLimitExceeded):
+        worker_loop.run(stubborn_task(), timeout=0.05, hard_timeout=0.2)
+
+
+def test_hard_timeout_excludes_time_waiting_for_a_slot(worker_loop):
+    async def task():
+        await asyncio.sleep(0.15)
+        return True
+
+    # Two slots, four tasks: the second pair queues for ~0.15s before starting
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: worker_loop.run(task(), hard_timeout=0.25), range(4)))
+
+    assert all(results)
+
+
+def test_unlimited_coroutines_take_a_slot_only_after_admission(worker_loop):
+    admitted = threading.Event()
+
+    async def queued_for_admission():
+        # Waiting here holds no slot and does not count toward the hard limit
+        while not admitted.is_set():
+            await asyncio.sleep(0.01)
+        return await worker_loop.run_limited(asyncio.sleep(0.01, "done"), timeout=1)
+
+    async def quick():
+        return "quick"
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        waiting = [
+            pool.submit(worker_loop.run, queued_for_admission(), hard_timeout=0.1, limit=False)
+            for _ in range(2)
+        ]
+        # Both slots are still free for other tasks
+        assert worker_loop.run(quick(), timeout=1) == "quick"
+        threading.Timer(0.2, admitted.set).start()
+        assert [future.result(2) for future in waiting] == ["done", "done"]